@@ -2,11 +2,17 @@ import getopt
 import logging
 import os
 import sys
+from contextlib import nullcontext
 
 from pcs import settings, usage, utils
 from pcs.cli.common import completion, errors, parse_args, routing
 from pcs.cli.reports import process_library_reports
-from pcs.cli.reports.output import deprecation_warning, error, print_to_stderr
+from pcs.cli.reports.output import (
+    deprecation_warning,
+    error,
+    print_to_stderr,
+    warn,
+)
 from pcs.cli.routing import (
     acl,
     alert,
@@ -28,7 +34,8 @@ from pcs.cli.routing import (
     stonith,
     tag,
 )
-from pcs.common import capabilities
+from pcs.common import capabilities, profiling
+from pcs.common.tools import format_os_error
 from pcs.lib.errors import LibraryError
 
 
@@ -108,6 +115,19 @@ def _non_root_run(argv_cmd):  # noqa: PLR0912 Too many branches
             sys.exit(exitcode)
 
 
+def _write_profile(profiler: profiling.Profiler, output_file: str | None):
+    if not output_file:
+        profiler.write_summary(sys.stderr)
+        return
+    try:
+        with open(output_file, "w", encoding="utf-8") as output:
+            profiler.write_json(output)
+    except OSError as e:
+        warn(
+            f"Unable to write profile to '{output_file}': {format_os_error(e)}"
+        )
+
+
 usefile = False
 filename = ""
 
@@ -133,6 +153,8 @@ def main(argv=None):  # noqa: PLR0912, PLR0915
     # we want to support optional arguments for --wait, so if an argument
     # is specified with --wait (ie. --wait=30) then we use them
     waitsecs = None
+    # the same applies to --profile (ie. --profile=file)
+    profile_file = None
     new_argv = []
     for arg in argv:
         if arg.startswith("--wait="):
@@ -141,6 +163,10 @@ def main(argv=None):  # noqa: PLR0912, PLR0915
                 waitsecs = tempsecs
                 new_argv.append("--wait")
                 continue
+        if arg.startswith("--profile="):
+            profile_file = arg.replace("--profile=", "", 1) or None
+            new_argv.append("--profile")
+            continue
         new_argv.append(arg)
     argv = new_argv
 
@@ -219,6 +245,8 @@ def main(argv=None):  # noqa: PLR0912, PLR0915
             sys.exit()
         elif opt == "--wait":
             utils.pcs_options[opt] = waitsecs
+        elif opt == "--profile":
+            utils.pcs_options[opt] = profile_file
         elif opt == "--request-timeout":
             request_timeout_valid = False
             try:
@@ -261,10 +289,14 @@ def main(argv=None):  # noqa: PLR0912, PLR0915
         "cib": cib.cib_cmd,
         "help": lambda lib, argv, modifiers: print(usage.main()),
     }
+    profiler = (
+        profiling.Profiler("pcs") if "--profile" in utils.pcs_options else None
+    )
     try:
-        routing.create_router(cmd_map, [])(
-            utils.get_library_wrapper(), argv, utils.get_input_modifiers()
-        )
+        with profiler.activate() if profiler else nullcontext():
+            routing.create_router(cmd_map, [])(
+                utils.get_library_wrapper(), argv, utils.get_input_modifiers()
+            )
     except LibraryError as e:
         if e.output:
             sys.stderr.write(e.output)
@@ -276,3 +308,6 @@ def main(argv=None):  # noqa: PLR0912, PLR0915
         else:
             print_to_stderr(usage.main())
         sys.exit(1)
+    finally:
+        if profiler is not None:
+            _write_profile(profiler, utils.pcs_options["--profile"])
@@ -22,11 +22,14 @@ class NodeRemoveRemoteReportProcessor(reports.ReportProcessor):
         self._save_in_memory = True
         self._reports: reports.ReportItemList = []
 
+    @property
+    def min_severity_level(self) -> reports.types.SeverityLevel:
+        if self._include_debug:
+            return reports.ReportItemSeverity.DEBUG
+        return reports.ReportItemSeverity.INFO
+
     def _do_report(self, report_item: reports.ReportItem) -> None:
-        if (
-            report_item.severity.level == reports.ReportItemSeverity.DEBUG
-            and not self._include_debug
-        ):
+        if not self.is_severity_reported(report_item.severity.level):
             return
 
         if not self._save_in_memory:
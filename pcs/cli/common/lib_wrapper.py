@@ -3,6 +3,7 @@ from collections import namedtuple
 
 from pcs import settings
 from pcs.cli.common import middleware
+from pcs.common import profiling
 from pcs.lib.commands import (
     acl,
     alert,
@@ -77,11 +78,21 @@ def lib_env_to_cli_env(lib_env, cli_env):
     return cli_env
 
 
+def _get_command_name(library_command):
+    return ".".join(
+        getattr(library_command, attr, "<unknown>")
+        for attr in ("__module__", "__qualname__")
+    )
+
+
 def bind(cli_env, run_with_middleware, run_library_command):
     def run(cli_env, *args, **kwargs):
         lib_env = cli_env_to_lib_env(cli_env)
 
-        lib_call_result = run_library_command(lib_env, *args, **kwargs)
+        with profiling.profile_library_command(
+            _get_command_name(run_library_command)
+        ):
+            lib_call_result = run_library_command(lib_env, *args, **kwargs)
 
         # midlewares needs finish its work and they see only cli_env
         # so we need reflect some changes to cli_env
@@ -311,6 +322,7 @@ def load_module(env, middleware_factory, name):  # noqa: PLR0911, PLR0912
             middleware.build(middleware_factory.cib),
             {
                 "get_config": constraint_common.get_config,
+                "import_constraints": constraint_common.import_constraints,
             },
         )
 
@@ -345,6 +357,8 @@ def load_module(env, middleware_factory, name):  # noqa: PLR0911, PLR0912
                 "maintenance_unmaintenance_local": (
                     node.maintenance_unmaintenance_local
                 ),
+                "set_nodes_attributes": node.set_nodes_attributes,
+                "set_nodes_utilization": node.set_nodes_utilization,
                 "standby_unstandby_all": node.standby_unstandby_all,
                 "standby_unstandby_list": node.standby_unstandby_list,
                 "standby_unstandby_local": node.standby_unstandby_local,
@@ -429,6 +443,9 @@ def load_module(env, middleware_factory, name):  # noqa: PLR0911, PLR0912
                 "list_agents": resource_agent.list_agents,
                 "list_ocf_providers": resource_agent.list_ocf_providers,
                 "list_standards": resource_agent.list_standards,
+                "refresh_metadata_cache": (
+                    resource_agent.refresh_metadata_cache
+                ),
             },
         )
 
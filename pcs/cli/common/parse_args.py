@@ -76,6 +76,7 @@ MODIFIER_OPTIONS_BOOL: Final[frozenset[str]] = frozenset(
         "--off",
         "--overwrite",
         "--pacemaker",
+        "--pipeline",
         "--promoted",
         "--safe",
         "--show-secrets",
@@ -116,6 +117,8 @@ ARG_TYPE_DELIMITER: Final = "%"
 PCS_SHORT_OPTIONS: Final = "hf:p:u:"
 PCS_LONG_OPTIONS: Final = [
     "debug",
+    # the value is optional, it is extracted from argv before getopt runs
+    "profile",
     "version",
     "help",
     "fullhelp",
@@ -162,6 +165,7 @@ PCS_LONG_OPTIONS: Final = [
     # pcs cluster setup
     "no-cluster-uuid",
     "no-keys-sync",
+    "pipeline",
     # in pcs status - do not display resource status on inactive node
     "hide-inactive",
     # pcs resource (un)manage - enable or disable monitor operations
@@ -621,8 +625,11 @@ class InputModifiers:
         hint_syntax_changed: str | None = None,
         output_format_supported: bool = False,
     ) -> None:
-        # --debug is supported in all commands
-        supported_options_set = set(supported_options) | {"--debug"}
+        # --debug and --profile are supported in all commands
+        supported_options_set = set(supported_options) | {
+            "--debug",
+            "--profile",
+        }
         if output_format_supported:
             supported_options_set.add(OUTPUT_FORMAT_OPTION)
         unsupported_options = self._defined_options - supported_options_set
@@ -1,3 +1,4 @@
+import sys
 from collections.abc import Callable
 from typing import Any
 
@@ -8,11 +9,13 @@ from pcs.cli.common.parse_args import (
     ensure_unique_args,
 )
 from pcs.cli.constraint import parse_args
+from pcs.common import reports
 from pcs.common.pacemaker.constraint import (
     get_all_constraints_ids,
     get_all_location_rules_ids,
 )
 from pcs.common.str_tools import format_list
+from pcs.common.tools import format_os_error
 
 
 def create_with_set(
@@ -62,3 +65,30 @@ def remove(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
             f"{format_list(missing_ids)}"
         )
     lib.cib.remove_elements(argv)
+
+
+def import_constraints(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
+    """
+    Options:
+      * --force - allow constraints for resources in clones and bundles, allow
+        duplicate constraints
+      * -f - CIB file
+    """
+    modifiers.ensure_only_supported("--force", "-f")
+    if len(argv) != 1:
+        raise CmdLineInputError()
+    file_path = argv[0]
+    try:
+        if file_path == "-":
+            constraints_xml = sys.stdin.read()
+        else:
+            with open(file_path, "r") as constraints_file:
+                constraints_xml = constraints_file.read()
+    except OSError as e:
+        raise CmdLineInputError(
+            f"Unable to read constraints: {format_os_error(e)}"
+        ) from e
+    lib.constraint.import_constraints(
+        constraints_xml,
+        force_flags=([reports.codes.FORCE] if modifiers.get("--force") else []),
+    )
@@ -27,13 +27,25 @@ class ReportProcessorToConsole(ReportProcessor):
         self._ignore_severities = self._get_ignored_severities([])
         self._report_item_preprocessor: ReportItemPreprocessor = lambda x: x
 
+    @property
+    def min_severity_level(self) -> SeverityLevel:
+        for severity_level in (
+            ReportItemSeverity.DEBUG,
+            ReportItemSeverity.INFO,
+            ReportItemSeverity.DEPRECATION,
+            ReportItemSeverity.WARNING,
+        ):
+            if severity_level not in self._ignore_severities:
+                return severity_level
+        return ReportItemSeverity.ERROR
+
     def _do_report(self, report_item: ReportItem) -> None:
         filtered_report_item = self._report_item_preprocessor(report_item)
         if not filtered_report_item:
             return
-        report_item_dto = filtered_report_item.to_dto()
-        if report_item_dto.severity.level not in self._ignore_severities:
-            print_report(report_item_dto)
+        # check severity before converting to dto, which renders the message
+        if filtered_report_item.severity.level not in self._ignore_severities:
+            print_report(filtered_report_item.to_dto())
 
     def _get_ignored_severities(
         self, suppressed_severity_list: Iterable[SeverityLevel]
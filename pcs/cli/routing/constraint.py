@@ -92,6 +92,7 @@ constraint_cmd = create_router(
             ["pcs constraint config"], pcs_version="0.12"
         ),
         "config": constraint.config_cmd,
+        "import": constraint_command.import_constraints,
         "ref": constraint.ref,
         "rule": lambda lib, argv, modifiers: raise_command_removed(
             pcs_version="0.12"
@@ -28,6 +28,12 @@ resource_cmd = create_router(
         "standards": resource.resource_standards,
         "providers": resource.resource_providers,
         "agents": resource.resource_agents,
+        "agent-cache": create_router(
+            {
+                "refresh": resource.resource_agent_cache_refresh,
+            },
+            ["resource", "agent-cache"],
+        ),
         "update": resource.update_cmd,
         "meta": resource_cli.meta,
         "delete": resource_cli.remove,
@@ -0,0 +1,130 @@
+"""
+Thin client of the pcs_warm server
+
+It runs pcs commands in processes of the server, which have all pcs modules
+already imported. If the server is not running, commands run in the client
+process the same way as if they were run by pcs.
+
+This module must not import anything which takes time to load.
+"""
+
+import contextlib
+import os
+import signal
+import socket
+import sys
+from collections.abc import Sequence
+from types import FrameType
+
+from pcs.cli.warm.common import (
+    get_socket_path,
+    read_message,
+    send_message,
+)
+from pcs.common.types import StringSequence
+
+# signals forwarded to processes running commands, so that e.g. Ctrl+C
+# interrupts the running command
+FORWARDED_SIGNALS = (signal.SIGINT, signal.SIGTERM, signal.SIGHUP)
+EXIT_CODE_CONNECTION_LOST = 1
+
+
+def _connect(socket_path: str) -> socket.socket | None:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def _get_umask() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def run_in_server(
+    socket_path: str,
+    argv: StringSequence,
+    stdio_fds: Sequence[int] = (0, 1, 2),
+) -> int | None:
+    """
+    Run a pcs command in the server, return its exit code
+
+    Return None if the command cannot be passed to the server, e.g. the
+    server is not running. In that case, the command has not been run.
+
+    socket_path -- path of the server socket
+    argv -- pcs command line arguments
+    stdio_fds -- file descriptors used by the command as stdin, stdout and
+        stderr
+    """
+    sock = _connect(socket_path)
+    if sock is None:
+        return None
+    with sock:
+        try:
+            socket.send_fds(sock, [b"\0"], list(stdio_fds))
+            send_message(
+                sock,
+                {
+                    "argv": list(argv),
+                    "cwd": os.getcwd(),
+                    "environ": dict(os.environ),
+                    "umask": _get_umask(),
+                },
+            )
+            reader = sock.makefile("rb")
+            started = read_message(reader)
+        except (OSError, ValueError):
+            return None
+        if started is None or not isinstance(started.get("pid"), int):
+            # the server refused the request before running it
+            return None
+
+        worker_pid = started["pid"]
+
+        def forward_signal(signum: int, frame: FrameType | None) -> None:
+            del frame
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(worker_pid, signum)
+
+        for signum in FORWARDED_SIGNALS:
+            signal.signal(signum, forward_signal)
+        try:
+            finished = read_message(reader)
+        except (OSError, ValueError):
+            finished = None
+        finally:
+            for signum in FORWARDED_SIGNALS:
+                signal.signal(signum, signal.SIG_DFL)
+    if finished is None or not isinstance(finished.get("exit_code"), int):
+        print(
+            "Error: Connection to the pcs_warm server has been lost",
+            file=sys.stderr,
+        )
+        return EXIT_CODE_CONNECTION_LOST
+    return finished["exit_code"]
+
+
+def main(argv: StringSequence | None = None) -> None:
+    argv = list(argv if argv is not None else sys.argv[1:])
+    if argv[:1] == ["--serve"]:
+        # pylint: disable=import-outside-toplevel
+        from pcs.cli.warm import server  # noqa: PLC0415
+
+        server.main(argv[1:])
+        return
+
+    socket_path = get_socket_path()
+    if socket_path is not None:
+        exit_code = run_in_server(socket_path, argv)
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    # pylint: disable=import-outside-toplevel
+    from pcs import app  # noqa: PLC0415
+
+    app.main(argv)  # type: ignore[no-untyped-call]
@@ -0,0 +1,56 @@
+"""
+Parts of the pcs_warm client and server shared by both of them
+
+The client connects to a Unix socket of the server and sends a single byte
+along with its stdin, stdout and stderr file descriptors. Then it sends
+a request as a line of JSON. The server responds with lines of JSON: first
+with a pid of a process running the request, then with an exit code of the
+request once it is finished.
+
+This module is imported by the client, so it must not import anything
+which takes time to load.
+"""
+
+import json
+import os
+import socket
+from typing import Any
+
+SOCKET_ENV = "PCS_WARM_SOCKET"
+SOCKET_NAME = "pcs_warm.sock"
+STDIO_FD_COUNT = 3
+
+
+def get_socket_path() -> str | None:
+    """
+    Get a path of the server socket of the current user
+
+    The path is specified in the PCS_WARM_SOCKET environment variable or it
+    is placed in the runtime directory of the user. Return None if there is
+    no such directory.
+    """
+    if os.environ.get(SOCKET_ENV):
+        return os.environ[SOCKET_ENV]
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if not runtime_dir:
+        return None
+    return os.path.join(runtime_dir, SOCKET_NAME)
+
+
+def send_message(sock: socket.socket, message: dict[str, Any]) -> None:
+    sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+def read_message(reader: Any) -> dict[str, Any] | None:
+    """
+    Read a message from a file-like object created from a socket
+
+    Return None if the connection has been closed.
+    """
+    line = reader.readline()
+    if not line:
+        return None
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        raise ValueError("Message is not a JSON object")
+    return message
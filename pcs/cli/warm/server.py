@@ -0,0 +1,318 @@
+"""
+Server running pcs commands in processes with pcs modules already imported
+
+The server imports pcs and forks a number of worker processes waiting for
+requests on a Unix socket. Each worker runs one pcs command in the
+environment of the client, i.e. its stdin, stdout, stderr, working
+directory, environment variables and umask, and exits, so that no state is
+shared between commands. The server forks a new worker for each one which
+has exited.
+
+Only processes of the user running the server are allowed to connect.
+"""
+
+import argparse
+import contextlib
+import errno
+import os
+import signal
+import socket
+import struct
+import sys
+import traceback
+from collections.abc import Sequence
+from typing import NoReturn
+
+from pcs import settings
+from pcs.cli.warm.common import (
+    STDIO_FD_COUNT,
+    get_socket_path,
+    read_message,
+    send_message,
+)
+from pcs.common.tools import format_os_error
+from pcs.common.types import StringSequence
+
+LISTEN_BACKLOG = 128
+EXIT_CODE_INTERRUPTED = 130
+# The signals are blocked in the server and waited for synchronously, so they
+# cannot interrupt forking of workers.
+SERVER_SIGNALS = frozenset({signal.SIGCHLD, signal.SIGINT, signal.SIGTERM})
+
+
+def _get_peer_uid(conn: socket.socket) -> int:
+    credentials = conn.getsockopt(
+        socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+    )
+    dummy_pid, uid, dummy_gid = struct.unpack("3i", credentials)
+    return uid
+
+
+def _setup_stdio(fds: Sequence[int]) -> None:
+    for target_fd, fd in enumerate(fds):
+        os.dup2(fd, target_fd)
+        os.close(fd)
+    # buffering of standard streams depends on what they are connected to
+    # pylint: disable=consider-using-with
+    sys.stdin = open(0, encoding="utf-8", closefd=False)  # noqa: SIM115
+    sys.stdout = open(  # noqa: SIM115
+        1,
+        "w",
+        buffering=1 if os.isatty(1) else -1,
+        encoding="utf-8",
+        closefd=False,
+    )
+    sys.stderr = open(  # noqa: SIM115
+        2,
+        "w",
+        buffering=1,
+        encoding="utf-8",
+        errors="backslashreplace",
+        closefd=False,
+    )
+
+
+def _run_pcs(argv: list[str]) -> int:
+    # pylint: disable=import-outside-toplevel
+    from pcs import app  # noqa: PLC0415
+
+    # pylint: disable=broad-except
+    try:
+        app.main(argv)  # type: ignore[no-untyped-call]
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        if isinstance(e.code, int):
+            return e.code
+        print(e.code, file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        traceback.print_exc()
+        return EXIT_CODE_INTERRUPTED
+    except BaseException:  # noqa: BLE001
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+def _handle_connection(conn: socket.socket) -> None:
+    if _get_peer_uid(conn) != os.getuid():
+        return
+    dummy_msg, fds, dummy_flags, dummy_addr = socket.recv_fds(
+        conn, 1, STDIO_FD_COUNT
+    )
+    if len(fds) != STDIO_FD_COUNT:
+        return
+    request = read_message(conn.makefile("rb"))
+    if request is None:
+        return
+    send_message(conn, {"pid": os.getpid()})
+
+    _setup_stdio(fds)
+    os.chdir(request["cwd"])
+    os.umask(request["umask"])
+    os.environ.clear()
+    os.environ.update(request["environ"])
+    sys.argv = ["pcs"] + request["argv"]
+    exit_code = _run_pcs(request["argv"])
+    for stream in (sys.stdout, sys.stderr):
+        with contextlib.suppress(OSError):
+            stream.flush()
+    send_message(conn, {"exit_code": exit_code})
+
+
+def _worker(
+    listen_sock: socket.socket,
+    busy_pipe_fd: int,
+    signal_mask: set[int],
+) -> NoReturn:
+    # pylint: disable=broad-except
+    exit_code = 0
+    try:
+        # SIGINT sent to the whole process group of the server, e.g. by
+        # Ctrl+C, stops the server and commands being run, idle workers are
+        # stopped by the server
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.pthread_sigmask(signal.SIG_SETMASK, signal_mask)
+        conn, dummy_addr = listen_sock.accept()
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        listen_sock.close()
+        # let the server know the worker is running a command and should not
+        # be stopped
+        os.write(busy_pipe_fd, f"{os.getpid()}\n".encode())
+        with conn:
+            _handle_connection(conn)
+    except BaseException:  # noqa: BLE001
+        traceback.print_exc()
+        exit_code = 1
+    finally:
+        # do not run any cleanup inherited from the server
+        os._exit(exit_code)  # pylint: disable=protected-access
+
+
+class Server:
+    def __init__(self, socket_path: str, worker_count: int):
+        self._socket_path = socket_path
+        self._worker_count = worker_count
+        self._workers: set[int] = set()
+        self._busy_workers: set[int] = set()
+        self._listen_sock: socket.socket | None = None
+        self._busy_pipe_read_fd = -1
+        self._busy_pipe_write_fd = -1
+        self._worker_signal_mask: set[int] = set()
+
+    def run(self) -> None:
+        """
+        Serve requests until SIGTERM or SIGINT is received
+        """
+        self._warm_up()
+        self._listen_sock = self._bind()
+        self._busy_pipe_read_fd, self._busy_pipe_write_fd = os.pipe()
+        os.set_blocking(self._busy_pipe_read_fd, False)
+        self._worker_signal_mask = signal.pthread_sigmask(
+            signal.SIG_BLOCK, SERVER_SIGNALS
+        )
+        try:
+            while True:
+                while len(self._workers) < self._worker_count:
+                    self._spawn_worker()
+                siginfo = signal.sigwaitinfo(SERVER_SIGNALS)
+                if siginfo.si_signo != signal.SIGCHLD:
+                    break
+                self._reap_workers()
+        finally:
+            self._stop()
+            signal.pthread_sigmask(signal.SIG_SETMASK, self._worker_signal_mask)
+
+    @staticmethod
+    def _warm_up() -> None:
+        # pylint: disable=import-outside-toplevel
+        # pylint: disable=unused-import
+        from pcs import app  # noqa: F401, PLC0415
+
+    def _bind(self) -> socket.socket:
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self._socket_path)
+            raise OSError(
+                errno.EADDRINUSE,
+                "Another server is listening on the socket",
+                self._socket_path,
+            )
+        except (ConnectionRefusedError, FileNotFoundError):
+            pass
+        finally:
+            probe.close()
+        if os.path.exists(self._socket_path):
+            # a stale socket of a server which has not stopped properly
+            os.unlink(self._socket_path)
+        listen_sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o177)
+        try:
+            listen_sock.bind(self._socket_path)
+        finally:
+            os.umask(old_umask)
+        listen_sock.listen(LISTEN_BACKLOG)
+        return listen_sock
+
+    def _spawn_worker(self) -> None:
+        assert self._listen_sock is not None
+        pid = os.fork()
+        if pid == 0:
+            os.close(self._busy_pipe_read_fd)
+            _worker(
+                self._listen_sock,
+                self._busy_pipe_write_fd,
+                self._worker_signal_mask,
+            )
+        self._workers.add(pid)
+
+    def _reap_workers(self) -> None:
+        self._read_busy_workers()
+        while True:
+            try:
+                pid, dummy_status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            self._workers.discard(pid)
+            self._busy_workers.discard(pid)
+
+    def _read_busy_workers(self) -> None:
+        data = b""
+        while True:
+            try:
+                chunk = os.read(self._busy_pipe_read_fd, 4096)
+            except BlockingIOError:
+                break
+            if not chunk:
+                break
+            data += chunk
+        self._busy_workers.update(
+            int(pid) for pid in data.split() if int(pid) in self._workers
+        )
+
+    def _stop(self) -> None:
+        if self._listen_sock is not None:
+            self._listen_sock.close()
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self._socket_path)
+        self._read_busy_workers()
+        # commands being run are let finish
+        for pid in self._workers - self._busy_workers:
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+        for pid in self._workers:
+            with contextlib.suppress(ChildProcessError):
+                os.waitpid(pid, 0)
+        self._workers = set()
+        self._busy_workers = set()
+        for fd in (self._busy_pipe_read_fd, self._busy_pipe_write_fd):
+            if fd >= 0:
+                os.close(fd)
+
+
+def _parse_args(argv: StringSequence) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="pcs_warm --serve",
+        description=(
+            "Run pcs commands sent by pcs_warm in processes with pcs already "
+            "loaded"
+        ),
+    )
+    parser.add_argument(
+        "--socket",
+        default=get_socket_path(),
+        help=(
+            "Path of the server socket, default: the PCS_WARM_SOCKET "
+            "environment variable or pcs_warm.sock in XDG_RUNTIME_DIR"
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.pcs_warm_worker_count,
+        help="Number of processes waiting for commands, default: %(default)s",
+    )
+    args = parser.parse_args(argv)
+    if not args.socket:
+        parser.error(
+            "unable to determine socket path, use --socket or set "
+            "PCS_WARM_SOCKET"
+        )
+    if args.workers < 1:
+        parser.error("--workers must be a positive integer")
+    return args
+
+
+def main(argv: StringSequence | None = None) -> None:
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    try:
+        Server(args.socket, args.workers).run()
+    except OSError as e:
+        print(
+            f"Error: Unable to run pcs_warm server: {format_os_error(e)}",
+            file=sys.stderr,
+        )
+        sys.exit(1)
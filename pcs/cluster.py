@@ -483,8 +483,11 @@ def stop_cluster_nodes(nodes: StringCollection) -> None:  # noqa: PLR0912
     utils.read_known_hosts_file()  # cache known hosts
     stopping_all = set(nodes) >= set(all_nodes)
     if "--force" not in utils.pcs_options and not stopping_all:
+        # the nodes are evaluated in the order of this list, nodes safe to
+        # stop are the ones preceding the nodes causing quorum loss
+        node_list = list(nodes)
         error_list = []
-        for node in nodes:
+        for node in node_list:
             retval, data = utils.get_remote_quorumtool_output(node)
             if retval != 0:
                 error_list.append(node + ": " + data)
@@ -497,10 +500,24 @@ def stop_cluster_nodes(nodes: StringCollection) -> None:  # noqa: PLR0912
                     # is no quorum to be lost and therefore no error to be
                     # reported.
                     continue
-                if quorum_status_facade.stopping_nodes_cause_quorum_loss(nodes):
+                quorum_loss_nodes = (
+                    quorum_status_facade.get_nodes_causing_quorum_loss(
+                        node_list
+                    )
+                )
+                if quorum_loss_nodes:
+                    safe_nodes = node_list[
+                        : len(node_list) - len(quorum_loss_nodes)
+                    ]
                     utils.err(
                         "Stopping the node(s) will cause a loss of the quorum"
                         + ", use --force to override"
+                        + (
+                            "\nNode(s) {} can be stopped without a loss of "
+                            "the quorum".format(format_list(safe_nodes))
+                            if safe_nodes
+                            else ""
+                        )
                     )
                 else:
                     # We have the info, no need to print errors
@@ -1584,17 +1601,18 @@ def cluster_auth_cmd(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
         )
         username, password = utils.get_user_and_pass()
         not_auth_node_list = []
-        for node_name in not_authorized_node_name_list:
-            for node in cluster_node_list:
-                if node.name == node_name:
-                    if node.addrs_plain():
-                        not_auth_node_list.append(node)
-                    else:
-                        print_to_stderr(
-                            f"{node.name}: No addresses defined in "
-                            "corosync.conf, use the 'pcs host auth' command to "
-                            "authenticate the node"
-                        )
+        for not_auth_node in filter(
+            None,
+            map(corosync_conf.get_node_by_name, not_authorized_node_name_list),
+        ):
+            if not_auth_node.addrs_plain():
+                not_auth_node_list.append(not_auth_node)
+            else:
+                print_to_stderr(
+                    f"{not_auth_node.name}: No addresses defined in "
+                    "corosync.conf, use the 'pcs host auth' command to "
+                    "authenticate the node"
+                )
         nodes_to_auth_data = {
             node.name: HostAuthData(
                 username,
@@ -1720,6 +1738,7 @@ def cluster_setup(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
       * --no-keys-sync - do not create and distribute pcsd ssl cert and key,
         corosync and pacemaker authkeys
       * --no-cluster-uuid - do not generate a cluster UUID during setup
+      * --pipeline - let nodes go through setup steps independently
       * --corosync_conf - corosync.conf file path, do not talk to cluster nodes
       * --overwrite - allow overwriting existing files
     """
@@ -1732,6 +1751,7 @@ def cluster_setup(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
         "--start",
         "--enable",
         "--no-keys-sync",
+        "--pipeline",
     ]
     allowed_options_local = ["--corosync_conf", "--overwrite"]
     modifiers.ensure_only_supported(
@@ -1804,6 +1824,7 @@ def cluster_setup(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
             enable=modifiers.get("--enable"),
             no_keys_sync=modifiers.get("--no-keys-sync"),
             no_cluster_uuid=modifiers.is_specified("--no-cluster-uuid"),
+            pipeline=modifiers.is_specified("--pipeline"),
             force_flags=force_flags,
         )
         return
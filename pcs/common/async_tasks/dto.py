@@ -25,6 +25,19 @@ class CommandDto(DataTransferObject):
     options: CommandOptionsDto
 
 
+@dataclass(frozen=True)
+class CommandBatchDto(DataTransferObject):
+    commands: list[CommandDto]
+
+
+@dataclass(frozen=True)
+class CommandResultDto(DataTransferObject):
+    command_name: str
+    success: bool
+    reports: list[ReportItemDto]
+    result: Any
+
+
 @dataclass(frozen=True)
 class TaskIdentDto(DataTransferObject):
     task_ident: str
@@ -39,3 +52,15 @@ class TaskResultDto(DataTransferObject):
     task_finish_type: TaskFinishType
     kill_reason: TaskKillReason | None
     result: Any
+
+
+@dataclass(frozen=True)
+class TaskProgressDto(DataTransferObject):
+    task_ident: str
+    state: TaskState
+    task_finish_type: TaskFinishType
+    kill_reason: TaskKillReason | None
+    # index of the first item of reports in the list of all task's reports
+    report_offset: int
+    reports: list[ReportItemDto]
+    result: Any
@@ -0,0 +1,38 @@
+class OperationCancelled(BaseException):
+    """
+    A long running operation has been stopped due to a cancellation request
+
+    It is derived from BaseException, so that it is not swallowed by generic
+    exception handlers and it reliably gets to the code which requested the
+    cancellation.
+    """
+
+
+class CancellationToken:
+    """
+    Lets a running operation know that it should stop as soon as possible
+
+    Waiting for external processes and remote nodes checks the token and
+    stops by raising OperationCancelled. Cancelling only sets a flag, so it is
+    safe to be done from a signal handler.
+    """
+
+    def __init__(self) -> None:
+        self._is_cancelled = False
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._is_cancelled
+
+    def cancel(self) -> None:
+        """
+        Request cancellation of operations watching this token
+        """
+        self._is_cancelled = True
+
+    def raise_if_cancelled(self) -> None:
+        """
+        Raise OperationCancelled if cancellation has been requested
+        """
+        if self._is_cancelled:
+            raise OperationCancelled()
@@ -1,5 +1,5 @@
 import os
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 
 from pcs import settings
 from pcs.common.node_communicator import (
@@ -8,7 +8,13 @@ from pcs.common.node_communicator import (
     Request,
     Response,
 )
-from pcs.common.reports import ReportItem, ReportProcessor, messages
+from pcs.common.reports import (
+    ReportItem,
+    ReportItemMessage,
+    ReportItemSeverity,
+    ReportProcessor,
+    messages,
+)
 from pcs.lib.external import is_proxy_set
 
 
@@ -24,11 +30,25 @@ class CommunicatorLogger(CommunicatorLoggerInterface):
         for reporter in self._reporters:
             reporter.report(msg)
 
+    def _log_debug_to_all_reporters(
+        self, message_factory: Callable[[], ReportItemMessage]
+    ) -> None:
+        # Debug messages contain whole requests and responses. Do not create
+        # them unless there is a reporter which wants them.
+        reporters = [
+            reporter
+            for reporter in self._reporters
+            if reporter.is_severity_reported(ReportItemSeverity.DEBUG)
+        ]
+        if not reporters:
+            return
+        report_item = ReportItem.debug(message_factory())
+        for reporter in reporters:
+            reporter.report(report_item)
+
     def log_request_start(self, request: Request) -> None:
-        self._log_report_to_all_reporters(
-            ReportItem.debug(
-                messages.NodeCommunicationStarted(request.url, request.data)
-            )
+        self._log_debug_to_all_reporters(
+            lambda: messages.NodeCommunicationStarted(request.url, request.data)
         )
 
     def log_response(self, response: Response) -> None:
@@ -39,22 +59,18 @@ class CommunicatorLogger(CommunicatorLoggerInterface):
         self._log_debug(response)
 
     def _log_response_successful(self, response: Response) -> None:
-        self._log_report_to_all_reporters(
-            ReportItem.debug(
-                messages.NodeCommunicationFinished(
-                    response.request.url,
-                    response.response_code,  # type: ignore
-                    response.data,
-                )
+        self._log_debug_to_all_reporters(
+            lambda: messages.NodeCommunicationFinished(
+                response.request.url,
+                response.response_code,  # type: ignore
+                response.data,
             )
         )
 
     def _log_response_failure(self, response: Response) -> None:
-        self._log_report_to_all_reporters(
-            ReportItem.debug(
-                messages.NodeCommunicationNotConnected(
-                    response.request.host_label, response.error_msg or ""
-                )
+        self._log_debug_to_all_reporters(
+            lambda: messages.NodeCommunicationNotConnected(
+                response.request.host_label, response.error_msg or ""
             )
         )
         if is_proxy_set(os.environ):
@@ -67,11 +83,9 @@ class CommunicatorLogger(CommunicatorLoggerInterface):
             )
 
     def _log_debug(self, response: Response) -> None:
-        self._log_report_to_all_reporters(
-            ReportItem.debug(
-                messages.NodeCommunicationDebugInfo(
-                    response.request.url, response.debug
-                )
+        self._log_debug_to_all_reporters(
+            lambda: messages.NodeCommunicationDebugInfo(
+                response.request.url, response.debug
             )
         )
 
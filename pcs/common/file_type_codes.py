@@ -19,3 +19,4 @@ PCS_KNOWN_HOSTS = FileTypeCode("PCS_KNOWN_HOSTS")
 PCS_SETTINGS_CONF = FileTypeCode("PCS_SETTINGS_CONF")
 PCS_DR_CONFIG = FileTypeCode("PCS_DR_CONFIG")
 PCS_USERS_CONF = FileTypeCode("PCS_USERS_CONF")
+RESOURCE_AGENT_METADATA_CACHE = FileTypeCode("RESOURCE_AGENT_METADATA_CACHE")
@@ -1,7 +1,9 @@
 import base64
 import io
 import re
+import time
 from collections.abc import Generator, Iterable, Mapping, Sequence
+from contextlib import suppress
 from dataclasses import (
     dataclass,
     field,
@@ -19,6 +21,8 @@ except ImportError:
 
 from pcs import settings
 from pcs.common import pcs_pycurl as pycurl
+from pcs.common import profiling
+from pcs.common.cancellation import CancellationToken, OperationCancelled
 from pcs.common.host import (
     Destination,
     PcsKnownHost,
@@ -295,9 +299,11 @@ class Communicator:
         user: str | None,
         groups: StringIterable | None,
         request_timeout: int | None = None,
+        cancellation_token: CancellationToken | None = None,
     ) -> None:
         self._logger = communicator_logger
         self._auth_cookies = _get_auth_cookies(user, groups)
+        self._cancellation_token = cancellation_token
         self._request_timeout = (
             request_timeout
             if request_timeout is not None
@@ -309,6 +315,8 @@ class Communicator:
         # We need to have references for all the handles, so they don't be
         # cleaned up by the garbage collector.
         self._easy_handle_list: list[pycurl.Curl] = []
+        # start times of requests, only tracked when profiling is active
+        self._request_start_times: dict[pycurl.Curl, float] = {}
 
     def add_requests(self, request_list: Iterable[Request]) -> None:
         """
@@ -331,6 +339,7 @@ class Communicator:
             self._multi_handle.add_handle(handle)
             if self._is_running:
                 self._logger.log_request_start(request)
+                self.__trace_request_start(handle)
 
     def start_loop(self) -> Generator[Response, None, None]:
         """
@@ -339,7 +348,9 @@ class Communicator:
         generator will then return responses for these requests. It is possible
         to add new request to the queue while the generator is in progress.
         Generator will stop (raise StopIteration) after all requests (also those
-        added after creation of generator) are processed.
+        added after creation of generator) are processed. If the cancellation
+        token of the Communicator gets cancelled, all unfinished requests are
+        aborted and the generator raises OperationCancelled.
 
         WARNING: do not use multiple instances of generator (of one
         Communicator instance) when there is one which didn't finish
@@ -360,16 +371,19 @@ class Communicator:
         self._is_running = True
         for handle in self._easy_handle_list:
             self._logger.log_request_start(handle.request_obj)  # type: ignore[attr-defined]
+            self.__trace_request_start(handle)
 
         finished_count = 0
         while finished_count < len(self._easy_handle_list):
             self.__multi_perform()
             self.__wait_for_multi_handle()
+            self.__abort_if_cancelled()
             response_list = self.__get_all_ready_responses()
             for response in response_list:
                 # free up memory for next usage of this Communicator instance
                 self._multi_handle.remove_handle(response.handle)
                 self._logger.log_response(response)
+                self.__trace_response(response)
                 yield response
                 # if something was added to the queue in the meantime, run it
                 # immediately, so we don't need to wait until all responses will
@@ -379,6 +393,47 @@ class Communicator:
         self._easy_handle_list = []
         self._is_running = False
 
+    def __is_cancelled(self) -> bool:
+        return (
+            self._cancellation_token is not None
+            and self._cancellation_token.is_cancelled
+        )
+
+    def __abort_if_cancelled(self) -> None:
+        if not self.__is_cancelled():
+            return
+        for handle in self._easy_handle_list:
+            # finished requests have been removed already
+            with suppress(pycurl.error):
+                self._multi_handle.remove_handle(handle)
+        self._easy_handle_list = []
+        self._request_start_times = {}
+        self._is_running = False
+        raise OperationCancelled()
+
+    def __trace_request_start(self, handle: pycurl.Curl) -> None:
+        if profiling.is_active():
+            self._request_start_times[handle] = time.perf_counter()
+
+    def __trace_response(self, response: Response) -> None:
+        start = self._request_start_times.pop(response.handle, None)
+        if start is None:
+            return
+        request = response.request
+        profiling.add_event(
+            profiling.EVENT_REQUEST,
+            start,
+            time.perf_counter() - start,
+            target=request.host_label,
+            action=request.action,
+            bytes_in=profiling.text_size(
+                response.handle.output_buffer.getvalue()  # type: ignore[attr-defined]
+            ),
+            bytes_out=profiling.text_size(request.data),
+            was_connected=response.was_connected,
+            response_code=response.response_code,
+        )
+
     def __get_all_ready_responses(self) -> list[Response]:
         response_list = []
         repeat = True
@@ -417,9 +472,17 @@ class Communicator:
                 # curl don't have timeout set, so we can use our default
                 else self.curl_multi_select_timeout_default
             )
+            if self._cancellation_token is not None:
+                # do not wait for curl for too long to notice cancellation
+                select_timeout = min(
+                    select_timeout, self.curl_multi_select_timeout_default
+                )
             # when value returned from select is -1, it timed out, so we can
             # wait
-            need_to_wait = self._multi_handle.select(select_timeout) == -1
+            need_to_wait = (
+                self._multi_handle.select(select_timeout) == -1
+                and not self.__is_cancelled()
+            )
 
 
 class MultiaddressCommunicator(Communicator):
@@ -453,11 +516,13 @@ class NodeCommunicatorFactory:
         user: str | None,
         groups: StringIterable | None,
         request_timeout: int | None,
+        cancellation_token: CancellationToken | None = None,
     ) -> None:
         self._logger = communicator_logger
         self._user = user
         self._groups = groups
         self._request_timeout = request_timeout
+        self._cancellation_token = cancellation_token
 
     def get_communicator(
         self, request_timeout: int | None = None
@@ -469,7 +534,11 @@ class NodeCommunicatorFactory:
     ) -> Communicator:
         timeout = request_timeout if request_timeout else self._request_timeout
         return Communicator(
-            self._logger, self._user, self._groups, request_timeout=timeout
+            self._logger,
+            self._user,
+            self._groups,
+            request_timeout=timeout,
+            cancellation_token=self._cancellation_token,
         )
 
     def get_communicator_no_privilege_transition(
@@ -488,6 +557,7 @@ class NodeCommunicatorFactory:
             user=None,
             groups=None,
             request_timeout=timeout,
+            cancellation_token=self._cancellation_token,
         )
 
     def get_multiaddress_communicator(
@@ -495,7 +565,11 @@ class NodeCommunicatorFactory:
     ) -> MultiaddressCommunicator:
         timeout = request_timeout if request_timeout else self._request_timeout
         return MultiaddressCommunicator(
-            self._logger, self._user, self._groups, request_timeout=timeout
+            self._logger,
+            self._user,
+            self._groups,
+            request_timeout=timeout,
+            cancellation_token=self._cancellation_token,
         )
 
 
@@ -535,10 +609,22 @@ def _create_request_handle(
     timeout -- request timeout
     """
 
+    compressed_response = False
+
     # it is not possible to take this callback out of this function, because of
     # curl API
     def __debug_callback(data_type: int, debug_data: bytes) -> None:
         # pylint: disable=no-member
+        nonlocal compressed_response
+        if data_type == pycurl.DEBUG_HEADER_IN:  # type: ignore[attr-defined]
+            if is_content_encoding_header(debug_data):
+                compressed_response = True
+        elif (
+            data_type == pycurl.DEBUG_DATA_IN  # type: ignore[attr-defined]
+            and compressed_response
+        ):
+            # curl provides received data before decompressing them
+            debug_data = compressed_data_placeholder(debug_data)
         prefixes = {
             # Dynamically added attributes in pcs/common/pcs_pycurl.py
             pycurl.DEBUG_TEXT: b"* ",  # type: ignore[attr-defined]
@@ -568,6 +654,9 @@ def _create_request_handle(
     handle.setopt(pycurl.SSL_VERIFYPEER, 0)
     handle.setopt(pycurl.NOSIGNAL, 1)  # required for multi-threading
     handle.setopt(pycurl.HTTPHEADER, ["Expect: "])
+    # accept all compressions supported by curl, responses are decompressed
+    # by curl transparently
+    handle.setopt(pycurl.ACCEPT_ENCODING, "")
     if handle_cookies:
         handle.setopt(
             pycurl.COOKIE, _dict_to_cookies(handle_cookies).encode("utf-8")
@@ -585,6 +674,24 @@ def _create_request_handle(
     return handle
 
 
+def is_content_encoding_header(header: bytes) -> bool:
+    """
+    Check whether a received HTTP header announces a compressed response
+    """
+    name, _, value = header.partition(b":")
+    return (
+        name.strip().lower() == b"content-encoding"
+        and value.strip().lower() not in (b"", b"identity")
+    )
+
+
+def compressed_data_placeholder(data: bytes) -> bytes:
+    """
+    Return text put to debug output instead of received compressed data
+    """
+    return f"[{len(data)} bytes of compressed data]".encode("utf-8")
+
+
 def _dict_to_cookies(cookies_dict: Mapping[str, str]) -> str:
     return ";".join(
         [f"{key}={value}" for key, value in sorted(cookies_dict.items())]
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from pcs.common.interface.dto import DataTransferObject
+
+
+@dataclass(frozen=True)
+class CibVersionDto(DataTransferObject):
+    admin_epoch: int
+    epoch: int
+    num_updates: int
+
+
+@dataclass(frozen=True)
+class CibChangeDto(DataTransferObject):
+    # increases by one with each change of the CIB version
+    generation: int
+    # unix time of the change
+    timestamp: float
+    # None if the CIB is not available, e.g. the cluster is not running
+    version: Optional[CibVersionDto]
@@ -0,0 +1,261 @@
+"""
+Timing traces and profiles of library commands
+
+Instrumented code records durations of its phases by calling functions of this
+module. The functions do nothing unless a Profiler has been activated in the
+current context, so it is cheap to call them when profiling is disabled.
+"""
+
+import cProfile
+import json
+import pstats
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    Any,
+    TextIO,
+)
+
+PROFILE_FORMAT_VERSION = 1
+
+# a library command run by pcs or pcsd
+EVENT_LIBRARY_COMMAND = "library_command"
+# an external process run by CommandRunner.run
+EVENT_COMMAND = "command"
+# a request to another node sent by a Communicator
+EVENT_REQUEST = "request"
+EVENT_CIB_LOAD = "cib_load"
+EVENT_CIB_PARSE = "cib_parse"
+EVENT_CIB_DIFF = "cib_diff"
+EVENT_CIB_PUSH = "cib_push"
+EVENT_WAIT = "wait"
+
+_active_profiler: ContextVar["Profiler | None"] = ContextVar(
+    "active_profiler", default=None
+)
+
+
+class Profiler:
+    """
+    Collect a timing trace of events and a cProfile profile of library commands
+    """
+
+    def __init__(self, name: str):
+        """
+        name -- description of the profiled run, e.g. a command name
+        """
+        self.name = name
+        self._started_at = time.time()
+        self._start = time.perf_counter()
+        self._events: list[dict[str, Any]] = []
+        self._cprofile = cProfile.Profile()
+        self._cprofile_depth = 0
+        self._cprofile_used = False
+
+    @contextmanager
+    def activate(self) -> Iterator["Profiler"]:
+        """
+        Record events produced by code run within the context
+        """
+        token = _active_profiler.set(self)
+        try:
+            yield self
+        finally:
+            _active_profiler.reset(token)
+
+    def add_event(
+        self, event_type: str, start: float, duration: float, **details: Any
+    ) -> None:
+        """
+        Record an event which has already finished
+
+        event_type -- one of the EVENT_* constants
+        start -- time.perf_counter() value at the start of the event
+        duration -- duration of the event in seconds
+        details -- event specific data, must be serializable to JSON
+        """
+        self._events.append(
+            dict(
+                type=event_type,
+                start=start - self._start,
+                duration=duration,
+                **details,
+            )
+        )
+
+    @contextmanager
+    def measure(
+        self, event_type: str, **details: Any
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Record an event spanning the context
+
+        Yield details of the event, which may be updated within the context.
+        """
+        start = time.perf_counter()
+        try:
+            yield details
+        finally:
+            self.add_event(
+                event_type, start, time.perf_counter() - start, **details
+            )
+
+    @contextmanager
+    def profile_library_command(self, name: str) -> Iterator[None]:
+        """
+        Record a library command and profile its functions by cProfile
+        """
+        cprofile_enabled = False
+        if self._cprofile_depth == 0:
+            try:
+                self._cprofile.enable()
+                cprofile_enabled = True
+                self._cprofile_used = True
+            except ValueError:
+                # another profiler is active in the process, e.g. in a thread
+                # running another library command, only the trace is recorded
+                pass
+        self._cprofile_depth += 1
+        try:
+            with self.measure(EVENT_LIBRARY_COMMAND, name=name):
+                yield
+        finally:
+            self._cprofile_depth -= 1
+            if cprofile_enabled:
+                self._cprofile.disable()
+
+    def _get_stats(self) -> pstats.Stats | None:
+        if not self._cprofile_used:
+            return None
+        return pstats.Stats(self._cprofile)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Export the trace and the profile to a structure serializable to JSON
+        """
+        summary: dict[str, dict[str, Any]] = {}
+        for event in self._events:
+            event_summary = summary.setdefault(
+                event["type"], {"count": 0, "duration": 0.0}
+            )
+            event_summary["count"] += 1
+            event_summary["duration"] += event["duration"]
+        functions = []
+        stats = self._get_stats()
+        if stats is not None:
+            for (filename, line, function_name), (
+                primitive_calls,
+                calls,
+                total_time,
+                cumulative_time,
+                _,
+            ) in stats.stats.items():  # type: ignore[attr-defined]
+                functions.append(
+                    {
+                        "function": f"{filename}:{line}({function_name})",
+                        "calls": calls,
+                        "primitive_calls": primitive_calls,
+                        "total_time": total_time,
+                        "cumulative_time": cumulative_time,
+                    }
+                )
+            functions.sort(key=lambda item: -item["cumulative_time"])
+        return {
+            "format_version": PROFILE_FORMAT_VERSION,
+            "name": self.name,
+            "started_at": self._started_at,
+            "duration": time.perf_counter() - self._start,
+            "summary": summary,
+            "events": sorted(self._events, key=lambda event: event["start"]),
+            "functions": functions,
+        }
+
+    def write_json(self, output: TextIO) -> None:
+        json.dump(self.to_dict(), output, indent=2)
+        output.write("\n")
+
+    def write_summary(self, output: TextIO, function_count: int = 25) -> None:
+        """
+        Write a human readable overview of the trace and the profile
+
+        function_count -- number of functions with the longest cumulative time
+            to be listed
+        """
+        profile = self.to_dict()
+        output.write(
+            f"Profile of '{profile['name']}', "
+            f"total time {profile['duration']:.3f} s\n"
+        )
+        for event_type, event_summary in sorted(profile["summary"].items()):
+            output.write(
+                f"  {event_type}: {event_summary['count']}x, "
+                f"{event_summary['duration']:.3f} s\n"
+            )
+        stats = self._get_stats()
+        if stats is not None:
+            stats.stream = output  # type: ignore[attr-defined]
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(
+                function_count
+            )
+
+
+def get_active_profiler() -> Profiler | None:
+    return _active_profiler.get()
+
+
+def is_active() -> bool:
+    return _active_profiler.get() is not None
+
+
+def add_event(
+    event_type: str, start: float, duration: float, **details: Any
+) -> None:
+    """
+    Record a finished event if profiling is active, see Profiler.add_event
+    """
+    profiler = _active_profiler.get()
+    if profiler is not None:
+        profiler.add_event(event_type, start, duration, **details)
+
+
+@contextmanager
+def measure(event_type: str, **details: Any) -> Iterator[dict[str, Any] | None]:
+    """
+    Record an event spanning the context if profiling is active
+
+    Yield details of the event, which may be updated within the context, or
+    None if profiling is not active. Details not passed to this function
+    should only be computed when something else than None is yielded.
+    """
+    profiler = _active_profiler.get()
+    if profiler is None:
+        yield None
+        return
+    with profiler.measure(event_type, **details) as event_details:
+        yield event_details
+
+
+@contextmanager
+def profile_library_command(name: str) -> Iterator[None]:
+    """
+    Profile a library command if profiling is active
+    """
+    profiler = _active_profiler.get()
+    if profiler is None:
+        yield
+        return
+    with profiler.profile_library_command(name):
+        yield
+
+
+def text_size(text: str | bytes | None) -> int:
+    """
+    Return size of a text in bytes
+    """
+    if text is None:
+        return 0
+    if isinstance(text, bytes):
+        return len(text)
+    return len(text.encode("utf-8"))
@@ -68,6 +68,7 @@ BOOTH_CONFIG_DISTRIBUTION_NODE_ERROR = M("BOOTH_CONFIG_DISTRIBUTION_NODE_ERROR")
 BOOTH_CONFIG_DISTRIBUTION_STARTED = M("BOOTH_CONFIG_DISTRIBUTION_STARTED")
 BOOTH_CONFIG_IS_USED = M("BOOTH_CONFIG_IS_USED")
 BOOTH_CONFIG_UNEXPECTED_LINES = M("BOOTH_CONFIG_UNEXPECTED_LINES")
+BOOTH_CONFIG_UP_TO_DATE_ON_NODES = M("BOOTH_CONFIG_UP_TO_DATE_ON_NODES")
 BOOTH_DAEMON_STATUS_ERROR = M("BOOTH_DAEMON_STATUS_ERROR")
 BOOTH_EVEN_PEERS_NUM = M("BOOTH_EVEN_PEERS_NUM")
 BOOTH_FETCHING_CONFIG_FROM_NODE = M("BOOTH_FETCHING_CONFIG_FROM_NODE")
@@ -175,6 +176,7 @@ CIB_UPGRADE_FAILED = M("CIB_UPGRADE_FAILED")
 CIB_UPGRADE_FAILED_TO_MINIMAL_REQUIRED_VERSION = M(
     "CIB_UPGRADE_FAILED_TO_MINIMAL_REQUIRED_VERSION"
 )
+CIB_UPGRADE_IN_BATCH_NOT_POSSIBLE = M("CIB_UPGRADE_IN_BATCH_NOT_POSSIBLE")
 CIB_UPGRADE_SUCCESSFUL = M("CIB_UPGRADE_SUCCESSFUL")
 CIB_XML_MISSING = M("CIB_XML_MISSING")
 CLUSTER_DESTROY_STARTED = M("CLUSTER_DESTROY_STARTED")
@@ -197,10 +199,14 @@ CLUSTER_STATUS_BUNDLE_MEMBER_ID_AS_IMPLICIT = M(
 CLUSTER_UUID_ALREADY_SET = M("CLUSTER_UUID_ALREADY_SET")
 CLUSTER_WILL_BE_DESTROYED = M("CLUSTER_WILL_BE_DESTROYED")
 COMMAND_INVALID_PAYLOAD = M("COMMAND_INVALID_PAYLOAD")
+COMMAND_NOT_ALLOWED_IN_BATCH = M("COMMAND_NOT_ALLOWED_IN_BATCH")
 COMMAND_UNKNOWN = M("COMMAND_UNKNOWN")
 CONFIGURED_RESOURCE_MISSING_IN_STATUS = M(
     "CONFIGURED_RESOURCE_MISSING_IN_STATUS"
 )
+CONSTRAINT_IMPORT_DUPLICATE = M("CONSTRAINT_IMPORT_DUPLICATE")
+CONSTRAINT_IMPORT_UNEXPECTED_ELEMENT = M("CONSTRAINT_IMPORT_UNEXPECTED_ELEMENT")
+CONSTRAINT_IMPORT_XML_SYNTAX_ERROR = M("CONSTRAINT_IMPORT_XML_SYNTAX_ERROR")
 LIVE_ENVIRONMENT_NOT_CONSISTENT = M("LIVE_ENVIRONMENT_NOT_CONSISTENT")
 LIVE_ENVIRONMENT_REQUIRED = M("LIVE_ENVIRONMENT_REQUIRED")
 LIVE_ENVIRONMENT_REQUIRED_FOR_LOCAL_NODE = M(
@@ -409,6 +415,7 @@ NODE_NAMES_DUPLICATION = M("NODE_NAMES_DUPLICATION")
 NODE_NOT_FOUND = M("NODE_NOT_FOUND")
 NODE_RENAME_NAMES_EQUAL = M("NODE_RENAME_NAMES_EQUAL")
 NODE_NOT_IN_CLUSTER = M("NODE_NOT_IN_CLUSTER")
+NODE_PHASE_DURATIONS = M("NODE_PHASE_DURATIONS")
 NODE_REMOVE_IN_PACEMAKER_FAILED = M("NODE_REMOVE_IN_PACEMAKER_FAILED")
 NODE_REMOVE_IN_PACEMAKER_SKIPPED = M("NODE_REMOVE_IN_PACEMAKER_SKIPPED")
 NODE_REPORTS_UNEXPECTED_CLUSTER_NAME = M("NODE_REPORTS_UNEXPECTED_CLUSTER_NAME")
@@ -95,6 +95,16 @@ def _format_booth_default(value: str | None, template: str) -> str:
     return "" if value in ("booth", "", None) else template.format(value)
 
 
+def _format_corosync_conf_position(
+    line_number: int | None, column_number: int | None
+) -> str:
+    if line_number is None:
+        return ""
+    return f" on line {line_number}" + format_optional(
+        column_number, " column {}"
+    )
+
+
 def _key_numeric(item: str) -> tuple[int, str]:
     try:
         return int(item), item
@@ -339,6 +349,66 @@ class DuplicateConstraintsExist(ReportItemMessage):
         return f"Duplicate {constraint} already {exists}"
 
 
+@dataclass(frozen=True)
+class ConstraintImportDuplicate(ReportItemMessage):
+    """
+    A constraint to be imported is a duplicate of existing constraints or of
+    other imported constraints
+
+    constraint_id -- id of the imported constraint
+    duplicate_ids -- ids of constraints duplicate to the imported one
+    """
+
+    constraint_id: str
+    duplicate_ids: list[str]
+    _code = codes.CONSTRAINT_IMPORT_DUPLICATE
+
+    @property
+    def message(self) -> str:
+        return (
+            f"Constraint '{self.constraint_id}' is a duplicate of "
+            f"{format_plural(self.duplicate_ids, 'constraint')} "
+            f"{format_list(self.duplicate_ids)}"
+        )
+
+
+@dataclass(frozen=True)
+class ConstraintImportUnexpectedElement(ReportItemMessage):
+    """
+    Constraints to be imported contain an element which cannot be imported
+
+    element_tag -- tag of the unexpected element
+    expected_tags -- tags of elements allowed in the place
+    """
+
+    element_tag: str
+    expected_tags: list[str]
+    _code = codes.CONSTRAINT_IMPORT_UNEXPECTED_ELEMENT
+
+    @property
+    def message(self) -> str:
+        return (
+            f"Unable to import element '{self.element_tag}', expected "
+            f"{format_list(self.expected_tags)}"
+        )
+
+
+@dataclass(frozen=True)
+class ConstraintImportXmlSyntaxError(ReportItemMessage):
+    """
+    Constraints to be imported are not a valid XML
+
+    reason -- error message of the XML parser
+    """
+
+    reason: str
+    _code = codes.CONSTRAINT_IMPORT_XML_SYNTAX_ERROR
+
+    @property
+    def message(self) -> str:
+        return f"Unable to parse constraints to import: {self.reason}"
+
+
 @dataclass(frozen=True)
 class EmptyResourceSet(ReportItemMessage):
     """
@@ -1636,26 +1706,52 @@ class CorosyncConfigUnsupportedTransport(ReportItemMessage):
 class ParseErrorCorosyncConfMissingClosingBrace(ReportItemMessage):
     """
     Corosync config cannot be parsed due to missing closing brace
+
+    line_number -- the line of the opening brace of an unclosed section
+    column_number -- the column of the opening brace of an unclosed section
     """
 
+    line_number: int | None = None
+    column_number: int | None = None
     _code = codes.PARSE_ERROR_COROSYNC_CONF_MISSING_CLOSING_BRACE
 
     @property
     def message(self) -> str:
-        return "Unable to parse corosync config: missing closing brace"
+        section_position = ""
+        if self.line_number is not None:
+            section_position = (
+                " of a section opened"
+                + _format_corosync_conf_position(
+                    self.line_number, self.column_number
+                )
+            )
+        return (
+            "Unable to parse corosync config: missing closing brace"
+            f"{section_position}"
+        )
 
 
 @dataclass(frozen=True)
 class ParseErrorCorosyncConfUnexpectedClosingBrace(ReportItemMessage):
     """
     Corosync config cannot be parsed due to unexpected closing brace
+
+    line_number -- the line where parsing failed
+    column_number -- the column where parsing failed
     """
 
+    line_number: int | None = None
+    column_number: int | None = None
     _code = codes.PARSE_ERROR_COROSYNC_CONF_UNEXPECTED_CLOSING_BRACE
 
     @property
     def message(self) -> str:
-        return "Unable to parse corosync config: unexpected closing brace"
+        return (
+            "Unable to parse corosync config: unexpected closing brace"
+            + _format_corosync_conf_position(
+                self.line_number, self.column_number
+            )
+        )
 
 
 @dataclass(frozen=True)
@@ -1664,14 +1760,22 @@ class ParseErrorCorosyncConfMissingSectionNameBeforeOpeningBrace(
 ):
     """
     Corosync config cannot be parsed due to a section name missing before {
+
+    line_number -- the line where parsing failed
+    column_number -- the column where parsing failed
     """
 
+    line_number: int | None = None
+    column_number: int | None = None
     _code = codes.PARSE_ERROR_COROSYNC_CONF_MISSING_SECTION_NAME_BEFORE_OPENING_BRACE
 
     @property
     def message(self) -> str:
         return (
             "Unable to parse corosync config: missing a section name before {"
+            + _format_corosync_conf_position(
+                self.line_number, self.column_number
+            )
         )
 
 
@@ -1679,13 +1783,23 @@ class ParseErrorCorosyncConfMissingSectionNameBeforeOpeningBrace(
 class ParseErrorCorosyncConfExtraCharactersAfterOpeningBrace(ReportItemMessage):
     """
     Corosync config cannot be parsed due to extra characters after {
+
+    line_number -- the line where parsing failed
+    column_number -- the column where parsing failed
     """
 
+    line_number: int | None = None
+    column_number: int | None = None
     _code = codes.PARSE_ERROR_COROSYNC_CONF_EXTRA_CHARACTERS_AFTER_OPENING_BRACE
 
     @property
     def message(self) -> str:
-        return "Unable to parse corosync config: extra characters after {"
+        return (
+            "Unable to parse corosync config: extra characters after {"
+            + _format_corosync_conf_position(
+                self.line_number, self.column_number
+            )
+        )
 
 
 @dataclass(frozen=True)
@@ -1694,21 +1808,37 @@ class ParseErrorCorosyncConfExtraCharactersBeforeOrAfterClosingBrace(
 ):
     """
     Corosync config cannot be parsed due to extra characters before or after }
+
+    line_number -- the line where parsing failed
+    column_number -- the column where parsing failed
     """
 
+    line_number: int | None = None
+    column_number: int | None = None
     _code = codes.PARSE_ERROR_COROSYNC_CONF_EXTRA_CHARACTERS_BEFORE_OR_AFTER_CLOSING_BRACE
 
     @property
     def message(self) -> str:
-        return "Unable to parse corosync config: extra characters before or after }"
+        return (
+            "Unable to parse corosync config: extra characters before or "
+            "after }"
+            + _format_corosync_conf_position(
+                self.line_number, self.column_number
+            )
+        )
 
 
 @dataclass(frozen=True)
 class ParseErrorCorosyncConfLineIsNotSectionNorKeyValue(ReportItemMessage):
     """
     Corosync config cannot be parsed due to a line is not a section nor key:val
+
+    line_number -- the line where parsing failed
+    column_number -- the column where parsing failed
     """
 
+    line_number: int | None = None
+    column_number: int | None = None
     _code = codes.PARSE_ERROR_COROSYNC_CONF_LINE_IS_NOT_SECTION_NOR_KEY_VALUE
 
     @property
@@ -1716,6 +1846,9 @@ class ParseErrorCorosyncConfLineIsNotSectionNorKeyValue(ReportItemMessage):
         return (
             "Unable to parse corosync config: a line is not opening or closing "
             "a section or key: value"
+            + _format_corosync_conf_position(
+                self.line_number, self.column_number
+            )
         )
 
 
@@ -5081,6 +5214,27 @@ class CibUpgradeFailedToMinimalRequiredVersion(ReportItemMessage):
         )
 
 
+@dataclass(frozen=True)
+class CibUpgradeInBatchNotPossible(ReportItemMessage):
+    """
+    CIB cannot be upgraded while running a batch of commands, as the CIB has
+    already been modified by previous commands of the batch
+
+    required_version -- required version of CIB schema
+    """
+
+    required_version: str
+    _code = codes.CIB_UPGRADE_IN_BATCH_NOT_POSSIBLE
+
+    @property
+    def message(self) -> str:
+        return (
+            "Unable to upgrade CIB to required schema version"
+            f" {self.required_version} or higher while running a batch of"
+            " commands, run the command separately"
+        )
+
+
 @dataclass(frozen=True)
 class FileAlreadyExists(ReportItemMessage):
     file_type_code: file_type_codes.FileTypeCode
@@ -5991,6 +6145,33 @@ class ClusterSetupSuccess(ReportItemMessage):
         return "Cluster has been successfully set up."
 
 
+@dataclass(frozen=True)
+class NodePhaseDurations(ReportItemMessage):
+    """
+    Node went through communication phases independently of other nodes, this
+    is how long each of the phases took on the node
+
+    node -- node name
+    phase_durations -- durations of the phases in seconds, keys are phase names
+    """
+
+    node: str
+    phase_durations: Mapping[str, float]
+    _code = codes.NODE_PHASE_DURATIONS
+
+    @property
+    def message(self) -> str:
+        durations = ", ".join(
+            f"{phase} {duration:.2f}s"
+            for phase, duration in self.phase_durations.items()
+        )
+        total = sum(self.phase_durations.values())
+        return (
+            f"Phase durations on node '{self.node}': {durations}, "
+            f"total {total:.2f}s"
+        )
+
+
 @dataclass(frozen=True)
 class UsingDefaultAddressForHost(ReportItemMessage):
     """
@@ -7525,6 +7706,32 @@ class BoothConfigAcceptedByNode(ReportItemMessage):
         )
 
 
+@dataclass(frozen=True)
+class BoothConfigUpToDateOnNodes(ReportItemMessage):
+    """
+    Booth config is not sent to specified nodes as they already have it
+
+    node_list -- names of nodes with the same booth config
+    name -- name of booth instance
+    """
+
+    node_list: list[str]
+    name: str = ""
+    _code = codes.BOOTH_CONFIG_UP_TO_DATE_ON_NODES
+
+    @property
+    def message(self) -> str:
+        desc = _format_booth_default(self.name, " '{}'")
+        return (
+            "Booth config{desc} is already up to date on {node} {node_list}, "
+            "skipping"
+        ).format(
+            desc=desc,
+            node=format_plural(self.node_list, "node"),
+            node_list=format_list(self.node_list),
+        )
+
+
 @dataclass(frozen=True)
 class BoothConfigDistributionNodeError(ReportItemMessage):
     """
@@ -8398,6 +8605,22 @@ class CommandInvalidPayload(ReportItemMessage):
         return f"Invalid command payload: {self.reason}"
 
 
+@dataclass(frozen=True)
+class CommandNotAllowedInBatch(ReportItemMessage):
+    """
+    The command cannot be run in a batch of commands
+
+    command -- name of the command
+    """
+
+    command: str
+    _code = codes.COMMAND_NOT_ALLOWED_IN_BATCH
+
+    @property
+    def message(self) -> str:
+        return f"Command '{self.command}' cannot be run in a batch of commands"
+
+
 @dataclass(frozen=True)
 class CommandUnknown(ReportItemMessage):
     command: str
@@ -1,4 +1,5 @@
 import abc
+import logging
 from logging import Logger
 
 from pcs.common.reports.utils import add_context_to_message
@@ -8,6 +9,25 @@ from .item import (
     ReportItemList,
     ReportItemSeverity,
 )
+from .types import SeverityLevel
+
+# Deprecations are presented the same way as warnings, so they have the same
+# rank
+_SEVERITY_RANK = {
+    ReportItemSeverity.DEBUG: 0,
+    ReportItemSeverity.INFO: 1,
+    ReportItemSeverity.DEPRECATION: 2,
+    ReportItemSeverity.WARNING: 2,
+    ReportItemSeverity.ERROR: 3,
+}
+
+_SEVERITY_TO_LOG_LEVEL = {
+    ReportItemSeverity.DEBUG: logging.DEBUG,
+    ReportItemSeverity.INFO: logging.INFO,
+    ReportItemSeverity.DEPRECATION: logging.WARNING,
+    ReportItemSeverity.WARNING: logging.WARNING,
+    ReportItemSeverity.ERROR: logging.ERROR,
+}
 
 
 class ReportProcessor(abc.ABC):
@@ -18,6 +38,28 @@ class ReportProcessor(abc.ABC):
     def has_errors(self) -> bool:
         return self._has_errors
 
+    @property
+    def min_severity_level(self) -> SeverityLevel:
+        """
+        Return the lowest severity of reports which are not dropped
+
+        Reports of lower severities are dropped by the processor, so their
+        producers may skip creating them. This is useful for debug reports
+        which are expensive to create.
+        """
+        return ReportItemSeverity.DEBUG
+
+    def is_severity_reported(self, severity_level: SeverityLevel) -> bool:
+        """
+        Check whether reports of the specified severity are not dropped
+
+        severity_level -- severity of reports to be created
+        """
+        return (
+            _SEVERITY_RANK[severity_level]
+            >= _SEVERITY_RANK[self.min_severity_level]
+        )
+
     def report(self, report_item: ReportItem) -> "ReportProcessor":
         if _is_error(report_item):
             self._has_errors = True
@@ -47,8 +89,22 @@ class ReportProcessorToLog(ReportProcessor):
         super().__init__()
         self._logger = logger
 
+    @property
+    def min_severity_level(self) -> SeverityLevel:
+        for severity_level, log_level in _SEVERITY_TO_LOG_LEVEL.items():
+            if self._logger.isEnabledFor(log_level):
+                return severity_level
+        return ReportItemSeverity.ERROR
+
     def _do_report(self, report_item: ReportItem) -> None:
         severity = report_item.severity.level
+        # Debug messages may be expensive to render, e.g. they may contain the
+        # whole CIB. Do not render them if they are not going to be logged.
+        if (
+            severity == ReportItemSeverity.DEBUG
+            and not self._logger.isEnabledFor(logging.DEBUG)
+        ):
+            return
 
         context_dto = None
         if report_item.context:
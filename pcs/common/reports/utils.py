@@ -17,6 +17,9 @@ _file_role_translation = {
     file_type_codes.PCS_CFGSYNC_CTL: "Config synchronization configuration",
     file_type_codes.PCS_KNOWN_HOSTS: "known-hosts",
     file_type_codes.PCS_SETTINGS_CONF: "pcs configuration",
+    file_type_codes.RESOURCE_AGENT_METADATA_CACHE: (
+        "resource agent metadata cache"
+    ),
 }
 
 
@@ -17,6 +17,7 @@ from pcs.daemon.app.auth_provider import (
 from pcs.daemon.app.common import get_legacy_desired_user_from_request
 from pcs.daemon.async_tasks.scheduler import Scheduler, TaskNotFoundError
 from pcs.daemon.async_tasks.types import Command
+from pcs.daemon.async_tasks.worker.command_mapping import COMMAND_MAP
 from pcs.lib.auth.tools import DesiredUser
 from pcs.lib.auth.types import AuthUser
 
@@ -135,6 +136,8 @@ class _BaseApiV1Handler(BaseHandler):
 
     _real_user: AuthUser
     _desired_user: DesiredUser
+    # ETag is only provided for successful results of read-only commands
+    _result_cacheable: bool = False
 
     def initialize(
         self,
@@ -152,7 +155,7 @@ class _BaseApiV1Handler(BaseHandler):
             raise InvalidInputError() from e
 
     async def prepare(self) -> None:
-        self.add_header("Content-Type", "application/json")
+        self.set_header("Content-Type", "application/json")
 
         # Authentication
         try:
@@ -174,6 +177,15 @@ class _BaseApiV1Handler(BaseHandler):
     ) -> None:
         self.finish(json.dumps(to_dict(response)))
 
+    def compute_etag(self) -> str | None:
+        # Tornado sets ETag of GET responses and replies with 304 Not Modified
+        # if a client sends a matching If-None-Match header. Errors are
+        # returned with HTTP 200 as well and results of commands changing the
+        # cluster are not meant to be cached, so do not provide ETag for them.
+        if not self._result_cacheable:
+            return None
+        return super().compute_etag()
+
     def write_error(self, status_code: int, **kwargs: Any) -> None:
         # Always return HTTP 200 to signal that the request got processed.
         # The actual errors are passed in the JSON structure response.
@@ -263,6 +275,10 @@ class _BaseApiV1Handler(BaseHandler):
             types.TaskFinishType.SUCCESS: communication.const.COM_STATUS_SUCCESS,
             types.TaskFinishType.FAIL: communication.const.COM_STATUS_ERROR,
         }
+        self._result_cacheable = (
+            COMMAND_MAP[command_dto.command_name].read_only
+            and task_result_dto.task_finish_type == types.TaskFinishType.SUCCESS
+        )
         return communication.dto.InternalCommunicationResultDto(
             status=status_map.get(
                 task_result_dto.task_finish_type,
@@ -1,26 +1,37 @@
+import asyncio
 import json
 import logging
 from http.client import responses
 from typing import Any, cast
 
 from dacite import DaciteError, MissingValueError, UnexpectedDataError
+from tornado.iostream import StreamClosedError
 from tornado.web import HTTPError, MissingArgumentError
 
-from pcs.common.async_tasks.dto import CommandDto, TaskIdentDto
+from pcs.common.async_tasks.dto import (
+    CommandBatchDto,
+    CommandDto,
+    TaskIdentDto,
+)
+from pcs.common.async_tasks.types import TaskState
 from pcs.common.interface.dto import (
     DTOTYPE,
     PayloadConversionError,
     from_dict,
     to_dict,
 )
+from pcs.common.pacemaker.cib_watch import CibChangeDto
 from pcs.daemon.app.auth_provider import (
     ApiAuthProviderFactoryInterface,
     ApiAuthProviderInterface,
     NotAuthorizedException,
 )
 from pcs.daemon.async_tasks.scheduler import Scheduler, TaskNotFoundError
-from pcs.daemon.async_tasks.types import Command
+from pcs.daemon.async_tasks.types import BATCH_COMMAND_NAME, Command
+from pcs.daemon.cib_watcher import CibWatcher
 from pcs.lib.auth.types import AuthUser
+from pcs.lib.permissions.checker import PermissionsChecker
+from pcs.lib.permissions.types import PermissionRequiredType
 
 from .common import BaseHandler, RoutesType
 
@@ -186,6 +197,70 @@ class RunTaskHandler(_BaseApiV2Handler):
             raise APIError(http_code=500) from exc
 
 
+class _BaseBatchHandler(_BaseApiV2Handler):
+    """
+    Base handler for running a batch of commands
+
+    Commands of a batch are run one by one in one task with a single CIB load
+    and push. If any of the commands fails, the rest of them is not run and
+    no changes are pushed to the CIB. Task result contains result and reports
+    of each command.
+    """
+
+    def _create_batch_task(self) -> str:
+        if self.json is None:
+            raise RequestBodyMissingError()
+
+        batch_dto = self._from_dict_exc_handled(CommandBatchDto, self.json)
+        if not batch_dto.commands:
+            raise APIError(
+                http_code=400, error_msg="No commands specified in the batch."
+            )
+        # The batch is run as one task, so all the commands are run as the
+        # same user with the same options
+        options = batch_dto.commands[0].options
+        if any(command.options != options for command in batch_dto.commands):
+            raise APIError(
+                http_code=400,
+                error_msg="All commands in the batch must have the same "
+                "options.",
+            )
+        return self.scheduler.new_task(
+            Command(
+                CommandDto(BATCH_COMMAND_NAME, to_dict(batch_dto), options),
+                is_batch=True,
+            ),
+            self._auth_user,
+        )
+
+
+class NewBatchTaskHandler(_BaseBatchHandler):
+    """Create a new task from a batch of commands"""
+
+    async def post(self) -> None:
+        task_ident = self._create_batch_task()
+        self.write(json.dumps(to_dict(TaskIdentDto(task_ident))))
+
+
+class RunBatchTaskHandler(_BaseBatchHandler):
+    """Run a batch of commands synchronously"""
+
+    async def post(self) -> None:
+        task_ident = self._create_batch_task()
+        try:
+            self.write(
+                json.dumps(
+                    to_dict(
+                        await self.scheduler.wait_for_task(
+                            task_ident, self._auth_user
+                        )
+                    )
+                )
+            )
+        except TaskNotFoundError as exc:
+            raise APIError(http_code=500) from exc
+
+
 class TaskInfoHandler(_BaseApiV2Handler):
     """Get task status"""
 
@@ -213,6 +288,70 @@ class TaskInfoHandler(_BaseApiV2Handler):
             ) from exc
 
 
+class TaskProgressHandler(_BaseApiV2Handler):
+    """
+    Stream task progress
+
+    Each line of the response is a JSON object describing the task state and
+    reports produced by the task since the previous line. The last line
+    contains the task result. Clients may resume streaming by specifying the
+    number of reports they have already received.
+    """
+
+    async def get(self) -> None:
+        try:
+            task_ident = cast(str, self.get_query_argument("task_ident"))
+            report_offset_str = self.get_query_argument("report_offset", "0")
+        except MissingArgumentError as exc:
+            raise APIError(
+                http_code=400,
+                error_msg=f'URL argument "{exc.arg_name}" is missing.',
+            ) from exc
+        try:
+            report_offset = int(cast(str, report_offset_str))
+        except ValueError:
+            report_offset = -1
+        if report_offset < 0:
+            raise APIError(
+                http_code=400,
+                error_msg=(
+                    'URL argument "report_offset" must be a non-negative '
+                    "integer."
+                ),
+            )
+        try:
+            progress = self.scheduler.get_task_progress(
+                task_ident, self._auth_user, report_offset
+            )
+        except TaskNotFoundError as exc:
+            raise APIError(
+                http_code=404,
+                error_msg="Task with this identifier does not exist.",
+            ) from exc
+
+        self.set_header("Content-Type", "application/x-ndjson")
+        try:
+            while True:
+                self.write(json.dumps(to_dict(progress)) + "\n")
+                await self.flush()
+                if progress.state == TaskState.FINISHED:
+                    break
+                progress = await self.scheduler.wait_for_task_progress(
+                    task_ident,
+                    self._auth_user,
+                    progress.report_offset + len(progress.reports),
+                    progress.state,
+                )
+        except StreamClosedError:
+            # the client disconnected, it may resume streaming later
+            return
+        except TaskNotFoundError:
+            # The task has been deleted in the meantime. The response has
+            # already been started, so no error can be reported.
+            pass
+        self.finish()
+
+
 class KillTaskHandler(_BaseApiV2Handler):
     """Stop execution of a task"""
 
@@ -232,13 +371,89 @@ class KillTaskHandler(_BaseApiV2Handler):
         self.finish()
 
 
+class CibChangesHandler(_BaseApiV2Handler):
+    """
+    Stream CIB changes
+
+    Each line of the response is a JSON object describing the current CIB
+    version and its generation. A new line is sent whenever the CIB version
+    changes. Clients may resume streaming by specifying the generation they
+    have already received.
+    """
+
+    cib_watcher: CibWatcher | None
+    _wait_task: asyncio.Future[CibChangeDto] | None
+    _connection_closed: bool
+
+    def initialize(  # type: ignore[override]
+        self,
+        scheduler: Scheduler,
+        api_auth_provider_factory: ApiAuthProviderFactoryInterface,
+        cib_watcher: CibWatcher | None,
+    ) -> None:
+        super().initialize(scheduler, api_auth_provider_factory)
+        self.cib_watcher = cib_watcher
+        self._wait_task = None
+        self._connection_closed = False
+
+    def on_connection_close(self) -> None:
+        # Do not wait for the next CIB change, which may take long, to find
+        # out the client has disconnected
+        self._connection_closed = True
+        if self._wait_task is not None:
+            self._wait_task.cancel()
+
+    async def get(self) -> None:
+        if not PermissionsChecker(self.logger).is_authorized(
+            self._auth_user, PermissionRequiredType.READ
+        ):
+            raise APIError(http_code=403)
+        if self.cib_watcher is None:
+            raise APIError(
+                http_code=404,
+                error_msg="Tracking of CIB changes is disabled in pcsd.",
+            )
+        try:
+            generation = int(
+                cast(str, self.get_query_argument("generation", "-1"))
+            )
+        except ValueError as exc:
+            raise APIError(
+                http_code=400,
+                error_msg='URL argument "generation" must be an integer.',
+            ) from exc
+
+        self.set_header("Content-Type", "application/x-ndjson")
+        try:
+            while not self._connection_closed:
+                self._wait_task = asyncio.ensure_future(
+                    self.cib_watcher.wait_for_change(generation)
+                )
+                try:
+                    change = await self._wait_task
+                except asyncio.CancelledError:
+                    if self._connection_closed:
+                        break
+                    raise
+                self.write(json.dumps(to_dict(change)) + "\n")
+                await self.flush()
+                generation = change.generation
+        except StreamClosedError:
+            # the client disconnected, it may resume streaming later
+            pass
+        finally:
+            self._wait_task = None
+
+
 def get_routes(
     api_auth_provider_factory: ApiAuthProviderFactoryInterface,
     scheduler: Scheduler,
+    cib_watcher: CibWatcher | None = None,
 ) -> RoutesType:
     """
     Returns mapping of URL routes to functions and links API to the scheduler
     :param scheduler: Scheduler's instance
+    :param cib_watcher: Tracker of CIB changes, None if disabled
     :return: URL to handler mapping
     """
     params = dict(
@@ -249,4 +464,12 @@ def get_routes(
         ("/api/v2/task/create", NewTaskHandler, params),
         ("/api/v2/task/kill", KillTaskHandler, params),
         ("/api/v2/task/run", RunTaskHandler, params),
+        ("/api/v2/task/progress", TaskProgressHandler, params),
+        ("/api/v2/task/batch/create", NewBatchTaskHandler, params),
+        ("/api/v2/task/batch/run", RunBatchTaskHandler, params),
+        (
+            "/api/v2/cib/changes",
+            CibChangesHandler,
+            dict(params, cib_watcher=cib_watcher),
+        ),
     ]
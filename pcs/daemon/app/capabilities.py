@@ -63,7 +63,7 @@ class CapabilitiesHandler(BaseHandler):
             raise HTTPError(401) from e
 
     async def get(self) -> None:
-        self.add_header("Content-Type", "application/json")
+        self.set_header("Content-Type", "application/json")
         self.write(_capabilities_to_str(self._capabilities))
 
 
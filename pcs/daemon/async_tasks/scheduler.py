@@ -1,14 +1,21 @@
+import asyncio
+import json
 import multiprocessing as mp
 import sys
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from logging import handlers
 from multiprocessing.pool import worker as mp_worker_init  # type: ignore
 from queue import Empty
 
 from pcs import settings
-from pcs.common.async_tasks.dto import TaskResultDto
-from pcs.common.async_tasks.types import TaskKillReason
+from pcs.common.async_tasks.dto import TaskProgressDto, TaskResultDto
+from pcs.common.async_tasks.types import (
+    TaskFinishType,
+    TaskKillReason,
+)
+from pcs.common.interface.dto import to_dict
 from pcs.common.tools import get_unique_uuid
 from pcs.daemon.async_tasks.types import Command
 from pcs.daemon.log import pcsd as pcsd_logger
@@ -20,11 +27,16 @@ from .task import (
     TaskState,
     UnknownMessageError,
 )
+from .worker.command_mapping import COMMAND_MAP
 from .worker.executor import (
+    in_process_task_executor,
     task_executor,
     worker_init,
 )
-from .worker.types import Message
+from .worker.types import ExecutionClass, Message
+
+# command, its parameters and options, legacy flag, user name and groups
+_CoalescingKey = tuple[str, bool, str, tuple[str, ...]]
 
 
 class TaskNotFoundError(Exception):
@@ -45,6 +57,8 @@ class SchedulerConfig:
     )
     worker_reset_limit: int = settings.pcsd_worker_reset_limit
     deadlock_threshold_timeout: int = settings.pcsd_deadlock_threshold_timeout
+    coalescing_ttl: int = settings.task_coalescing_ttl_seconds
+    in_process_worker_count: int = settings.pcsd_in_process_worker_count
     task_config: TaskConfig = TaskConfig()
 
 
@@ -74,7 +88,18 @@ class Scheduler:
             initializer=worker_init,
             initargs=[self._worker_message_q, self._logging_q],
         )
+        # Threads for running lightweight commands in the scheduler's process
+        self._thread_pool = ThreadPoolExecutor(
+            max_workers=self._config.in_process_worker_count,
+            thread_name_prefix="pcsd-task",
+        )
         self._task_register: dict[str, Task] = {}
+        # Tasks running read-only commands, identical new tasks get their
+        # result instead of being executed
+        self._coalescing_register: dict[_CoalescingKey, Task] = {}
+        # Tasks waiting for a result of a task from the coalescing register,
+        # task_ident: key in the coalescing register
+        self._coalescing_followers: dict[str, _CoalescingKey] = {}
         self._logger.info("Scheduler was successfully initialized.")
         self._logger.debug(
             "Scheduler initialized with config: %s", self._config
@@ -113,6 +138,39 @@ class Scheduler:
         task.request_deletion()
         return task.to_dto()
 
+    def get_task_progress(
+        self, task_ident: str, auth_user: AuthUser, report_offset: int
+    ) -> TaskProgressDto:
+        """
+        Fetches task state and reports not yet known to the client
+
+        :param report_offset: Number of reports already known to the client
+        """
+        task = self._return_task(task_ident)
+        self._check_user(task, auth_user)
+        if task.state == TaskState.FINISHED:
+            task.request_deletion()
+        return task.to_progress_dto(report_offset)
+
+    async def wait_for_task_progress(
+        self,
+        task_ident: str,
+        auth_user: AuthUser,
+        report_offset: int,
+        state: TaskState,
+    ) -> TaskProgressDto:
+        """
+        Waits until the task makes progress and fetches its state and reports
+        not yet known to the client
+
+        :param report_offset: Number of reports already known to the client
+        :param state: Task state already known to the client
+        """
+        task = self._return_task(task_ident)
+        self._check_user(task, auth_user)
+        await task.wait_for_progress(report_offset, state)
+        return self.get_task_progress(task_ident, auth_user, report_offset)
+
     def kill_task(self, task_ident: str, auth_user: AuthUser) -> None:
         """
         Terminates the specified task
@@ -134,9 +192,8 @@ class Scheduler:
         """
         task_ident = get_unique_uuid(tuple(self._task_register.keys()))
 
-        self._task_register[task_ident] = Task(
-            task_ident, command, auth_user, self._config.task_config
-        )
+        task = Task(task_ident, command, auth_user, self._config.task_config)
+        self._task_register[task_ident] = task
         self._logger.debug(
             (
                 "New task %s created (command: %s, parameters: %s, "
@@ -147,12 +204,118 @@ class Scheduler:
             command.command_dto.params,
             command.is_legacy_command,
         )
+        self._coalesce_task(task)
+        if task.state == TaskState.CREATED and self._is_run_in_process(task):
+            # Do not wait for the next scheduler pass, lightweight tasks are
+            # expected to be done as soon as possible
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                # not running in the event loop, the task is scheduled during
+                # the next scheduler pass
+                pass
+            else:
+                self._schedule_task(task)
         return task_ident
 
+    @staticmethod
+    def _get_coalescing_key(task: Task) -> _CoalescingKey | None:
+        """
+        Get a key identifying tasks which are guaranteed to have the same
+        result, return None for tasks which must always be executed
+        """
+        command_dto = task.command.command_dto
+        command = COMMAND_MAP.get(command_dto.command_name)
+        if command is None or not command.read_only:
+            return None
+        try:
+            command_payload = json.dumps(to_dict(command_dto), sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+        # Commands are run with permissions of the user and their groups, so
+        # tasks of different users cannot share results
+        return (
+            command_payload,
+            task.command.is_legacy_command,
+            task.auth_user.username,
+            tuple(sorted(task.auth_user.groups)),
+        )
+
+    def _can_share_result(self, leader: Task) -> bool:
+        """
+        Check that a result of a task may be provided to identical tasks
+        """
+        if leader.is_kill_requested():
+            return False
+        if leader.state != TaskState.FINISHED:
+            return True
+        # Killed tasks have no result. Do not keep failures, they may be caused
+        # by temporary issues and should be reported only to tasks that waited
+        # for them.
+        return (
+            leader.task_finish_type == TaskFinishType.SUCCESS
+            and leader.is_finished_within(self._config.coalescing_ttl)
+        )
+
+    def _coalesce_task(self, task: Task) -> None:
+        """
+        Attach a new task to a running identical task or register it as a
+        task other identical tasks can attach to
+        """
+        key = self._get_coalescing_key(task)
+        if key is None:
+            return
+        leader = self._coalescing_register.get(key)
+        if leader is None or not self._can_share_result(leader):
+            self._coalescing_register[key] = task
+            return
+        self._logger.debug(
+            "Task %s shares result of an identical task %s",
+            task.task_ident,
+            leader.task_ident,
+        )
+        if leader.state == TaskState.FINISHED:
+            task.finish_with_result_of(leader)
+        else:
+            self._coalescing_followers[task.task_ident] = key
+
+    def _resolve_coalesced_tasks(self) -> None:
+        """
+        Finish tasks whose identical task has finished and schedule tasks
+        whose identical task has been killed
+        """
+        for task_ident, key in list(self._coalescing_followers.items()):
+            task = self._task_register.get(task_ident)
+            leader = self._coalescing_register.get(key)
+            if task is None or task.state != TaskState.CREATED:
+                del self._coalescing_followers[task_ident]
+            elif leader is None or leader.is_kill_requested():
+                # Let the task run on its own, it becomes a new task for the
+                # rest of identical tasks to attach to
+                del self._coalescing_followers[task_ident]
+                self._coalescing_register.pop(key, None)
+                self._coalesce_task(task)
+            elif leader.state == TaskState.FINISHED:
+                del self._coalescing_followers[task_ident]
+                task.finish_with_result_of(leader)
+        for key, leader in list(self._coalescing_register.items()):
+            if (
+                leader.state == TaskState.FINISHED
+                and key not in self._coalescing_followers.values()
+                and not self._can_share_result(leader)
+            ):
+                del self._coalescing_register[key]
+
     def _is_possibly_dead_locked(self) -> bool:
         counter: dict[TaskState, list[Task]] = defaultdict(list)
         for task in self._task_register.values():
-            counter[task.state].append(task)
+            # Tasks waiting for another task and tasks running in the
+            # scheduler's process do not occupy any worker
+            if (
+                task.task_ident not in self._coalescing_followers
+                and not task.is_executed_in_process
+            ):
+                counter[task.state].append(task)
 
         return (
             len(counter[TaskState.CREATED]) + len(counter[TaskState.QUEUED]) > 0
@@ -170,6 +333,11 @@ class Scheduler:
             # collection, we only prevent tasks here from queuing if
             # they are killed in CREATED state
             return
+        if task.task_ident in self._coalescing_followers:
+            return
+        if self._is_run_in_process(task):
+            self._execute_task_in_process(task)
+            return
         try:
             self._proc_pool.apply_async(
                 func=task_executor,
@@ -183,7 +351,53 @@ class Scheduler:
             sys.exit(1)
         task.state = TaskState.QUEUED
 
+    @staticmethod
+    def _is_run_in_process(task: Task) -> bool:
+        command = COMMAND_MAP.get(task.command.command_dto.command_name)
+        return (
+            command is not None
+            and command.execution_class == ExecutionClass.IN_PROCESS
+        )
+
+    def _execute_task_in_process(self, task: Task) -> None:
+        """
+        Run a task in a thread of the scheduler's process
+
+        Lightweight tasks avoid overhead of the worker pool. Their messages are
+        delivered directly to the task once it finishes, so that they do not
+        wait for the next scheduler pass.
+        """
+        loop = asyncio.get_running_loop()
+        task.mark_executed_in_process()
+        future = self._thread_pool.submit(
+            in_process_task_executor, task.to_worker_command(), self._logger
+        )
+        future.add_done_callback(
+            lambda future: loop.call_soon_threadsafe(
+                self._finish_in_process_task, task, future
+            )
+        )
+
+    def _finish_in_process_task(
+        self, task: Task, future: "Future[list[Message]]"
+    ) -> None:
+        if task.state == TaskState.FINISHED:
+            # the task has been killed while running, drop its result
+            return
+        try:
+            messages = future.result()
+        except Exception:  # pylint: disable=broad-except
+            self._logger.exception(
+                "Task %s running in the scheduler's process failed.",
+                task.task_ident,
+            )
+            task.request_kill(TaskKillReason.INTERNAL_MESSAGING_ERROR)
+            return
+        for message in messages:
+            task.receive_message(message)
+
     async def _process_tasks(self) -> None:
+        self._resolve_coalesced_tasks()
         for task in list(self._task_register.values()):
             await self._process_task(task)
 
@@ -310,4 +524,5 @@ class Scheduler:
         """
         self._worker_log_listener.stop()
         self._proc_pool.terminate()
+        self._thread_pool.shutdown(wait=False, cancel_futures=True)
         self._logger.info("Scheduler is correctly terminated.")
@@ -3,11 +3,12 @@ import os
 import signal
 from asyncio import Event
 from collections.abc import Awaitable
+from contextlib import suppress
 from dataclasses import dataclass
 from typing import Any
 
 from pcs import settings
-from pcs.common.async_tasks.dto import TaskResultDto
+from pcs.common.async_tasks.dto import TaskProgressDto, TaskResultDto
 from pcs.common.async_tasks.types import (
     TaskFinishType,
     TaskKillReason,
@@ -49,6 +50,8 @@ class TaskConfig:
     abandoned_timeout: int = settings.task_abandoned_timeout_seconds
     unresponsive_timeout: int = settings.task_unresponsive_timeout_seconds
     deletion_timeout: int = settings.task_deletion_timeout_seconds
+    # directory for storing profiles of tasks, profiling is disabled if None
+    profile_dir: str | None = None
 
 
 class Task(ImplementsToDto):
@@ -76,7 +79,10 @@ class Task(ImplementsToDto):
         self._last_message_at: datetime.datetime | None = None
         self._execution_started_at: datetime.datetime | None = None
         self._worker_pid: int = -1
+        self._is_executed_in_process = False
         self._finished_event = Event()
+        # replaced by a new event each time the task makes progress
+        self._progress_event = Event()
         self._to_delete_timestamp: datetime.datetime | None = None
 
     @property
@@ -102,6 +108,7 @@ class Task(ImplementsToDto):
         except ValueError as e:
             raise AssertionError(f"Invalid Task state: {state}") from e
         self._state = state
+        self._notify_progress()
         if self.state == TaskState.FINISHED:
             self._finished_event.set()
         elif self.state == TaskState.EXECUTED:
@@ -115,9 +122,69 @@ class Task(ImplementsToDto):
     def auth_user(self) -> AuthUser:
         return self._auth_user
 
+    @property
+    def command(self) -> Command:
+        return self._command
+
+    @property
+    def task_finish_type(self) -> TaskFinishType:
+        return self._task_finish_type
+
+    def is_finished_within(self, timeout_s: int) -> bool:
+        """
+        Checks that the task finished less than timeout ago
+        :param timeout_s: Timeout in seconds
+        """
+        if self.state != TaskState.FINISHED:
+            return False
+        # Last message of finished task is notification of its completion
+        # and thus marks the time of its completion
+        return timeout_s > 0 and not self._is_timed_out(timeout_s)
+
+    @property
+    def is_executed_in_process(self) -> bool:
+        return self._is_executed_in_process
+
+    def mark_executed_in_process(self) -> None:
+        """
+        Marks the task as executed in the scheduler's process instead of by
+        a worker process
+        """
+        self._is_executed_in_process = True
+        self._set_state(TaskState.EXECUTED)
+
+    def finish_with_result_of(self, task: "Task") -> None:
+        """
+        Finishes the task with the outcome of another finished task
+
+        This is used for tasks which have not been executed themselves, because
+        an identical task has been run instead of them.
+        :param task: Finished task to take reports and result from
+        """
+        self._reports = list(task._reports)  # noqa: SLF001
+        self._result = task._result  # noqa: SLF001
+        self._task_finish_type = task.task_finish_type
+        self._set_state(TaskState.FINISHED)
+
     def wait_until_finished(self) -> Awaitable[Any]:
         return self._finished_event.wait()
 
+    async def wait_for_progress(
+        self, report_offset: int, state: TaskState
+    ) -> None:
+        """
+        Waits until the task has more reports than report_offset or its state
+        is different from the specified state
+        :param report_offset: Number of reports already known to the caller
+        :param state: Task state known to the caller
+        """
+        while len(self._reports) <= report_offset and self._state == state:
+            await self._progress_event.wait()
+
+    def _notify_progress(self) -> None:
+        self._progress_event.set()
+        self._progress_event = Event()
+
     def _get_last_updated_timestamp(self) -> datetime.datetime | None:
         """
         Helper function for getting timestamp of the last message received
@@ -223,14 +290,22 @@ class Task(ImplementsToDto):
         CREATED tasks are already prevented from being scheduled by requesting
         to kill them, only their state gets corrected here.
         EXECUTED tasks are terminated by by sending SIGTERM to their worker
-        process and their state is changed here.
+        process and their state is changed here. The worker cancels the running
+        command, which then stops waiting for remote nodes and terminates its
+        child processes. SIGCONT is sent as well, so that a worker which has
+        paused itself after finishing the task handles SIGTERM right away.
+        Tasks executed in the scheduler's process cannot be terminated, they
+        are only marked as killed and their result is dropped once they finish.
         """
         if self.state in (
             TaskState.QUEUED,
             TaskState.FINISHED,
         ):
             return
-        if self.state == TaskState.EXECUTED:
+        if (
+            self.state == TaskState.EXECUTED
+            and not self._is_executed_in_process
+        ):
             try:
                 os.kill(self._worker_pid, signal.SIGTERM)
             except ProcessLookupError:
@@ -238,6 +313,8 @@ class Task(ImplementsToDto):
                 # finished even in the time since task state was checked. Since
                 # the killing wasn't successful, don't change the state
                 return
+            with suppress(ProcessLookupError):
+                os.kill(self._worker_pid, signal.SIGCONT)
 
         self._set_state(TaskState.FINISHED)
         self._task_finish_type = TaskFinishType.KILL
@@ -269,16 +346,22 @@ class Task(ImplementsToDto):
         """
         Handler for scheduler's TaskFinished messages
         """
+        if self.state == TaskState.FINISHED:
+            # The task has been killed, its worker has already been resumed
+            # and exits on its own. Keep the task's kill finish type.
+            return
         self._result = message_payload.result
         self._set_state(TaskState.FINISHED)
         self._task_finish_type = message_payload.task_finish_type
-        os.kill(self._worker_pid, signal.SIGCONT)
+        if not self._is_executed_in_process:
+            os.kill(self._worker_pid, signal.SIGCONT)
 
     def _store_reports(self, message_payload: ReportItemDto) -> None:
         """
         Handler for PCS reports
         """
         self._reports.append(message_payload)
+        self._notify_progress()
 
     # Type conversions
     def to_worker_command(self) -> WorkerCommand:
@@ -286,7 +369,30 @@ class Task(ImplementsToDto):
         Creates structure for sending task to a worker process
         :return: Instance with task identifier, command and parameters
         """
-        return WorkerCommand(self._task_ident, self._command, self._auth_user)
+        return WorkerCommand(
+            self._task_ident,
+            self._command,
+            self._auth_user,
+            profile_dir=self._config.profile_dir,
+        )
+
+    def to_progress_dto(self, report_offset: int) -> TaskProgressDto:
+        """
+        Prepares response for task progress query
+        :param report_offset: Number of reports not to be included in the
+            response, as they are already known to the client
+        :return: DTO object with the task state, its new reports and result
+        """
+        report_offset = min(max(report_offset, 0), len(self._reports))
+        return TaskProgressDto(
+            self._task_ident,
+            self.state,
+            self._task_finish_type,
+            self._kill_reason,
+            report_offset,
+            self._reports[report_offset:],
+            self._result,
+        )
 
     def to_dto(self) -> TaskResultDto:
         """
@@ -7,3 +7,8 @@ from pcs.common.async_tasks.dto import CommandDto
 class Command:
     command_dto: CommandDto
     is_legacy_command: bool = False
+    # command_dto params contain a list of commands to be run in one batch
+    is_batch: bool = False
+
+
+BATCH_COMMAND_NAME = "batch"
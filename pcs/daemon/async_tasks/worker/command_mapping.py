@@ -30,89 +30,117 @@ from pcs.lib.commands import (
 )
 from pcs.lib.permissions.types import PermissionRequiredType as p
 
+from .types import ExecutionClass
+
 
 @dataclass(frozen=True)
 class _Cmd:
     cmd: Callable[..., Any]
     required_permission: p
+    # The command only reads data. Identical requests running at the same time
+    # may be served by one run of the command.
+    read_only: bool = False
+    execution_class: ExecutionClass = ExecutionClass.WORKER
+    # The command only works with CIB, so it can be run in a batch of commands
+    # sharing one CIB load and push.
+    allowed_in_batch: bool = False
 
 
 COMMAND_MAP: Mapping[str, _Cmd] = {
     "acl.add_permission": _Cmd(
         cmd=acl.add_permission,
         required_permission=p.GRANT,
+        allowed_in_batch=True,
     ),
     "acl.assign_role_to_group": _Cmd(
         cmd=acl.assign_role_to_group,
         required_permission=p.GRANT,
+        allowed_in_batch=True,
     ),
     "acl.assign_role_to_target": _Cmd(
         cmd=acl.assign_role_to_target,
         required_permission=p.GRANT,
+        allowed_in_batch=True,
     ),
     "acl.create_group": _Cmd(
         cmd=acl.create_group,
         required_permission=p.GRANT,
+        allowed_in_batch=True,
     ),
     "acl.create_role": _Cmd(
         cmd=acl.create_role,
         required_permission=p.GRANT,
+        allowed_in_batch=True,
     ),
     "acl.create_target": _Cmd(
         cmd=acl.create_target,
         required_permission=p.GRANT,
+        allowed_in_batch=True,
     ),
     "acl.remove_group": _Cmd(
         cmd=acl.remove_group,
         required_permission=p.GRANT,
+        allowed_in_batch=True,
     ),
     "acl.remove_permission": _Cmd(
         cmd=acl.remove_permission,
         required_permission=p.GRANT,
+        allowed_in_batch=True,
     ),
     "acl.remove_role": _Cmd(
         cmd=acl.remove_role,
         required_permission=p.GRANT,
+        allowed_in_batch=True,
     ),
     "acl.remove_target": _Cmd(
         cmd=acl.remove_target,
         required_permission=p.GRANT,
+        allowed_in_batch=True,
     ),
     "acl.unassign_role_from_group": _Cmd(
         cmd=acl.unassign_role_from_group,
         required_permission=p.GRANT,
+        allowed_in_batch=True,
     ),
     "acl.unassign_role_from_target": _Cmd(
         cmd=acl.unassign_role_from_target,
         required_permission=p.GRANT,
+        allowed_in_batch=True,
     ),
     "alert.add_recipient": _Cmd(
         cmd=alert.add_recipient,
         required_permission=p.WRITE,
+        allowed_in_batch=True,
     ),
     "alert.create_alert": _Cmd(
         cmd=alert.create_alert,
         required_permission=p.WRITE,
+        allowed_in_batch=True,
     ),
     "alert.get_config_dto": _Cmd(
         cmd=alert.get_config_dto,
         required_permission=p.READ,
+        read_only=True,
     ),
     "alert.remove_alert": _Cmd(
         cmd=alert.remove_alert,
         required_permission=p.WRITE,
+        allowed_in_batch=True,
     ),
     "alert.remove_recipient": _Cmd(
         cmd=alert.remove_recipient,
         required_permission=p.WRITE,
+        allowed_in_batch=True,
     ),
     "alert.update_alert": _Cmd(
         cmd=alert.update_alert,
         required_permission=p.WRITE,
+        allowed_in_batch=True,
     ),
     "alert.update_recipient": _Cmd(
         cmd=alert.update_recipient,
         required_permission=p.WRITE,
+        allowed_in_batch=True,
     ),
     "auth.auth_hosts": _Cmd(
         cmd=auth.auth_hosts,
@@ -153,6 +181,7 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "cluster.get_corosync_conf_struct": _Cmd(
         cmd=cluster.get_corosync_conf_struct,
         required_permission=p.READ,
+        read_only=True,
     ),
     "cluster.get_host_daemons_info": _Cmd(
         cmd=cluster.get_host_daemons_info,
@@ -161,10 +190,12 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "cluster.get_permissions": _Cmd(
         cmd=cluster.get_permissions,
         required_permission=p.GRANT,
+        execution_class=ExecutionClass.IN_PROCESS,
     ),
     "cluster.get_permissions_metadata": _Cmd(
         cmd=cluster.get_permissions_metadata,
         required_permission=p.GRANT,
+        execution_class=ExecutionClass.IN_PROCESS,
     ),
     "cluster.node_clear": _Cmd(
         cmd=cluster.node_clear,
@@ -201,10 +232,12 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "cluster_property.get_properties": _Cmd(
         cmd=cluster_property.get_properties,
         required_permission=p.READ,
+        read_only=True,
     ),
     "cluster_property.get_properties_metadata": _Cmd(
         cmd=cluster_property.get_properties_metadata,
         required_permission=p.READ,
+        read_only=True,
     ),
     "cluster_property.set_properties": _Cmd(
         cmd=cluster_property.set_properties,
@@ -221,10 +254,12 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "cib.element_description_get": _Cmd(
         cmd=cib.element_description_get,
         required_permission=p.READ,
+        read_only=True,
     ),
     "cib.element_description_set": _Cmd(
         cmd=cib.element_description_set,
         required_permission=p.WRITE,
+        allowed_in_batch=True,
     ),
     "cib.remove_elements": _Cmd(
         cmd=cib.remove_elements,
@@ -233,10 +268,12 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "cib_options.operation_defaults_config": _Cmd(
         cmd=cib_options.operation_defaults_config,
         required_permission=p.READ,
+        read_only=True,
     ),
     "cib_options.resource_defaults_config": _Cmd(
         cmd=cib_options.resource_defaults_config,
         required_permission=p.READ,
+        read_only=True,
     ),
     "constraint.colocation.create_with_set": _Cmd(
         cmd=constraint.colocation.create_with_set,
@@ -265,22 +302,32 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "constraint.get_config": _Cmd(
         cmd=constraint.common.get_config,
         required_permission=p.READ,
+        read_only=True,
+    ),
+    "constraint.import_constraints": _Cmd(
+        cmd=constraint.common.import_constraints,
+        required_permission=p.WRITE,
+        allowed_in_batch=True,
     ),
     "fencing_topology.add_level": _Cmd(
         cmd=fencing_topology.add_level,
         required_permission=p.WRITE,
+        allowed_in_batch=True,
     ),
     "fencing_topology.get_config_dto": _Cmd(
         cmd=fencing_topology.get_config_dto,
         required_permission=p.READ,
+        read_only=True,
     ),
     "fencing_topology.remove_all_levels": _Cmd(
         cmd=fencing_topology.remove_all_levels,
         required_permission=p.WRITE,
+        allowed_in_batch=True,
     ),
     "fencing_topology.remove_levels_by_params": _Cmd(
         cmd=fencing_topology.remove_levels_by_params,
         required_permission=p.WRITE,
+        allowed_in_batch=True,
     ),
     "fencing_topology.verify": _Cmd(
         cmd=fencing_topology.verify,
@@ -302,6 +349,11 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
         # the original handler in ruby
         required_permission=p.NONE,
     ),
+    "node.get_config_dto": _Cmd(
+        cmd=node.get_config_dto,
+        required_permission=p.READ,
+        read_only=True,
+    ),
     "node.maintenance_unmaintenance_all": _Cmd(
         cmd=node.maintenance_unmaintenance_all,
         required_permission=p.WRITE,
@@ -310,6 +362,14 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
         cmd=node.maintenance_unmaintenance_list,
         required_permission=p.WRITE,
     ),
+    "node.set_nodes_attributes": _Cmd(
+        cmd=node.set_nodes_attributes,
+        required_permission=p.WRITE,
+    ),
+    "node.set_nodes_utilization": _Cmd(
+        cmd=node.set_nodes_utilization,
+        required_permission=p.WRITE,
+    ),
     "node.standby_unstandby_all": _Cmd(
         cmd=node.standby_unstandby_all,
         required_permission=p.WRITE,
@@ -321,6 +381,7 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "pcs_cfgsync.get_configs": _Cmd(
         cmd=pcs_cfgsync.get_configs,
         required_permission=p.FULL,
+        execution_class=ExecutionClass.IN_PROCESS,
     ),
     "pcs_cfgsync.set_configs": _Cmd(
         cmd=pcs_cfgsync.set_configs,
@@ -366,6 +427,7 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "qdevice.qdevice_net_get_ca_certificate": _Cmd(
         cmd=qdevice.qdevice_net_get_ca_certificate,
         required_permission=p.READ,
+        execution_class=ExecutionClass.IN_PROCESS,
     ),
     "qdevice.qdevice_net_sign_certificate_request": _Cmd(
         cmd=qdevice.qdevice_net_sign_certificate_request,
@@ -375,38 +437,50 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "resource_agent.describe_agent": _Cmd(
         cmd=resource_agent.describe_agent,
         required_permission=p.READ,
+        read_only=True,
     ),
     "resource_agent.get_agents_list": _Cmd(
         cmd=resource_agent.get_agents_list,
         required_permission=p.READ,
+        read_only=True,
     ),
     "resource_agent.get_agent_metadata": _Cmd(
         cmd=resource_agent.get_agent_metadata,
         required_permission=p.READ,
+        read_only=True,
     ),
     "resource_agent.get_meta_attributes_metadata": _Cmd(
         cmd=resource_agent.get_meta_attributes_metadata,
         required_permission=p.READ,
+        read_only=True,
     ),
     # deprecated, API v1 compatibility
     "resource_agent.list_agents": _Cmd(
         cmd=resource_agent.list_agents,
         required_permission=p.READ,
+        read_only=True,
     ),
     # deprecated, API v1 compatibility
     "resource_agent.list_agents_for_standard_and_provider": _Cmd(
         cmd=resource_agent.list_agents_for_standard_and_provider,
         required_permission=p.READ,
+        read_only=True,
     ),
     # deprecated, API v1 compatibility
     "resource_agent.list_ocf_providers": _Cmd(
         cmd=resource_agent.list_ocf_providers,
         required_permission=p.READ,
+        read_only=True,
     ),
     # deprecated, API v1 compatibility
     "resource_agent.list_standards": _Cmd(
         cmd=resource_agent.list_standards,
         required_permission=p.READ,
+        read_only=True,
+    ),
+    "resource_agent.refresh_metadata_cache": _Cmd(
+        cmd=resource_agent.refresh_metadata_cache,
+        required_permission=p.WRITE,
     ),
     "resource.ban": _Cmd(
         cmd=resource.ban,
@@ -415,18 +489,22 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "resource.create": _Cmd(
         cmd=resource.create,
         required_permission=p.WRITE,
+        allowed_in_batch=True,
     ),
     "resource.create_as_clone": _Cmd(
         cmd=resource.create_as_clone,
         required_permission=p.WRITE,
+        allowed_in_batch=True,
     ),
     "resource.create_in_group": _Cmd(
         cmd=resource.create_in_group,
         required_permission=p.WRITE,
+        allowed_in_batch=True,
     ),
     "resource.disable": _Cmd(
         cmd=resource.disable,
         required_permission=p.WRITE,
+        allowed_in_batch=True,
     ),
     "resource.disable_safe": _Cmd(
         cmd=resource.disable_safe,
@@ -439,6 +517,7 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "resource.enable": _Cmd(
         cmd=resource.enable,
         required_permission=p.WRITE,
+        allowed_in_batch=True,
     ),
     "resource.get_cibsecrets": _Cmd(
         cmd=resource.get_cibsecrets,
@@ -447,18 +526,22 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "resource.get_configured_resources": _Cmd(
         cmd=resource.get_configured_resources,
         required_permission=p.READ,
+        read_only=True,
     ),
     "resource.group_add": _Cmd(
         cmd=resource.group_add,
         required_permission=p.WRITE,
+        allowed_in_batch=True,
     ),
     "resource.manage": _Cmd(
         cmd=resource.manage,
         required_permission=p.WRITE,
+        allowed_in_batch=True,
     ),
     "resource.update_meta": _Cmd(
         cmd=resource.update_meta,
         required_permission=p.WRITE,
+        allowed_in_batch=True,
     ),
     "resource.move": _Cmd(
         cmd=resource.move,
@@ -479,6 +562,7 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "resource.unmanage": _Cmd(
         cmd=resource.unmanage,
         required_permission=p.WRITE,
+        allowed_in_batch=True,
     ),
     "resource.unmove_unban": _Cmd(
         cmd=resource.unmove_unban,
@@ -524,28 +608,34 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "status.full_cluster_status_plaintext": _Cmd(
         cmd=status.full_cluster_status_plaintext,
         required_permission=p.READ,
+        read_only=True,
     ),
     "status.resources_status": _Cmd(
         cmd=status.resources_status,
         required_permission=p.READ,
+        read_only=True,
     ),
     # deprecated, API v1 compatibility
     "stonith_agent.describe_agent": _Cmd(
         cmd=stonith_agent.describe_agent,
         required_permission=p.READ,
+        read_only=True,
     ),
     # deprecated, API v1 compatibility
     "stonith_agent.list_agents": _Cmd(
         cmd=stonith_agent.list_agents,
         required_permission=p.READ,
+        read_only=True,
     ),
     "stonith.create": _Cmd(
         cmd=stonith.create,
         required_permission=p.WRITE,
+        allowed_in_batch=True,
     ),
     "tag.get_config_dto": _Cmd(
         cmd=tag.get_config_dto,
         required_permission=p.READ,
+        read_only=True,
     ),
     # CMDs allowed in pcs_internal but not exposed via REST API:
     # "services.disable_service": Cmd(services.disable_service,
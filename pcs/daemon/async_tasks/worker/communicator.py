@@ -22,3 +22,16 @@ class WorkerCommunicator:
             self._queue.put(msg)
         if self._terminate:
             raise SystemExit(0)
+
+
+class MessageCollector:
+    """
+    Stores messages of a task running in the scheduler's process, they are
+    handed over to the scheduler once the task finishes
+    """
+
+    def __init__(self) -> None:
+        self.messages: list[Message] = []
+
+    def put(self, msg: Message) -> None:
+        self.messages.append(msg)
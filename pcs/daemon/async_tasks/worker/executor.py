@@ -3,14 +3,22 @@ import inspect
 import multiprocessing as mp
 import os
 import signal
+from collections.abc import Callable
 from logging import Logger, getLogger
 from typing import Any
 
 import dacite
 
-from pcs.common import reports
-from pcs.common.async_tasks.dto import CommandOptionsDto
+from pcs import settings
+from pcs.common import profiling, reports
+from pcs.common.async_tasks.dto import (
+    CommandBatchDto,
+    CommandDto,
+    CommandOptionsDto,
+    CommandResultDto,
+)
 from pcs.common.async_tasks.types import TaskFinishType
+from pcs.common.cancellation import CancellationToken, OperationCancelled
 from pcs.common.interface import dto
 from pcs.lib.auth.tools import DesiredUser, get_effective_user
 from pcs.lib.auth.types import AuthUser
@@ -20,16 +28,34 @@ from pcs.lib.permissions.checker import PermissionsChecker
 from pcs.utils import read_known_hosts_file_not_cached
 
 from .command_mapping import COMMAND_MAP, LEGACY_API_COMMANDS
-from .communicator import WorkerCommunicator
+from .communicator import MessageCollector, WorkerCommunicator
 from .logging import WORKER_LOGGER, setup_worker_logger
-from .report_processor import WorkerReportProcessor
+from .report_processor import WorkerBatchReportProcessor, WorkerReportProcessor
 from .types import Message, TaskExecuted, TaskFinished, WorkerCommand
 
 worker_com: WorkerCommunicator
+# cancellation token of the task currently run by the worker
+_task_cancellation_token: CancellationToken | None = None
 
 
 def _sigterm_handler(sig_num: int, frame: Any) -> None:
     del sig_num, frame
+    token = _task_cancellation_token
+    if token is not None and not token.is_cancelled:
+        # Let the running task stop and clean up after itself. If it does not
+        # manage to do so in time, SIGALRM terminates the worker.
+        token.cancel()
+        signal.alarm(settings.task_cancel_timeout_seconds)
+        return
+    _terminate_worker()
+
+
+def _sigalrm_handler(sig_num: int, frame: Any) -> None:
+    del sig_num, frame
+    _terminate_worker()
+
+
+def _terminate_worker() -> None:
     if worker_com.is_locked:
         worker_com.set_terminate()
     else:
@@ -57,6 +83,7 @@ def worker_init(message_q: mp.Queue, logging_q: mp.Queue) -> None:
 
     signal.signal(signal.SIGINT, ignore_signals)
     signal.signal(signal.SIGTERM, _sigterm_handler)
+    signal.signal(signal.SIGALRM, _sigalrm_handler)
 
 
 def _pause_worker() -> None:
@@ -89,6 +116,8 @@ def task_executor(task: WorkerCommand) -> None:
     Launches the task inside the worker
     :param task: Task identifier, command and parameter object
     """
+    # pylint: disable=global-statement
+    global _task_cancellation_token  # noqa: PLW0603
     logger = getLogger(WORKER_LOGGER)
 
     worker_com.put(
@@ -102,6 +131,93 @@ def task_executor(task: WorkerCommand) -> None:
         task.task_ident,
         task.auth_user.username,
     )
+    cancellation_token = CancellationToken()
+    _task_cancellation_token = cancellation_token
+    try:
+        _execute_task(task, worker_com, logger, cancellation_token)
+    except OperationCancelled:
+        logger.info("Task %s has been cancelled.", task.task_ident)
+    finally:
+        _task_cancellation_token = None
+        signal.alarm(0)
+    if cancellation_token.is_cancelled:
+        # The task has been killed by the scheduler, which does not expect any
+        # more messages from this worker. Exit, the worker gets replaced.
+        raise SystemExit(0)
+    _pause_worker()
+
+
+def in_process_task_executor(
+    task: WorkerCommand, logger: Logger
+) -> list[Message]:
+    """
+    Runs the task in the current process, this is meant for running tasks in
+    a thread of the scheduler's process
+    :param task: Task identifier, command and parameter object
+    :param logger: Logger of the scheduler
+    :return: Messages for the scheduler produced by the task
+    """
+    message_collector = MessageCollector()
+    logger.info(
+        "Task '%s' executed in process by user '%s'.",
+        task.task_ident,
+        task.auth_user.username,
+    )
+    _execute_task(task, message_collector, logger)
+    return message_collector.messages
+
+
+def _execute_task(
+    task: WorkerCommand,
+    communicator: WorkerCommunicator | MessageCollector,
+    logger: Logger,
+    cancellation_token: CancellationToken | None = None,
+) -> None:
+    """
+    Runs the task's command and sends its reports and result to the scheduler
+
+    If profiling is enabled, a profile of the task is stored in the profile
+    directory. OperationCancelled is raised if the task gets cancelled while
+    waiting for remote nodes or external processes.
+    """
+    if task.profile_dir is None:
+        _run_task(task, communicator, logger, cancellation_token)
+        return
+    profiler = profiling.Profiler(task.command.command_dto.command_name)
+    try:
+        with profiler.activate():
+            _run_task(task, communicator, logger, cancellation_token)
+    finally:
+        _write_task_profile(profiler, task.profile_dir, task.task_ident, logger)
+
+
+def _write_task_profile(
+    profiler: profiling.Profiler,
+    profile_dir: str,
+    task_ident: str,
+    logger: Logger,
+) -> None:
+    profile_path = os.path.join(profile_dir, f"{task_ident}.json")
+    try:
+        with open(profile_path, "w", encoding="utf-8") as output:
+            profiler.write_json(output)
+    except OSError as e:
+        logger.warning(
+            "Unable to write profile of task %s to '%s': %s",
+            task_ident,
+            profile_path,
+            e,
+        )
+        return
+    logger.debug("Profile of task %s written to '%s'", task_ident, profile_path)
+
+
+def _run_task(
+    task: WorkerCommand,
+    communicator: WorkerCommunicator | MessageCollector,
+    logger: Logger,
+    cancellation_token: CancellationToken | None,
+) -> None:
     request_timeout = task.command.command_dto.options.request_timeout
     if request_timeout is not None and request_timeout <= 0:
         logger.warning(
@@ -118,79 +234,69 @@ def task_executor(task: WorkerCommand) -> None:
     if auth_user.is_superuser:
         auth_user = _get_effective_user(logger, auth_user, command_dto.options)
 
+    report_processor: WorkerReportProcessor
+    batch_report_processor: WorkerBatchReportProcessor | None = None
+    if task.command.is_batch:
+        batch_report_processor = WorkerBatchReportProcessor(
+            communicator, task.task_ident
+        )
+        report_processor = batch_report_processor
+    else:
+        report_processor = WorkerReportProcessor(communicator, task.task_ident)
     env = LibraryEnvironment(  # type: ignore
         logger,
-        WorkerReportProcessor(worker_com, task.task_ident),
+        report_processor,
         known_hosts_getter=read_known_hosts_file_not_cached,
         user_login=auth_user.username,
         user_groups=auth_user.groups,
         request_timeout=request_timeout,
+        cancellation_token=cancellation_token,
     )
 
     task_retval = None
-    command_name = command_dto.command_name
     try:
-        if command_name not in COMMAND_MAP or (
-            not task.command.is_legacy_command
-            and command_name in LEGACY_API_COMMANDS
-        ):
-            raise LibraryError(
-                reports.ReportItem.error(
-                    reports.messages.CommandUnknown(command_name)
-                )
+        if batch_report_processor is not None:
+            task_retval = _run_batch(
+                env,
+                batch_report_processor,
+                command_dto,
+                auth_user,
+                logger,
             )
-        cmd = COMMAND_MAP[command_name]
-        if not PermissionsChecker(logger).is_authorized(
-            auth_user, cmd.required_permission
-        ):
-            raise LibraryError(
-                reports.ReportItem.error(reports.messages.NotAuthorized())
+        else:
+            cmd, params = _get_command(
+                command_dto, task.command.is_legacy_command, auth_user, logger
             )
-        # Dacite will validate command.params against command signature.
-        # Dacite works only with dataclasses so we need to dynamically create
-        # one
-        try:
-            data = dto.from_dict(
-                dataclasses.make_dataclass(
-                    f"{command_name}_params",
-                    [
-                        _param_to_field_tuple(param)
-                        for param in list(
-                            inspect.signature(cmd.cmd).parameters.values()
-                        )[1:]
-                    ],
-                ),
-                command_dto.params,
-                strict=True,
-            ).__dict__  # type: ignore
-        except (dacite.DaciteError, dto.PayloadConversionError) as e:
-            # TODO: make custom message from exception without mentioning
-            # dataclasses and fields
-            raise LibraryError(
-                reports.ReportItem.error(
-                    reports.messages.CommandInvalidPayload(str(e))
-                )
-            ) from e
-
-        task_retval = cmd.cmd(env, **data)
+            with profiling.profile_library_command(command_dto.command_name):
+                task_retval = cmd(env, **params)
+    except _BatchFailed as e:
+        communicator.put(
+            Message(
+                task.task_ident,
+                TaskFinished(TaskFinishType.FAIL, e.results),
+            )
+        )
+        logger.error(
+            "Task %s failed running a batch of commands.", task.task_ident
+        )
+        return
     except LibraryError as e:
         # Some code uses args for storing ReportList, sending them to the report
         # processor here
 
         for report in e.args:
-            worker_com.put(Message(task.task_ident, report.to_dto()))
-        worker_com.put(
+            communicator.put(Message(task.task_ident, report.to_dto()))
+        communicator.put(
             Message(
                 task.task_ident,
                 TaskFinished(TaskFinishType.FAIL, None),
             )
         )
         logger.error("Task %s raised a LibraryError: %s.", task.task_ident, e)
-        _pause_worker()
         return
     except Exception as e:  # pylint: disable=broad-except
         # For unhandled exceptions during execution
-        worker_com.put(
+        communicator.put(
             Message(
                 task.task_ident,
                 TaskFinished(TaskFinishType.UNHANDLED_EXCEPTION, None),
@@ -199,16 +305,155 @@ def task_executor(task: WorkerCommand) -> None:
         logger.exception(
             "Task %s raised an unhandled exception: %s", task.task_ident, e
         )
-        _pause_worker()
         return
-    worker_com.put(
+    communicator.put(
         Message(
             task.task_ident,
             TaskFinished(TaskFinishType.SUCCESS, task_retval),
         )
     )
     logger.info("Task %s finished.", task.task_ident)
-    _pause_worker()
+
+
+class _BatchFailed(Exception):
+    """
+    A command of a batch of commands failed
+    """
+
+    def __init__(self, results: list[CommandResultDto]):
+        super().__init__()
+        self.results = results
+
+
+def _get_command(
+    command_dto: CommandDto,
+    is_legacy_command: bool,
+    auth_user: AuthUser,
+    logger: Logger,
+    in_batch: bool = False,
+) -> tuple[Callable[..., Any], dict[str, Any]]:
+    """
+    Check that the user may run the command and validate its parameters
+
+    Return the command's function and its parameters
+    """
+    command_name = command_dto.command_name
+    if command_name not in COMMAND_MAP or (
+        not is_legacy_command and command_name in LEGACY_API_COMMANDS
+    ):
+        raise LibraryError(
+            reports.ReportItem.error(
+                reports.messages.CommandUnknown(command_name)
+            )
+        )
+    cmd = COMMAND_MAP[command_name]
+    if in_batch and not cmd.allowed_in_batch:
+        raise LibraryError(
+            reports.ReportItem.error(
+                reports.messages.CommandNotAllowedInBatch(command_name)
+            )
+        )
+    if not PermissionsChecker(logger).is_authorized(
+        auth_user, cmd.required_permission
+    ):
+        raise LibraryError(
+            reports.ReportItem.error(reports.messages.NotAuthorized())
+        )
+    # Dacite will validate command.params against command signature.
+    # Dacite works only with dataclasses so we need to dynamically create
+    # one
+    try:
+        params = dto.from_dict(
+            dataclasses.make_dataclass(
+                f"{command_name}_params",
+                [
+                    _param_to_field_tuple(param)
+                    for param in list(
+                        inspect.signature(cmd.cmd).parameters.values()
+                    )[1:]
+                ],
+            ),
+            command_dto.params,
+            strict=True,
+        ).__dict__  # type: ignore
+    except (dacite.DaciteError, dto.PayloadConversionError) as e:
+        # TODO: make custom message from exception without mentioning
+        # dataclasses and fields
+        raise LibraryError(
+            reports.ReportItem.error(
+                reports.messages.CommandInvalidPayload(str(e))
+            )
+        ) from e
+    if in_batch and params.get("wait", False) is not False:
+        # The command would wait for the cluster before CIB is pushed
+        raise LibraryError(
+            reports.ReportItem.error(
+                reports.messages.CommandInvalidPayload(
+                    "waiting is not supported in a batch of commands"
+                )
+            )
+        )
+    return cmd.cmd, params
+
+
+def _run_batch(
+    env: LibraryEnvironment,
+    report_processor: WorkerBatchReportProcessor,
+    batch_dto: CommandDto,
+    auth_user: AuthUser,
+    logger: Logger,
+) -> list[CommandResultDto]:
+    """
+    Run a batch of commands with a single CIB load and push
+
+    All commands are run one by one. If any of them fails, the rest of them is
+    not run and CIB is not pushed.
+    """
+    try:
+        command_dto_list = dto.from_dict(
+            CommandBatchDto, batch_dto.params, strict=True
+        ).commands
+    except (dacite.DaciteError, dto.PayloadConversionError) as e:
+        raise LibraryError(
+            reports.ReportItem.error(
+                reports.messages.CommandInvalidPayload(str(e))
+            )
+        ) from e
+
+    results = []
+    env.begin_cib_batch()
+    for command_dto in command_dto_list:
+        report_processor.start_command()
+        try:
+            cmd, params = _get_command(
+                command_dto, False, auth_user, logger, in_batch=True
+            )
+            with profiling.profile_library_command(command_dto.command_name):
+                result = cmd(env, **params)
+        except LibraryError as e:
+            for report in e.args:
+                report_processor.send_report_dto(report.to_dto())
+            results.append(
+                CommandResultDto(
+                    command_dto.command_name,
+                    False,
+                    report_processor.command_reports,
+                    None,
+                )
+            )
+            raise _BatchFailed(results) from e
+        results.append(
+            CommandResultDto(
+                command_dto.command_name,
+                True,
+                report_processor.command_reports,
+                result,
+            )
+        )
+    # reports of pushing CIB do not belong to any command
+    report_processor.start_command()
+    env.end_cib_batch()
+    return results
 
 
 def _param_to_field_tuple(
@@ -1,6 +1,6 @@
 from pcs.common import reports as pcs_reports
 
-from .communicator import WorkerCommunicator
+from .communicator import MessageCollector, WorkerCommunicator
 from .types import Message
 
 
@@ -11,7 +11,7 @@ class WorkerReportProcessor(pcs_reports.ReportProcessor):
 
     def __init__(
         self,
-        worker_com: WorkerCommunicator,
+        worker_com: WorkerCommunicator | MessageCollector,
         task_ident: str,
         enable_debug: bool = False,
     ) -> None:
@@ -20,12 +20,44 @@ class WorkerReportProcessor(pcs_reports.ReportProcessor):
         self._task_ident: str = task_ident
         self._debug_enabled = enable_debug
 
+    @property
+    def min_severity_level(self) -> pcs_reports.types.SeverityLevel:
+        if self._debug_enabled:
+            return pcs_reports.ReportItemSeverity.DEBUG
+        return pcs_reports.ReportItemSeverity.INFO
+
     def _do_report(self, report_item: pcs_reports.item.ReportItem) -> None:
-        if (
-            self._debug_enabled
-            or report_item.severity.level
-            != pcs_reports.ReportItemSeverity.DEBUG
-        ):
-            self._worker_communicator.put(
-                Message(self._task_ident, report_item.to_dto())
-            )
+        if self.is_severity_reported(report_item.severity.level):
+            self.send_report_dto(report_item.to_dto())
+
+    def send_report_dto(self, report_dto: pcs_reports.ReportItemDto) -> None:
+        """
+        Send a report to the scheduler without processing it
+        """
+        self._worker_communicator.put(Message(self._task_ident, report_dto))
+
+
+class WorkerBatchReportProcessor(WorkerReportProcessor):
+    """
+    Report processor for batches of commands, it keeps reports of the command
+    being run in addition to sending them to the scheduler
+    """
+
+    def __init__(
+        self,
+        worker_com: WorkerCommunicator | MessageCollector,
+        task_ident: str,
+        enable_debug: bool = False,
+    ) -> None:
+        super().__init__(worker_com, task_ident, enable_debug)
+        self.command_reports: list[pcs_reports.ReportItemDto] = []
+
+    def start_command(self) -> None:
+        """
+        Start collecting reports of a new command
+        """
+        self.command_reports = []
+
+    def send_report_dto(self, report_dto: pcs_reports.ReportItemDto) -> None:
+        super().send_report_dto(report_dto)
+        self.command_reports.append(report_dto)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from enum import Enum, auto
 from typing import Any
 
 from pcs.common.async_tasks.types import TaskFinishType
@@ -7,6 +8,15 @@ from pcs.daemon.async_tasks.types import Command
 from pcs.lib.auth.types import AuthUser
 
 
+class ExecutionClass(Enum):
+    # Commands are run in a worker process of the worker pool
+    WORKER = auto()
+    # Commands are run in a thread of the scheduler's process. This is meant
+    # for quick commands which only read small files. They must not run any
+    # external processes or block for a long time.
+    IN_PROCESS = auto()
+
+
 @dataclass(frozen=True)
 class TaskExecuted:
     worker_pid: int
@@ -29,3 +39,4 @@ class WorkerCommand:
     task_ident: str
     command: Command
     auth_user: AuthUser
+    profile_dir: str | None = None
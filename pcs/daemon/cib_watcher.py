@@ -0,0 +1,166 @@
+"""
+Tracking of CIB changes in pcsd
+
+Pacemaker does not provide a way of subscribing to CIB changes usable from
+pcsd. Instead, the version attributes of the CIB are queried periodically,
+which is cheap as only the root element of the CIB is transferred. Whenever
+the version changes, a new generation of the CIB state is created and waiting
+consumers are notified. The whole CIB is loaded only if it is requested to
+be kept in memory and only when the version has changed.
+"""
+
+import asyncio
+import contextlib
+import time
+from asyncio import Event
+from collections.abc import Callable
+from logging import Logger
+
+from pcs import settings
+from pcs.common.pacemaker.cib_watch import CibChangeDto, CibVersionDto
+from pcs.lib.pacemaker.status_snapshot import (
+    get_cib_version_query_args,
+    parse_cib_version,
+)
+
+CibChangeListener = Callable[[CibChangeDto], None]
+
+QUERY_TIMEOUT_SECONDS = 30
+
+
+async def run_tool(logger: Logger, argv: list[str]) -> str | None:
+    """
+    Run a pacemaker tool, return its stdout or None if it has failed
+
+    logger -- pcsd logger
+    argv -- the tool and its arguments
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *argv,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env={"LC_ALL": "C"},
+        )
+    except OSError as e:
+        logger.debug("Unable to run %s: %s", argv[0], e)
+        return None
+    try:
+        stdout, stderr = await asyncio.wait_for(
+            process.communicate(), QUERY_TIMEOUT_SECONDS
+        )
+    except TimeoutError:
+        with contextlib.suppress(ProcessLookupError):
+            process.kill()
+        await process.wait()
+        logger.debug("Running %s has timed out", argv[0])
+        return None
+    if process.returncode != 0:
+        logger.debug(
+            "Running %s has failed: %s",
+            argv[0],
+            stderr.decode("utf-8", errors="replace").strip(),
+        )
+        return None
+    return stdout.decode("utf-8")
+
+
+class CibWatcher:
+    """
+    Keeps the current version of the CIB and notifies about its changes
+    """
+
+    def __init__(self, logger: Logger, keep_cib: bool = False) -> None:
+        """
+        logger -- pcsd logger
+        keep_cib -- if True, keep a copy of the current CIB in memory
+        """
+        self._logger = logger
+        self._keep_cib = keep_cib
+        self._state = CibChangeDto(
+            generation=0, timestamp=time.time(), version=None
+        )
+        self._cib: str | None = None
+        self._listeners: list[CibChangeListener] = []
+        self._change_event = Event()
+
+    @property
+    def state(self) -> CibChangeDto:
+        return self._state
+
+    @property
+    def cib(self) -> str | None:
+        """
+        The current CIB, None if it is not available or not kept in memory
+        """
+        return self._cib
+
+    def add_listener(self, listener: CibChangeListener) -> None:
+        """
+        Call the listener with a new state after each CIB change
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: CibChangeListener) -> None:
+        with contextlib.suppress(ValueError):
+            self._listeners.remove(listener)
+
+    async def wait_for_change(self, generation: int) -> CibChangeDto:
+        """
+        Wait until the CIB state is newer than the specified generation
+
+        Generations start from zero with each start of pcsd. If the specified
+        generation is newer than the current one, the caller got it from a
+        previous run of pcsd and the current state is returned immediately.
+
+        generation -- generation of the CIB state known to the caller
+        """
+        if generation > self._state.generation:
+            return self._state
+        while self._state.generation <= generation:
+            await self._change_event.wait()
+        return self._state
+
+    async def refresh(self) -> None:
+        """
+        Check the CIB version and update the state if it has changed
+        """
+        version_xml = await run_tool(self._logger, get_cib_version_query_args())
+        version = (
+            parse_cib_version(version_xml) if version_xml is not None else None
+        )
+        if version == self._state.version:
+            return
+        cib = None
+        if self._keep_cib and version is not None:
+            cib = await run_tool(
+                self._logger, [settings.cibadmin_exec, "--local", "--query"]
+            )
+            # the CIB may have changed since its version was queried
+            version = parse_cib_version(cib) if cib is not None else None
+            if version is None:
+                cib = None
+        self._set_state(version, cib)
+
+    def _set_state(
+        self, version: CibVersionDto | None, cib: str | None
+    ) -> None:
+        if version is None:
+            self._logger.info("CIB is not available")
+        elif self._state.version is None:
+            self._logger.info("CIB is available")
+        self._state = CibChangeDto(
+            generation=self._state.generation + 1,
+            timestamp=time.time(),
+            version=version,
+        )
+        self._cib = cib
+        self._change_event.set()
+        self._change_event = Event()
+        for listener in list(self._listeners):
+            # pylint: disable=broad-except
+            try:
+                listener(self._state)
+            except Exception:
+                self._logger.exception("Error in a CIB change listener")
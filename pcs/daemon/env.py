@@ -40,6 +40,11 @@ PCSD_CHECK_INTERVAL_MS = "PCSD_CHECK_INTERVAL_MS"
 PCSD_TASK_ABANDONED_TIMEOUT = "PCSD_TASK_ABANDONED_TIMEOUT"
 PCSD_TASK_UNRESPONSIVE_TIMEOUT = "PCSD_TASK_UNRESPONSIVE_TIMEOUT"
 PCSD_TASK_DELETION_TIMEOUT = "PCSD_TASK_DELETION_TIMEOUT"
+PCSD_TASK_COALESCING_TTL = "PCSD_TASK_COALESCING_TTL"
+PCSD_PROFILE_DIR = "PCSD_PROFILE_DIR"
+PCSD_CIB_WATCH_INTERVAL_MS = "PCSD_CIB_WATCH_INTERVAL_MS"
+PCSD_CIB_WATCH_KEEP_CIB = "PCSD_CIB_WATCH_KEEP_CIB"
+PCSD_STATUS_WATCH = "PCSD_STATUS_WATCH"
 
 Env = namedtuple(
     "Env",
@@ -62,6 +67,11 @@ Env = namedtuple(
         PCSD_TASK_ABANDONED_TIMEOUT,
         PCSD_TASK_UNRESPONSIVE_TIMEOUT,
         PCSD_TASK_DELETION_TIMEOUT,
+        PCSD_TASK_COALESCING_TTL,
+        PCSD_PROFILE_DIR,
+        PCSD_CIB_WATCH_INTERVAL_MS,
+        PCSD_CIB_WATCH_KEEP_CIB,
+        PCSD_STATUS_WATCH,
         "has_errors",
     ],
 )
@@ -89,6 +99,11 @@ def prepare_env(environ, logger=None):
         loader.pcsd_task_abandoned_timeout(),
         loader.pcsd_task_unresponsive_timeout(),
         loader.pcsd_task_deletion_timeout(),
+        loader.pcsd_task_coalescing_ttl(),
+        loader.pcsd_profile_dir(),
+        loader.pcsd_cib_watch_interval_ms(),
+        loader.pcsd_cib_watch_keep_cib(),
+        loader.pcsd_status_watch(),
         loader.has_errors(),
     )
     if logger:
@@ -285,5 +300,43 @@ class EnvLoader:
             PCSD_TASK_DELETION_TIMEOUT, settings.task_deletion_timeout_seconds
         )
 
+    @lru_cache(maxsize=1)
+    def pcsd_task_coalescing_ttl(self) -> int:
+        return self._get_non_negative_int(
+            PCSD_TASK_COALESCING_TTL, settings.task_coalescing_ttl_seconds
+        )
+
+    @lru_cache(maxsize=1)
+    def pcsd_profile_dir(self) -> str | None:
+        profile_dir = self.environ.get(PCSD_PROFILE_DIR, "")
+        if not profile_dir:
+            return None
+        if not os.path.isdir(profile_dir):
+            self.errors.append(
+                f"Directory '{profile_dir}' for '{PCSD_PROFILE_DIR}' does not "
+                "exist"
+            )
+            return None
+        return profile_dir
+
+    @lru_cache(maxsize=1)
+    def pcsd_cib_watch_interval_ms(self) -> int:
+        return self._get_non_negative_int(
+            PCSD_CIB_WATCH_INTERVAL_MS, settings.pcsd_cib_watch_interval_ms
+        )
+
+    def pcsd_cib_watch_keep_cib(self) -> bool:
+        return self.__has_true_in_environ(PCSD_CIB_WATCH_KEEP_CIB)
+
+    def pcsd_status_watch(self) -> bool:
+        status_watch = self.__has_true_in_environ(PCSD_STATUS_WATCH)
+        if status_watch and not self.pcsd_cib_watch_interval_ms():
+            self.errors.append(
+                f"'{PCSD_STATUS_WATCH}' requires '{PCSD_CIB_WATCH_INTERVAL_MS}' "
+                "to be a positive integer"
+            )
+            return False
+        return status_watch
+
     def __has_true_in_environ(self, environ_key):
         return self.environ.get(environ_key, "").lower() == "true"
@@ -48,15 +48,18 @@ from pcs.common.reports.processor import ReportProcessorToLog
 from pcs.daemon.app.common import Http404Handler, RedirectHandler
 from pcs.daemon.async_tasks.scheduler import Scheduler, SchedulerConfig
 from pcs.daemon.async_tasks.task import TaskConfig
+from pcs.daemon.cib_watcher import CibWatcher
 from pcs.daemon.env import prepare_env
 from pcs.daemon.http_server import HttpsServerManage
 from pcs.daemon.pcs_cfgsync import CfgSyncPullManager
+from pcs.daemon.status_watcher import ClusterStatusWatcher
 from pcs.lib.auth.provider import AuthProvider
 
 
 class SignalInfo:
     async_scheduler: Scheduler | None = None
     server_manage = None
+    status_watcher: ClusterStatusWatcher | None = None
     ioloop_started = False
 
 
@@ -67,6 +70,8 @@ def handle_signal(incoming_signal, frame):
         SignalInfo.server_manage.stop()
     if SignalInfo.async_scheduler:
         SignalInfo.async_scheduler.terminate_nowait()
+    if SignalInfo.status_watcher:
+        SignalInfo.status_watcher.stop()
     if SignalInfo.ioloop_started:
         IOLoop.current().stop()
     raise SystemExit(0)
@@ -108,6 +113,23 @@ async def config_sync(
     )
 
 
+def start_cib_watcher(
+    interval_ms: int, keep_cib: bool, watch_status: bool
+) -> CibWatcher | None:
+    if not interval_ms:
+        return None
+    cib_watcher = CibWatcher(log.pcsd, keep_cib=keep_cib)
+    if watch_status:
+        SignalInfo.status_watcher = ClusterStatusWatcher(
+            log.pcsd, cib_watcher, settings.pcsd_cluster_status_snapshot
+        )
+        SignalInfo.status_watcher.start()
+    # load the CIB version right away, not after the first interval
+    IOLoop.current().add_callback(cib_watcher.refresh)
+    PeriodicCallback(cib_watcher.refresh, callback_time=interval_ms).start()
+    return cib_watcher
+
+
 def configure_app(  # noqa: PLR0913
     async_scheduler: Scheduler,
     lib_auth_provider: AuthProvider,
@@ -118,6 +140,7 @@ def configure_app(  # noqa: PLR0913
     webui_fallback: str,
     pcsd_capabilities: Iterable[capabilities.Capability],
     *,
+    cib_watcher: CibWatcher | None = None,
     debug: bool = False,
 ):
     # pylint: disable=too-many-arguments
@@ -167,7 +190,9 @@ def configure_app(  # noqa: PLR0913
             [token_auth_factory, socket_auth_factory]
         )
 
-        routes = api_v2.get_routes(api_v2_auth_factory, async_scheduler)
+        routes = api_v2.get_routes(
+            api_v2_auth_factory, async_scheduler, cib_watcher
+        )
         routes.extend(api_v1.get_routes(api_auth_factory, async_scheduler))
         routes.extend(
             api_v0.get_routes(
@@ -203,7 +228,12 @@ def configure_app(  # noqa: PLR0913
         routes.extend(sinatra_ui.get_routes(ui_auth_factory, ruby_pcsd_wrapper))
 
         return Application(
-            routes, debug=debug, default_handler_class=Http404Handler
+            routes,
+            debug=debug,
+            default_handler_class=Http404Handler,
+            # gzip responses of text and json content types if a client
+            # accepts it
+            compress_response=True,
         )
 
     return make_app
@@ -258,10 +288,12 @@ def main(argv=None) -> None:
             max_worker_count=env.PCSD_MAX_WORKER_COUNT,
             worker_reset_limit=env.PCSD_WORKER_RESET_LIMIT,
             deadlock_threshold_timeout=env.PCSD_DEADLOCK_THRESHOLD_TIMEOUT,
+            coalescing_ttl=env.PCSD_TASK_COALESCING_TTL,
             task_config=TaskConfig(
                 abandoned_timeout=env.PCSD_TASK_ABANDONED_TIMEOUT,
                 unresponsive_timeout=env.PCSD_TASK_UNRESPONSIVE_TIMEOUT,
                 deletion_timeout=env.PCSD_TASK_DELETION_TIMEOUT,
+                profile_dir=env.PCSD_PROFILE_DIR,
             ),
         )
     )
@@ -280,6 +312,12 @@ def main(argv=None) -> None:
         pcsd_capabilities = []
         log.pcsd.error(e.msg)
 
+    cib_watcher = start_cib_watcher(
+        env.PCSD_CIB_WATCH_INTERVAL_MS,
+        env.PCSD_CIB_WATCH_KEEP_CIB,
+        env.PCSD_STATUS_WATCH,
+    )
+
     make_app = configure_app(
         async_scheduler,
         lib_auth_provider,
@@ -289,6 +327,7 @@ def main(argv=None) -> None:
         env.WEBUI_DIR,
         env.WEBUI_FALLBACK,
         pcsd_capabilities,
+        cib_watcher=cib_watcher,
         debug=env.PCSD_DEV,
     )
     pcsd_ssl = ssl.PcsdSSL(
@@ -0,0 +1,124 @@
+"""
+Keeping the cluster status up to date in pcsd
+
+crm_mon provides XML output in its one-shot mode only, so the status cannot be
+read from a long running crm_mon. Instead, crm_mon is run once for each change
+of the CIB version detected by the CIB watcher. The status is stored to a file
+from which library commands run by pcsd workers load it, see
+pcs.lib.pacemaker.status_snapshot.
+"""
+
+import asyncio
+import os
+import time
+from logging import Logger
+
+from pcs.common.pacemaker.cib_watch import CibChangeDto, CibVersionDto
+from pcs.common.tools import format_os_error
+from pcs.daemon.cib_watcher import CibWatcher, run_tool
+from pcs.lib.pacemaker.live import get_cluster_status_xml_args
+from pcs.lib.pacemaker.status_snapshot import (
+    ClusterStatusSnapshot,
+    get_process_start_time,
+    remove_snapshot,
+    save_snapshot,
+)
+
+
+class ClusterStatusWatcher:
+    """
+    Keeps the current cluster status and shares it with worker processes
+    """
+
+    def __init__(
+        self, logger: Logger, cib_watcher: CibWatcher, snapshot_path: str
+    ) -> None:
+        """
+        logger -- pcsd logger
+        cib_watcher -- source of CIB changes
+        snapshot_path -- file to store the status to
+        """
+        self._logger = logger
+        self._cib_watcher = cib_watcher
+        self._snapshot_path = snapshot_path
+        self._snapshot: ClusterStatusSnapshot | None = None
+        self._generation = 0
+        self._refresh_requested = False
+        self._refresh_task: asyncio.Future[None] | None = None
+        self._pid = os.getpid()
+        self._process_start_time = get_process_start_time(self._pid)
+
+    @property
+    def snapshot(self) -> ClusterStatusSnapshot | None:
+        """
+        The current cluster status, None if it is not available
+        """
+        return self._snapshot
+
+    def start(self) -> None:
+        # a status stored by a previous pcsd run is not trusted
+        self._remove_snapshot()
+        self._cib_watcher.add_listener(self._on_cib_change)
+
+    def stop(self) -> None:
+        self._cib_watcher.remove_listener(self._on_cib_change)
+        self._remove_snapshot()
+
+    def _on_cib_change(self, change: CibChangeDto) -> None:
+        del change
+        # CIB changes coming while crm_mon is running are merged into one
+        # crm_mon run started after the current one finishes
+        self._refresh_requested = True
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.ensure_future(self._refresh())
+
+    async def _refresh(self) -> None:
+        while self._refresh_requested:
+            self._refresh_requested = False
+            # The status is obtained after the version has been read, so it
+            # is never older than the version. If it is newer, the version
+            # does not match the live CIB and the status is not used.
+            version = self._cib_watcher.state.version
+            status_xml = None
+            if version is not None:
+                status_xml = await run_tool(
+                    self._logger, get_cluster_status_xml_args()
+                )
+            self._set_snapshot(version, status_xml)
+
+    def _set_snapshot(
+        self, version: CibVersionDto | None, status_xml: str | None
+    ) -> None:
+        if (
+            version is None
+            or status_xml is None
+            or self._process_start_time is None
+        ):
+            self._snapshot = None
+            self._remove_snapshot()
+            return
+        self._generation += 1
+        self._snapshot = ClusterStatusSnapshot(
+            generation=self._generation,
+            timestamp=time.time(),
+            cib_version=version,
+            status_xml=status_xml,
+            pid=self._pid,
+            process_start_time=self._process_start_time,
+        )
+        try:
+            save_snapshot(self._snapshot_path, self._snapshot)
+        except OSError as e:
+            self._logger.error(
+                "Unable to store cluster status: %s", format_os_error(e)
+            )
+            self._remove_snapshot()
+
+    def _remove_snapshot(self) -> None:
+        try:
+            remove_snapshot(self._snapshot_path)
+        except OSError as e:
+            self._logger.error(
+                "Unable to remove stored cluster status: %s",
+                format_os_error(e),
+            )
@@ -2,6 +2,7 @@ from typing import cast
 
 from lxml.etree import _Element
 
+from pcs.common.types import StringIterable
 from pcs.lib.booth.constants import DEFAULT_INSTANCE_NAME
 
 _BOOTH_ATTRIBUTE = "booth-cfg-name"
@@ -34,3 +35,44 @@ def get_ticket_names(cib: _Element) -> list[str]:
     cib -- element representing the CIB
     """
     return cast(list[str], cib.xpath("status/tickets/ticket_state/@id"))
+
+
+def _get_ticket_state_elements(
+    cib: _Element, ticket_names: StringIterable
+) -> list[_Element]:
+    wanted_names = set(ticket_names)
+    return [
+        ticket_state
+        for ticket_state in cast(
+            list[_Element], cib.xpath("status/tickets/ticket_state")
+        )
+        if ticket_state.get("id") in wanted_names
+    ]
+
+
+def set_tickets_standby(cib: _Element, ticket_names: StringIterable) -> bool:
+    """
+    Put the specified tickets to standby, return True if the CIB was changed
+
+    cib -- element representing the CIB
+    ticket_names -- names of the tickets to put to standby
+    """
+    changed = False
+    for ticket_state in _get_ticket_state_elements(cib, ticket_names):
+        if ticket_state.get("standby") != "true":
+            ticket_state.set("standby", "true")
+            changed = True
+    return changed
+
+
+def remove_ticket_states(cib: _Element, ticket_names: StringIterable) -> None:
+    """
+    Remove all state of the specified tickets from the CIB
+
+    cib -- element representing the CIB
+    ticket_names -- names of the tickets to remove
+    """
+    for ticket_state in _get_ticket_state_elements(cib, ticket_names):
+        parent = ticket_state.getparent()
+        if parent is not None:
+            parent.remove(ticket_state)
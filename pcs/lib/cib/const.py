@@ -9,6 +9,7 @@ TAG_CONSTRAINT_COLOCATION: Final = "rsc_colocation"
 TAG_CONSTRAINT_LOCATION: Final = "rsc_location"
 TAG_CONSTRAINT_ORDER: Final = "rsc_order"
 TAG_CONSTRAINT_TICKET: Final = "rsc_ticket"
+TAG_CONSTRAINTS: Final = "constraints"
 TAG_CRM_CONFIG: Final = "crm_config"
 TAG_FENCING_LEVEL: Final = "fencing-level"
 TAG_NODE: Final = "node"
@@ -1,8 +1,9 @@
+from collections.abc import Hashable
 from functools import partial
 
 from lxml.etree import _Element
 
-from pcs.common import reports
+from pcs.common import const, reports
 from pcs.common.pacemaker.constraint import (
     CibConstraintColocationAttributesDto,
     CibConstraintColocationDto,
@@ -11,7 +12,10 @@ from pcs.common.pacemaker.constraint import (
 from pcs.common.reports.item import ReportItem
 from pcs.lib.cib.const import TAG_CONSTRAINT_COLOCATION as TAG
 from pcs.lib.cib.constraint import constraint
-from pcs.lib.cib.constraint.common import is_set_constraint
+from pcs.lib.cib.constraint.common import (
+    DuplicatesChecker,
+    is_set_constraint,
+)
 from pcs.lib.cib.constraint.resource_set import (
     constraint_element_to_resource_set_dto_list,
 )
@@ -117,3 +121,32 @@ def get_all_as_dtos(
                 _constraint_el_to_dto(constraint_el, rule_in_effect_eval)
             )
     return plain_list, set_list
+
+
+class DuplicatesCheckerColocationPlain(DuplicatesChecker):
+    """
+    Searcher of duplicate plain colocation constraints
+    """
+
+    def _are_duplicate(
+        self,
+        constraint_to_check: _Element,
+        constraint_el: _Element,
+    ) -> bool:
+        return self._have_common_signature(constraint_to_check, constraint_el)
+
+    def get_signatures(self, constraint_el: _Element) -> list[Hashable]:
+        return [
+            (
+                constraint_el.get("rsc"),
+                constraint_el.get("with-rsc"),
+                role_constructor(
+                    constraint_el.get("rsc-role", "").capitalize()
+                    or const.PCMK_ROLE_STARTED
+                ),
+                role_constructor(
+                    constraint_el.get("with-rsc-role", "").capitalize()
+                    or const.PCMK_ROLE_STARTED
+                ),
+            )
+        ]
@@ -1,5 +1,6 @@
 import abc
-from collections.abc import Iterable, Mapping, Sequence
+from collections import defaultdict
+from collections.abc import Hashable, Iterable, Mapping, Sequence
 from typing import TypedDict
 
 from lxml.etree import SubElement, _Element
@@ -203,6 +204,25 @@ class DuplicatesChecker:
         """
         raise NotImplementedError()
 
+    def get_signatures(self, constraint_el: _Element) -> list[Hashable]:
+        """
+        Return normalized signatures of a constraint
+
+        Two constraints are duplicate to each other if they have a signature
+        in common. Signatures allow ConstraintSignatureIndex to find
+        duplicates without comparing a constraint to all other constraints.
+
+        constraint_el -- a constraint of a type handled by the checker
+        """
+        raise NotImplementedError()
+
+    def _have_common_signature(
+        self, constraint_to_check: _Element, constraint_el: _Element
+    ) -> bool:
+        return not set(self.get_signatures(constraint_to_check)).isdisjoint(
+            self.get_signatures(constraint_el)
+        )
+
 
 class DuplicatesCheckerSetConstraint(DuplicatesChecker):
     _constraint_id_set_list: list[list[str]]
@@ -231,6 +251,87 @@ class DuplicatesCheckerSetConstraint(DuplicatesChecker):
             self._get_id_set_list(constraint_el) == self._constraint_id_set_list
         )
 
+    def get_signatures(self, constraint_el: _Element) -> list[Hashable]:
+        return [
+            tuple(
+                tuple(id_set) for id_set in self._get_id_set_list(constraint_el)
+            )
+        ]
+
+
+class ConstraintSignatureIndex:
+    """
+    Index of constraints by their signatures for finding duplicate constraints
+
+    The index is built for a constraint section once and it is kept up to date
+    by adding new constraints to it. Finding duplicates of a constraint then
+    does not depend on the number of existing constraints.
+    """
+
+    def __init__(self, constraint_section: _Element):
+        """
+        constraint_section -- existing constraints to be indexed
+        """
+        self._constraint_section = constraint_section
+        # index of constraints of the same type and setness, each built by a
+        # checker when first needed
+        self._indexes: dict[
+            tuple[str, bool],
+            tuple[DuplicatesChecker, dict[Hashable, list[_Element]]],
+        ] = {}
+        # position of indexed constraints for reporting them in document order
+        self._positions: dict[_Element, int] = {}
+
+    def _get_index(
+        self, checker: DuplicatesChecker, constraint_el: _Element
+    ) -> dict[Hashable, list[_Element]]:
+        key = (str(constraint_el.tag), is_set_constraint(constraint_el))
+        if key not in self._indexes:
+            self._indexes[key] = (checker, defaultdict(list))
+            for element in self._constraint_section.iterfind(key[0]):
+                if is_set_constraint(element) == key[1]:
+                    self._add_to_index(element, *self._indexes[key])
+        return self._indexes[key][1]
+
+    def _add_to_index(
+        self,
+        constraint_el: _Element,
+        checker: DuplicatesChecker,
+        index: dict[Hashable, list[_Element]],
+    ) -> None:
+        self._positions.setdefault(constraint_el, len(self._positions))
+        for signature in checker.get_signatures(constraint_el):
+            index[signature].append(constraint_el)
+
+    def find_duplicates(
+        self, checker: DuplicatesChecker, constraint_el: _Element
+    ) -> list[_Element]:
+        """
+        Return indexed constraints duplicate to the specified constraint
+
+        checker -- defines signatures of constraints of the constraint's type
+        constraint_el -- search for duplicates of this constraint
+        """
+        index = self._get_index(checker, constraint_el)
+        duplicates = {
+            element
+            for signature in checker.get_signatures(constraint_el)
+            for element in index.get(signature, [])
+            if element is not constraint_el
+        }
+        return sorted(duplicates, key=lambda element: self._positions[element])
+
+    def add(self, constraint_el: _Element) -> None:
+        """
+        Add a constraint, which has been put to the constraint section, to the
+        index
+        """
+        key = (str(constraint_el.tag), is_set_constraint(constraint_el))
+        # if the index has not been built yet, the constraint will be added
+        # when building it
+        if key in self._indexes and constraint_el not in self._positions:
+            self._add_to_index(constraint_el, *self._indexes[key])
+
 
 def validate_constrainable_elements(
     element_list: Iterable[_Element], in_multiinstance_allowed: bool = False
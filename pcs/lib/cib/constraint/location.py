@@ -1,4 +1,4 @@
-from collections.abc import Mapping
+from collections.abc import Hashable, Mapping
 
 from lxml import etree
 from lxml.etree import _Element
@@ -19,7 +19,7 @@ from pcs.common.pacemaker.types import CibResourceDiscovery
 from pcs.lib import validate
 from pcs.lib.cib import rule
 from pcs.lib.cib.const import TAG_CONSTRAINT_LOCATION as TAG
-from pcs.lib.cib.const import TAG_RULE
+from pcs.lib.cib.const import TAG_NODE, TAG_RULE
 from pcs.lib.cib.tools import (
     IdProvider,
     Version,
@@ -30,6 +30,7 @@ from pcs.lib.tools import get_optional_value
 
 from .common import (
     DuplicatesChecker,
+    DuplicatesCheckerSetConstraint,
     is_set_constraint,
     validate_constrainable_elements,
 )
@@ -110,61 +111,115 @@ def get_all_as_dtos(
     return plain_list, set_list
 
 
-class DuplicatesCheckerLocationRulePlain(DuplicatesChecker):
+class DuplicatesCheckerLocationPlain(DuplicatesChecker):
     """
-    Searcher of duplicate plain location constraints with rules
+    Searcher of duplicate plain location constraints with a node or rules
 
-    The constraint_to_check is limited to contain one rule at most. If you need
-    more, split it to individual constraint elements containing one rule each
-    for the purposes of the check.
+    Constraints with a node are duplicate if they constrain the same resource
+    in the same role to the same node. Constraints with rules are duplicate if
+    they constrain the same resource in the same role and have a rule in
+    common.
     """
 
     def __init__(self) -> None:
         super().__init__()
         self._rule_to_str = rule.RuleToStr(normalize=True)
-        self._constraint_to_check_rule: str | None = None
+
+    def _are_duplicate(
+        self,
+        constraint_to_check: _Element,
+        constraint_el: _Element,
+    ) -> bool:
+        return self._have_common_signature(constraint_to_check, constraint_el)
+
+    def get_signatures(self, constraint_el: _Element) -> list[Hashable]:
+        return [
+            (
+                constraint_el.get("rsc"),
+                constraint_el.get("rsc-pattern"),
+                placement,
+            )
+            for placement in _placement_signatures(
+                self._rule_to_str, constraint_el
+            )
+        ]
+
+
+class DuplicatesCheckerLocationRulePlain(DuplicatesCheckerLocationPlain):
+    """
+    Searcher of duplicate plain location constraints with rules
+
+    Constraints are duplicate if they constrain the same resource in the same
+    role and have a rule in common, just like in DuplicatesCheckerLocationPlain.
+    The constraint_to_check is limited to contain one rule at most. If you need
+    more, split it to individual constraint elements containing one rule each
+    for the purposes of the check.
+    """
 
     def _check_init(self, constraint_to_check: _Element) -> None:
-        self._constraint_to_check_rule = None
         if len(constraint_to_check.findall(TAG_RULE)) != 1:
             raise RuntimeError(
                 "constraint_to_check must contain exactly one rule"
             )
 
+
+class DuplicatesCheckerLocationWithSet(DuplicatesCheckerSetConstraint):
+    """
+    Searcher of duplicate location constraints with resource sets
+
+    Constraints are duplicate if they have the same resource sets, constrain
+    them in the same role and have the same node or a rule in common.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._rule_to_str = rule.RuleToStr(normalize=True)
+
     def _are_duplicate(
         self,
         constraint_to_check: _Element,
         constraint_el: _Element,
     ) -> bool:
-        # simple node-score constraints are not duplicate to rule constraints
-        if not is_location_constraint_with_rule(constraint_el):
-            return False
-
-        # get the base constraint's rule as string
-        if self._constraint_to_check_rule is None:
-            rule_el = constraint_to_check.find(TAG_RULE)
-            if rule_el is not None:
-                self._constraint_to_check_rule = self._rule_to_str.get_str(
-                    rule_el
-                )
+        return self._have_common_signature(constraint_to_check, constraint_el)
+
+    def get_signatures(self, constraint_el: _Element) -> list[Hashable]:
+        return [
+            (set_signature, placement)
+            for set_signature in super().get_signatures(constraint_el)
+            for placement in _placement_signatures(
+                self._rule_to_str, constraint_el
+            )
+        ]
+
+
+def _placement_signatures(
+    rule_to_str: rule.RuleToStr, constraint_el: _Element
+) -> list[Hashable]:
+    """
+    Return signatures of where and in which role a constraint places resources
 
-        # get the tested constraint's rules as strings
-        rules = {
-            self._rule_to_str.get_str(rule_el)
+    A constraint with rules has a signature for each of its rules, as
+    pacemaker acts as if there was a separate constraint for each rule.
+    A role of a rule applies instead of a role of its constraint. Constraints
+    with a node are not duplicate to constraints with rules.
+    """
+    role = constraint_el.get("role")
+    if is_location_constraint_with_rule(constraint_el):
+        return [
+            (
+                TAG_RULE,
+                get_optional_value(role_constructor, rule_el.get("role", role)),
+                rule_to_str.get_str(rule_el),
+            )
             for rule_el in constraint_el.iterfind(TAG_RULE)
-        }
-
-        # compare the two constraints
-        return (
-            constraint_to_check.get("rsc") == constraint_el.get("rsc")
-            and constraint_to_check.get("rsc-pattern")
-            == constraint_el.get("rsc-pattern")
-            # From pacemaker explained:
-            # A location constraint may contain one or more top-level rules.
-            # The cluster will act as if there is a separate location
-            # constraint for each rule that evaluates as true.
-            and self._constraint_to_check_rule in rules
+        ]
+    return [
+        (
+            TAG_NODE,
+            get_optional_value(role_constructor, role),
+            constraint_el.get("node"),
         )
+    ]
 
 
 class ValidateCreatePlainWithRule:
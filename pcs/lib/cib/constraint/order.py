@@ -1,9 +1,10 @@
+from collections.abc import Hashable
 from functools import partial
 
 from lxml.etree import _Element
 
 from pcs.common import reports
-from pcs.common.const import PcmkAction
+from pcs.common.const import PCMK_ACTION_START, PcmkAction
 from pcs.common.pacemaker.constraint import (
     CibConstraintOrderAttributesDto,
     CibConstraintOrderDto,
@@ -13,7 +14,10 @@ from pcs.common.pacemaker.types import CibResourceSetOrderType
 from pcs.common.reports.item import ReportItem
 from pcs.lib.cib.const import TAG_CONSTRAINT_ORDER as TAG
 from pcs.lib.cib.constraint import constraint
-from pcs.lib.cib.constraint.common import is_set_constraint
+from pcs.lib.cib.constraint.common import (
+    DuplicatesChecker,
+    is_set_constraint,
+)
 from pcs.lib.cib.constraint.resource_set import (
     constraint_element_to_resource_set_dto_list,
 )
@@ -127,3 +131,28 @@ def get_all_as_dtos(
         else:
             plain_list.append(_constraint_el_to_dto(constraint_el))
     return plain_list, set_list
+
+
+class DuplicatesCheckerOrderPlain(DuplicatesChecker):
+    """
+    Searcher of duplicate plain order constraints
+    """
+
+    def _are_duplicate(
+        self,
+        constraint_to_check: _Element,
+        constraint_el: _Element,
+    ) -> bool:
+        return self._have_common_signature(constraint_to_check, constraint_el)
+
+    def get_signatures(self, constraint_el: _Element) -> list[Hashable]:
+        return [
+            (
+                constraint_el.get("first"),
+                constraint_el.get("then"),
+                constraint_el.get("first-action", "").lower()
+                or PCMK_ACTION_START,
+                constraint_el.get("then-action", "").lower()
+                or PCMK_ACTION_START,
+            )
+        ]
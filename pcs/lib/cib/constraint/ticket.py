@@ -1,4 +1,4 @@
-from collections.abc import Mapping
+from collections.abc import Hashable, Mapping
 from typing import cast
 
 from lxml.etree import SubElement, _Element
@@ -327,6 +327,9 @@ class DuplicatesCheckerTicketPlain(DuplicatesChecker):
             == self._constraint_characteristics
         )
 
+    def get_signatures(self, constraint_el: _Element) -> list[Hashable]:
+        return [tuple(self._characteristics(constraint_el).items())]
+
 
 class DuplicatesCheckerTicketWithSet(DuplicatesCheckerSetConstraint):
     """
@@ -342,6 +345,12 @@ class DuplicatesCheckerTicketWithSet(DuplicatesCheckerSetConstraint):
             "ticket"
         ) and super()._are_duplicate(constraint_to_check, constraint_el)
 
+    def get_signatures(self, constraint_el: _Element) -> list[Hashable]:
+        return [
+            (constraint_el.get("ticket"), signature)
+            for signature in super().get_signatures(constraint_el)
+        ]
+
 
 def _element_to_attributes_dto(
     element: _Element,
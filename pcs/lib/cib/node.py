@@ -73,6 +73,50 @@ def update_node_instance_attrs(
     dict attrs -- attrs to update, e.g. {'A': 'a', 'B': ''}
     iterable state_nodes -- optional list of node state objects
     """
+    # If no instance_attributes id is specified, crm_attribute modifies the
+    # first one found. So we just mimic this behavior here.
+    _update_node_nvset(
+        cib,
+        id_provider,
+        node_name,
+        "instance_attributes",
+        "nodes-{0}",
+        attrs,
+        state_nodes,
+    )
+
+
+def update_node_utilization(
+    cib, id_provider, node_name, attrs, state_nodes=None
+):
+    """
+    Update nvpairs in utilization for a node specified by its name.
+
+    Automatically creates utilization element if needed. If the node has more
+    than one utilization element, the first one is modified. If the node is
+    missing in the CIB, it is automatically created if its state is provided
+    in state_nodes.
+
+    etree cib -- cib
+    IdProvider id_provider -- elements' ids generator
+    string node_name -- name of the node to be updated
+    dict attrs -- utilization attrs to update, e.g. {'A': '1', 'B': ''}
+    iterable state_nodes -- optional list of node state objects
+    """
+    _update_node_nvset(
+        cib,
+        id_provider,
+        node_name,
+        "utilization",
+        "nodes-{0}-utilization",
+        attrs,
+        state_nodes,
+    )
+
+
+def _update_node_nvset(
+    cib, id_provider, node_name, nvset_tag, nvset_id_pattern, attrs, state_nodes
+):
     # Do not ever remove the nvset element or the node element, even if they
     # are empty. There may be ACLs set in pacemaker which allow "write" for
     # nvpairs (adding, changing and removing) but not nvsets. In such a case,
@@ -85,13 +129,13 @@ def update_node_instance_attrs(
 
     cib_nodes = get_nodes(cib)
     node_el = _ensure_node_exists(cib_nodes, node_name, state_nodes)
-    # If no instance_attributes id is specified, crm_attribute modifies the
-    # first one found. So we just mimic this behavior here.
-    attrs_el = node_el.find("./instance_attributes")
+    attrs_el = node_el.find(f"./{nvset_tag}")
     if attrs_el is None:
         attrs_el = etree.Element(
-            "instance_attributes",
-            id=id_provider.allocate_id("nodes-{0}".format(node_el.get("id"))),
+            nvset_tag,
+            id=id_provider.allocate_id(
+                nvset_id_pattern.format(node_el.get("id"))
+            ),
         )
     update_nvset(attrs_el, attrs, id_provider)
     append_when_useful(node_el, attrs_el)
@@ -320,6 +320,61 @@ def get_elements_by_ids(
     return found_element_list, id_not_found_list
 
 
+def get_configuration_id_map(tree: _Element) -> dict[str, _Element]:
+    """
+    Return all configuration elements (not in status section of cib) by their
+    ids
+
+    This is a counterpart of get_configuration_elements_by_id for resolving
+    many ids, the tree is searched only once. See the function for what is
+    considered to be an id.
+
+    tree -- any element in xml tree, whole tree (not only its subtree) will be
+        searched
+    """
+    root = get_root(tree)
+    configuration_xpath = '(/cib/*[name()!="status"] | /*[name()!="cib"])'
+    id_map = {
+        str(element.attrib["id"]): element
+        for element in cast(
+            list[_Element],
+            root.xpath(
+                f"""
+                {configuration_xpath}
+                //*[
+                    @id
+                    and
+                    name()!="acl_target"
+                    and
+                    name()!="role"
+                    and
+                    name()!="obj_ref"
+                    and
+                    name()!="resource_ref"
+                ]
+                """
+            ),
+        )
+    }
+    for primitive_el in cast(
+        list[_Element],
+        root.xpath(
+            f"""
+            {configuration_xpath}
+            //primitive[meta_attributes/nvpair[@name="remote-node" and @value]]
+            """
+        ),
+    ):
+        for remote_node in cast(
+            list[str],
+            primitive_el.xpath(
+                './meta_attributes/nvpair[@name="remote-node"]/@value'
+            ),
+        ):
+            id_map.setdefault(str(remote_node), primitive_el)
+    return id_map
+
+
 # DEPRECATED, use IdProvider instead
 def does_id_exist(tree: _Element, check_id: str) -> bool:
     """
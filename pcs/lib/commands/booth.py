@@ -2,6 +2,7 @@ import base64
 import os.path
 from collections.abc import Mapping
 from functools import partial
+from hashlib import sha1
 from typing import cast
 
 from lxml.etree import _Element
@@ -13,7 +14,6 @@ from pcs.common.booth_dto import (
     BoothConfigFileDto,
 )
 from pcs.common.file import FileAlreadyExists, RawFileError
-from pcs.common.reports import ReportProcessor
 from pcs.common.reports import codes as report_codes
 from pcs.common.reports.item import ReportItem, get_severity
 from pcs.common.services.errors import ManageServiceError
@@ -31,6 +31,8 @@ from pcs.lib.booth.cib import (
     get_booth_ticket_names as get_cib_booth_ticket_names,
 )
 from pcs.lib.booth.cib import get_ticket_names as get_cib_ticket_names
+from pcs.lib.booth.cib import remove_ticket_states as remove_cib_ticket_states
+from pcs.lib.booth.cib import set_tickets_standby as set_cib_tickets_standby
 from pcs.lib.booth.env import BoothEnv
 from pcs.lib.cib.remove_elements import (
     ElementsToRemove,
@@ -39,8 +41,12 @@ from pcs.lib.cib.remove_elements import (
 )
 from pcs.lib.cib.resource import group, hierarchy, primitive
 from pcs.lib.cib.tools import IdProvider, get_resources
-from pcs.lib.communication.booth import BoothGetConfig, BoothSendConfig
-from pcs.lib.communication.tools import run_and_raise
+from pcs.lib.communication.booth import (
+    BoothGetConfig,
+    BoothGetConfigFiles,
+    BoothSendConfig,
+)
+from pcs.lib.communication.tools import run, run_and_raise
 from pcs.lib.env import LibraryEnvironment
 from pcs.lib.errors import LibraryError
 from pcs.lib.external import CommandRunner
@@ -49,7 +55,6 @@ from pcs.lib.file.raw_file import GhostFile, RealFile, raw_file_error_report
 from pcs.lib.interface.config import ParserErrorException
 from pcs.lib.node import get_existing_nodes_names
 from pcs.lib.pacemaker.live import has_cib_xml, resource_restart
-from pcs.lib.pacemaker.live import ticket_cleanup as live_ticket_cleanup
 from pcs.lib.pacemaker.live import ticket_standby as live_ticket_standby
 from pcs.lib.pacemaker.live import ticket_unstandby as live_ticket_unstandby
 from pcs.lib.resource_agent import (
@@ -539,7 +544,7 @@ def create_in_cluster(
         enable_agent_self_validation=False,
     )
     agent_factory = ResourceAgentFacadeFactory(
-        env.cmd_runner(), report_processor
+        env.cmd_runner(), report_processor, env.get_agent_metadata_cache()
     )
 
     # Group id validation is not needed since create_id creates a new unique
@@ -789,7 +794,7 @@ def ticket_cleanup(env: LibraryEnvironment, ticket_name: str) -> None:
     ).has_errors:
         raise LibraryError()
 
-    _cleanup_tickets(env.cmd_runner(), env.report_processor, [ticket_name])
+    _cleanup_tickets(env, [ticket_name])
 
 
 def ticket_cleanup_auto(
@@ -819,41 +824,44 @@ def ticket_cleanup_auto(
     conf_tickets = set(booth_conf.get_ticket_names())
     cib_tickets = set(get_cib_booth_ticket_names(env.get_cib(), instance_name))
 
-    _cleanup_tickets(
-        env.cmd_runner(), report_processor, sorted(cib_tickets - conf_tickets)
-    )
+    _cleanup_tickets(env, sorted(cib_tickets - conf_tickets))
 
 
 def _cleanup_tickets(
-    cmd_runner: CommandRunner,
-    report_processor: ReportProcessor,
-    ticket_names: StringSequence,
+    env: LibraryEnvironment, ticket_names: StringSequence
 ) -> None:
-    for ticket in ticket_names:
-        # standby the ticket first, so the node is not fenced if ticket-loss
-        # policy is set to 'fence' in the ticket constraint
-        report_processor.report_list(_ticket_standby(cmd_runner, ticket))
-        if report_processor.has_errors:
-            raise LibraryError()
+    """
+    Remove state of the specified tickets from the loaded CIB
 
-        report_processor.report(
-            reports.ReportItem.info(reports.messages.BoothTicketCleanup(ticket))
-        )
-        stdout, stderr, retval = live_ticket_cleanup(cmd_runner, ticket)
-        if retval != 0:
-            report_processor.report(
-                reports.ReportItem.error(
-                    reports.messages.BoothTicketOperationFailed(
-                        "cleanup",
-                        join_multilines([stderr, stdout]),
-                        None,
-                        ticket,
-                    )
-                )
+    All the tickets are put to standby in one CIB update first, so the node is
+    not fenced if ticket-loss policy is set to 'fence' in the ticket
+    constraint. Then all the tickets are removed in a second CIB update.
+
+    ticket_names -- names of the tickets to remove
+    """
+    if not ticket_names:
+        return
+
+    env.report_processor.report_list(
+        [
+            reports.ReportItem.info(
+                reports.messages.BoothTicketChangingState(ticket, "standby")
             )
+            for ticket in ticket_names
+        ]
+    )
+    if set_cib_tickets_standby(env.cib, ticket_names):
+        env.push_cib()
+        env.get_cib()
 
-        if report_processor.has_errors:
-            raise LibraryError()
+    env.report_processor.report_list(
+        [
+            reports.ReportItem.info(reports.messages.BoothTicketCleanup(ticket))
+            for ticket in ticket_names
+        ]
+    )
+    remove_cib_ticket_states(env.cib, ticket_names)
+    env.push_cib()
 
 
 def ticket_standby(env: LibraryEnvironment, ticket_name: str) -> None:
@@ -999,6 +1007,51 @@ def config_sync(
     if report_processor.has_errors:
         raise LibraryError()
 
+    if not authfile_name:
+        authfile_data = None
+    target_list = env.get_node_target_factory().get_target_list(
+        cluster_nodes_names,
+        skip_non_existing=skip_offline_nodes,
+    )
+
+    # Do not send the files to nodes which already have them. Those are found
+    # in one request round, so it is cheaper than sending the files to all
+    # the nodes and saving them there. The raw files are compared, so that
+    # nodes with files differing in comments or formatting get the files too.
+    local_files_hash = _get_booth_files_hash(booth_conf_data, authfile_data)
+    com_cmd_get = BoothGetConfigFiles(
+        env.report_processor,
+        booth_env.instance_name,
+        skip_offline_targets=skip_offline_nodes,
+    )
+    com_cmd_get.set_targets(target_list)
+    node_files, offline_node_list = run(
+        env.get_node_communicator(), com_cmd_get
+    )
+    up_to_date_node_set = {
+        node_label
+        for node_label, (node_config_data, node_authfile_data) in (
+            node_files.items()
+        )
+        if _get_booth_files_hash(node_config_data, node_authfile_data)
+        == local_files_hash
+    }
+    if up_to_date_node_set:
+        report_processor.report(
+            ReportItem.info(
+                reports.messages.BoothConfigUpToDateOnNodes(
+                    sorted(up_to_date_node_set), booth_env.instance_name
+                )
+            )
+        )
+    # offline nodes have already been reported, do not wait for them again
+    skip_node_set = up_to_date_node_set | set(offline_node_list)
+    target_list = [
+        target for target in target_list if target.label not in skip_node_set
+    ]
+    if not target_list:
+        return
+
     com_cmd = BoothSendConfig(
         env.report_processor,
         booth_env.instance_name,
@@ -1007,15 +1060,29 @@ def config_sync(
         authfile_data=authfile_data,
         skip_offline_targets=skip_offline_nodes,
     )
-    com_cmd.set_targets(
-        env.get_node_target_factory().get_target_list(
-            cluster_nodes_names,
-            skip_non_existing=skip_offline_nodes,
-        )
-    )
+    com_cmd.set_targets(target_list)
     run_and_raise(env.get_node_communicator(), com_cmd)
 
 
+def _get_booth_files_hash(
+    config_data: bytes, authfile_data: bytes | None
+) -> str:
+    """
+    Get a hash of raw booth config and authfile identifying their content
+
+    config_data -- content of booth config
+    authfile_data -- content of booth authfile, None if there is no authfile
+    """
+    # The hash is only used to compare the files, not for security reasons
+    authfile_hash = (
+        sha1(authfile_data, usedforsecurity=False).hexdigest()
+        if authfile_data is not None
+        else ""
+    )
+    config_hash = sha1(config_data, usedforsecurity=False).hexdigest()
+    return f"{config_hash}:{authfile_hash}"
+
+
 def enable_booth(
     env: LibraryEnvironment, instance_name: str | None = None
 ) -> None:
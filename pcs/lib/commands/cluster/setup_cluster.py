@@ -5,6 +5,7 @@ from pcs import settings
 from pcs.common import reports, ssl
 from pcs.lib import node_communication_format
 from pcs.lib.commands.cluster.setup_utils import (
+    PhaseRunner,
     get_addrs_defaulter,
     get_validated_wait_timeout,
     host_check_cluster_setup,
@@ -48,6 +49,7 @@ def setup(  # noqa:  PLR0913, PLR0915
     enable: bool = False,
     no_keys_sync: bool = False,
     no_cluster_uuid: bool = False,
+    pipeline: bool = False,
     force_flags: reports.types.ForceFlags = (),
 ) -> None:
     # pylint: disable=too-many-arguments
@@ -85,6 +87,9 @@ def setup(  # noqa:  PLR0913, PLR0915
         cert and key, pacemaker authkey, corosync authkey
     no_cluster_uuid -- if True, do not generate a unique cluster UUID into
         the 'totem' section of corosync.conf
+    pipeline -- if True, let each node go through the steps preceding
+        distribution of corosync.conf independently of other nodes and report
+        how long each step took on each node
     force_flags -- list of flags codes
 
     The command is defaulting node addresses if they are not specified. The
@@ -183,10 +188,12 @@ def setup(  # noqa:  PLR0913, PLR0915
     # Validation done. If errors occurred, an exception has been raised and we
     # don't get below this line.
 
+    phase_runner = PhaseRunner(env, pipeline)
+
     # Destroy cluster on all nodes.
     com_cmd = cluster.Destroy(env.report_processor)
     com_cmd.set_targets(target_list)
-    run_and_raise(env.get_node_communicator(), com_cmd)
+    phase_runner.add("destroy", com_cmd)
 
     # Distribute auth tokens.
     com_cmd = UpdateKnownHosts(
@@ -197,7 +204,7 @@ def setup(  # noqa:  PLR0913, PLR0915
         known_hosts_to_remove=[],
     )
     com_cmd.set_targets(target_list)
-    run_and_raise(env.get_node_communicator(), com_cmd)
+    phase_runner.add("known hosts", com_cmd)
 
     # TODO This should be in the file distribution call but so far we don't
     # have a call which allows to save and delete files at the same time.
@@ -206,7 +213,7 @@ def setup(  # noqa:  PLR0913, PLR0915
         {"pcsd settings": {"type": "pcsd_settings"}},
     )
     com_cmd.set_targets(target_list)
-    run_and_raise(env.get_node_communicator(), com_cmd)
+    phase_runner.add("pcsd settings", com_cmd)
 
     if not no_keys_sync:
         # Distribute configuration files except corosync.conf. Sending
@@ -227,7 +234,7 @@ def setup(  # noqa:  PLR0913, PLR0915
         )
         com_cmd = DistributeFilesWithoutForces(env.report_processor, actions)
         com_cmd.set_targets(target_list)
-        run_and_raise(env.get_node_communicator(), com_cmd)
+        phase_runner.add("authkeys", com_cmd)
 
         # Distribute and reload pcsd SSL certificate
         if sync_ssl_certs:
@@ -249,7 +256,10 @@ def setup(  # noqa:  PLR0913, PLR0915
                 env.report_processor, ssl_cert, ssl_key
             )
             com_cmd.set_targets(target_list)
-            run_and_raise(env.get_node_communicator(), com_cmd)
+            phase_runner.add("pcsd ssl certificate", com_cmd)
+
+    # All nodes must be ready before any of them becomes a part of the cluster.
+    phase_runner.run()
 
     # Create and distribute corosync.conf. Once a node saves corosync.conf it
     # is considered to be in a cluster.
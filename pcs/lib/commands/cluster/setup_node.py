@@ -10,6 +10,7 @@ from pcs.lib.booth import sync as booth_sync
 from pcs.lib.cib.resource.guest_node import find_node_list as get_guest_nodes
 from pcs.lib.cib.resource.remote_node import find_node_list as get_remote_nodes
 from pcs.lib.commands.cluster.setup_utils import (
+    PhaseRunner,
     get_addrs_defaulter,
     get_validated_wait_timeout,
     host_check_cluster_setup,
@@ -55,6 +56,7 @@ def add_nodes(  # noqa: PLR0912, PLR0915
     start=False,
     enable=False,
     no_watchdog_validation=False,
+    pipeline=False,
     force_flags: reports.types.ForceFlags = (),
 ):
     # pylint: disable=too-many-branches
@@ -76,6 +78,9 @@ def add_nodes(  # noqa: PLR0912, PLR0915
     enable bool -- if True enable cluster when it is set up
     no_watchdog_validation bool -- if True do not validate specified watchdogs
         on remote hosts
+    pipeline bool -- if True, let each new node go through the steps preceding
+        distribution of corosync.conf independently of other new nodes and
+        report how long each step took on each node
     force_flags list -- list of flags codes
 
     The command is defaulting node addresses if they are not specified. The
@@ -358,12 +363,14 @@ def add_nodes(  # noqa: PLR0912, PLR0915
     # Validation done. If errors occurred, an exception has been raised and we
     # don't get below this line.
 
+    phase_runner = PhaseRunner(env, pipeline)
+
     # First, destroy cluster on new nodes. This is needed to make sure that
     # new nodes are not part of another cluster and that there are no cluster
     # configs left there which would interfere with the current cluster.
     com_cmd = cluster.Destroy(env.report_processor)
     com_cmd.set_targets(new_nodes_target_list)
-    run_and_raise(env.get_node_communicator(), com_cmd)
+    phase_runner.add("destroy", com_cmd)
 
     # Set up everything else than corosync. Once the new nodes are present
     # in corosync.conf, they're considered part of a cluster and the node add
@@ -380,10 +387,11 @@ def add_nodes(  # noqa: PLR0912, PLR0915
         known_hosts_to_remove=[],
     )
     com_cmd.set_targets(new_nodes_target_list)
-    run_and_raise(env.get_node_communicator(), com_cmd)
+    phase_runner.add("known hosts", com_cmd)
 
     # qdevice setup
     if corosync_conf.get_quorum_device_model() == "net":
+        phase_runner.run()
         qdevice_net.set_up_client_certificates(
             env.cmd_runner(),
             env.report_processor,
@@ -413,17 +421,18 @@ def add_nodes(  # noqa: PLR0912, PLR0915
                     device_list=new_node["devices"],
                 ),
             )
-        run_and_raise(env.get_node_communicator(), com_cmd_sbd_cfg)
+        phase_runner.add("sbd config", com_cmd_sbd_cfg)
 
         com_cmd = EnableSbdService(env.report_processor)
         com_cmd.set_targets(new_nodes_target_list)
-        run_and_raise(env.get_node_communicator(), com_cmd)
+        phase_runner.add("sbd service", com_cmd)
     else:
         com_cmd = DisableSbdService(env.report_processor)
         com_cmd.set_targets(new_nodes_target_list)
-        run_and_raise(env.get_node_communicator(), com_cmd)
+        phase_runner.add("sbd service", com_cmd)
 
     # booth setup
+    phase_runner.run()
     booth_sync.send_all_config_to_node(
         env.get_node_communicator(),
         env.report_processor,
@@ -539,7 +548,7 @@ def add_nodes(  # noqa: PLR0912, PLR0915
             env.report_processor, files_action
         )
         com_cmd.set_targets(new_nodes_target_list)
-        run_and_raise(env.get_node_communicator(), com_cmd)
+        phase_runner.add("config files", com_cmd)
 
     # Distribute and reload pcsd SSL certificate
     if sync_ssl_certs:
@@ -584,7 +593,11 @@ def add_nodes(  # noqa: PLR0912, PLR0915
 
         com_cmd = SendPcsdSslCertAndKey(env.report_processor, ssl_cert, ssl_key)
         com_cmd.set_targets(new_nodes_target_list)
-        run_and_raise(env.get_node_communicator(), com_cmd)
+        phase_runner.add("pcsd ssl certificate", com_cmd)
+
+    # All new nodes must be ready before any of them becomes a part of the
+    # cluster.
+    phase_runner.run()
 
     # When corosync >= 2 is in use, the procedure for adding a node is:
     # 1. add the new node to corosync.conf on all existing nodes
@@ -7,13 +7,65 @@ from pcs.common import file_type_codes, reports
 from pcs.common.file import RawFileError
 from pcs.common.tools import format_os_error
 from pcs.lib.communication.nodes import CheckPacemakerStarted, StartCluster
+from pcs.lib.communication.tools import (
+    NodePipeline,
+    RunRemotelyBase,
+    run_and_raise,
+)
 from pcs.lib.communication.tools import run as run_com
-from pcs.lib.communication.tools import run_and_raise
 from pcs.lib.errors import LibraryError
 from pcs.lib.pacemaker.values import get_valid_timeout_seconds
 from pcs.lib.tools import environment_file_to_dict
 
 
+class PhaseRunner:
+    """
+    Run communication commands (phases) changing nodes during cluster setup or
+    node add
+
+    By default, each phase is run right away and it is a barrier: all nodes
+    must finish it before the next phase is started. In the pipeline mode,
+    phases are collected and run as independent per-node pipelines once a
+    barrier is requested by calling the 'run' method.
+    """
+
+    def __init__(self, env, pipeline: bool = False):
+        """
+        env LibraryEnvironment
+        pipeline -- if True, run the phases in the pipeline mode
+        """
+        self._env = env
+        self._pipeline = pipeline
+        self._phase_list: list[tuple[str, RunRemotelyBase]] = []
+
+    def add(self, name: str, com_cmd: RunRemotelyBase) -> None:
+        """
+        Run a phase now or enqueue it to a pipeline
+
+        name -- phase name used in the phases durations report
+        com_cmd -- communication command with its targets specified
+        """
+        if self._pipeline:
+            self._phase_list.append((name, com_cmd))
+            return
+        run_and_raise(self._env.get_node_communicator(), com_cmd)
+
+    def run(self) -> None:
+        """
+        Run all enqueued phases, wait for all nodes to finish them
+
+        Raise LibraryError if any of the phases failed on any node
+        """
+        if not self._phase_list:
+            return
+        phase_list = self._phase_list
+        self._phase_list = []
+        run_and_raise(
+            self._env.get_node_communicator(),
+            NodePipeline(self._env.report_processor, phase_list),
+        )
+
+
 def start_cluster(
     communicator_factory,
     report_processor: reports.ReportProcessor,
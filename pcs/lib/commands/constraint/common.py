@@ -1,10 +1,22 @@
+from collections.abc import Mapping
 from functools import partial
 
+from lxml import etree
 from lxml.etree import _Element
 
 from pcs.common import const, reports
 from pcs.common.pacemaker.constraint import CibConstraintsDto
+from pcs.common.tools import xml_fromstring
 from pcs.lib import validate
+from pcs.lib.cib.const import (
+    TAG_CONSTRAINT_COLOCATION,
+    TAG_CONSTRAINT_LOCATION,
+    TAG_CONSTRAINT_ORDER,
+    TAG_CONSTRAINT_TICKET,
+    TAG_CONSTRAINTS,
+    TAG_LIST_CONSTRAINT,
+    TAG_RESOURCE_REF,
+)
 from pcs.lib.cib.constraint import (
     colocation,
     common,
@@ -17,10 +29,12 @@ from pcs.lib.cib.constraint import (
 from pcs.lib.cib.rule.in_effect import get_rule_evaluator
 from pcs.lib.cib.tools import (
     ElementNotFound,
+    get_configuration_id_map,
     get_constraints,
     get_element_by_id,
 )
 from pcs.lib.env import LibraryEnvironment
+from pcs.lib.errors import LibraryError
 
 
 # This is an extracted part of lib commands for creating set constraints for
@@ -125,6 +139,171 @@ def get_config(
     )
 
 
+def import_constraints(
+    env: LibraryEnvironment,
+    constraints_xml: str,
+    force_flags: reports.types.ForceFlags = (),
+) -> None:
+    """
+    Add many constraints to the CIB in one CIB update
+
+    Only ids, referenced resources and duplicates of the constraints are
+    checked, each constraint is looked up in indexes of existing ids and
+    constraints instead of searching the whole CIB. Constraint and resource
+    set options are not validated, the constraints are added as they are and
+    invalid options are only reported by pacemaker when the CIB is pushed.
+
+    constraints_xml -- a constraints element with constraints to be added in
+        the CIB format
+    force_flags -- list of flags codes
+    """
+    try:
+        constraints_el = xml_fromstring(constraints_xml)
+    except etree.XMLSyntaxError as e:
+        raise LibraryError(
+            reports.ReportItem.error(
+                reports.messages.ConstraintImportXmlSyntaxError(str(e))
+            )
+        ) from e
+    if constraints_el.tag != TAG_CONSTRAINTS:
+        raise LibraryError(
+            reports.ReportItem.error(
+                reports.messages.ConstraintImportUnexpectedElement(
+                    str(constraints_el.tag), [TAG_CONSTRAINTS]
+                )
+            )
+        )
+
+    cib = env.get_cib()
+    constraint_section = get_constraints(cib)
+    id_map = get_configuration_id_map(cib)
+    signature_index = common.ConstraintSignatureIndex(constraint_section)
+    imported_ids: set[str] = set()
+    report_list: reports.ReportItemList = []
+
+    for constraint_el in list(constraints_el.iterchildren(etree.Element)):
+        if constraint_el.tag not in TAG_LIST_CONSTRAINT:
+            report_list.append(
+                reports.ReportItem.error(
+                    reports.messages.ConstraintImportUnexpectedElement(
+                        str(constraint_el.tag), sorted(TAG_LIST_CONSTRAINT)
+                    )
+                )
+            )
+            continue
+        report_list.extend(
+            _validate_imported_constraint_ids(
+                constraint_el, id_map, imported_ids
+            )
+        )
+        report_list.extend(
+            _validate_imported_constraint_resources(
+                constraint_el, id_map, force_flags
+            )
+        )
+        duplicate_list = signature_index.find_duplicates(
+            _get_duplicates_checker(constraint_el), constraint_el
+        )
+        if duplicate_list:
+            report_list.append(
+                reports.ReportItem(
+                    reports.item.get_severity(
+                        reports.codes.FORCE, reports.codes.FORCE in force_flags
+                    ),
+                    reports.messages.ConstraintImportDuplicate(
+                        str(constraint_el.get("id", "")),
+                        [str(el.attrib["id"]) for el in duplicate_list],
+                    ),
+                )
+            )
+        constraint_section.append(constraint_el)
+        signature_index.add(constraint_el)
+
+    if env.report_processor.report_list(report_list).has_errors:
+        raise LibraryError()
+    env.push_cib()
+
+
+def _validate_imported_constraint_ids(
+    constraint_el: _Element,
+    id_map: Mapping[str, _Element],
+    imported_ids: set[str],
+) -> reports.ReportItemList:
+    report_list: reports.ReportItemList = []
+    if "id" not in constraint_el.attrib:
+        report_list.append(
+            reports.ReportItem.error(
+                reports.messages.RequiredOptionsAreMissing(
+                    ["id"], str(constraint_el.tag)
+                )
+            )
+        )
+    for element in constraint_el.iter(etree.Element):
+        # resource_ref ids are references to resources, not ids of elements
+        if element.tag == TAG_RESOURCE_REF or "id" not in element.attrib:
+            continue
+        element_id = str(element.attrib["id"])
+        if element_id in id_map or element_id in imported_ids:
+            report_list.append(
+                reports.ReportItem.error(
+                    reports.messages.IdAlreadyExists(element_id)
+                )
+            )
+        imported_ids.add(element_id)
+    return report_list
+
+
+def _validate_imported_constraint_resources(
+    constraint_el: _Element,
+    id_map: Mapping[str, _Element],
+    force_flags: reports.types.ForceFlags,
+) -> reports.ReportItemList:
+    report_list: reports.ReportItemList = []
+    resource_ids = [
+        str(constraint_el.attrib[attribute])
+        for attribute in ("rsc", "with-rsc", "first", "then")
+        if attribute in constraint_el.attrib
+    ] + [
+        str(ref_el.attrib["id"])
+        for ref_el in constraint_el.iterfind(f".//{TAG_RESOURCE_REF}")
+    ]
+    resource_el_list = []
+    for resource_id in resource_ids:
+        if resource_id in id_map:
+            resource_el_list.append(id_map[resource_id])
+        else:
+            report_list.append(
+                reports.ReportItem.error(
+                    reports.messages.IdNotFound(resource_id, [])
+                )
+            )
+    report_list.extend(
+        common.validate_constrainable_elements(
+            resource_el_list,
+            in_multiinstance_allowed=reports.codes.FORCE in force_flags,
+        )
+    )
+    return report_list
+
+
+def _get_duplicates_checker(
+    constraint_el: _Element,
+) -> common.DuplicatesChecker:
+    if common.is_set_constraint(constraint_el):
+        if constraint_el.tag == TAG_CONSTRAINT_TICKET:
+            return ticket.DuplicatesCheckerTicketWithSet()
+        if constraint_el.tag == TAG_CONSTRAINT_LOCATION:
+            return location.DuplicatesCheckerLocationWithSet()
+        return common.DuplicatesCheckerSetConstraint()
+    plain_checkers: Mapping[str, type[common.DuplicatesChecker]] = {
+        TAG_CONSTRAINT_COLOCATION: colocation.DuplicatesCheckerColocationPlain,
+        TAG_CONSTRAINT_LOCATION: location.DuplicatesCheckerLocationPlain,
+        TAG_CONSTRAINT_ORDER: order.DuplicatesCheckerOrderPlain,
+        TAG_CONSTRAINT_TICKET: ticket.DuplicatesCheckerTicketPlain,
+    }
+    return plain_checkers[str(constraint_el.tag)]()
+
+
 # This is an extracted part of lib commands for creating set constraints for
 # the purposes of code deduplication. It is not meant to be part of API.
 def _load_resource_set_list(
@@ -1,10 +1,16 @@
+from collections.abc import Callable, Mapping
 from contextlib import contextmanager
 
 from pcs.common import reports
 from pcs.common.pacemaker.node import CibNodeListDto
 from pcs.common.reports.item import ReportItem
+from pcs.lib import validate
 from pcs.lib.cib import node
-from pcs.lib.cib.node import update_node_instance_attrs
+from pcs.lib.cib.node import (
+    get_node_names,
+    update_node_instance_attrs,
+    update_node_utilization,
+)
 from pcs.lib.cib.rule.in_effect import get_rule_evaluator
 from pcs.lib.cib.tools import IdProvider, get_nodes
 from pcs.lib.env import LibraryEnvironment, WaitType
@@ -184,6 +190,88 @@ def _set_instance_attrs_all_nodes(
             )
 
 
+def set_nodes_attributes(
+    lib_env: LibraryEnvironment,
+    nodes_attributes: Mapping[str, Mapping[str, str]],
+) -> None:
+    """
+    Set instance attributes of several nodes in one CIB update
+
+    LibraryEnvironment lib_env
+    nodes_attributes -- node names and their attributes to be set, an
+        attribute with an empty value is removed
+    """
+    _set_nodes_nvsets(lib_env, nodes_attributes, update_node_instance_attrs)
+
+
+def set_nodes_utilization(
+    lib_env: LibraryEnvironment,
+    nodes_utilization: Mapping[str, Mapping[str, str]],
+) -> None:
+    """
+    Set utilization attributes of several nodes in one CIB update
+
+    LibraryEnvironment lib_env
+    nodes_utilization -- node names and their utilization attributes to be
+        set, an attribute with an empty value is removed
+    """
+    report_list = []
+    validated_attrs_list: list[Mapping[str, str]] = []
+    for attrs in nodes_utilization.values():
+        # The same attributes are commonly set for many nodes. Validate them
+        # once, so that each error is reported only once.
+        if attrs in validated_attrs_list:
+            continue
+        validated_attrs_list.append(attrs)
+        for name in attrs:
+            validator = validate.ValueInteger(name)
+            validator.empty_string_valid = True
+            report_list.extend(validator.validate(attrs))
+    if lib_env.report_processor.report_list(report_list).has_errors:
+        raise LibraryError()
+    _set_nodes_nvsets(lib_env, nodes_utilization, update_node_utilization)
+
+
+def _set_nodes_nvsets(
+    lib_env: LibraryEnvironment,
+    nodes_attrs: Mapping[str, Mapping[str, str]],
+    update_nvset: Callable[..., None],
+) -> None:
+    cib = lib_env.get_cib()
+    cib_nodes = get_node_names(cib)
+    # Nodes missing in the CIB may still be known to pacemaker, e.g. remote
+    # nodes which have never had any attributes set. Their elements are
+    # created from the cluster status. The status is only available in a live
+    # cluster, though, and it is only needed if such nodes are requested.
+    state_nodes = (
+        ClusterState(lib_env.get_cluster_state()).node_section.nodes
+        if lib_env.is_cib_live
+        and any(node_name not in cib_nodes for node_name in nodes_attrs)
+        else []
+    )
+    known_nodes = cib_nodes | {
+        state_node.attrs.name for state_node in state_nodes
+    }
+    report_list = [
+        ReportItem.error(reports.messages.NodeNotFound(node_name))
+        for node_name in nodes_attrs
+        if node_name not in known_nodes
+    ]
+    if report_list:
+        raise LibraryError(*report_list)
+
+    id_provider = IdProvider(cib)
+    for node_name, attrs in nodes_attrs.items():
+        if node_name not in cib_nodes and not any(attrs.values()):
+            # There is nothing to remove from a node missing in the CIB. Do not
+            # create an empty element for it.
+            continue
+        update_nvset(
+            cib, id_provider, node_name, attrs, state_nodes=state_nodes
+        )
+    lib_env.push_cib()
+
+
 def get_config_dto(
     lib_env: LibraryEnvironment, evaluate_expired: bool = False
 ) -> CibNodeListDto:
@@ -312,7 +312,7 @@ def node_add_remote(  # noqa: PLR0912, PLR0913, PLR0915
 
     try:
         resource_agent_facade = ResourceAgentFacadeFactory(
-            env.cmd_runner(), report_processor
+            env.cmd_runner(), report_processor, env.get_agent_metadata_cache()
         ).facade_from_parsed_name(remote_node.AGENT_NAME)
     except ResourceAgentError as e:
         report_processor.report(resource_agent_error_to_report_item(e))
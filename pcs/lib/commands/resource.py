@@ -544,7 +544,9 @@ def create(  # noqa: PLR0913
         )
 
     runner = env.cmd_runner()
-    agent_factory = ResourceAgentFacadeFactory(runner, env.report_processor)
+    agent_factory = ResourceAgentFacadeFactory(
+        runner, env.report_processor, env.get_agent_metadata_cache()
+    )
     agent_name = _get_resource_agent_name(
         runner, env.report_processor, resource_agent_name
     )
@@ -660,7 +662,9 @@ def create_as_clone(  # noqa: PLR0913
         )
 
     runner = env.cmd_runner()
-    agent_factory = ResourceAgentFacadeFactory(runner, env.report_processor)
+    agent_factory = ResourceAgentFacadeFactory(
+        runner, env.report_processor, env.get_agent_metadata_cache()
+    )
     agent_name = _get_resource_agent_name(
         runner, env.report_processor, resource_agent_name
     )
@@ -825,7 +829,9 @@ def create_in_group(  # noqa: PLR0913
         )
 
     runner = env.cmd_runner()
-    agent_factory = ResourceAgentFacadeFactory(runner, env.report_processor)
+    agent_factory = ResourceAgentFacadeFactory(
+        runner, env.report_processor, env.get_agent_metadata_cache()
+    )
     agent_name = _get_resource_agent_name(
         runner, env.report_processor, resource_agent_name
     )
@@ -979,7 +985,9 @@ def create_into_bundle(  # noqa: PLR0913
         )
 
     runner = env.cmd_runner()
-    agent_factory = ResourceAgentFacadeFactory(runner, env.report_processor)
+    agent_factory = ResourceAgentFacadeFactory(
+        runner, env.report_processor, env.get_agent_metadata_cache()
+    )
     agent_name = _get_resource_agent_name(
         runner, env.report_processor, resource_agent_name
     )
@@ -3044,7 +3052,11 @@ def update_meta(
     if resource.clone.is_any_clone(resource_el):
         _validate_clone_meta_attributes(
             env.report_processor,
-            ResourceAgentFacadeFactory(cmd_runner, env.report_processor),
+            ResourceAgentFacadeFactory(
+                cmd_runner,
+                env.report_processor,
+                env.get_agent_metadata_cache(),
+            ),
             resource_el,
             meta_attrs,
             force_flags,
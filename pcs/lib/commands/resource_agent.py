@@ -1,6 +1,9 @@
 from collections.abc import Iterable
 from typing import Any, cast
 
+from pcs import settings
+from pcs.common import file_type_codes, reports
+from pcs.common.file import RawFileError
 from pcs.common.interface.dto import to_dict
 from pcs.common.pacemaker.resource.operations import (
     OCF_CHECK_LEVEL_INSTANCE_ATTRIBUTE_NAME,
@@ -10,6 +13,8 @@ from pcs.common.reports import (
     ReportItemSeverity,
     ReportProcessor,
 )
+from pcs.common.reports.item import ReportItem
+from pcs.common.tools import format_os_error
 from pcs.lib.cib.resource.agent import (
     get_default_operations,
     operation_dto_to_legacy_dict,
@@ -110,7 +115,7 @@ def list_agents(
             continue
         agent_names.extend(_get_agent_names(runner, std_prov))
     return _complete_agent_list(
-        runner,
+        _get_agent_factory(lib_env),
         lib_env.report_processor,
         sorted(agent_names, key=lambda item: item.full_name),
         describe,
@@ -205,41 +210,58 @@ def _agent_metadata_to_dict(
     return agent_dict
 
 
+def _get_agent_factory(
+    lib_env: LibraryEnvironment,
+) -> ResourceAgentFacadeFactory:
+    return ResourceAgentFacadeFactory(
+        lib_env.cmd_runner(),
+        lib_env.report_processor,
+        lib_env.get_agent_metadata_cache(),
+    )
+
+
 def _complete_agent_list(
-    runner: CommandRunner,
+    agent_factory: ResourceAgentFacadeFactory,
     report_processor: ReportProcessor,
     agent_names: Iterable[ResourceAgentName],
     describe: bool,
     search: str | None,
 ) -> list[dict[str, Any]]:
-    agent_factory = ResourceAgentFacadeFactory(runner, report_processor)
     search_lower = search.lower() if search else None
+    name_list = [
+        name
+        for name in agent_names
+        if not search_lower or search_lower in name.full_name.lower()
+    ]
+    if not describe:
+        return [
+            _agent_metadata_to_dict(name_to_void_metadata(name), describe)
+            for name in name_list
+        ]
+
     agent_list = []
-    for name in agent_names:
-        if search_lower and search_lower not in name.full_name.lower():
-            continue
-        try:
-            metadata = (
-                agent_factory.facade_from_parsed_name(name).metadata
-                if describe
-                else name_to_void_metadata(name)
-            )
-            agent_list.append(_agent_metadata_to_dict(metadata, describe))
-        except ResourceAgentError as e:
+    for facade in agent_factory.facades_from_parsed_names(
+        name_list,
+        max_processes=settings.agent_metadata_load_max_processes,
+        timeout=settings.agent_metadata_load_timeout,
+    ):
+        if isinstance(facade, ResourceAgentError):
+            # Do not let one broken agent prevent listing all the other ones.
             report_processor.report(
                 resource_agent_error_to_report_item(
-                    e, ReportItemSeverity.warning()
+                    facade, ReportItemSeverity.warning()
                 )
             )
+            continue
+        agent_list.append(_agent_metadata_to_dict(facade.metadata, describe))
     return agent_list
 
 
 def _get_agent_metadata(
-    runner: CommandRunner,
-    report_processor: ReportProcessor,
-    agent_name: ResourceAgentNameDto,
+    lib_env: LibraryEnvironment, agent_name: ResourceAgentNameDto
 ) -> ResourceAgentMetadata:
-    agent_factory = ResourceAgentFacadeFactory(runner, report_processor)
+    report_processor = lib_env.report_processor
+    agent_factory = _get_agent_factory(lib_env)
     try:
         return agent_factory.facade_from_parsed_name(
             ResourceAgentName.from_dto(agent_name)
@@ -257,11 +279,7 @@ def get_agent_metadata(
 
     agent_name -- name of the agent
     """
-    return _get_agent_metadata(
-        lib_env.cmd_runner(),
-        lib_env.report_processor,
-        agent_name,
-    ).to_dto()
+    return _get_agent_metadata(lib_env, agent_name).to_dto()
 
 
 # deprecated: use get_agent_metadata instead
@@ -276,7 +294,7 @@ def describe_agent(
     """
     runner = lib_env.cmd_runner()
     report_processor = lib_env.report_processor
-    agent_factory = ResourceAgentFacadeFactory(runner, report_processor)
+    agent_factory = _get_agent_factory(lib_env)
     try:
         found_name = (
             split_resource_agent_name(agent_name)
@@ -301,9 +319,7 @@ def get_agent_default_operations(
 ) -> ListCibResourceOperationDto:
     report_list, operation_list = uniquify_operations_intervals(
         get_default_operations(
-            _get_agent_metadata(
-                lib_env.cmd_runner(), lib_env.report_processor, agent_name
-            ),
+            _get_agent_metadata(lib_env, agent_name),
             necessary_only,
         )
     )
@@ -345,3 +361,23 @@ def get_meta_attributes_metadata(
         name=resource_type,
         parameters=[parameter.to_dto() for parameter in parameters_metadata],
     )
+
+
+def refresh_metadata_cache(lib_env: LibraryEnvironment) -> None:
+    """
+    Drop cached agents metadata, they get loaded from the agents again
+    """
+    try:
+        lib_env.get_agent_metadata_cache().clear()
+    except OSError as e:
+        lib_env.report_processor.report(
+            ReportItem.error(
+                reports.messages.FileIoError(
+                    file_type_codes.RESOURCE_AGENT_METADATA_CACHE,
+                    RawFileError.ACTION_REMOVE,
+                    format_os_error(e),
+                    file_path=settings.agent_metadata_cache_dir,
+                )
+            )
+        )
+        raise LibraryError() from e
@@ -140,7 +140,9 @@ def create(  # noqa: PLR0913
         )
 
     runner = env.cmd_runner()
-    agent_factory = ResourceAgentFacadeFactory(runner, env.report_processor)
+    agent_factory = ResourceAgentFacadeFactory(
+        runner, env.report_processor, env.get_agent_metadata_cache()
+    )
     stonith_agent = _get_agent_facade(
         env.report_processor,
         agent_factory,
@@ -3,6 +3,7 @@ from typing import Any
 from pcs.lib.commands.resource_agent import (
     _agent_metadata_to_dict,
     _complete_agent_list,
+    _get_agent_factory,
     _get_agent_names,
 )
 from pcs.lib.env import LibraryEnvironment
@@ -10,7 +11,6 @@ from pcs.lib.errors import LibraryError
 from pcs.lib.resource_agent import (
     InvalidResourceAgentName,
     ResourceAgentError,
-    ResourceAgentFacadeFactory,
     ResourceAgentName,
     StandardProviderTuple,
     resource_agent_error_to_report_item,
@@ -32,7 +32,7 @@ def list_agents(
     """
     runner = lib_env.cmd_runner()
     return _complete_agent_list(
-        runner,
+        _get_agent_factory(lib_env),
         lib_env.report_processor,
         sorted(
             _get_agent_names(runner, StandardProviderTuple("stonith")),
@@ -53,8 +53,7 @@ def describe_agent(
 
     agent_name -- name of the agent (not containing "stonith:" prefix)
     """
-    runner = lib_env.cmd_runner()
-    agent_factory = ResourceAgentFacadeFactory(runner, lib_env.report_processor)
+    agent_factory = _get_agent_factory(lib_env)
     try:
         if ":" in agent_name:
             raise InvalidResourceAgentName(agent_name)
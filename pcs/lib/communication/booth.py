@@ -11,6 +11,7 @@ from pcs.lib.communication.tools import (
     SimpleResponseProcessingMixin,
     SkipOfflineMixin,
 )
+from pcs.lib.node_communication import response_to_report_item
 
 
 class BoothSendConfig(
@@ -111,6 +112,65 @@ class BoothGetConfig(
         )
 
 
+class BoothGetConfigFiles(
+    AllSameDataMixin,
+    AllAtOnceStrategyMixin,
+    RunRemotelyBase,
+):
+    """
+    Get booth config and authfile from nodes
+
+    Failures are not reported, nodes which did not provide their files are
+    simply missing in the result. If offline nodes are to be skipped, nodes
+    which could not be connected are reported as warnings and listed in the
+    result, so that they can be skipped in further communication.
+    """
+
+    def __init__(
+        self, report_processor, booth_name, skip_offline_targets=False
+    ):
+        super().__init__(report_processor)
+        self._booth_name = booth_name
+        self._skip_offline_targets = skip_offline_targets
+        self._files = {}
+        self._offline_node_list = []
+
+    def _get_request_data(self):
+        return RequestData(
+            "remote/booth_get_config", [("name", self._booth_name)]
+        )
+
+    def _process_response(self, response):
+        report_item = response_to_report_item(
+            response, severity=reports.ReportItemSeverity.WARNING
+        )
+        if report_item is not None:
+            if self._skip_offline_targets and not response.was_connected:
+                self._report(report_item)
+                self._offline_node_list.append(response.request.target.label)
+            return
+        try:
+            data = json.loads(response.data)
+            config_data = data["config"]["data"].encode("utf-8")
+            authfile_data = None
+            if data.get("authfile") and data["authfile"].get("data"):
+                authfile_data = base64.b64decode(data["authfile"]["data"])
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return
+        self._files[response.request.target.label] = (
+            config_data,
+            authfile_data,
+        )
+
+    def on_complete(self):
+        """
+        Return tuple:
+          dict: node label -> (config data, authfile data or None)
+          list of labels of nodes which could not be connected
+        """
+        return self._files, self._offline_node_list
+
+
 class BoothSaveFiles(
     ProcessJsonDataMixin,
     AllSameDataMixin,
@@ -1,3 +1,5 @@
+import time
+
 from pcs.common import reports
 from pcs.common.node_communicator import Request
 from pcs.common.reports import ReportItemSeverity
@@ -90,6 +92,7 @@ class RunRemotelyBase(CommunicationCommandInterface):
     def __init__(self, report_processor):
         self.__report_processor = report_processor
         self.__has_errors = False
+        self.__response_has_errors = False
 
     def _get_response_report(self, response):
         """
@@ -111,11 +114,10 @@ class RunRemotelyBase(CommunicationCommandInterface):
         """
 
         self.__report_processor.report_list(report_list)
-        if self.has_errors:
-            return
         for report_item in report_list:
             if report_item.severity.level == reports.ReportItemSeverity.ERROR:
                 self.__has_errors = True
+                self.__response_has_errors = True
                 return
 
     def _report(self, report):
@@ -137,6 +139,7 @@ class RunRemotelyBase(CommunicationCommandInterface):
         raise NotImplementedError()
 
     def on_response(self, response):
+        self.__response_has_errors = False
         returned = self._process_response(response)
         return returned if returned else []
 
@@ -150,6 +153,13 @@ class RunRemotelyBase(CommunicationCommandInterface):
     def has_errors(self):
         return self.__has_errors
 
+    @property
+    def response_has_errors(self):
+        """
+        Has an error occurred while processing the last received response.
+        """
+        return self.__response_has_errors
+
 
 class StrategyBase:
     """
@@ -350,3 +360,107 @@ class SkipOfflineMixin:
             forceable=self._failure_forceable,
             report_pcsd_too_old_on_404=self._report_pcsd_too_old_on_404,
         )
+
+
+class NodePipeline(CommunicationCommandInterface):
+    """
+    Run several communication commands (phases) as independent pipelines, one
+    pipeline per node.
+
+    A node proceeds to the next phase as soon as its own requests of the
+    current phase are processed successfully. So the slowest node does not
+    hold back the other nodes in each phase. A node which fails in a phase
+    does not proceed to the following phases. The only barrier is the end of
+    the whole pipeline. Nodes which have a request in the first phase are
+    processed by the pipeline.
+
+    The phases must be RunRemotelyBase commands with AllAtOnceStrategyMixin
+    strategy and their requests already specified. Methods 'before' and
+    'get_initial_request_list' of a phase are called once the first node
+    enters the phase.
+    """
+
+    def __init__(self, report_processor, phase_list):
+        """
+        report_processor -- a tool for reporting the phases durations
+        list phase_list -- list of tuples (phase name, communication command)
+        """
+        self._report_processor = report_processor
+        self._phase_list = list(phase_list)
+        self._phase_requests = {}
+        self._node_phase = {}
+        self._node_pending_requests = {}
+        self._node_failed = set()
+        self._node_phase_start = {}
+        self._node_durations = {}
+
+    def _get_phase_requests(self, phase_index):
+        if phase_index not in self._phase_requests:
+            com_cmd = self._phase_list[phase_index][1]
+            com_cmd.before()
+            requests_by_node = {}
+            for request in com_cmd.get_initial_request_list():
+                requests_by_node.setdefault(request.target.label, []).append(
+                    request
+                )
+            self._phase_requests[phase_index] = requests_by_node
+        return self._phase_requests[phase_index]
+
+    def _enter_phase(self, node_label, phase_index):
+        for index in range(phase_index, len(self._phase_list)):
+            request_list = self._get_phase_requests(index).pop(node_label, [])
+            if request_list:
+                self._node_phase[node_label] = index
+                self._node_pending_requests[node_label] = len(request_list)
+                self._node_phase_start[node_label] = time.monotonic()
+                return request_list
+        return []
+
+    def _leave_phase(self, node_label):
+        phase_name = self._phase_list[self._node_phase[node_label]][0]
+        self._node_durations.setdefault(node_label, {})[phase_name] = (
+            time.monotonic() - self._node_phase_start[node_label]
+        )
+
+    def get_initial_request_list(self):
+        request_list = []
+        for node_label in list(self._get_phase_requests(0).keys()):
+            request_list.extend(self._enter_phase(node_label, 0))
+        return request_list
+
+    def on_response(self, response):
+        node_label = response.request.target.label
+        phase_index = self._node_phase[node_label]
+        com_cmd = self._phase_list[phase_index][1]
+        extra_requests = com_cmd.on_response(response)
+        if com_cmd.response_has_errors:
+            self._node_failed.add(node_label)
+        self._node_pending_requests[node_label] += len(extra_requests) - 1
+        if extra_requests or self._node_pending_requests[node_label] > 0:
+            return extra_requests
+        self._leave_phase(node_label)
+        if node_label in self._node_failed:
+            return []
+        return self._enter_phase(node_label, phase_index + 1)
+
+    def on_complete(self):
+        for phase_index in sorted(self._phase_requests):
+            self._phase_list[phase_index][1].on_complete()
+        for node_label in sorted(self._node_durations):
+            self._report_processor.report(
+                ReportItem.info(
+                    reports.messages.NodePhaseDurations(
+                        node_label, self._node_durations[node_label]
+                    )
+                )
+            )
+
+    def before(self):
+        pass
+
+    @property
+    def has_errors(self):
+        return any(
+            self._phase_list[phase_index][1].has_errors
+            for phase_index in self._phase_requests
+        )
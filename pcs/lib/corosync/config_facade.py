@@ -1,4 +1,5 @@
 from collections.abc import Generator, Mapping, Sequence
+from dataclasses import dataclass
 from typing import Any, TypeVar, overload
 
 from pcs import settings
@@ -17,6 +18,23 @@ _KNET_CRYPTO_OPTIONS_PREFIX = "crypto_"
 T = TypeVar("T")
 
 
+@dataclass(frozen=True)
+class _NodesView:
+    """
+    Nodes and links of a config computed at once for repeated lookups
+
+    If several nodes have the same name, nodeid or address, the first of them
+    is available in the respective lookup.
+    """
+
+    nodes: list[CorosyncNode]
+    nodes_by_name: dict[str, CorosyncNode]
+    nodes_by_nodeid: dict[str, CorosyncNode]
+    nodes_by_addr: dict[str, CorosyncNode]
+    used_linknumbers: list[int]
+    addrs_by_link: dict[str, list[str]]
+
+
 class ConfigFacade(FacadeInterface):
     # pylint: disable=too-many-public-methods
     """
@@ -80,6 +98,10 @@ class ConfigFacade(FacadeInterface):
         self._need_stopped_cluster = False
         # set to True if qdevice reload is required to apply changes
         self._need_qdevice_reload = False
+        # Views computed from the config together with the config revision
+        # they were computed from. They are recomputed when the config changes.
+        self._nodes_view: tuple[int, _NodesView] | None = None
+        self._links_options: tuple[int, dict[str, dict[str, str]]] | None = None
 
     @property
     def need_stopped_cluster(self) -> bool:
@@ -126,6 +148,63 @@ class ConfigFacade(FacadeInterface):
         """
         Get all defined nodes
         """
+        return list(self._get_nodes_view().nodes)
+
+    def get_node_by_name(self, name: str) -> CorosyncNode | None:
+        """
+        Get a node with the specified name, None if there is no such node
+        """
+        return self._get_nodes_view().nodes_by_name.get(name)
+
+    def get_node_by_nodeid(self, nodeid: str) -> CorosyncNode | None:
+        """
+        Get a node with the specified nodeid, None if there is no such node
+        """
+        return self._get_nodes_view().nodes_by_nodeid.get(nodeid)
+
+    def get_node_by_addr(self, addr: str) -> CorosyncNode | None:
+        """
+        Get a node with the specified address in any of its links, None if
+        there is no such node
+        """
+        return self._get_nodes_view().nodes_by_addr.get(addr)
+
+    def get_link_addrs(self, linknumber: str) -> list[str]:
+        """
+        Get addresses of all nodes in the specified link
+        """
+        return list(self._get_nodes_view().addrs_by_link.get(linknumber, []))
+
+    def _get_nodes_view(self) -> _NodesView:
+        revision = self.config.revision
+        if self._nodes_view is None or self._nodes_view[0] != revision:
+            self._nodes_view = (revision, self._build_nodes_view())
+        return self._nodes_view[1]
+
+    def _build_nodes_view(self) -> _NodesView:
+        nodes = self._load_nodes()
+        nodes_by_name: dict[str, CorosyncNode] = {}
+        nodes_by_nodeid: dict[str, CorosyncNode] = {}
+        nodes_by_addr: dict[str, CorosyncNode] = {}
+        addrs_by_link: dict[str, list[str]] = {}
+        for node in nodes:
+            if node.name is not None:
+                nodes_by_name.setdefault(node.name, node)
+            if node.nodeid is not None:
+                nodes_by_nodeid.setdefault(node.nodeid, node)
+            for addr in node.addrs:
+                nodes_by_addr.setdefault(addr.addr, node)
+                addrs_by_link.setdefault(addr.link, []).append(addr.addr)
+        return _NodesView(
+            nodes=nodes,
+            nodes_by_name=nodes_by_name,
+            nodes_by_nodeid=nodes_by_nodeid,
+            nodes_by_addr=nodes_by_addr,
+            used_linknumbers=self._load_used_linknumber_list(),
+            addrs_by_link=addrs_by_link,
+        )
+
+    def _load_nodes(self) -> list[CorosyncNode]:
         result = []
         for nodelist in self.config.get_sections("nodelist"):
             for node_section in nodelist.get_sections("node"):
@@ -183,6 +262,9 @@ class ConfigFacade(FacadeInterface):
         }
 
     def get_used_linknumber_list(self) -> list[int]:
+        return list(self._get_nodes_view().used_linknumbers)
+
+    def _load_used_linknumber_list(self) -> list[int]:
         for nodelist_section in self.config.get_sections("nodelist"):
             for node_section in nodelist_section.get_sections("node"):
                 node_data = self._get_node_data(node_section)
@@ -220,12 +302,12 @@ class ConfigFacade(FacadeInterface):
         node_id_generator = self._get_nodeid_generator(
             self._get_used_nodeid_list()
         )
+        # new nodes do not change links used in the config
+        used_linknumber_list = self.get_used_linknumber_list()
         for node_options in node_list:
             nodelist_section.add_section(
                 self._create_node_section(
-                    next(node_id_generator),
-                    node_options,
-                    self.get_used_linknumber_list(),
+                    next(node_id_generator), node_options, used_linknumber_list
                 )
             )
         self.__update_two_node()
@@ -464,6 +546,15 @@ class ConfigFacade(FacadeInterface):
         """
         Get all links' options in a dict: key=linknumber value=dict of options
         """
+        revision = self.config.revision
+        if self._links_options is None or self._links_options[0] != revision:
+            self._links_options = (revision, self._load_links_options())
+        return {
+            linknumber: dict(options)
+            for linknumber, options in self._links_options[1].items()
+        }
+
+    def _load_links_options(self) -> dict[str, dict[str, str]]:
         transport = self.get_transport()
         allowed_options = (
             constants.LINK_OPTIONS_UDP
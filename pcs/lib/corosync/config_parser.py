@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Callable, Mapping
 
 from pcs.common import (
     file_type_codes,
@@ -26,6 +26,13 @@ class Section:
         self._attr_list: list[AttrTuple] = []
         self._section_list: list["Section"] = []
         self._name: str = name
+        # Attributes and subsections by their names, in the same order as in
+        # the lists above. Configs with many nodes and links are searched for
+        # sections and attributes of a given name repeatedly.
+        self._attr_index: dict[AttrName, list[AttrTuple]] = {}
+        self._section_index: dict[str, list["Section"]] = {}
+        # number of changes in the tree, only maintained in its root section
+        self._revision = 0
 
     @property
     def parent(self) -> "Section | None":
@@ -35,6 +42,20 @@ class Section:
     def name(self) -> str:
         return self._name
 
+    @property
+    def revision(self) -> int:
+        """
+        Number of changes done to the tree of sections the section belongs to
+
+        Data computed from the tree may be cached until the number changes.
+        """
+        # pylint: disable=protected-access
+        return self.get_root()._revision  # noqa: SLF001
+
+    def _changed(self) -> None:
+        # pylint: disable=protected-access
+        self.get_root()._revision += 1  # noqa: SLF001
+
     @property
     def empty(self) -> bool:
         return not self._attr_list and not self._section_list
@@ -66,9 +87,9 @@ class Section:
         return parent
 
     def get_attributes(self, name: AttrName | None = None) -> list[AttrTuple]:
-        return [
-            attr for attr in self._attr_list if name is None or attr[0] == name
-        ]
+        if name is None:
+            return list(self._attr_list)
+        return list(self._attr_index.get(name, []))
 
     def get_attributes_dict(self) -> AttrDict:
         return {attr[0]: attr[1] for attr in self._attr_list}
@@ -76,23 +97,40 @@ class Section:
     def get_attribute_value(
         self, name: AttrName, default: AttrValue | None = None
     ) -> AttrValue | None:
-        return self.get_attributes_dict().get(name, default)
+        # the last attribute of the name wins, as in get_attributes_dict
+        attr_list = self._attr_index.get(name)
+        return attr_list[-1][1] if attr_list else default
 
     def add_attribute(self, name: AttrName, value: AttrValue) -> "Section":
-        self._attr_list.append((name, value))
+        attr = (name, value)
+        self._attr_list.append(attr)
+        self._attr_index.setdefault(name, []).append(attr)
+        self._changed()
         return self
 
     def del_attributes_by_name(
         self, name: AttrName, value: AttrValue | None = None
     ) -> "Section":
-        self._attr_list = [
-            attr
-            for attr in self._attr_list
-            if not (attr[0] == name and (value is None or attr[1] == value))
+        if name not in self._attr_index:
+            return self
+
+        def _keep(attr: AttrTuple) -> bool:
+            return not (attr[0] == name and (value is None or attr[1] == value))
+
+        self._attr_list = [attr for attr in self._attr_list if _keep(attr)]
+        remaining_attr_list = [
+            attr for attr in self._attr_index[name] if _keep(attr)
         ]
+        if remaining_attr_list:
+            self._attr_index[name] = remaining_attr_list
+        else:
+            del self._attr_index[name]
+        self._changed()
         return self
 
     def set_attribute(self, name: AttrName, value: AttrValue) -> "Section":
+        if name not in self._attr_index:
+            return self.add_attribute(name, value)
         found = False
         new_attr_list = []
         for attr in self._attr_list:
@@ -102,16 +140,14 @@ class Section:
                 found = True
                 new_attr_list.append((name, value))
         self._attr_list = new_attr_list
-        if not found:
-            self.add_attribute(name, value)
+        self._attr_index[name] = [(name, value)]
+        self._changed()
         return self
 
     def get_sections(self, name: str | None = None) -> list["Section"]:
-        return [
-            section
-            for section in self._section_list
-            if name is None or section.name == name
-        ]
+        if name is None:
+            return list(self._section_list)
+        return list(self._section_index.get(name, []))
 
     def add_section(self, section: "Section") -> "Section":
         parent: "Section | None" = self
@@ -125,10 +161,17 @@ class Section:
         # pylint: disable=protected-access
         section._parent = self  # noqa: SLF001
         self._section_list.append(section)
+        self._section_index.setdefault(section.name, []).append(section)
+        self._changed()
         return self
 
     def del_section(self, section: "Section") -> "Section":
         self._section_list.remove(section)
+        section_list = self._section_index[section.name]
+        section_list.remove(section)
+        if not section_list:
+            del self._section_index[section.name]
+        self._changed()
         # don't set parent to None if the section was not found in the list
         # thanks to remove raising a ValueError in that case
         # here we are editing obj's _parent attribute of the same class
@@ -144,7 +187,7 @@ class Parser(ParserInterface):
     @staticmethod
     def parse(raw_file_data: bytes) -> Section:
         root = Section("")
-        Parser._parse_section(raw_file_data.decode("utf-8").split("\n"), root)
+        Parser._parse(raw_file_data.decode("utf-8").split("\n"), root)
         return root
 
     @staticmethod
@@ -165,45 +208,73 @@ class Parser(ParserInterface):
         ]
 
     @staticmethod
-    def _parse_section(lines: list[str], section: Section) -> None:
+    def _parse(raw_lines: list[str], root: Section) -> None:
         # parser should work the same way as the original parser in corosync
-        while lines:
-            current_line = lines.pop(0).strip()
+        # Sections being parsed are kept in a stack together with the position
+        # of their opening brace, so that each line is processed only once.
+        section = root
+        open_section_stack: list[tuple[Section, int, int]] = []
+        for line_number, raw_line in enumerate(raw_lines, 1):
+            current_line = raw_line.strip()
             if not current_line or current_line[0] == "#":
                 continue
             if "{" in current_line:
                 section_name_candidate, after_brace_junk = current_line.rsplit(
                     "{", 1
                 )
+                brace_column = _get_column(
+                    raw_line, len(section_name_candidate)
+                )
                 if after_brace_junk.strip():
-                    raise ExtraCharactersAfterOpeningBraceException()
+                    raise ExtraCharactersAfterOpeningBraceException(
+                        line_number,
+                        brace_column
+                        + 1
+                        + len(after_brace_junk)
+                        - len(after_brace_junk.lstrip()),
+                    )
                 section_name = section_name_candidate.strip()
                 if not section_name:
-                    raise MissingSectionNameBeforeOpeningBraceException()
-                new_section = Section(section_name.strip())
+                    raise MissingSectionNameBeforeOpeningBraceException(
+                        line_number, brace_column
+                    )
+                new_section = Section(section_name)
                 section.add_section(new_section)
-                Parser._parse_section(lines, new_section)
+                open_section_stack.append((section, line_number, brace_column))
+                section = new_section
             elif "}" in current_line:
-                if current_line.strip() != "}":
-                    raise ExtraCharactersBeforeOrAfterClosingBraceException()
-                if not section.parent:
-                    raise UnexpectedClosingBraceException()
-                return
+                if current_line != "}":
+                    junk_index = 0
+                    if current_line[0] == "}":
+                        junk_index = len(current_line) - len(
+                            current_line[1:].lstrip()
+                        )
+                    raise ExtraCharactersBeforeOrAfterClosingBraceException(
+                        line_number, _get_column(raw_line, junk_index)
+                    )
+                if not open_section_stack:
+                    raise UnexpectedClosingBraceException(
+                        line_number, _get_column(raw_line, 0)
+                    )
+                section = open_section_stack.pop()[0]
             elif ":" in current_line:
-                section.add_attribute(
-                    *[x.strip() for x in current_line.split(":", 1)]
-                )
+                name, value = current_line.split(":", 1)
+                section.add_attribute(name.strip(), value.strip())
             else:
-                raise LineIsNotSectionNorKeyValueException()
-        if section.parent:
-            raise MissingClosingBraceException()
+                raise LineIsNotSectionNorKeyValueException(
+                    line_number, _get_column(raw_line, 0)
+                )
+        if open_section_stack:
+            _, line_number, brace_column = open_section_stack[-1]
+            raise MissingClosingBraceException(line_number, brace_column)
 
     @staticmethod
     def parser_exception_to_report_msg(
         exception: ParserErrorException,
     ) -> reports.item.ReportItemMessage:
         exc_to_msg: Mapping[
-            type[ParserErrorException], type[reports.item.ReportItemMessage]
+            type[ParsingErrorException],
+            Callable[[int | None, int | None], reports.item.ReportItemMessage],
         ] = {
             MissingClosingBraceException: (
                 reports.messages.ParseErrorCorosyncConfMissingClosingBrace
@@ -224,9 +295,13 @@ class Parser(ParserInterface):
                 reports.messages.ParseErrorCorosyncConfLineIsNotSectionNorKeyValue
             ),
         }
-        return exc_to_msg.get(
-            type(exception), reports.messages.ParseErrorCorosyncConf
-        )()
+        if isinstance(exception, ParsingErrorException):
+            message_class = exc_to_msg.get(type(exception))
+            if message_class is not None:
+                return message_class(
+                    exception.line_number, exception.column_number
+                )
+        return reports.messages.ParseErrorCorosyncConf()
 
 
 class Exporter(ExporterInterface):
@@ -267,6 +342,16 @@ def verify_section(
     )
 
 
+def _get_column(raw_line: str, index: int) -> int:
+    """
+    Return 1-based column of a character in a line
+
+    raw_line -- the line as it is in the config
+    index -- index of the character in the line stripped of whitespace
+    """
+    return len(raw_line) - len(raw_line.lstrip()) + index + 1
+
+
 def _prefix_path(prefix: str, path: str) -> str:
     return f"{prefix}.{path}" if prefix and path else path
 
@@ -289,7 +374,16 @@ class CircularParentshipException(CorosyncConfParserException):
 
 
 class ParsingErrorException(CorosyncConfParserException):
-    pass
+    def __init__(
+        self, line_number: int | None = None, column_number: int | None = None
+    ):
+        """
+        line_number -- 1-based number of the line where parsing failed
+        column_number -- 1-based column of the line where parsing failed
+        """
+        super().__init__(line_number, column_number)
+        self.line_number = line_number
+        self.column_number = column_number
 
 
 class MissingClosingBraceException(ParsingErrorException):
@@ -8,6 +8,7 @@ from pcs.common.file import RawFileError
 from pcs.common.reports.item import ReportItem
 from pcs.common.str_tools import format_list
 from pcs.common.tools import Version, get_version_from_string
+from pcs.common.types import StringSequence
 from pcs.lib.errors import LibraryError
 from pcs.lib.external import CommandRunner
 from pcs.lib.file.instance import FileInstance
@@ -160,6 +161,32 @@ class QuorumStatusFacade:
             < self.votes_needed_for_quorum
         )
 
+    def get_nodes_causing_quorum_loss(
+        self, node_names: StringSequence
+    ) -> list[str]:
+        """
+        Which nodes cause quorum loss if the nodes are stopped one by one?
+
+        The nodes are evaluated in the specified order, each of them with all
+        the previous ones stopped. Return the nodes, starting with the first
+        one which would cause quorum loss. Return an empty list if stopping all
+        of the nodes keeps the quorum.
+
+        node_names -- names of nodes to be stopped in the order of stopping
+        """
+        if not self.is_quorate:
+            return []
+        votes_by_node = {node.name: node.votes for node in self.node_list}
+        remaining_votes = self._get_votes_excluding_nodes(())
+        stopped_nodes: set[str] = set()
+        for index, node_name in enumerate(node_names):
+            if node_name not in stopped_nodes:
+                stopped_nodes.add(node_name)
+                remaining_votes -= votes_by_node.get(node_name, 0)
+            if remaining_votes < self.votes_needed_for_quorum:
+                return list(node_names[index:])
+        return []
+
     def stopping_local_node_cause_quorum_loss(self) -> bool:
         """
         Will quorum be lost if the local node is stopped?
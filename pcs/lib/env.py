@@ -4,7 +4,9 @@ from typing import Any, cast
 
 from lxml.etree import _Element
 
-from pcs.common import file_type_codes, reports
+from pcs import settings
+from pcs.common import file_type_codes, profiling, reports
+from pcs.common.cancellation import CancellationToken
 from pcs.common.communication.logger import CommunicatorLogger
 from pcs.common.host import PcsKnownHost
 from pcs.common.node_communicator import Communicator, NodeCommunicatorFactory
@@ -15,6 +17,7 @@ from pcs.common.services.interfaces import ServiceManagerInterface
 from pcs.common.tools import Version
 from pcs.common.types import StringIterable
 from pcs.lib.booth.env import BoothEnv
+from pcs.lib.cib.tools import get_pacemaker_version_by_which_cib_was_validated
 from pcs.lib.communication import qdevice
 from pcs.lib.communication.corosync import (
     CheckCorosyncOffline,
@@ -40,11 +43,13 @@ from pcs.lib.pacemaker.live import (
     get_cib,
     get_cib_xml,
     get_cluster_status_dom,
+    get_pacemaker_version,
     push_cib_diff_xml,
     replace_cib_configuration,
     wait_for_idle,
 )
 from pcs.lib.pacemaker.values import get_valid_timeout_seconds
+from pcs.lib.resource_agent import AgentMetadataCache
 from pcs.lib.services import get_service_manager
 from pcs.lib.tools import create_tmp_cib
 from pcs.lib.xml_tools import etree_to_str
@@ -87,6 +92,8 @@ class LibraryEnvironment:
             Callable[[], Mapping[str, PcsKnownHost]] | None
         ) = None,
         request_timeout: int | None = None,
+        *,
+        cancellation_token: CancellationToken | None = None,
     ):
         # pylint: disable=too-many-arguments
         # pylint: disable=too-many-positional-arguments
@@ -98,6 +105,7 @@ class LibraryEnvironment:
         self._corosync_conf_data = corosync_conf_data
         self._booth_files_data = booth_files_data or {}
         self._request_timeout = request_timeout
+        self._cancellation_token = cancellation_token
         # TODO tokens probably should not be inserted from outside, but we're
         # postponing dealing with them, because it's not that easy to move
         # related code currently - it's in pcsd
@@ -107,6 +115,8 @@ class LibraryEnvironment:
         self._cib_data_tmp_file: Any | None = None  # TODO proper type hint
         self.__loaded_cib_diff_source: str | None = None
         self.__loaded_cib_to_modify: _Element | None = None
+        self.__cib_batch = False
+        self.__cib_batch_push_requested = False
         self._communicator_factory = NodeCommunicatorFactory(
             CommunicatorLogger(
                 [ReportProcessorToLog(self.logger), self.report_processor]
@@ -114,10 +124,12 @@ class LibraryEnvironment:
             self.user_login,
             self.user_groups,
             self._request_timeout,
+            self._cancellation_token,
         )
         self.__loaded_booth_env: BoothEnv | None = None
         self.__loaded_dr_env: DrEnv | None = None
         self.__service_manager: ServiceManagerInterface | None = None
+        self.__agent_metadata_cache: AgentMetadataCache | None = None
 
     @property
     def logger(self) -> Logger:
@@ -150,10 +162,14 @@ class LibraryEnvironment:
         nice_to_have_version: Version | None = None,
     ) -> _Element:
         if self.__loaded_cib_diff_source is not None:
-            raise AssertionError("CIB has already been loaded")
+            if not self.__cib_batch:
+                raise AssertionError("CIB has already been loaded")
+            return self.__get_batch_cib(minimal_version)
 
-        self.__loaded_cib_diff_source = get_cib_xml(self.cmd_runner())
-        self.__loaded_cib_to_modify = get_cib(self.__loaded_cib_diff_source)
+        with profiling.measure(profiling.EVENT_CIB_LOAD):
+            self.__loaded_cib_diff_source = get_cib_xml(self.cmd_runner())
+        with profiling.measure(profiling.EVENT_CIB_PARSE):
+            self.__loaded_cib_to_modify = get_cib(self.__loaded_cib_diff_source)
 
         if (
             nice_to_have_version is not None
@@ -186,6 +202,59 @@ class LibraryEnvironment:
 
         return self.__loaded_cib_to_modify
 
+    def __get_batch_cib(self, minimal_version: Version | None) -> _Element:
+        # The CIB has been loaded and possibly modified by previous commands of
+        # the batch. Upgrading it would require to load it again from the
+        # cluster, which would discard the modifications.
+        cib = cast(_Element, self.__loaded_cib_to_modify)
+        if (
+            minimal_version is not None
+            and get_pacemaker_version_by_which_cib_was_validated(cib)
+            < minimal_version
+        ):
+            raise LibraryError(
+                ReportItem.error(
+                    reports.messages.CibUpgradeInBatchNotPossible(
+                        str(minimal_version)
+                    )
+                )
+            )
+        return cib
+
+    def begin_cib_batch(self) -> None:
+        """
+        Start running commands with a single CIB load and push
+
+        CIB is loaded by the first command which needs it. Following commands
+        get the same instance of CIB including changes done by the previous
+        commands. Pushing CIB is postponed until end_cib_batch is called.
+        Waiting for the cluster to settle down is not supported in a batch.
+        """
+        if self.__cib_batch:
+            raise AssertionError("CIB batch has already been started")
+        self.__cib_batch = True
+        self.__cib_batch_push_requested = False
+
+    def end_cib_batch(self) -> None:
+        """
+        Push CIB modified by commands run since begin_cib_batch was called
+        """
+        if not self.__cib_batch:
+            raise AssertionError("CIB batch has not been started")
+        self.__cib_batch = False
+        if self.__cib_batch_push_requested:
+            self.__push_cib_diff(-1)
+        else:
+            # CIB has only been read, there is nothing to push
+            self.drop_loaded_cib()
+
+    def drop_loaded_cib(self) -> None:
+        """
+        Forget the loaded CIB so that it can be loaded again
+        """
+        self.__loaded_cib_diff_source = None
+        self.__loaded_cib_to_modify = None
+
     @property
     def cib(self) -> _Element:
         if self.__loaded_cib_to_modify is None:
@@ -208,7 +277,8 @@ class LibraryEnvironment:
         self.report_processor.report(
             ReportItem.info(reports.messages.WaitForIdleStarted(timeout))
         )
-        wait_for_idle(self.cmd_runner(), timeout)
+        with profiling.measure(profiling.EVENT_WAIT, timeout=timeout):
+            wait_for_idle(self.cmd_runner(), timeout)
 
     def ensure_wait_satisfiable(self, wait: WaitType) -> int:
         """
@@ -242,6 +312,16 @@ class LibraryEnvironment:
             skipped, if 0 wait indefinitely
         """
         self._ensure_wait_satisfiable(wait_timeout)
+        if self.__cib_batch:
+            if custom_cib is not None:
+                raise AssertionError("Cannot push custom CIB in a CIB batch")
+            if self.__loaded_cib_diff_source is None:
+                raise AssertionError("CIB has not been loaded")
+            if wait_timeout >= 0:
+                # commands would check the cluster state before CIB is pushed
+                raise AssertionError("Cannot wait for pushing a CIB batch")
+            self.__cib_batch_push_requested = True
+            return None
         if custom_cib is not None:
             if self.__loaded_cib_diff_source is not None:
                 raise AssertionError(
@@ -254,30 +334,36 @@ class LibraryEnvironment:
 
     def __push_cib_full(self, cib_to_push, wait_timeout: int):
         self.__do_push_cib(
-            lambda: replace_cib_configuration(self.cmd_runner(), cib_to_push),
+            lambda: self.__main_push_cib_full(self.cmd_runner(), cib_to_push),
             wait_timeout,
         )
 
+    @staticmethod
+    def __main_push_cib_full(cmd_runner, cib_to_push):
+        with profiling.measure(profiling.EVENT_CIB_PUSH):
+            replace_cib_configuration(cmd_runner, cib_to_push)
+
     def __push_cib_diff(self, wait_timeout: int):
         self.__do_push_cib(
             lambda: self.__main_push_cib_diff(self.cmd_runner()), wait_timeout
         )
 
     def __main_push_cib_diff(self, cmd_runner):
-        cib_diff_xml = diff_cibs_xml(
-            cmd_runner,
-            self.report_processor,
-            self.__loaded_cib_diff_source,
-            etree_to_str(self.__loaded_cib_to_modify),
-        )
+        with profiling.measure(profiling.EVENT_CIB_DIFF):
+            cib_diff_xml = diff_cibs_xml(
+                cmd_runner,
+                self.report_processor,
+                self.__loaded_cib_diff_source,
+                etree_to_str(self.__loaded_cib_to_modify),
+            )
         if cib_diff_xml:
-            push_cib_diff_xml(cmd_runner, cib_diff_xml)
+            with profiling.measure(profiling.EVENT_CIB_PUSH):
+                push_cib_diff_xml(cmd_runner, cib_diff_xml)
 
     def __do_push_cib(self, push_strategy, wait_timeout: int) -> None:
         push_strategy()
         self._cib_upgrade_reported = False
-        self.__loaded_cib_diff_source = None
-        self.__loaded_cib_to_modify = None
+        self.drop_loaded_cib()
         if self.is_cib_live:
             self.wait_for_idle(wait_timeout)
 
@@ -474,7 +560,12 @@ class LibraryEnvironment:
         if env:
             runner_env.update(env)
 
-        return CommandRunner(self.logger, self.report_processor, runner_env)
+        return CommandRunner(
+            self.logger,
+            self.report_processor,
+            runner_env,
+            cancellation_token=self._cancellation_token,
+        )
 
     @property
     def communicator_factory(self) -> NodeCommunicatorFactory:
@@ -530,6 +621,15 @@ class LibraryEnvironment:
             self.__loaded_dr_env = DrEnv()
         return self.__loaded_dr_env
 
+    def get_agent_metadata_cache(self) -> AgentMetadataCache:
+        if self.__agent_metadata_cache is None:
+            runner = self.cmd_runner()
+            self.__agent_metadata_cache = AgentMetadataCache(
+                settings.agent_metadata_cache_dir,
+                lambda: get_pacemaker_version(runner),
+            )
+        return self.__agent_metadata_cache
+
     def _get_service_manager(self) -> ServiceManagerInterface:
         if self.__service_manager is None:
             self.__service_manager = get_service_manager(
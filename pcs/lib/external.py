@@ -1,11 +1,22 @@
+import fcntl
+import hashlib
+import locale
+import logging
+import os
+import selectors
 import signal
 import subprocess
-from collections.abc import Mapping
+import time
+from collections import deque
+from collections.abc import Mapping, Sequence
+from contextlib import suppress
 from logging import Logger
 from shlex import quote as shell_quote
+from typing import IO, Any, cast
 
 from pcs import settings
-from pcs.common import reports
+from pcs.common import profiling, reports
+from pcs.common.cancellation import CancellationToken, OperationCancelled
 from pcs.common.reports import ReportProcessor
 from pcs.common.reports.item import ReportItem
 from pcs.common.str_tools import join_multilines
@@ -13,6 +24,12 @@ from pcs.common.tools import format_os_error
 from pcs.common.types import StringSequence
 from pcs.lib.errors import LibraryError
 
+_READ_CHUNK_SIZE = 65536
+# how often a running process checks for cancellation of the operation, seconds
+_CANCELLATION_CHECK_INTERVAL = 0.5
+# for how long a process has to exit after it has been terminated, seconds
+_TERMINATE_TIMEOUT = 2
+
 
 class KillServicesError(Exception):
     def __init__(self, service, message=None, instance=None):
@@ -27,9 +44,13 @@ class CommandRunner:
         logger: Logger,
         reporter: ReportProcessor,
         env_vars: Mapping[str, str] | None = None,
+        cancellation_token: CancellationToken | None = None,
     ):
         self._logger = logger
         self._reporter = reporter
+        # If the token gets cancelled, running processes are terminated and
+        # OperationCancelled is raised
+        self._cancellation_token = cancellation_token
         # Reset environment variables by empty dict is desired here.  We need
         # to get rid of defaults - we do not know the context and environment
         # where the library runs.  We also get rid of PATH settings, so all
@@ -48,71 +69,206 @@ class CommandRunner:
         env_extend: Mapping[str, str] | None = None,
         binary_output: bool = False,
     ) -> tuple[str, str, int]:
+        env_vars = self._get_env_vars(env_extend)
+        log_args = self._log_started(args, env_vars, stdin_string)
+
+        with profiling.measure(
+            profiling.EVENT_COMMAND, binary=args[0]
+        ) as trace:
+            try:
+                process = self._start_process(
+                    args, env_vars, stdin_string is not None, binary_output
+                )
+                if self._cancellation_token is None:
+                    out_std, out_err = process.communicate(stdin_string)
+                else:
+                    out_std, out_err = self._communicate_cancellable(
+                        process,
+                        log_args,
+                        stdin_string,
+                        self._cancellation_token,
+                    )
+                retval = process.returncode
+            except OSError as e:
+                raise LibraryError(
+                    ReportItem.error(
+                        reports.messages.RunExternalProcessError(
+                            log_args, format_os_error(e)
+                        )
+                    )
+                ) from e
+            if trace is not None:
+                trace.update(
+                    bytes_in=profiling.text_size(stdin_string),
+                    bytes_out=(
+                        profiling.text_size(out_std)
+                        + profiling.text_size(out_err)
+                    ),
+                    return_code=retval,
+                )
+
+        self._log_finished(log_args, retval, out_std, out_err)
+        return out_std, out_err, retval
+
+    def run_parallel(
+        self,
+        args_list: Sequence[StringSequence],
+        env_extend: Mapping[str, str] | None = None,
+        max_processes: int = 1,
+        timeout: float | None = None,
+    ) -> list[tuple[str, str, int] | None]:
+        """
+        Run several processes, at most max_processes of them at a time
+
+        Return stdout, stderr and return value of each process in the order of
+        args_list. If a process does not finish in the specified timeout, it
+        gets killed and None is returned in its place.
+
+        args_list -- commands to run
+        env_extend -- environment variables to set for all the processes
+        max_processes -- maximal number of processes running at the same time
+        timeout -- maximal number of seconds each process is allowed to run
+        """
+        env_vars = self._get_env_vars(env_extend)
+        results: list[tuple[str, str, int] | None] = [None] * len(args_list)
+        waiting = deque(enumerate(args_list))
+        running: dict[int, _RunningProcess] = {}
+        with selectors.DefaultSelector() as selector:
+            try:
+                while waiting or running:
+                    while waiting and len(running) < max(max_processes, 1):
+                        index, args = waiting.popleft()
+                        running[index] = self._start_parallel_process(
+                            args, env_vars, selector, timeout
+                        )
+                    self._poll_parallel_processes(
+                        selector,
+                        running,
+                        (
+                            None
+                            if self._cancellation_token is None
+                            else _CANCELLATION_CHECK_INTERVAL
+                        ),
+                    )
+                    if self._cancellation_token is not None:
+                        # running processes are killed in the finally block
+                        self._cancellation_token.raise_if_cancelled()
+                    for index, running_process in list(running.items()):
+                        if running_process.is_finished:
+                            results[index] = self._finish_parallel_process(
+                                running_process
+                            )
+                            del running[index]
+                        elif running_process.is_timed_out:
+                            self._kill_parallel_process(
+                                selector, running_process
+                            )
+                            self._logger.debug(
+                                "Timed out running: %s",
+                                running_process.log_args,
+                            )
+                            del running[index]
+            except OperationCancelled:
+                for running_process in running.values():
+                    self._kill_parallel_process(selector, running_process)
+                    self._logger.debug(
+                        "Cancelled running: %s", running_process.log_args
+                    )
+                raise
+            except BaseException as e:
+                # do not leave any processes behind if something went wrong
+                for running_process in running.values():
+                    self._kill_parallel_process(selector, running_process)
+                    self._logger.debug(
+                        "Killed running: %s, due to an error: %r",
+                        running_process.log_args,
+                        e,
+                    )
+                raise
+        return results
+
+    def _get_env_vars(
+        self, env_extend: Mapping[str, str] | None
+    ) -> dict[str, str]:
         # Allow overriding default settings. If a piece of code really wants to
         # set own PATH or CIB_file, we must allow it. I.e. it wants to run
         # a pacemaker tool on a CIB in a file but cannot afford the risk of
         # changing the CIB in the file specified by the user.
         env_vars = dict(self._env_vars)
         env_vars.update(dict(env_extend) if env_extend else {})
+        return env_vars
 
-        log_args = " ".join([shell_quote(x) for x in args])
-        env = (
-            ""
-            if not env_vars
-            else (
-                "\n"
-                + "\n".join(
-                    [
-                        "  {0}={1}".format(key, val)
-                        for key, val in sorted(env_vars.items())
-                    ]
-                )
-            )
-        )
-        stdin = (
-            ""
-            if not stdin_string
-            else ("\n--Debug Input Start--\n{0}\n--Debug Input End--").format(
-                stdin_string
-            )
-        )
-        self._logger.debug(
-            "Running: %s\nEnvironment:%s%s", log_args, env, stdin
+    @staticmethod
+    def _start_process(
+        args: StringSequence,
+        env_vars: Mapping[str, str],
+        use_stdin: bool,
+        binary_output: bool,
+    ) -> subprocess.Popen:
+        # pylint: disable=subprocess-popen-preexec-fn, consider-using-with
+        # this is OK as pcs is only single-threaded application
+        return subprocess.Popen(
+            args,
+            # Some commands react differently if they get anything via stdin
+            stdin=(subprocess.PIPE if use_stdin else subprocess.DEVNULL),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            preexec_fn=(  # noqa: PLW1509
+                lambda: signal.signal(signal.SIGPIPE, signal.SIG_DFL)
+            ),
+            close_fds=True,
+            shell=False,
+            env=env_vars,
+            # decodes newlines and in python3 also converts bytes to str
+            universal_newlines=(not binary_output),
         )
-        self._reporter.report(
-            ReportItem.debug(
-                reports.messages.RunExternalProcessStarted(
-                    log_args,
-                    stdin_string,
-                    env_vars,
+
+    def _communicate_cancellable(
+        self,
+        process: subprocess.Popen,
+        log_args: str,
+        stdin_string: str | None,
+        cancellation_token: CancellationToken,
+    ) -> tuple[Any, Any]:
+        """
+        Wait for a process to finish, terminate it if cancellation is requested
+        """
+        while True:
+            try:
+                # No output is lost by repeating communicate after a timeout.
+                # Input must only be passed to the first call, subsequent
+                # calls continue sending it.
+                return process.communicate(
+                    stdin_string, timeout=_CANCELLATION_CHECK_INTERVAL
                 )
-            )
-        )
+            except subprocess.TimeoutExpired:
+                stdin_string = None
+                if not cancellation_token.is_cancelled:
+                    continue
+            process.terminate()
+            try:
+                process.wait(timeout=_TERMINATE_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+            for stream in (process.stdin, process.stdout, process.stderr):
+                if stream:
+                    stream.close()
+            self._logger.debug("Cancelled running: %s", log_args)
+            raise OperationCancelled()
 
+    def _start_parallel_process(
+        self,
+        args: StringSequence,
+        env_vars: Mapping[str, str],
+        selector: selectors.BaseSelector,
+        timeout: float | None,
+    ) -> "_RunningProcess":
+        log_args = self._log_started(args, env_vars, None)
         try:
-            # pylint: disable=subprocess-popen-preexec-fn, consider-using-with
-            # this is OK as pcs is only single-threaded application
-            process = subprocess.Popen(
-                args,
-                # Some commands react differently if they get anything via stdin
-                stdin=(
-                    subprocess.PIPE
-                    if stdin_string is not None
-                    else subprocess.DEVNULL
-                ),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                preexec_fn=(  # noqa: PLW1509
-                    lambda: signal.signal(signal.SIGPIPE, signal.SIG_DFL)
-                ),
-                close_fds=True,
-                shell=False,
-                env=env_vars,
-                # decodes newlines and in python3 also converts bytes to str
-                universal_newlines=(not binary_output),
+            process = self._start_process(
+                args, env_vars, use_stdin=False, binary_output=True
             )
-            out_std, out_err = process.communicate(stdin_string)
-            retval = process.returncode
         except OSError as e:
             raise LibraryError(
                 ReportItem.error(
@@ -121,29 +277,282 @@ class CommandRunner:
                     )
                 )
             ) from e
-
-        self._logger.debug(
-            (
-                "Finished running: %s\nReturn value: %s"
-                "\n--Debug Stdout Start--\n%s\n--Debug Stdout End--"
-                "\n--Debug Stderr Start--\n%s\n--Debug Stderr End--"
-            ),
+        running_process = _RunningProcess(
             log_args,
-            retval,
-            out_std,
-            out_err,
+            process,
+            None if timeout is None else time.monotonic() + timeout,
         )
-        self._reporter.report(
-            ReportItem.debug(
-                reports.messages.RunExternalProcessFinished(
-                    log_args,
-                    retval,
-                    out_std,
-                    out_err,
+        for stream in running_process.streams:
+            selector.register(stream, selectors.EVENT_READ, running_process)
+        return running_process
+
+    @staticmethod
+    def _poll_parallel_processes(
+        selector: selectors.BaseSelector,
+        running: Mapping[int, "_RunningProcess"],
+        max_wait: float | None,
+    ) -> None:
+        deadline_list = [
+            running_process.deadline
+            for running_process in running.values()
+            if running_process.deadline is not None
+        ]
+        select_timeout = (
+            max(min(deadline_list) - time.monotonic(), 0)
+            if deadline_list
+            else None
+        )
+        if max_wait is not None:
+            select_timeout = (
+                max_wait
+                if select_timeout is None
+                else min(select_timeout, max_wait)
+            )
+        for key, _ in selector.select(select_timeout):
+            running_process = key.data
+            data = os.read(key.fd, _READ_CHUNK_SIZE)
+            if data:
+                running_process.output[key.fileobj].append(data)
+            else:
+                selector.unregister(key.fileobj)
+                running_process.open_streams -= 1
+
+    def _finish_parallel_process(
+        self, running_process: "_RunningProcess"
+    ) -> tuple[str, str, int]:
+        retval = running_process.process.wait()
+        out_std, out_err = [
+            _decode_output(b"".join(running_process.output[stream]))
+            for stream in running_process.streams
+        ]
+        for stream in running_process.streams:
+            stream.close()
+        self._log_finished(running_process.log_args, retval, out_std, out_err)
+        return out_std, out_err, retval
+
+    def _kill_parallel_process(
+        self,
+        selector: selectors.BaseSelector,
+        running_process: "_RunningProcess",
+    ) -> None:
+        for stream in running_process.streams:
+            with suppress(KeyError):
+                selector.unregister(stream)
+            stream.close()
+        running_process.process.kill()
+        running_process.process.wait()
+
+    def _log_started(
+        self,
+        args: StringSequence,
+        env_vars: Mapping[str, str],
+        stdin_string: str | None,
+    ) -> str:
+        log_args = " ".join([shell_quote(x) for x in args])
+        if self._logger.isEnabledFor(logging.DEBUG):
+            env = (
+                ""
+                if not env_vars
+                else (
+                    "\n"
+                    + "\n".join(
+                        [
+                            "  {0}={1}".format(key, val)
+                            for key, val in sorted(env_vars.items())
+                        ]
+                    )
+                )
+            )
+            stdin = (
+                ""
+                if not stdin_string
+                else (
+                    "\n--Debug Input Start--\n{0}\n--Debug Input End--"
+                ).format(_shorten_debug_payload(stdin_string))
+            )
+            self._logger.debug(
+                "Running: %s\nEnvironment:%s%s", log_args, env, stdin
+            )
+        if self._reporter.is_severity_reported(
+            reports.ReportItemSeverity.DEBUG
+        ):
+            self._reporter.report(
+                ReportItem.debug(
+                    reports.messages.RunExternalProcessStarted(
+                        log_args,
+                        stdin_string,
+                        env_vars,
+                    )
                 )
             )
+        return log_args
+
+    def _log_finished(
+        self, log_args: str, retval: int, out_std: str, out_err: str
+    ) -> None:
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                (
+                    "Finished running: %s\nReturn value: %s"
+                    "\n--Debug Stdout Start--\n%s\n--Debug Stdout End--"
+                    "\n--Debug Stderr Start--\n%s\n--Debug Stderr End--"
+                ),
+                log_args,
+                retval,
+                _shorten_debug_payload(out_std),
+                _shorten_debug_payload(out_err),
+            )
+        if self._reporter.is_severity_reported(
+            reports.ReportItemSeverity.DEBUG
+        ):
+            self._reporter.report(
+                ReportItem.debug(
+                    reports.messages.RunExternalProcessFinished(
+                        log_args,
+                        retval,
+                        out_std,
+                        out_err,
+                    )
+                )
+            )
+
+
+def _shorten_debug_payload(payload: str | bytes) -> str:
+    """
+    Shorten a long process input or output for logging
+
+    Only the beginning and the end of the payload is kept, accompanied by the
+    payload's length and sha256 hash. The full payload is written to the debug
+    spool file, if configured. Binary payloads are measured in bytes and
+    logged in their printable representation.
+    """
+    max_chars = settings.command_runner_debug_payload_max_chars
+    if max_chars <= 0 or len(payload) <= max_chars:
+        return payload if isinstance(payload, str) else repr(payload)
+    if isinstance(payload, bytes):
+        data = payload
+        unit = "bytes"
+    else:
+        data = payload.encode("utf-8", errors="surrogateescape")
+        unit = "characters"
+    digest = hashlib.sha256(data).hexdigest()
+    spool_file = _spool_debug_payload(digest, data)
+    head_len = max_chars // 2
+    tail_len = max_chars - head_len
+    note = (
+        f"\n[... {len(payload) - max_chars} of {len(payload)} {unit} "
+        f"omitted, sha256 {digest}"
+        + (f", full content in {spool_file}" if spool_file else "")
+        + " ...]\n"
+    )
+    if isinstance(payload, bytes):
+        return f"{payload[:head_len]!r}{note}{payload[-tail_len:]!r}"
+    return payload[:head_len] + note + payload[-tail_len:]
+
+
+def _open_owner_only(path: str, flags: int) -> int:
+    # spooled payloads contain whole CIBs and other possibly sensitive data
+    return os.open(path, flags, 0o600)
+
+
+def _spool_debug_payload(digest: str, payload: bytes) -> str | None:
+    """
+    Write a full payload to the debug spool file, return the file's path
+
+    All processes share one spool file. Writing and rotating the file is
+    serialized by a lock held on a lock file next to it, so that processes do
+    not interfere.
+
+    digest -- sha256 of the payload identifying it in the spool file
+    payload -- data to be written
+    """
+    spool_file = settings.command_runner_debug_spool_file
+    if not spool_file:
+        return None
+    record = (
+        (
+            f"{time.strftime('%Y-%m-%d %H:%M:%S')} pid {os.getpid()} "
+            f"sha256 {digest}\n"
+        ).encode("utf-8")
+        + payload
+        + b"\n\n"
+    )
+    try:
+        with open(
+            f"{spool_file}.lock", "ab", opener=_open_owner_only
+        ) as lock_file:
+            # the lock is released when the file gets closed on leaving the
+            # with statement
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            _rotate_debug_spool(spool_file, len(record))
+            with open(spool_file, "ab", opener=_open_owner_only) as spool:
+                spool.write(record)
+    except OSError:
+        return None
+    return spool_file
+
+
+def _rotate_debug_spool(spool_file: str, record_size: int) -> None:
+    """
+    Rotate the debug spool file if a record would not fit in it
+
+    Must be called with the spool lock held.
+
+    spool_file -- path to the spool file
+    record_size -- size of a record about to be written to the file
+    """
+    max_bytes = settings.command_runner_debug_spool_max_bytes
+    if max_bytes <= 0:
+        return
+    try:
+        size = os.path.getsize(spool_file)
+    except FileNotFoundError:
+        return
+    # a record larger than the limit is written to an empty file
+    if size == 0 or size + record_size <= max_bytes:
+        return
+    backup_count = settings.command_runner_debug_spool_backup_count
+    if backup_count <= 0:
+        os.remove(spool_file)
+        return
+    for index in range(backup_count - 1, 0, -1):
+        with suppress(FileNotFoundError):
+            os.replace(f"{spool_file}.{index}", f"{spool_file}.{index + 1}")
+    os.replace(spool_file, f"{spool_file}.1")
+
+
+class _RunningProcess:
+    def __init__(
+        self, log_args: str, process: subprocess.Popen, deadline: float | None
+    ):
+        self.log_args = log_args
+        self.process = process
+        self.deadline = deadline
+        self.streams = (
+            cast(IO[bytes], process.stdout),
+            cast(IO[bytes], process.stderr),
         )
-        return out_std, out_err, retval
+        self.output: dict[Any, list[bytes]] = {
+            stream: [] for stream in self.streams
+        }
+        self.open_streams = 2
+
+    @property
+    def is_finished(self) -> bool:
+        return self.open_streams == 0
+
+    @property
+    def is_timed_out(self) -> bool:
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+
+def _decode_output(data: bytes) -> str:
+    # the same decoding as subprocess does with universal_newlines=True
+    return (
+        data.decode(locale.getpreferredencoding(False))
+        .replace("\r\n", "\n")
+        .replace("\r", "\n")
+    )
 
 
 def kill_services(runner, services):
@@ -34,6 +34,7 @@ from pcs.lib.pacemaker.api_result import (
     get_status_from_api_result,
 )
 from pcs.lib.pacemaker.state import ClusterState
+from pcs.lib.pacemaker.status_snapshot import get_current_status_xml
 from pcs.lib.resource_agent import ResourceAgentName
 from pcs.lib.xml_tools import etree_to_str
 
@@ -66,20 +67,31 @@ class CibResourceSecretErrorException(Exception):
 ### status
 
 
+def get_cluster_status_xml_args() -> list[str]:
+    """
+    Get a command providing pacemaker XML status
+    """
+    return [
+        settings.crm_mon_exec,
+        "--one-shot",
+        "--inactive",
+        "--output-as",
+        "xml",
+    ]
+
+
 def get_cluster_status_xml_raw(runner: CommandRunner) -> tuple[str, str, int]:
     """
     Run pacemaker tool to get XML status. This function doesn't do any
     processing. Usually, using get_cluster_status_dom is preferred instead.
+
+    If pcsd keeps the cluster status up to date, its status is used instead
+    of running the tool, provided the CIB has not changed since then.
     """
-    return runner.run(
-        [
-            settings.crm_mon_exec,
-            "--one-shot",
-            "--inactive",
-            "--output-as",
-            "xml",
-        ]
-    )
+    status_xml = get_current_status_xml(runner)
+    if status_xml is not None:
+        return status_xml, "", 0
+    return runner.run(get_cluster_status_xml_args())
 
 
 def _get_cluster_status_xml(runner: CommandRunner) -> str:
@@ -855,25 +867,6 @@ def ticket_standby(
     )
 
 
-def ticket_cleanup(
-    cmd_runner: CommandRunner, ticket_name: str
-) -> tuple[str, str, int]:
-    """
-    Delete all state of the ticket from the CIB.
-
-    ticket_name -- name of the ticket
-    """
-    return cmd_runner.run(
-        [
-            settings.crm_ticket_exec,
-            "--cleanup",
-            "--force",
-            "--ticket",
-            ticket_name,
-        ]
-    )
-
-
 def ticket_unstandby(
     cmd_runner: CommandRunner, ticket_name: str
 ) -> tuple[str, str, int]:
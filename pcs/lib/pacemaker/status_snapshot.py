@@ -0,0 +1,188 @@
+"""
+Cluster status shared by pcsd with library commands
+
+Pcsd may keep the cluster status up to date and store it to a file along with
+the version of the CIB the status has been obtained for. Library commands use
+the stored status instead of running crm_mon if the CIB has not changed since
+then. Checking the CIB version is much cheaper than computing the status.
+
+The CIB version alone does not identify the status, as num_updates starts
+from zero again when pacemaker restarts. The status is therefore only used
+while the pcsd process which stored it is running, because that process keeps
+it in sync with the CIB and removes it once the CIB is not available.
+"""
+
+import json
+import os
+import os.path
+import tempfile
+from contextlib import suppress
+from dataclasses import dataclass
+
+from lxml import etree
+
+from pcs import settings
+from pcs.common.interface.dto import to_dict
+from pcs.common.pacemaker.cib_watch import CibVersionDto
+from pcs.lib.external import CommandRunner
+
+_VERSION_ATTRIBUTES = ("admin_epoch", "epoch", "num_updates")
+
+
+@dataclass(frozen=True)
+class ClusterStatusSnapshot:
+    # increases by one with each new snapshot
+    generation: int
+    # unix time of obtaining the status
+    timestamp: float
+    # version of the CIB the status has been obtained for
+    cib_version: CibVersionDto
+    # crm_mon XML output
+    status_xml: str
+    # pid of the process keeping the status up to date
+    pid: int
+    # start time of the process, tells it apart from a process reusing its pid
+    process_start_time: int
+
+
+def parse_cib_version(cib_xml: str) -> CibVersionDto | None:
+    """
+    Get a version of a CIB, return None if the version cannot be determined
+
+    cib_xml -- the whole CIB or its root element only
+    """
+    try:
+        root = etree.fromstring(cib_xml.encode("utf-8"))
+    except etree.XMLSyntaxError:
+        return None
+    # results of xpath queries may be wrapped in an element
+    cib = root if root.tag == "cib" else root.find(".//cib")
+    if cib is None:
+        return None
+    try:
+        return CibVersionDto(
+            *(int(str(cib.get(name))) for name in _VERSION_ATTRIBUTES)
+        )
+    except ValueError:
+        return None
+
+
+def get_process_start_time(pid: int) -> int | None:
+    """
+    Get a start time of a process in clock ticks since boot, None if the
+    process is not running
+    """
+    try:
+        with open(f"/proc/{pid}/stat", encoding="utf-8") as stat_file:
+            stat = stat_file.read()
+        # the process name is in parentheses and may contain spaces, the start
+        # time is the 22nd field, i.e. the 20th field after the name
+        return int(stat[stat.rindex(")") + 2 :].split()[19])
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def get_cib_version_query_args() -> list[str]:
+    """
+    Get a command querying only the version attributes of the live CIB
+    """
+    return [
+        settings.cibadmin_exec,
+        "--local",
+        "--query",
+        "--xpath",
+        "/cib",
+        "--no-children",
+    ]
+
+
+def save_snapshot(path: str, snapshot: ClusterStatusSnapshot) -> None:
+    """
+    Store a status snapshot to a file atomically
+
+    Raises OSError if the snapshot cannot be stored
+    """
+    tmp_path = None
+    try:
+        # write to a temporary file and rename it, so that readers never get
+        # a partially written snapshot
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(path), suffix=".tmp", text=True
+        )
+        with os.fdopen(fd, "w", encoding="utf-8") as snapshot_file:
+            json.dump(
+                {
+                    "generation": snapshot.generation,
+                    "timestamp": snapshot.timestamp,
+                    "cib_version": to_dict(snapshot.cib_version),
+                    "status_xml": snapshot.status_xml,
+                    "pid": snapshot.pid,
+                    "process_start_time": snapshot.process_start_time,
+                },
+                snapshot_file,
+            )
+        os.replace(tmp_path, path)
+        tmp_path = None
+    finally:
+        if tmp_path is not None:
+            with suppress(OSError):
+                os.remove(tmp_path)
+
+
+def load_snapshot(path: str) -> ClusterStatusSnapshot | None:
+    """
+    Load a status snapshot, return None if it is missing or not valid
+    """
+    try:
+        with open(path, encoding="utf-8") as snapshot_file:
+            data = json.load(snapshot_file)
+        snapshot = ClusterStatusSnapshot(
+            generation=int(data["generation"]),
+            timestamp=float(data["timestamp"]),
+            cib_version=CibVersionDto(
+                *(
+                    int(data["cib_version"][name])
+                    for name in _VERSION_ATTRIBUTES
+                )
+            ),
+            status_xml=data["status_xml"],
+            pid=int(data["pid"]),
+            process_start_time=int(data["process_start_time"]),
+        )
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+    if not isinstance(snapshot.status_xml, str):
+        return None
+    return snapshot
+
+
+def remove_snapshot(path: str) -> None:
+    with suppress(FileNotFoundError):
+        os.remove(path)
+
+
+def get_current_status_xml(runner: CommandRunner) -> str | None:
+    """
+    Get cluster status stored by pcsd if it is up to date, None otherwise
+
+    The stored status is only used for the live CIB and for users not
+    restricted by ACLs, as it has been obtained by pcsd with full access.
+    A status left behind by a pcsd process which is not running anymore is
+    not used either.
+    """
+    env_vars = runner.env_vars
+    if "CIB_file" in env_vars or env_vars.get("CIB_user", "root") not in (
+        "root",
+        settings.pacemaker_uname,
+    ):
+        return None
+    snapshot = load_snapshot(settings.pcsd_cluster_status_snapshot)
+    if (
+        snapshot is None
+        or get_process_start_time(snapshot.pid) != snapshot.process_start_time
+    ):
+        return None
+    stdout, dummy_stderr, retval = runner.run(get_cib_version_query_args())
+    if retval != 0 or parse_cib_version(stdout) != snapshot.cib_version:
+        return None
+    return snapshot.status_xml
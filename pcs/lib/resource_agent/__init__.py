@@ -7,6 +7,7 @@ from pcs.common.resource_agent.dto import (
     ResourceMetaAttributesMetadataDto,
 )
 
+from .cache import AgentMetadataCache
 from .error import (
     AgentNameGuessFoundMoreThanOne,
     AgentNameGuessFoundNone,
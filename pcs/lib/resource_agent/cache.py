@@ -0,0 +1,167 @@
+import hashlib
+import json
+import os
+import os.path
+import tempfile
+from collections.abc import Callable
+from contextlib import suppress
+
+from pcs import settings
+from pcs.common.tools import Version
+
+from .types import ResourceAgentName
+
+_CACHE_FILE_SUFFIX = ".json"
+
+
+class AgentMetadataCache:
+    """
+    Persistent cache of raw resource and stonith agents metadata
+
+    The cache is shared by all pcs processes running on the local host. An
+    entry is only valid for the agent file it has been created from (matched
+    by the file's mtime and size) and for the pacemaker version it has been
+    obtained by. Only ocf and stonith agents are cached, as those are the only
+    agents with their metadata provided by an agent file. Any error while
+    working with the cache is ignored, the cache is a pure optimization and
+    metadata are loaded from the agent in such a case.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        pacemaker_version_getter: Callable[[], Version | None],
+    ) -> None:
+        """
+        cache_dir -- directory where cache entries are stored
+        pacemaker_version_getter -- provides the local pacemaker version
+        """
+        self._cache_dir = cache_dir
+        self._pacemaker_version_getter = pacemaker_version_getter
+        self._pacemaker_version: str | None = None
+        self._pacemaker_version_loaded = False
+
+    def get(self, agent_name: ResourceAgentName) -> str | None:
+        """
+        Return cached metadata of an agent or None if not cached or outdated
+
+        agent_name -- name of an agent whose metadata we want to get
+        """
+        key = self._get_key(agent_name)
+        if key is None:
+            return None
+        try:
+            with open(
+                self._get_entry_path(agent_name), encoding="utf-8"
+            ) as entry_file:
+                entry = json.load(entry_file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("key") != key:
+            return None
+        metadata = entry.get("metadata")
+        return metadata if isinstance(metadata, str) else None
+
+    def put(self, agent_name: ResourceAgentName, metadata: str) -> None:
+        """
+        Store metadata of an agent
+
+        agent_name -- name of an agent the metadata belong to
+        metadata -- raw metadata of the agent
+        """
+        key = self._get_key(agent_name)
+        if key is None:
+            return
+        tmp_path = None
+        try:
+            os.makedirs(self._cache_dir, mode=0o755, exist_ok=True)
+            # write to a temporary file and rename it, so that concurrent pcs
+            # processes never read a partially written entry
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self._cache_dir, suffix=".tmp", text=True
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as entry_file:
+                json.dump({"key": key, "metadata": metadata}, entry_file)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, self._get_entry_path(agent_name))
+            tmp_path = None
+        except OSError:
+            pass
+        finally:
+            if tmp_path is not None:
+                with suppress(OSError):
+                    os.remove(tmp_path)
+
+    def clear(self) -> int:
+        """
+        Remove all cache entries, return the number of removed entries
+
+        Raises OSError if the cache cannot be cleared
+        """
+        try:
+            file_list = os.listdir(self._cache_dir)
+        except FileNotFoundError:
+            return 0
+        removed = 0
+        for file_name in file_list:
+            if file_name.endswith((_CACHE_FILE_SUFFIX, ".tmp")):
+                os.remove(os.path.join(self._cache_dir, file_name))
+                removed += 1
+        return removed
+
+    def _get_entry_path(self, agent_name: ResourceAgentName) -> str:
+        # Agent names come from users, hash them to get safe file names.
+        return os.path.join(
+            self._cache_dir,
+            hashlib.sha256(agent_name.full_name.encode("utf-8")).hexdigest()
+            + _CACHE_FILE_SUFFIX,
+        )
+
+    def _get_key(self, agent_name: ResourceAgentName) -> list[str] | None:
+        agent_path = _get_agent_file_path(agent_name)
+        if agent_path is None:
+            return None
+        try:
+            agent_stat = os.stat(agent_path)
+        except OSError:
+            return None
+        pacemaker_version = self._get_pacemaker_version()
+        if pacemaker_version is None:
+            return None
+        return [
+            agent_name.full_name,
+            str(agent_stat.st_mtime_ns),
+            str(agent_stat.st_size),
+            pacemaker_version,
+        ]
+
+    def _get_pacemaker_version(self) -> str | None:
+        if not self._pacemaker_version_loaded:
+            version = self._pacemaker_version_getter()
+            self._pacemaker_version = None if version is None else str(version)
+            self._pacemaker_version_loaded = True
+        return self._pacemaker_version
+
+
+def _get_agent_file_path(agent_name: ResourceAgentName) -> str | None:
+    parts = [agent_name.type]
+    if agent_name.is_ocf:
+        if not agent_name.provider:
+            return None
+        parts.append(agent_name.provider)
+    if not all(_is_safe_path_part(part) for part in parts):
+        return None
+    if agent_name.is_ocf:
+        return os.path.join(
+            settings.ocf_root,
+            "resource.d",
+            str(agent_name.provider),
+            agent_name.type,
+        )
+    if agent_name.is_stonith:
+        return os.path.join(settings.fence_agent_execs, agent_name.type)
+    return None
+
+
+def _is_safe_path_part(part: str) -> bool:
+    return bool(part) and "/" not in part and not part.startswith(".")
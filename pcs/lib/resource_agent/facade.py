@@ -1,5 +1,5 @@
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from dataclasses import replace as dc_replace
 
 from pcs.common import reports
@@ -8,6 +8,7 @@ from pcs.lib import validate
 from pcs.lib.external import CommandRunner
 
 from . import const
+from .cache import AgentMetadataCache
 from .error import ResourceAgentError, resource_agent_error_to_report_item
 from .name import name_to_void_metadata
 from .ocf_transform import ocf_version_to_ocf_unified
@@ -25,6 +26,7 @@ from .xml import (
     load_crm_resource_metadata,
     load_fake_agent_metadata,
     load_metadata,
+    load_metadata_list,
     parse_metadata,
 )
 
@@ -203,10 +205,19 @@ class ResourceAgentFacadeFactory:
     """
 
     def __init__(
-        self, runner: CommandRunner, report_processor: reports.ReportProcessor
+        self,
+        runner: CommandRunner,
+        report_processor: reports.ReportProcessor,
+        metadata_cache: AgentMetadataCache | None = None,
     ) -> None:
+        """
+        runner -- external processes runner
+        report_processor -- tool for warning/info/error reporting
+        metadata_cache -- persistent cache of agents metadata, optional
+        """
         self._runner = runner
         self._report_processor = report_processor
+        self._metadata_cache = metadata_cache
         self._fenced_metadata: ResourceAgentMetadata | None = None
 
     def facade_from_parsed_name(
@@ -219,10 +230,56 @@ class ResourceAgentFacadeFactory:
         """
         return self._facade_from_metadata(
             ocf_version_to_ocf_unified(
-                parse_metadata(name, load_metadata(self._runner, name))
+                parse_metadata(
+                    name,
+                    load_metadata(self._runner, name, self._metadata_cache),
+                )
             )
         )
 
+    def facades_from_parsed_names(
+        self,
+        name_list: Sequence[ResourceAgentName],
+        max_processes: int = 1,
+        timeout: float | None = None,
+    ) -> list[ResourceAgentFacade | ResourceAgentError]:
+        """
+        Create ResourceAgentFacades based on specified agent names
+
+        Metadata of the agents are loaded in parallel. An error is returned in
+        place of each facade which cannot be created.
+
+        name_list -- agent names to get facades for
+        max_processes -- maximal number of agents run at the same time
+        timeout -- maximal number of seconds to wait for metadata of one agent
+        """
+        result_list: list[ResourceAgentFacade | ResourceAgentError] = []
+        for name, metadata_dom in zip(
+            name_list,
+            load_metadata_list(
+                self._runner,
+                name_list,
+                self._metadata_cache,
+                max_processes,
+                timeout,
+            ),
+            strict=True,
+        ):
+            if isinstance(metadata_dom, ResourceAgentError):
+                result_list.append(metadata_dom)
+                continue
+            try:
+                result_list.append(
+                    self._facade_from_metadata(
+                        ocf_version_to_ocf_unified(
+                            parse_metadata(name, metadata_dom)
+                        )
+                    )
+                )
+            except ResourceAgentError as e:
+                result_list.append(e)
+        return result_list
+
     def void_facade_from_parsed_name(
         self, name: ResourceAgentName
     ) -> ResourceAgentFacade:
@@ -1,3 +1,7 @@
+from collections.abc import Sequence
+from contextlib import suppress
+from typing import cast
+
 from lxml import etree
 from lxml.etree import _Element
 
@@ -12,6 +16,7 @@ from pcs.lib.pacemaker.api_result import (
 from pcs.lib.xml_tools import etree_to_str
 
 from . import const
+from .cache import AgentMetadataCache
 from .error import (
     UnableToGetAgentMetadata,
     UnsupportedOcfVersion,
@@ -41,6 +46,19 @@ def _load_metadata_xml(
     runner -- external processes runner
     agent_name -- name of an agent whose metadata we want to get
     """
+    stdout, stderr, retval = runner.run(
+        _get_metadata_cmd(agent_name), env_extend=_get_metadata_cmd_env()
+    )
+    if retval != 0:
+        raise UnableToGetAgentMetadata(agent_name.full_name, stderr.strip())
+    return stdout.strip()
+
+
+def _get_metadata_cmd(agent_name: ResourceAgentName) -> list[str]:
+    return [settings.crm_resource_exec, "--show-metadata", agent_name.full_name]
+
+
+def _get_metadata_cmd_env() -> dict[str, str]:
     env_path = ":".join(
         [
             # otherwise pacemaker cannot run RHEL fence agents to get their
@@ -52,13 +70,7 @@ def _load_metadata_xml(
             "/usr/bin",
         ]
     )
-    stdout, stderr, retval = runner.run(
-        [settings.crm_resource_exec, "--show-metadata", agent_name.full_name],
-        env_extend={"PATH": env_path},
-    )
-    if retval != 0:
-        raise UnableToGetAgentMetadata(agent_name.full_name, stderr.strip())
-    return stdout.strip()
+    return {"PATH": env_path}
 
 
 def _load_fake_agent_metadata_xml(
@@ -192,18 +204,105 @@ def _metadata_xml_to_dom(metadata: str) -> _Element:
 
 
 def load_metadata(
-    runner: CommandRunner, agent_name: ResourceAgentName
+    runner: CommandRunner,
+    agent_name: ResourceAgentName,
+    metadata_cache: AgentMetadataCache | None = None,
 ) -> _Element:
     """
     Return specified agent's metadata as an XML document
 
     runner -- external processes runner
     agent_name -- name of an agent whose metadata we want to get
+    metadata_cache -- if specified, get metadata from and store them to it
     """
+    if metadata_cache is not None:
+        cached_metadata = metadata_cache.get(agent_name)
+        if cached_metadata is not None:
+            try:
+                return _metadata_xml_to_dom(cached_metadata)
+            except (etree.XMLSyntaxError, etree.DocumentInvalid):
+                # broken cache entry, load the metadata from the agent
+                pass
     try:
-        return _metadata_xml_to_dom(_load_metadata_xml(runner, agent_name))
+        metadata = _load_metadata_xml(runner, agent_name)
+        dom = _metadata_xml_to_dom(metadata)
     except (etree.XMLSyntaxError, etree.DocumentInvalid) as e:
         raise UnableToGetAgentMetadata(agent_name.full_name, str(e)) from e
+    if metadata_cache is not None:
+        metadata_cache.put(agent_name, metadata)
+    return dom
+
+
+def load_metadata_list(
+    runner: CommandRunner,
+    agent_name_list: Sequence[ResourceAgentName],
+    metadata_cache: AgentMetadataCache | None = None,
+    max_processes: int = 1,
+    timeout: float | None = None,
+) -> list[_Element | UnableToGetAgentMetadata]:
+    """
+    Return metadata of specified agents as XML documents
+
+    Metadata are loaded from several agents at the same time. An error is
+    returned instead of the metadata for each agent whose metadata cannot be
+    loaded, so that one failing agent does not prevent getting metadata of
+    other agents.
+
+    runner -- external processes runner
+    agent_name_list -- names of agents whose metadata we want to get
+    metadata_cache -- if specified, get metadata from and store them to it
+    max_processes -- maximal number of agents run at the same time
+    timeout -- maximal number of seconds to wait for metadata of one agent
+    """
+    result_list: list[_Element | UnableToGetAgentMetadata | None] = []
+    to_load: list[int] = []
+    for agent_name in agent_name_list:
+        dom = None
+        cached_metadata = (
+            metadata_cache.get(agent_name) if metadata_cache else None
+        )
+        if cached_metadata is not None:
+            # broken cache entries are loaded from agents
+            with suppress(etree.XMLSyntaxError, etree.DocumentInvalid):
+                dom = _metadata_xml_to_dom(cached_metadata)
+        if dom is None:
+            to_load.append(len(result_list))
+        result_list.append(dom)
+
+    loaded_list = (
+        runner.run_parallel(
+            [_get_metadata_cmd(agent_name_list[index]) for index in to_load],
+            env_extend=_get_metadata_cmd_env(),
+            max_processes=max_processes,
+            timeout=timeout,
+        )
+        if to_load
+        else []
+    )
+    for index, loaded in zip(to_load, loaded_list, strict=True):
+        agent_name = agent_name_list[index]
+        if loaded is None:
+            result_list[index] = UnableToGetAgentMetadata(
+                agent_name.full_name,
+                f"Agent did not provide metadata in {timeout} seconds",
+            )
+            continue
+        stdout, stderr, retval = loaded
+        if retval != 0:
+            result_list[index] = UnableToGetAgentMetadata(
+                agent_name.full_name, stderr.strip()
+            )
+            continue
+        try:
+            result_list[index] = _metadata_xml_to_dom(stdout.strip())
+        except (etree.XMLSyntaxError, etree.DocumentInvalid) as e:
+            result_list[index] = UnableToGetAgentMetadata(
+                agent_name.full_name, str(e)
+            )
+            continue
+        if metadata_cache is not None:
+            metadata_cache.put(agent_name, stdout.strip())
+    return cast(list[_Element | UnableToGetAgentMetadata], result_list)
 
 
 def load_fake_agent_metadata(
@@ -1,4 +1,5 @@
 import json
+import sys
 from typing import Any
 
 import pcs.lib.pacemaker.live as lib_pacemaker
@@ -24,7 +25,6 @@ def node_attribute_cmd(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
       * --name - specify attribute name for filter
       * --output-format - supported formats: text, cmd, json
     """
-    del lib
     modifiers.ensure_only_supported(
         "-f", "--force", "--name", output_format_supported=True
     )
@@ -32,7 +32,10 @@ def node_attribute_cmd(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
         ["--name", OUTPUT_FORMAT_OPTION]
     ):
         raise CmdLineInputError()
-    attribute_set_cmd(argv.pop(0), argv)
+    node_list, nvpair_dict = _split_node_list_and_nvpairs(argv)
+    if not modifiers.get("--force"):
+        _ensure_removed_attributes_exist(lib, node_list, nvpair_dict)
+    lib.node.set_nodes_attributes(dict.fromkeys(node_list, nvpair_dict))
 
 
 def node_utilization_cmd(
@@ -57,7 +60,8 @@ def node_utilization_cmd(
             lib.cluster_property.get_properties_metadata(),
         )
     )
-    set_node_utilization(argv.pop(0), argv)
+    node_list, nvpair_dict = _split_node_list_and_nvpairs(argv)
+    lib.node.set_nodes_utilization(dict.fromkeys(node_list, nvpair_dict))
 
 
 def node_maintenance_cmd(
@@ -104,52 +108,6 @@ def node_standby_cmd(
         lib.node.standby_unstandby_local(enable, wait)
 
 
-def set_node_utilization(node: str, argv: Argv) -> None:
-    """
-    Commandline options:
-      * -f - CIB file
-    """
-    nvpair_dict = KeyValueParser(argv).get_unique()
-    if not nvpair_dict:
-        return
-    only_removing = True
-    for value in nvpair_dict.values():
-        if value != "":
-            only_removing = False
-            break
-
-    cib = utils.get_cib_dom()
-    node_el = utils.dom_get_node(cib, node)
-    if node_el is None:
-        if utils.usefile:
-            utils.err(f"Unable to find a node: {node}")
-
-        for attrs in utils.getNodeAttributesFromPacemaker():
-            if attrs.name == node and attrs.type == "remote":
-                node_attrs = attrs
-                break
-        else:
-            utils.err(f"Unable to find a node: {node}")
-
-        nodes_section_list = cib.getElementsByTagName("nodes")
-        if not nodes_section_list:
-            utils.err("Unable to get nodes section of cib")
-
-        if only_removing:
-            # Do not create new node if we are only removing values from it.
-            return
-
-        dom = nodes_section_list[0].ownerDocument
-        node_el = dom.createElement("node")
-        node_el.setAttribute("id", node_attrs.id)
-        node_el.setAttribute("type", node_attrs.type)
-        node_el.setAttribute("uname", node_attrs.name)
-        nodes_section_list[0].appendChild(node_el)
-
-    utils.dom_update_utilization(node_el, nvpair_dict, "nodes-")
-    utils.replace_cib_configuration(cib)
-
-
 def node_pacemaker_status(
     lib: Any, argv: Argv, modifiers: InputModifiers
 ) -> None:
@@ -162,11 +120,48 @@ def node_pacemaker_status(
     print(json.dumps(lib_pacemaker.get_local_node_status(utils.cmd_runner())))
 
 
-def attribute_set_cmd(node: str, argv: Argv) -> None:
+def _split_node_list_and_nvpairs(
+    argv: Argv,
+) -> tuple[list[str], dict[str, str]]:
+    """
+    Split arguments to node names and name=value pairs
+
+    The first argument is always a node name. More node names may follow
+    until the first name=value pair is found.
+    """
+    first_pair_index = next(
+        (index for index, arg in enumerate(argv) if index > 0 and "=" in arg),
+        1,
+    )
+    # preserve order of the nodes while removing duplicates
+    node_list = list(dict.fromkeys(argv[:first_pair_index]))
+    return node_list, KeyValueParser(argv[first_pair_index:]).get_unique()
+
+
+def _ensure_removed_attributes_exist(
+    lib: Any, node_list: list[str], nvpair_dict: dict[str, str]
+) -> None:
     """
     Commandline options:
       * -f - CIB file
-      * --force - no error if attribute to delete doesn't exist
     """
-    for name, value in KeyValueParser(argv).get_unique().items():
-        utils.set_node_attribute(name, value, node)
+    removed_names = {name for name, value in nvpair_dict.items() if not value}
+    if not removed_names:
+        return
+    existing_attrs = {
+        node_dto.uname: {
+            nvpair.name
+            for nvset in node_dto.instance_attributes
+            for nvpair in nvset.nvpairs
+        }
+        for node_dto in lib.node.get_config_dto().nodes
+    }
+    for node in node_list:
+        for name in sorted(removed_names):
+            if name not in existing_attrs.get(node, set()):
+                utils.err(
+                    f"attribute: '{name}' doesn't exist for node: '{node}'",
+                    False,
+                )
+                # This return code is used by pcsd
+                sys.exit(2)
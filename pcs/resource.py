@@ -919,6 +919,18 @@ def resource_agents(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
         )
 
 
+def resource_agent_cache_refresh(
+    lib: Any, argv: Argv, modifiers: InputModifiers
+) -> None:
+    """
+    Options: no options
+    """
+    modifiers.ensure_only_supported()
+    if argv:
+        raise CmdLineInputError()
+    lib.resource_agent.refresh_metadata_cache()
+
+
 def update_cmd(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
     """
     Options:
@@ -244,6 +244,11 @@ Options:
                        A few commands only use the specified file in read-only
                        mode since their effect is not a CIB modification.
     --debug            Print all network traffic and external commands run.
+    --profile[=file]   Profile library commands run by pcs. Write a timing
+                       trace of external commands, network requests and CIB
+                       operations together with a profile of called functions
+                       to the file as JSON. If no file is specified, print
+                       a summary to stderr.
     --version          Print pcs version information. List pcs capabilities if
                        --full is specified.
     --request-timeout  Timeout for each outgoing request to another node in
@@ -1107,6 +1112,12 @@ Commands:
     agents [standard[:provider]]
         List available agents optionally filtered by standard and provider.
 
+    agent-cache refresh
+        Drop cached metadata of resource and stonith agents on the local node.
+        Metadata of ocf and stonith agents are cached and reloaded
+        automatically when an agent or pacemaker gets updated. Use this
+        command to force reloading metadata of all agents.
+
 {update_syntax}
 {update_desc}
 
@@ -1506,8 +1517,8 @@ Commands:
                 [compression <compression options>] [crypto <crypto options>]
             ] [totem <totem options>] [quorum <quorum options>] 
             [--no-cluster-uuid]
-            ([--enable] [--start [--wait[=<n>]]] [--no-keys-sync])
-            | [--corosync_conf <path>]
+            ([--enable] [--start [--wait[=<n>]]] [--no-keys-sync]
+            [--pipeline]) | [--corosync_conf <path>]
         Create a cluster from the listed nodes and synchronize cluster
         configuration files to them. If --corosync_conf is specified, do not
         connect to other nodes and save corosync.conf to the specified path; see
@@ -1570,6 +1581,10 @@ Commands:
         --no-keys-sync will skip creating and distributing pcsd SSL certificate
             and key and corosync and pacemaker authkey files. Use this if you
             provide your own certificates and keys.
+        --pipeline will let each node go through the setup steps preceding
+            distribution of corosync.conf independently of other nodes, so
+            that a slow node does not hold back the others in each step. Time
+            spent in each step is reported for each node.
 
         Local only mode:
         By default, pcs connects to all specified nodes to verify they can be
@@ -2658,6 +2673,17 @@ Commands:
 
     ref <resource>...
         List constraints referencing specified resource.
+
+    import <file> [--force]
+        Add all constraints from the file to the CIB in one CIB update. The
+        file contains a 'constraints' element with constraints in the CIB
+        format, e.g. as exported by 'pcs cluster cib scope=constraints'. Use
+        '-' to read the constraints from the standard input. Constraint ids
+        must not exist in the CIB. Referenced resources must exist. Duplicates
+        of existing constraints and of other imported constraints are errors.
+        Use --force to allow duplicate constraints and constraints for
+        resources in clones and bundles. Constraint options are not checked
+        by pcs, pacemaker rejects the CIB update if they are not valid.
 """.format(
         output_format_syntax=_output_format_syntax(),
         output_format_desc=_format_desc((" ", _output_format_desc())),
@@ -3079,13 +3105,13 @@ Manage cluster nodes
 
 Commands:
     attribute [[<node>] [--name <name>] | ({output_format_syntax})
-            | <node> <name>=<value> ...]
+            | <node>... <name>=<value> ...]
         Manage node attributes.  If no parameters are specified, show attributes
         of all nodes.  If one parameter is specified, show attributes
         of specified node.  If --name is specified, show specified attribute's
         value from all nodes.  If more parameters are specified, set attributes
-        of specified node.  Attributes can be removed by setting an attribute
-        without a value.
+        of specified nodes.  All the nodes are updated at once.  Attributes can
+        be removed by setting an attribute without a value.
         {output_format_desc}
 
     maintenance [--all | <node>...] [--wait[=n]]
@@ -3127,13 +3153,14 @@ Commands:
         to 60 minutes.
 
     utilization [[<node>] [--name <name>] | ({output_format_syntax})
-            | <node> <name>=<value> ...]
-        Add specified utilization options to specified node.  If node is not
-        specified, shows utilization of all nodes.  If --name is specified,
-        shows specified utilization value from all nodes. If utilization options
-        are not specified, shows utilization of specified node.  Utilization
-        option should be in format name=value, value has to be integer.  Options
-        may be removed by setting an option without a value.
+            | <node>... <name>=<value> ...]
+        Add specified utilization options to specified nodes.  All the nodes
+        are updated at once.  If node is not specified, shows utilization of
+        all nodes.  If --name is specified, shows specified utilization value
+        from all nodes. If utilization options are not specified, shows
+        utilization of specified node.  Utilization option should be in format
+        name=value, value has to be integer.  Options may be removed by setting
+        an option without a value.
         {output_format_desc}
 
         Example: pcs node utilization node1 cpu=4 ram=
@@ -39,6 +39,10 @@ from pcs.common import file as pcs_file
 from pcs.common import pacemaker as common_pacemaker
 from pcs.common import pcs_pycurl as pycurl
 from pcs.common.host import PcsKnownHost
+from pcs.common.node_communicator import (
+    compressed_data_placeholder,
+    is_content_encoding_header,
+)
 from pcs.common.pacemaker.resource.operations import (
     OCF_CHECK_LEVEL_INSTANCE_ATTRIBUTE_NAME,
 )
@@ -56,8 +60,6 @@ from pcs.lib.external import CommandRunner, is_proxy_set
 from pcs.lib.file.instance import FileInstance as LibFileInstance
 from pcs.lib.host.config.facade import Facade as KnownHostsFacade
 from pcs.lib.interface.config import ParserErrorException
-from pcs.lib.pacemaker.live import get_cluster_status_dom
-from pcs.lib.pacemaker.state import ClusterState
 from pcs.lib.pacemaker.values import is_score as is_score_value
 from pcs.lib.pacemaker.values import validate_id
 from pcs.lib.services import get_service_manager as _get_service_manager
@@ -545,7 +547,17 @@ def sendHTTPRequest(  # noqa: PLR0912, PLR0915
     if "--debug" in pcs_options:
         print_to_stderr(f"Sending HTTP Request to: {url}\nData: {data}")
 
+    compressed_response = False
+
     def __debug_callback(data_type, debug_data):
+        nonlocal compressed_response
+        # pylint: disable=no-member
+        if data_type == pycurl.DEBUG_HEADER_IN:
+            if is_content_encoding_header(debug_data):
+                compressed_response = True
+        elif data_type == pycurl.DEBUG_DATA_IN and compressed_response:
+            # curl provides received data before decompressing them
+            debug_data = compressed_data_placeholder(debug_data)
         prefixes = {
             # pylint: disable=no-member
             pycurl.DEBUG_TEXT: b"* ",
@@ -578,6 +590,7 @@ def sendHTTPRequest(  # noqa: PLR0912, PLR0915
     handler.setopt(pycurl.SSL_VERIFYHOST, 0)
     handler.setopt(pycurl.SSL_VERIFYPEER, 0)
     handler.setopt(pycurl.HTTPHEADER, ["Expect: "])
+    handler.setopt(pycurl.ACCEPT_ENCODING, "")
     if cookies:
         handler.setopt(pycurl.COOKIE, ";".join(cookies).encode("utf-8"))
     if data:
@@ -697,21 +710,6 @@ def get_corosync_conf_facade(conf_text=None):
         return err("Unable to parse corosync.conf: %s" % e)
 
 
-def getNodeAttributesFromPacemaker():
-    """
-    Commandline options: no options
-    """
-    try:
-        return [
-            node.attrs
-            for node in ClusterState(
-                get_cluster_status_dom(cmd_runner())
-            ).node_section.nodes
-        ]
-    except LibraryError as e:
-        return process_library_reports(e.args)
-
-
 def hasCorosyncConf():
     """
     Commandline options:
@@ -1725,63 +1723,6 @@ def get_operation_ocf_check_level(operation_el):
     return None
 
 
-def set_node_attribute(prop, value, node):
-    """
-    Commandline options:
-      * -f - CIB file
-      * --force - no error if attribute to delete doesn't exist
-    """
-    if value == "":
-        o, r = run(
-            [
-                "crm_attribute",
-                "-t",
-                "nodes",
-                "--node",
-                node,
-                "--name",
-                prop,
-                "--query",
-            ]
-        )
-        if r != 0 and "--force" not in pcs_options:
-            err(
-                "attribute: '%s' doesn't exist for node: '%s'" % (prop, node),
-                False,
-            )
-            # This return code is used by pcsd
-            sys.exit(2)
-        o, r = run(
-            [
-                "crm_attribute",
-                "-t",
-                "nodes",
-                "--node",
-                node,
-                "--name",
-                prop,
-                "--delete",
-            ]
-        )
-    else:
-        o, r = run(
-            [
-                "crm_attribute",
-                "-t",
-                "nodes",
-                "--node",
-                node,
-                "--name",
-                prop,
-                "--update",
-                value,
-            ]
-        )
-
-    if r != 0:
-        err("unable to set attribute %s\n%s" % (prop, o))
-
-
 def get_terminal_input(message=None):
     """
     Commandline options: no options
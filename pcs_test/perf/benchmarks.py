@@ -0,0 +1,352 @@
+"""
+Benchmarks of hot library code paths
+
+Each benchmark takes generated cluster data and returns the time in seconds
+spent in one run of the measured code. Preparation of inputs and checks of
+results are not included in the time.
+
+Benchmarks of cluster-wide commands communicate with simulated pcsd nodes
+running on the local machine, see pcs_test.perf.simulator.
+"""
+
+import logging
+import time
+import unittest
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
+
+from lxml import etree
+
+from pcs.common.reports import ReportProcessor
+from pcs.common.resource_status import ResourcesStatusFacade, ResourceState
+from pcs.lib.cib.remove_elements import (
+    ElementsToRemove,
+    remove_specified_elements,
+)
+from pcs.lib.cib.rule.parser import parse_rule
+from pcs.lib.cib.tools import IdProvider
+from pcs.lib.commands import cluster, resource
+from pcs.lib.commands.constraint import common as constraint_common
+from pcs.lib.communication.booth import BoothSendConfig
+from pcs.lib.communication.nodes import CheckReachability
+from pcs.lib.communication.pcs_cfgsync import GetConfigs
+from pcs.lib.communication.tools import AllSameDataMixin, run_and_raise
+from pcs.lib.corosync.config_parser import Parser as CorosyncParser
+from pcs.lib.env import LibraryEnvironment
+from pcs.lib.pacemaker.status import ClusterStatusParser
+
+from pcs_test.perf import generators
+from pcs_test.perf.simulator import NodeBehavior, PcsdSimulator
+from pcs_test.tools.command_env import get_env_tools
+from pcs_test.tools.custom_mock import MockLibraryReportProcessor
+
+
+class ClusterData:
+    """
+    Generated inputs of benchmarks, each input is generated only once
+
+    Simulated pcsd nodes are started when first needed and they run until
+    the close method is called.
+    """
+
+    def __init__(self, size: generators.ClusterSize, node_latency: float = 0.0):
+        """
+        size -- size of the generated cluster
+        node_latency -- seconds each simulated node waits before responding
+        """
+        self.size = size
+        self.node_latency = node_latency
+
+    @cached_property
+    def cib_xml(self) -> str:
+        return generators.generate_cib(self.size)
+
+    @cached_property
+    def crm_mon_xml(self) -> str:
+        return generators.generate_crm_mon(self.size)
+
+    @cached_property
+    def corosync_conf(self) -> bytes:
+        return generators.generate_corosync_conf(self.size).encode("utf-8")
+
+    @cached_property
+    def rules(self) -> list[str]:
+        return generators.generate_rules(self.size)
+
+    @cached_property
+    def simulator(self) -> PcsdSimulator:
+        simulator = PcsdSimulator(
+            self.node_names,
+            dict.fromkeys(
+                self.node_names, NodeBehavior(latency=self.node_latency)
+            ),
+        )
+        simulator.start()
+        return simulator
+
+    @property
+    def node_names(self) -> list[str]:
+        return [generators.node_name(index) for index in range(self.size.nodes)]
+
+    @property
+    def primitive_ids(self) -> list[str]:
+        return [
+            generators.primitive_id(index)
+            for index in range(self.size.primitives)
+        ]
+
+    def parse_cib(self) -> etree._Element:
+        return etree.fromstring(self.cib_xml)
+
+    def get_simulator_env(self) -> LibraryEnvironment:
+        """
+        Return a live environment knowing the simulated pcsd nodes
+        """
+        simulator = self.simulator
+        return LibraryEnvironment(
+            logging.getLogger("pcs_test.perf"),
+            MockLibraryReportProcessor(),
+            known_hosts_getter=lambda: simulator.known_hosts,
+        )
+
+    def close(self) -> None:
+        if "simulator" in self.__dict__:
+            self.simulator.stop()
+            del self.__dict__["simulator"]
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    description: str
+    run: Callable[[ClusterData], float]
+
+
+class _LibCommandRun(unittest.TestCase):
+    """
+    Run a library command in an environment mocked by command_env
+
+    The command_env checks, that all expected calls have been made and no
+    unexpected reports have been produced, are done as in tier0 tests.
+    """
+
+    def __init__(
+        self, cib_xml: str, command: Callable[[LibraryEnvironment], Any]
+    ):
+        super().__init__()
+        self._cib_xml = cib_xml
+        self._command = command
+        self.elapsed: float | None = None
+
+    def runTest(self) -> None:  # noqa: N802
+        env_assist, config = get_env_tools(self)
+        config.runner.cib.load_content(self._cib_xml)
+        env = env_assist.get_env()
+        start = time.perf_counter()
+        self._command(env)
+        self.elapsed = time.perf_counter() - start
+
+
+def _run_lib_command(
+    cib_xml: str, command: Callable[[LibraryEnvironment], Any]
+) -> float:
+    test_run = _LibCommandRun(cib_xml, command)
+    result = unittest.TestResult()
+    test_run.run(result)
+    problems = result.errors + result.failures
+    if problems or test_run.elapsed is None:
+        raise RuntimeError(
+            "\n".join(traceback for _, traceback in problems)
+            or "Library command has not been run"
+        )
+    return test_run.elapsed
+
+
+def _timed(func: Callable[..., Any], *args: Any) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def _id_provider(data: ClusterData) -> float:
+    cib = data.parse_cib()
+
+    def allocate() -> None:
+        id_provider = IdProvider(cib)
+        for resource_id in data.primitive_ids:
+            id_provider.allocate_id(f"{resource_id}-instance_attributes")
+            id_provider.book_ids(f"{resource_id}-meta_attributes")
+
+    return _timed(allocate)
+
+
+def _remove_elements(data: ClusterData) -> float:
+    cib = data.parse_cib()
+    # every fifth primitive, removing it removes constraints and tag
+    # references as well
+    ids = data.primitive_ids[::5]
+
+    def remove() -> None:
+        remove_specified_elements(cib, ElementsToRemove(cib, ids))
+
+    return _timed(remove)
+
+
+def _status_parse(data: ClusterData) -> float:
+    status = etree.fromstring(data.crm_mon_xml)
+    return _timed(lambda: ClusterStatusParser(status).status_xml_to_dto())
+
+
+def _status_facade(data: ClusterData) -> float:
+    status_dto = ClusterStatusParser(
+        etree.fromstring(data.crm_mon_xml)
+    ).status_xml_to_dto()
+    # queries on clones are not supported in clusters with bundles
+    resource_ids = data.primitive_ids + [
+        generators.group_id(index) for index in range(data.size.groups)
+    ]
+
+    def query() -> None:
+        facade = ResourcesStatusFacade.from_resources_status_dto(status_dto)
+        for resource_id in resource_ids:
+            facade.is_state(resource_id, None, ResourceState.STARTED)
+            facade.get_nodes(resource_id, None)
+
+    return _timed(query)
+
+
+def _constraint_dto(data: ClusterData) -> float:
+    return _run_lib_command(data.cib_xml, constraint_common.get_config)
+
+
+def _resource_dto(data: ClusterData) -> float:
+    return _run_lib_command(data.cib_xml, resource.get_configured_resources)
+
+
+def _rule_parse(data: ClusterData) -> float:
+    rules = data.rules
+
+    def parse() -> None:
+        for rule in rules:
+            parse_rule(rule)
+
+    return _timed(parse)
+
+
+def _corosync_parse(data: ClusterData) -> float:
+    return _timed(CorosyncParser.parse, data.corosync_conf)
+
+
+def _run_communication(
+    data: ClusterData,
+    com_cmd_factory: Callable[[ReportProcessor], AllSameDataMixin],
+) -> float:
+    env = data.get_simulator_env()
+    com_cmd = com_cmd_factory(env.report_processor)
+    com_cmd.set_targets(
+        env.get_node_target_factory().get_target_list(data.node_names)
+    )
+    return _timed(run_and_raise, env.get_node_communicator(), com_cmd)
+
+
+def _check_reachability(data: ClusterData) -> float:
+    return _run_communication(data, CheckReachability)
+
+
+def _booth_send_config(data: ClusterData) -> float:
+    config = (
+        "".join(f"site = 10.0.0.{index + 1}\n" for index in range(3))
+        + "ticket = T1\nauthfile = /etc/booth/booth.key\n"
+    )
+    return _run_communication(
+        data,
+        lambda report_processor: BoothSendConfig(
+            report_processor,
+            "booth",
+            config.encode("utf-8"),
+            authfile="booth.key",
+            authfile_data=bytes(range(256)),
+        ),
+    )
+
+
+def _cfgsync_get_configs(data: ClusterData) -> float:
+    return _run_communication(
+        data,
+        lambda report_processor: GetConfigs(report_processor, "perf"),
+    )
+
+
+def _cluster_setup(data: ClusterData) -> float:
+    env = data.get_simulator_env()
+    nodes = [
+        {"name": name, "addrs": [f"10.0.{index // 250}.{index % 250 + 1}"]}
+        for index, name in enumerate(data.node_names)
+    ]
+    return _timed(cluster.setup, env, "perf", nodes)
+
+
+BENCHMARKS = [
+    Benchmark(
+        "cib.id_provider",
+        "allocate and book ids of nvsets of all primitives",
+        _id_provider,
+    ),
+    Benchmark(
+        "cib.remove_elements",
+        "remove every fifth primitive including references to it",
+        _remove_elements,
+    ),
+    Benchmark(
+        "status.parse",
+        "parse crm_mon xml to resources status dto",
+        _status_parse,
+    ),
+    Benchmark(
+        "status.facade",
+        "check state and nodes of all primitives and groups",
+        _status_facade,
+    ),
+    Benchmark(
+        "constraint.get_config",
+        "export all constraints to dtos",
+        _constraint_dto,
+    ),
+    Benchmark(
+        "resource.get_configured_resources",
+        "export all resources to dtos",
+        _resource_dto,
+    ),
+    Benchmark(
+        "rule.parse",
+        "parse rules in pcs rule syntax",
+        _rule_parse,
+    ),
+    Benchmark(
+        "corosync.parse",
+        "parse corosync.conf",
+        _corosync_parse,
+    ),
+    Benchmark(
+        "network.check_reachability",
+        "check authentication of all simulated nodes",
+        _check_reachability,
+    ),
+    Benchmark(
+        "network.booth_send_config",
+        "send booth config and authfile to all simulated nodes",
+        _booth_send_config,
+    ),
+    Benchmark(
+        "network.cfgsync_get_configs",
+        "fetch pcsd config files from all simulated nodes",
+        _cfgsync_get_configs,
+    ),
+    Benchmark(
+        "network.cluster_setup",
+        "set up a cluster on all simulated nodes",
+        _cluster_setup,
+    ),
+]
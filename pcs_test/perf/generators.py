@@ -0,0 +1,484 @@
+"""
+Generators of synthetic cluster configuration and status of a specified size
+"""
+
+from dataclasses import dataclass, fields, replace
+
+from lxml import etree
+from lxml.etree import _Element
+
+from pcs_test.tools import fixture_crm_mon
+from pcs_test.tools.fixture_cib import modify_cib
+from pcs_test.tools.misc import read_test_resource
+from pcs_test.tools.xml import etree_to_str
+
+
+@dataclass(frozen=True)
+class ClusterSize:
+    """
+    Numbers of elements in a generated cluster
+
+    nodes -- number of cluster nodes
+    primitives -- number of standalone primitive resources
+    groups -- number of groups, each containing group_size primitives
+    group_size -- number of primitives in each group
+    clones -- number of clones, each containing one primitive
+    bundles -- number of bundles, each running bundle_replicas replicas
+    bundle_replicas -- number of replicas of each bundle
+    constraints -- number of location, colocation and order constraints, the
+        types of constraints alternate
+    rules -- number of location constraints with a rule
+    nvpairs -- number of instance attributes of each standalone primitive
+    tags -- number of tags, each referencing three primitives
+    acls -- number of acl roles, each with a target and three permissions
+    """
+
+    nodes: int = 3
+    primitives: int = 0
+    groups: int = 0
+    group_size: int = 3
+    clones: int = 0
+    bundles: int = 0
+    bundle_replicas: int = 2
+    constraints: int = 0
+    rules: int = 0
+    nvpairs: int = 0
+    tags: int = 0
+    acls: int = 0
+
+    def scaled(self, factor: int) -> "ClusterSize":
+        """
+        Return a size with numbers of top level elements multiplied by factor
+
+        Sizes of groups and bundles and numbers of nodes and nvpairs are kept,
+        so that the cluster grows in width rather than in depth.
+        """
+        kept = {"nodes", "group_size", "bundle_replicas", "nvpairs"}
+        return replace(
+            self,
+            **{
+                field.name: getattr(self, field.name) * factor
+                for field in fields(self)
+                if field.name not in kept
+            },
+        )
+
+
+SIZES = {
+    "small": ClusterSize(
+        nodes=8,
+        primitives=50,
+        groups=10,
+        clones=10,
+        bundles=5,
+        constraints=60,
+        rules=20,
+        nvpairs=5,
+        tags=10,
+        acls=10,
+    ),
+}
+SIZES["medium"] = replace(SIZES["small"].scaled(10), nodes=32)
+SIZES["large"] = replace(SIZES["small"].scaled(40), nodes=128)
+
+
+def node_name(index: int) -> str:
+    return f"node-{index}"
+
+
+def primitive_id(index: int) -> str:
+    return f"R-{index}"
+
+
+def group_id(index: int) -> str:
+    return f"G-{index}"
+
+
+def clone_id(index: int) -> str:
+    return f"C-{index}"
+
+
+def bundle_id(index: int) -> str:
+    return f"B-{index}"
+
+
+def generate_cib(size: ClusterSize) -> str:
+    """
+    Return a CIB containing configuration of a cluster of the specified size
+    """
+    return modify_cib(
+        read_test_resource("cib-empty-3.9.xml"),
+        nodes=_str(_cib_nodes(size)),
+        resources=_str(_cib_resources(size)),
+        constraints=_str(_cib_constraints(size)),
+        tags=_str(_cib_tags(size)),
+        acls=_str(_cib_acls(size)),
+    )
+
+
+def generate_crm_mon(size: ClusterSize) -> str:
+    """
+    Return crm_mon xml output with status of a cluster of the specified size
+
+    All resources are started, resources and clone instances are spread
+    evenly across the nodes.
+    """
+    nodes_el = etree.Element("nodes")
+    for index in range(size.nodes):
+        etree.SubElement(
+            nodes_el,
+            "node",
+            name=node_name(index),
+            id=str(index + 1),
+            is_dc="true" if index == 0 else "false",
+        )
+
+    resources_el = etree.Element("resources")
+    for index in range(size.primitives):
+        _status_primitive(resources_el, primitive_id(index), size, index)
+    for index in range(size.groups):
+        group_el = etree.SubElement(
+            resources_el,
+            "group",
+            id=group_id(index),
+            number_resources=str(size.group_size),
+        )
+        for member in range(size.group_size):
+            _status_primitive(
+                group_el, f"{group_id(index)}-R-{member}", size, index
+            )
+    for index in range(size.clones):
+        clone_el = etree.SubElement(
+            resources_el,
+            "clone",
+            id=clone_id(index),
+            multi_state="false",
+            unique="false",
+        )
+        for node_index in range(size.nodes):
+            _status_primitive(
+                clone_el, f"{clone_id(index)}-R", size, node_index
+            )
+    for index in range(size.bundles):
+        bundle_el = etree.SubElement(
+            resources_el, "bundle", id=bundle_id(index), image="pcs:test"
+        )
+        for replica in range(size.bundle_replicas):
+            replica_el = etree.SubElement(bundle_el, "replica", id=str(replica))
+            _status_primitive(
+                replica_el,
+                f"{bundle_id(index)}-ip-192.168.{index % 256}.{replica}",
+                size,
+                replica,
+                resource_agent="ocf:heartbeat:IPaddr2",
+            )
+            _status_primitive(
+                replica_el,
+                f"{bundle_id(index)}-docker-{replica}",
+                size,
+                replica,
+                resource_agent="ocf:heartbeat:docker",
+            )
+
+    return etree_to_str(
+        fixture_crm_mon.complete_state(
+            read_test_resource("crm_mon.minimal.xml"),
+            resources_xml=_str(resources_el),
+            nodes_xml=_str(nodes_el),
+        )
+    )
+
+
+def generate_corosync_conf(size: ClusterSize, links: int = 2) -> str:
+    """
+    Return corosync.conf of a cluster with the specified number of nodes
+    """
+    lines = [
+        "totem {",
+        "    version: 2",
+        "    cluster_name: perf",
+        "    transport: knet",
+        "    crypto_cipher: aes256",
+        "    crypto_hash: sha256",
+    ]
+    for link in range(links):
+        lines += [
+            "",
+            "    interface {",
+            f"        linknumber: {link}",
+            "        knet_transport: udp",
+            "    }",
+        ]
+    lines += ["}", "", "nodelist {"]
+    for index in range(size.nodes):
+        lines += ["    node {"]
+        lines += [
+            f"        ring{link}_addr: 10.{link}.{index // 256}.{index % 256}"
+            for link in range(links)
+        ]
+        lines += [
+            f"        name: {node_name(index)}",
+            f"        nodeid: {index + 1}",
+            "    }",
+            "",
+        ]
+    lines += [
+        "}",
+        "",
+        "quorum {",
+        "    provider: corosync_votequorum",
+        "}",
+        "",
+        "logging {",
+        "    to_logfile: yes",
+        "    logfile: /var/log/cluster/corosync.log",
+        "    to_syslog: yes",
+        "    timestamp: on",
+        "}",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def generate_rules(size: ClusterSize) -> list[str]:
+    """
+    Return rule strings in the pcs rule syntax
+
+    The rules are the same as rules in location constraints of the generated
+    CIB.
+    """
+    return [_rule_string(size, index) for index in range(size.rules)]
+
+
+def _str(element: _Element) -> str:
+    return etree.tostring(element).decode()
+
+
+def _rule_string(size: ClusterSize, index: int) -> str:
+    return (
+        f"#uname eq {node_name(index % size.nodes)} and "
+        f"(date gt 2024-01-{index % 28 + 1:02d} or "
+        f"(defined pingd and pingd gt integer {index}))"
+    )
+
+
+def _cib_nodes(size: ClusterSize) -> _Element:
+    nodes_el = etree.Element("nodes")
+    for index in range(size.nodes):
+        etree.SubElement(
+            nodes_el, "node", id=str(index + 1), uname=node_name(index)
+        )
+    return nodes_el
+
+
+def _cib_primitive(
+    parent: _Element, resource_id: str, nvpairs: int = 0
+) -> _Element:
+    primitive_el = etree.SubElement(
+        parent,
+        "primitive",
+        {
+            "id": resource_id,
+            "class": "ocf",
+            "provider": "pacemaker",
+            "type": "Dummy",
+        },
+    )
+    if nvpairs:
+        attrs_el = etree.SubElement(
+            primitive_el,
+            "instance_attributes",
+            id=f"{resource_id}-instance_attributes",
+        )
+        for index in range(nvpairs):
+            etree.SubElement(
+                attrs_el,
+                "nvpair",
+                id=f"{resource_id}-instance_attributes-attr{index}",
+                name=f"attr{index}",
+                value=str(index),
+            )
+    operations_el = etree.SubElement(primitive_el, "operations")
+    etree.SubElement(
+        operations_el,
+        "op",
+        id=f"{resource_id}-monitor-interval-10s",
+        name="monitor",
+        interval="10s",
+        timeout="20s",
+    )
+    return primitive_el
+
+
+def _cib_resources(size: ClusterSize) -> _Element:
+    resources_el = etree.Element("resources")
+    for index in range(size.primitives):
+        _cib_primitive(resources_el, primitive_id(index), size.nvpairs)
+    for index in range(size.groups):
+        group_el = etree.SubElement(resources_el, "group", id=group_id(index))
+        for member in range(size.group_size):
+            _cib_primitive(group_el, f"{group_id(index)}-R-{member}")
+    for index in range(size.clones):
+        clone_el = etree.SubElement(resources_el, "clone", id=clone_id(index))
+        _cib_primitive(clone_el, f"{clone_id(index)}-R")
+    for index in range(size.bundles):
+        bundle_el = etree.SubElement(
+            resources_el, "bundle", id=bundle_id(index)
+        )
+        etree.SubElement(
+            bundle_el,
+            "docker",
+            image="pcs:test",
+            replicas=str(size.bundle_replicas),
+        )
+        etree.SubElement(
+            bundle_el,
+            "network",
+            {
+                "ip-range-start": f"192.168.{index % 256}.0",
+                "control-port": str(3121 + index),
+            },
+        )
+    return resources_el
+
+
+def _cib_constraints(size: ClusterSize) -> _Element:
+    constraints_el = etree.Element("constraints")
+    if size.primitives < 2:
+        return constraints_el
+    for index in range(size.constraints):
+        first = primitive_id(index % size.primitives)
+        second = primitive_id((index + 1) % size.primitives)
+        kind = index % 3
+        if kind == 0:
+            etree.SubElement(
+                constraints_el,
+                "rsc_location",
+                id=f"location-{first}-{index}",
+                rsc=first,
+                node=node_name(index % size.nodes),
+                score="INFINITY",
+            )
+        elif kind == 1:
+            etree.SubElement(
+                constraints_el,
+                "rsc_colocation",
+                {
+                    "id": f"colocation-{first}-{second}-{index}",
+                    "rsc": first,
+                    "with-rsc": second,
+                    "score": "INFINITY",
+                },
+            )
+        else:
+            etree.SubElement(
+                constraints_el,
+                "rsc_order",
+                {
+                    "id": f"order-{first}-{second}-{index}",
+                    "first": first,
+                    "first-action": "start",
+                    "then": second,
+                    "then-action": "start",
+                },
+            )
+    for index in range(size.rules):
+        resource = primitive_id(index % size.primitives)
+        location_el = etree.SubElement(
+            constraints_el,
+            "rsc_location",
+            id=f"location-rule-{resource}-{index}",
+            rsc=resource,
+        )
+        rule_id = f"location-rule-{resource}-{index}-rule"
+        rule_el = etree.SubElement(
+            location_el,
+            "rule",
+            {"id": rule_id, "score": "INFINITY", "boolean-op": "and"},
+        )
+        etree.SubElement(
+            rule_el,
+            "expression",
+            id=f"{rule_id}-expr",
+            attribute="#uname",
+            operation="eq",
+            value=node_name(index % size.nodes),
+        )
+        inner_rule_el = etree.SubElement(
+            rule_el, "rule", {"id": f"{rule_id}-rule", "boolean-op": "or"}
+        )
+        etree.SubElement(
+            inner_rule_el,
+            "date_expression",
+            id=f"{rule_id}-rule-expr",
+            operation="gt",
+            start=f"2024-01-{index % 28 + 1:02d}",
+        )
+        etree.SubElement(
+            inner_rule_el,
+            "expression",
+            id=f"{rule_id}-rule-expr-1",
+            attribute="pingd",
+            operation="defined",
+        )
+    return constraints_el
+
+
+def _cib_tags(size: ClusterSize) -> _Element:
+    tags_el = etree.Element("tags")
+    if not size.primitives:
+        return tags_el
+    for index in range(size.tags):
+        tag_el = etree.SubElement(tags_el, "tag", id=f"T-{index}")
+        for offset in range(3):
+            etree.SubElement(
+                tag_el,
+                "obj_ref",
+                id=primitive_id((index + offset) % size.primitives),
+            )
+    return tags_el
+
+
+def _cib_acls(size: ClusterSize) -> _Element:
+    acls_el = etree.Element("acls")
+    for index in range(size.acls):
+        role_id = f"role-{index}"
+        target_el = etree.SubElement(acls_el, "acl_target", id=f"user-{index}")
+        etree.SubElement(target_el, "role", id=role_id)
+        role_el = etree.SubElement(acls_el, "acl_role", id=role_id)
+        for kind in ("read", "write", "deny"):
+            etree.SubElement(
+                role_el,
+                "acl_permission",
+                id=f"{role_id}-{kind}",
+                kind=kind,
+                xpath=f"/cib/configuration/resources/primitive[@id='R-{index}']",
+            )
+    return acls_el
+
+
+def _status_primitive(
+    parent: _Element,
+    resource_id: str,
+    size: ClusterSize,
+    index: int,
+    resource_agent: str = "ocf:pacemaker:Dummy",
+) -> _Element:
+    resource_el = etree.SubElement(
+        parent,
+        "resource",
+        id=resource_id,
+        resource_agent=resource_agent,
+        role="Started",
+        active="true",
+        blocked="false",
+        maintenance="false",
+    )
+    etree.SubElement(
+        resource_el,
+        "node",
+        name=node_name(index % size.nodes),
+        id=str(index % size.nodes + 1),
+        cached="true",
+    )
+    return resource_el
@@ -0,0 +1,236 @@
+# ruff: noqa: PLC0415 `import` should be at the top-level of a file
+"""
+Run pcs performance benchmarks and print their results as JSON
+
+Results of two runs, e.g. of two commits, can be compared by passing a file
+with the results of the first run in the --compare option of the second run.
+"""
+
+import argparse
+import json
+import os.path
+import platform
+import statistics
+import subprocess
+import sys
+from typing import Any
+
+PACKAGE_DIR = os.path.realpath(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+RESULTS_FORMAT_VERSION = 1
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    from pcs_test.perf.generators import SIZES
+
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "benchmarks",
+        nargs="*",
+        metavar="BENCHMARK",
+        help="Run only benchmarks whose names start with any of the values",
+    )
+    parser.add_argument(
+        "--size",
+        choices=sorted(SIZES),
+        default="small",
+        help="Size of the generated cluster, default: %(default)s",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of runs of each benchmark, default: %(default)s",
+    )
+    parser.add_argument(
+        "--node-latency",
+        type=float,
+        default=0.0,
+        metavar="SECONDS",
+        help=(
+            "Delay of responses of simulated pcsd nodes, default: %(default)s"
+        ),
+    )
+    parser.add_argument(
+        "--output",
+        metavar="FILE",
+        help="Write results to a file instead of the standard output",
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="FILE",
+        help="Compare results with previous results stored in a file",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help=(
+            "Exit with an error if a benchmark is slower by more than the "
+            "percentage when comparing results, default: %(default)s"
+        ),
+    )
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    if args.node_latency < 0:
+        parser.error("--node-latency must not be negative")
+    return args
+
+
+def _get_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=PACKAGE_DIR,
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(
+    size_name: str,
+    repeat: int,
+    name_prefixes: list[str],
+    node_latency: float = 0.0,
+) -> dict[str, Any]:
+    """
+    Run benchmarks and return their results
+
+    size_name -- name of a size of the generated cluster
+    repeat -- number of runs of each benchmark
+    name_prefixes -- run only benchmarks with names starting with any of the
+        prefixes, run all benchmarks if empty
+    node_latency -- delay of responses of simulated pcsd nodes in seconds
+    """
+    from dataclasses import asdict
+
+    from pcs_test.perf.benchmarks import BENCHMARKS, ClusterData
+    from pcs_test.perf.generators import SIZES
+
+    size = SIZES[size_name]
+    data = ClusterData(size, node_latency)
+    results = {}
+    try:
+        for benchmark in BENCHMARKS:
+            if name_prefixes and not benchmark.name.startswith(
+                tuple(name_prefixes)
+            ):
+                continue
+            # the first run warms up caches and lazily generated inputs
+            benchmark.run(data)
+            runs = [benchmark.run(data) for _ in range(repeat)]
+            results[benchmark.name] = {
+                "description": benchmark.description,
+                "min": min(runs),
+                "median": statistics.median(runs),
+                "mean": statistics.mean(runs),
+                "max": max(runs),
+                "runs": runs,
+            }
+    finally:
+        data.close()
+    return {
+        "format_version": RESULTS_FORMAT_VERSION,
+        "commit": _get_commit(),
+        "python": platform.python_version(),
+        "size_name": size_name,
+        "size": asdict(size),
+        "node_latency": node_latency,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare_results(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float
+) -> tuple[list[str], bool]:
+    """
+    Return lines describing differences of medians and whether any benchmark
+    got slower by more than the threshold percentage
+
+    baseline -- results of a previous run
+    current -- results of the current run
+    threshold -- allowed slowdown in percents
+    """
+    if baseline.get("format_version") != RESULTS_FORMAT_VERSION:
+        raise ValueError("Unsupported format of the compared results")
+    if baseline.get("size") != current["size"]:
+        raise ValueError(
+            "The compared results have been obtained with a different size "
+            "of the generated cluster"
+        )
+    if baseline.get("node_latency", 0.0) != current.get("node_latency", 0.0):
+        raise ValueError(
+            "The compared results have been obtained with a different latency "
+            "of simulated nodes"
+        )
+    lines = []
+    regression = False
+    for name, result in current["results"].items():
+        if name not in baseline["results"]:
+            lines.append(f"{name}: no previous result")
+            continue
+        old_median = baseline["results"][name]["median"]
+        change = (
+            (result["median"] - old_median) / old_median * 100
+            if old_median
+            else 0.0
+        )
+        slower = change > threshold
+        regression = regression or slower
+        lines.append(
+            f"{name}: {old_median * 1000:.3f} ms -> "
+            f"{result['median'] * 1000:.3f} ms ({change:+.1f} %)"
+            + (" SLOWER" if slower else "")
+        )
+    return lines, regression
+
+
+def main(argv: list[str] | None = None) -> int:
+    if PACKAGE_DIR not in sys.path:
+        sys.path.insert(0, PACKAGE_DIR)
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+
+    results = run_benchmarks(
+        args.size, args.repeat, args.benchmarks, args.node_latency
+    )
+    for name, result in results["results"].items():
+        print(
+            f"{name}: median {result['median'] * 1000:.3f} ms, "
+            f"min {result['min'] * 1000:.3f} ms",
+            file=sys.stderr,
+        )
+
+    output = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            output_file.write(output + "\n")
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        try:
+            lines, regression = compare_results(
+                baseline, results, args.threshold
+            )
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        print("\n".join(lines), file=sys.stderr)
+        if regression:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
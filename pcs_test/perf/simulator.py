@@ -0,0 +1,342 @@
+"""
+Simulated cluster of pcsd instances running on the local machine
+
+Each simulated node is an HTTPS server listening on a random port of the
+loopback interface. The servers answer requests of pcsd remote actions used by
+cluster-wide library commands, so the commands and node communicators can be
+run and measured without a real cluster. Latency, failures and slowly sent
+responses of each node can be configured.
+"""
+
+import asyncio
+import json
+import os.path
+import ssl
+import threading
+from collections import Counter
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from tornado.httpserver import HTTPServer
+from tornado.netutil import bind_sockets
+from tornado.web import Application, RequestHandler
+
+from pcs.common import ssl as pcs_ssl
+from pcs.common.communication.const import COM_STATUS_SUCCESS
+from pcs.common.communication.dto import InternalCommunicationResultDto
+from pcs.common.file_type_codes import PCS_SETTINGS_CONF
+from pcs.common.host import Destination, PcsKnownHost
+from pcs.common.interface.dto import to_dict
+from pcs.common.pcs_cfgsync_dto import SyncConfigsDto
+
+from pcs_test.tools.misc import get_tmp_dir
+
+_ADDR = "127.0.0.1"
+_PCS_SETTINGS_CONF = json.dumps(
+    {
+        "format_version": 2,
+        "data_version": 1,
+        "clusters": [],
+        "permissions": {"local_cluster": []},
+    }
+)
+
+
+@dataclass(frozen=True)
+class NodeBehavior:
+    """
+    Behavior of a simulated node
+
+    latency -- seconds to wait before responding to a request
+    response_code -- HTTP code of responses, responses with a code other than
+        200 have no body, e.g. 401 simulates a node with an invalid token
+    offline -- if True, nothing listens on the port of the node
+    drip_chunk_size -- if greater than 0, responses are sent in chunks of the
+        size in bytes with drip_interval seconds between the chunks
+    drip_interval -- seconds between chunks of slowly sent responses
+    """
+
+    latency: float = 0.0
+    response_code: int = 200
+    offline: bool = False
+    drip_chunk_size: int = 0
+    drip_interval: float = 0.0
+
+
+@dataclass(frozen=True)
+class SimulatedRequest:
+    """
+    Request received by a simulated node
+
+    node -- name of the node which received the request
+    action -- requested pcsd action, e.g. "remote/check_auth"
+    params -- form encoded parameters of the request
+    body -- raw body of the request
+    """
+
+    node: str
+    action: str
+    params: Mapping[str, str]
+    body: bytes
+
+
+Responder = Callable[[SimulatedRequest], str]
+
+
+def _respond_empty(request: SimulatedRequest) -> str:
+    del request
+    return ""
+
+
+def _respond_check_auth(request: SimulatedRequest) -> str:
+    del request
+    return json.dumps({"success": True})
+
+
+def _respond_check_host(request: SimulatedRequest) -> str:
+    del request
+    service = {
+        "installed": True,
+        "enabled": False,
+        "running": False,
+        "version": "1.0.0",
+    }
+    return json.dumps(
+        {
+            "services": dict.fromkeys(
+                ("pacemaker", "pacemaker_remote", "corosync", "pcsd"), service
+            ),
+            "cluster_configuration_exists": False,
+        }
+    )
+
+
+def _file_action_responder(code: str) -> Responder:
+    def respond(request: SimulatedRequest) -> str:
+        return json.dumps(
+            {
+                "files": {
+                    key: {"code": code, "message": ""}
+                    for key in json.loads(request.params["data_json"])
+                }
+            }
+        )
+
+    return respond
+
+
+def _respond_cfgsync_get_configs(request: SimulatedRequest) -> str:
+    return json.dumps(
+        to_dict(
+            InternalCommunicationResultDto(
+                status=COM_STATUS_SUCCESS,
+                status_msg=None,
+                report_list=[],
+                data=to_dict(
+                    SyncConfigsDto(
+                        cluster_name=json.loads(request.body)["cluster_name"],
+                        configs={PCS_SETTINGS_CONF: _PCS_SETTINGS_CONF},
+                    )
+                ),
+            )
+        )
+    )
+
+
+DEFAULT_RESPONDERS: dict[str, Responder] = {
+    "remote/booth_set_config": _respond_empty,
+    "remote/check_auth": _respond_check_auth,
+    "remote/check_host": _respond_check_host,
+    "remote/cluster_destroy": _respond_empty,
+    "remote/known_hosts_change": _respond_empty,
+    "remote/put_file": _file_action_responder("written"),
+    "remote/remove_file": _file_action_responder("deleted"),
+    "api/v1/cfgsync-get-configs/v1": _respond_cfgsync_get_configs,
+}
+
+
+class _SimulatedNode:
+    def __init__(
+        self,
+        name: str,
+        behavior: NodeBehavior,
+        responders: Mapping[str, Responder],
+        request_counter: Counter[tuple[str, str]],
+    ):
+        self.name = name
+        self.behavior = behavior
+        self.responders = responders
+        self.request_counter = request_counter
+        self.port = 0
+        self.server: HTTPServer | None = None
+
+
+class _ActionHandler(RequestHandler):
+    # pylint: disable=abstract-method
+    def initialize(self, node: _SimulatedNode) -> None:
+        # pylint: disable=attribute-defined-outside-init
+        self._node = node
+
+    async def get(self, action: str) -> None:
+        await self._respond(action)
+
+    async def post(self, action: str) -> None:
+        await self._respond(action)
+
+    async def _respond(self, action: str) -> None:
+        node = self._node
+        behavior = node.behavior
+        node.request_counter[(node.name, action)] += 1
+        if behavior.latency > 0:
+            await asyncio.sleep(behavior.latency)
+        responder = node.responders.get(action)
+        if responder is None:
+            self.set_status(404)
+            return
+        if behavior.response_code != 200:
+            self.set_status(behavior.response_code)
+            return
+        body = responder(
+            SimulatedRequest(
+                node=node.name,
+                action=action,
+                params={
+                    name: self.get_body_argument(name)
+                    for name in self.request.body_arguments
+                },
+                body=self.request.body,
+            )
+        ).encode("utf-8")
+        if behavior.drip_chunk_size <= 0:
+            self.write(body)
+            return
+        for start in range(0, len(body), behavior.drip_chunk_size):
+            self.write(body[start : start + behavior.drip_chunk_size])
+            await self.flush()
+            await asyncio.sleep(behavior.drip_interval)
+
+
+class PcsdSimulator:
+    """
+    Run simulated pcsd nodes in a background thread
+
+    Use an instance as a context manager, the nodes are available within the
+    context.
+    """
+
+    def __init__(
+        self,
+        node_names: list[str],
+        behaviors: Mapping[str, NodeBehavior] | None = None,
+        responders: Mapping[str, Responder] | None = None,
+    ):
+        """
+        node_names -- names of simulated nodes
+        behaviors -- behavior of nodes, default behavior is used for nodes
+            not specified here
+        responders -- functions creating response bodies of pcsd actions,
+            they extend and override DEFAULT_RESPONDERS
+        """
+        behaviors = behaviors or {}
+        self.request_counter: Counter[tuple[str, str]] = Counter()
+        self._nodes = [
+            _SimulatedNode(
+                name,
+                behaviors.get(name, NodeBehavior()),
+                {**DEFAULT_RESPONDERS, **(responders or {})},
+                self.request_counter,
+            )
+            for name in node_names
+        ]
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def known_hosts(self) -> dict[str, PcsKnownHost]:
+        """
+        Known hosts pointing to the simulated nodes
+        """
+        return {
+            node.name: PcsKnownHost(
+                node.name,
+                token=f"token-{node.name}",
+                dest_list=[Destination(_ADDR, node.port)],
+            )
+            for node in self._nodes
+        }
+
+    def __enter__(self) -> "PcsdSimulator":
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        ssl_context = self._create_ssl_context()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="pcsd-simulator",
+            daemon=True,
+        )
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(
+            self._start_servers(ssl_context), self._loop
+        ).result()
+
+    def stop(self) -> None:
+        if self._loop is None or self._thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(
+            self._stop_servers(), self._loop
+        ).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+
+    @staticmethod
+    def _create_ssl_context() -> ssl.SSLContext:
+        # communicators do not verify certificates of nodes, so a self-signed
+        # certificate is sufficient
+        key = pcs_ssl.generate_key(length=2048)
+        cert = pcs_ssl.generate_cert(key, _ADDR)
+        with get_tmp_dir("pcsd_simulator") as tmp_dir:
+            cert_path = os.path.join(tmp_dir, "pcsd.crt")
+            key_path = os.path.join(tmp_dir, "pcsd.key")
+            with open(cert_path, "wb") as cert_file:
+                cert_file.write(pcs_ssl.dump_cert(cert))
+            with open(key_path, "wb") as key_file:
+                key_file.write(pcs_ssl.dump_key(key))
+            ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            ssl_context.load_cert_chain(cert_path, key_path)
+        return ssl_context
+
+    async def _start_servers(self, ssl_context: ssl.SSLContext) -> None:
+        for node in self._nodes:
+            sockets = bind_sockets(0, _ADDR)
+            node.port = sockets[0].getsockname()[1]
+            if node.behavior.offline:
+                # the port is released and nothing listens on it
+                for sock in sockets:
+                    sock.close()
+                continue
+            node.server = HTTPServer(
+                Application(
+                    [(r"/(.*)", _ActionHandler, dict(node=node))],
+                    # do not log requests
+                    log_function=lambda handler: None,
+                ),
+                ssl_options=ssl_context,
+            )
+            node.server.add_sockets(sockets)
+
+    async def _stop_servers(self) -> None:
+        for node in self._nodes:
+            if node.server is not None:
+                node.server.stop()
+                await node.server.close_all_connections()
+                node.server = None
@@ -8,10 +8,20 @@ import unittest
 from collections.abc import Callable
 from importlib import import_module
 from threading import Thread
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pcs_test.tools.parallel_test_runner import ParallelTestResult
 
 PACKAGE_DIR = os.path.realpath(
     os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 )
+DEFAULT_DURATIONS_FILE = os.path.join(
+    PACKAGE_DIR, "pcs_test", ".test_durations.json"
+)
+# Tests are split to more shards than there are workers. Workers which finish
+# their shards sooner than expected take the remaining ones.
+SHARDS_PER_WORKER = 4
 
 
 def prepare_test_name(test_name):
@@ -156,19 +166,23 @@ def parallel_run(
     verbosity: int,
     vanilla: bool,
     last_slash: bool,
-) -> bool:
+    durations: dict[str, float],
+) -> "ParallelTestResult":
+    from pcs_test.tools.duration_sharding import shard_tests
     from pcs_test.tools.parallel_test_runner import (
         ParallelTestManager,
         aggregate_test_results,
     )
 
     manager = ParallelTestManager(result_class, verbosity=verbosity)
+    worker_count = os.cpu_count() or 1
+    shards = shard_tests(tests, durations, worker_count * SHARDS_PER_WORKER)
 
-    with mp.Pool() as pool:
+    with mp.Pool(worker_count) as pool:
         start_time = time.perf_counter()
-        results = pool.map(
-            manager.run_test, tests, 10 if len(tests) > 99 else 1
-        )
+        # shards are ordered from the longest one, each is dispatched to the
+        # first free worker
+        results = list(pool.imap_unordered(manager.run_tests, shards, 1))
         end_time = time.perf_counter()
 
     test_result = aggregate_test_results(results)
@@ -178,7 +192,7 @@ def parallel_run(
         vanilla=vanilla,
         last_slash=last_slash,
     )
-    return test_result.was_successful
+    return test_result
 
 
 def non_parallel_run(tests: list[str], result_class, verbosity: int) -> bool:
@@ -192,6 +206,34 @@ def non_parallel_run(tests: list[str], result_class, verbosity: int) -> bool:
     return test_result.wasSuccessful()
 
 
+def _shard_arg(value: str) -> tuple[int, int]:
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(
+            f"'{value}' is not in the INDEX/COUNT format"
+        ) from e
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(
+            f"'{value}' is not a valid shard, INDEX must be from 1 to COUNT"
+        )
+    return index, count
+
+
+def _save_durations(
+    path: str, durations: dict[str, float], known_tests: list[str] | None
+) -> None:
+    from pcs_test.tools.duration_sharding import save_durations
+
+    try:
+        save_durations(path, durations, known_tests)
+    except OSError as e:
+        print(
+            f"Unable to save durations of tests to '{path}': {e.strerror}",
+            file=sys.stderr,
+        )
+
+
 def _parse_args() -> argparse.Namespace:
     arg_parser = argparse.ArgumentParser(
         prog="pcs_test/suite",
@@ -211,6 +253,12 @@ Examples:
         module.TestClass \\
         module.Class.test_method \\
         path/to/test_file.py                 - run all tests except the specified ones
+    pcs_test/suite --shard 2/3               - run the second of three parts of
+                                               all tests with balanced durations
+
+  Tests run in parallel are distributed to workers based on their durations
+  measured in previous runs. The durations are updated after each parallel
+  run.
 
 """,
         allow_abbrev=False,
@@ -296,6 +344,31 @@ Examples:
         dest="measure_time",
         help="Measure each test execution time",
     )
+    arg_parser.add_argument(
+        "--durations-file",
+        default=DEFAULT_DURATIONS_FILE,
+        metavar="PATH",
+        help=(
+            "File storing durations of tests used for balancing tests among "
+            "workers and shards, default: %(default)s"
+        ),
+    )
+    arg_parser.add_argument(
+        "--shard",
+        type=_shard_arg,
+        metavar="INDEX/COUNT",
+        help=(
+            "Run only one of COUNT parts of tests with balanced durations, "
+            "used to split tests among several machines"
+        ),
+    )
+    arg_parser.add_argument(
+        "--slowest",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Print N slowest tests of a parallel run",
+    )
     return arg_parser.parse_args()
 
 
@@ -332,6 +405,18 @@ def main() -> None:
     discovered_tests = discover_tests(
         explicitly_enumerated_tests, args.all_but, tier=args.tier
     )
+    from pcs_test.tools.duration_sharding import (
+        format_slowest,
+        load_durations,
+        select_shard,
+    )
+
+    durations = load_durations(args.durations_file)
+    all_tests = discovered_tests
+    if args.shard:
+        discovered_tests = select_shard(
+            discovered_tests, durations, *args.shard
+        )
     if args.list_tests:
         print("\n".join(sorted(discovered_tests)))
         print("{0} tests found".format(len(discovered_tests)))
@@ -364,12 +449,31 @@ def main() -> None:
         )
 
     if run_concurrently:
-        test_success = parallel_run(
+        parallel_result = parallel_run(
             discovered_tests,
             ResultClass,
             args.verbosity,
             args.vanilla,
             args.last_slash,
+            durations,
+        )
+        test_success = parallel_result.was_successful
+        if args.slowest > 0:
+            print(
+                "\n".join(
+                    format_slowest(parallel_result.durations, args.slowest)
+                ),
+                file=sys.stderr,
+            )
+        # durations of removed tests are only dropped when all tests run
+        _save_durations(
+            args.durations_file,
+            parallel_result.durations,
+            (
+                all_tests
+                if not explicitly_enumerated_tests and args.tier is None
+                else None
+            ),
         )
     else:
         test_success = non_parallel_run(
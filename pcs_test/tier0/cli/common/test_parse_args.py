@@ -681,6 +681,10 @@ class InputModifiersTest(TestCase):
         # pylint: disable=no-self-use
         InputModifiers({"--debug": ""}).ensure_only_supported()
 
+    def test_profile_implicit(self):
+        # pylint: disable=no-self-use
+        InputModifiers({"--profile": "file"}).ensure_only_supported()
+
     def test_bool_options(self):
         for opt in self.bool_opts:
             with self.subTest(opt=opt):
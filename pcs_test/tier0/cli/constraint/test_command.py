@@ -5,10 +5,15 @@ from unittest import (
 
 from pcs.cli.common.errors import CmdLineInputError
 from pcs.cli.constraint import command as constraint_command
+from pcs.common import reports
 
 from pcs_test.tools.constraints_dto import get_all_constraints
 from pcs_test.tools.custom_mock import RuleInEffectEvalMock
-from pcs_test.tools.misc import dict_to_modifiers
+from pcs_test.tools.misc import (
+    dict_to_modifiers,
+    get_tmp_file,
+    write_data_to_tmpfile,
+)
 
 
 class TestRemoveConstraint(TestCase):
@@ -75,3 +80,64 @@ class TestRemoveConstraint(TestCase):
         self._call_cmd(constraint_or_rule_ids)
         self.constraint.get_config.assert_called_once_with(evaluate_rules=False)
         self.cib.remove_elements.assert_called_once_with(constraint_or_rule_ids)
+
+
+class TestImportConstraints(TestCase):
+    constraints_xml = '<constraints><rsc_order id="O" first="A" then="B"/>'
+
+    def setUp(self):
+        self.lib = mock.Mock(spec_set=["constraint"])
+        self.constraint = mock.Mock(spec_set=["import_constraints"])
+        self.lib.constraint = self.constraint
+
+    def _call_cmd(self, argv, modifiers=None):
+        constraint_command.import_constraints(
+            self.lib, argv, dict_to_modifiers(modifiers or {})
+        )
+
+    def test_no_args(self):
+        with self.assertRaises(CmdLineInputError) as cm:
+            self._call_cmd([])
+        self.assertIsNone(cm.exception.message)
+        self.constraint.import_constraints.assert_not_called()
+
+    def test_too_many_args(self):
+        with self.assertRaises(CmdLineInputError) as cm:
+            self._call_cmd(["file1", "file2"])
+        self.assertIsNone(cm.exception.message)
+        self.constraint.import_constraints.assert_not_called()
+
+    def test_unsupported_modifier(self):
+        with self.assertRaises(CmdLineInputError) as cm:
+            self._call_cmd(["file"], {"wait": "10"})
+        self.assertEqual(
+            cm.exception.message,
+            "Specified option '--wait' is not supported in this command",
+        )
+        self.constraint.import_constraints.assert_not_called()
+
+    def test_file(self):
+        with get_tmp_file("import_constraints") as constraints_file:
+            write_data_to_tmpfile(self.constraints_xml, constraints_file)
+            self._call_cmd([constraints_file.name])
+        self.constraint.import_constraints.assert_called_once_with(
+            self.constraints_xml, force_flags=[]
+        )
+
+    def test_stdin_forced(self):
+        with mock.patch("sys.stdin") as mock_stdin:
+            mock_stdin.read.return_value = self.constraints_xml
+            self._call_cmd(["-"], {"force": True})
+        self.constraint.import_constraints.assert_called_once_with(
+            self.constraints_xml, force_flags=[reports.codes.FORCE]
+        )
+
+    def test_unreadable_file(self):
+        with self.assertRaises(CmdLineInputError) as cm:
+            self._call_cmd(["/nonexistent/constraints.xml"])
+        self.assertEqual(
+            cm.exception.message,
+            "Unable to read constraints: No such file or directory: "
+            "'/nonexistent/constraints.xml'",
+        )
+        self.constraint.import_constraints.assert_not_called()
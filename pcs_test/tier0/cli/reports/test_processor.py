@@ -0,0 +1,59 @@
+from unittest import TestCase, mock
+
+from pcs.cli.reports.processor import ReportProcessorToConsole
+from pcs.common import reports
+
+
+@mock.patch("pcs.cli.reports.processor.print_report")
+class ReportProcessorToConsoleTest(TestCase):
+    def test_debug_disabled(self, mock_print_report):
+        report_processor = ReportProcessorToConsole()
+        message = mock.Mock(spec=reports.ReportItemMessage)
+        report_processor.report(reports.ReportItem.debug(message))
+        mock_print_report.assert_not_called()
+        # the message has not been rendered
+        self.assertEqual(message.mock_calls, [])
+        self.assertEqual(
+            report_processor.min_severity_level,
+            reports.ReportItemSeverity.INFO,
+        )
+
+    def test_debug_enabled(self, mock_print_report):
+        report_processor = ReportProcessorToConsole(debug=True)
+        report_item = reports.ReportItem.debug(
+            reports.messages.NoActionNecessary()
+        )
+        report_processor.report(report_item)
+        mock_print_report.assert_called_once_with(report_item.to_dto())
+        self.assertEqual(
+            report_processor.min_severity_level,
+            reports.ReportItemSeverity.DEBUG,
+        )
+
+    def test_suppressed_severities(self, mock_print_report):
+        del mock_print_report
+        report_processor = ReportProcessorToConsole(debug=True)
+        report_processor.suppress_reports_of_severity(
+            [
+                reports.ReportItemSeverity.DEBUG,
+                reports.ReportItemSeverity.INFO,
+                reports.ReportItemSeverity.DEPRECATION,
+            ]
+        )
+        # debug flag overrides suppressed debug
+        self.assertEqual(
+            report_processor.min_severity_level,
+            reports.ReportItemSeverity.DEBUG,
+        )
+        report_processor = ReportProcessorToConsole()
+        report_processor.suppress_reports_of_severity(
+            [
+                reports.ReportItemSeverity.INFO,
+                reports.ReportItemSeverity.DEPRECATION,
+                reports.ReportItemSeverity.WARNING,
+            ]
+        )
+        self.assertEqual(
+            report_processor.min_severity_level,
+            reports.ReportItemSeverity.ERROR,
+        )
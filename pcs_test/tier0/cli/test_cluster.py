@@ -51,7 +51,13 @@ class ClusterSetup(TestCase):
     def assert_setup_called_with(self, node_list, **kwargs):
         default_kwargs = self._get_default_kwargs()
         default_kwargs.update(
-            dict(wait=False, start=False, enable=False, no_keys_sync=False)
+            dict(
+                wait=False,
+                start=False,
+                enable=False,
+                no_keys_sync=False,
+                pipeline=False,
+            )
         )
         default_kwargs.update(kwargs)
         self.cluster.setup.assert_called_once_with(
@@ -414,6 +420,11 @@ class ClusterSetup(TestCase):
         self.call_cmd([node_name], {"no-cluster-uuid": True})
         self.assert_setup_called_with([_node(node_name)], no_cluster_uuid=True)
 
+    def test_pipeline(self):
+        node_name = "node"
+        self.call_cmd([node_name], {"pipeline": True})
+        self.assert_setup_called_with([_node(node_name)], pipeline=True)
+
     def test_force(self):
         node_name = "node"
         self.call_cmd([node_name], {"force": True})
@@ -433,6 +444,7 @@ class ClusterSetup(TestCase):
                 "wait": "15",
                 "no-keys-sync": True,
                 "no-cluster-uuid": True,
+                "pipeline": True,
             },
         )
         self.assert_setup_called_with(
@@ -442,6 +454,7 @@ class ClusterSetup(TestCase):
             wait="15",
             no_keys_sync=True,
             no_cluster_uuid=True,
+            pipeline=True,
             force_flags=[report_codes.FORCE],
         )
 
@@ -470,8 +483,9 @@ class ClusterSetup(TestCase):
                 },
             )
         self.assertEqual(
-            "Cannot specify any of '--enable', '--no-keys-sync', '--start', "
-            "'--wait' when '--corosync_conf' is specified",
+            "Cannot specify any of '--enable', '--no-keys-sync', "
+            "'--pipeline', '--start', '--wait' when '--corosync_conf' is "
+            "specified",
             cm.exception.message,
         )
 
@@ -1723,3 +1737,100 @@ class ClusterAuthkeyCorosync(TestCase):
             cm.exception.message,
         )
         self.lib_call.assert_not_called()
+
+
+def _quorum_status(votes_needed):
+    return dedent(
+        f"""\
+        Quorum information
+        ------------------
+        Date:             Fri Jan 16 13:03:28 2015
+        Quorum provider:  corosync_votequorum
+        Nodes:            3
+        Node ID:          1
+        Ring ID:          19860
+        Quorate:          Yes
+
+        Votequorum information
+        ----------------------
+        Expected votes:   3
+        Highest expected: 3
+        Total votes:      3
+        Quorum:           {votes_needed}
+        Flags:            Quorate
+
+        Membership information
+        ----------------------
+            Nodeid      Votes    Qdevice Name
+                 1          1         NR node1 (local)
+                 2          1         NR node2
+                 3          1         NR node3
+        """
+    )
+
+
+@mock.patch("pcs.cluster.parallel_for_nodes", return_value={})
+@mock.patch("pcs.utils.get_remote_quorumtool_output")
+@mock.patch("pcs.utils.err", side_effect=SystemExit(1))
+@mock.patch("pcs.utils.read_known_hosts_file")
+@mock.patch(
+    "pcs.cluster.get_existing_nodes_names",
+    return_value=(["node1", "node2", "node3"], []),
+)
+@mock.patch("pcs.utils.get_corosync_conf_facade")
+class StopClusterNodes(TestCase):
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def test_all_nodes_safe(
+        self,
+        mock_facade,
+        mock_nodes,
+        mock_known_hosts,
+        mock_err,
+        mock_quorumtool,
+        mock_parallel,
+    ):
+        del mock_facade, mock_nodes, mock_known_hosts
+        mock_quorumtool.return_value = (0, _quorum_status(1))
+        cluster.stop_cluster_nodes(["node2", "node3"])
+        mock_err.assert_not_called()
+        mock_quorumtool.assert_called_once_with("node2")
+        self.assertEqual(mock_parallel.call_count, 2)
+
+    def test_some_nodes_safe(
+        self,
+        mock_facade,
+        mock_nodes,
+        mock_known_hosts,
+        mock_err,
+        mock_quorumtool,
+        mock_parallel,
+    ):
+        del mock_facade, mock_nodes, mock_known_hosts
+        mock_quorumtool.return_value = (0, _quorum_status(2))
+        with self.assertRaises(SystemExit):
+            cluster.stop_cluster_nodes(["node3", "node2"])
+        mock_err.assert_called_once_with(
+            "Stopping the node(s) will cause a loss of the quorum, use "
+            "--force to override\n"
+            "Node(s) 'node3' can be stopped without a loss of the quorum"
+        )
+        mock_parallel.assert_not_called()
+
+    def test_no_node_safe(
+        self,
+        mock_facade,
+        mock_nodes,
+        mock_known_hosts,
+        mock_err,
+        mock_quorumtool,
+        mock_parallel,
+    ):
+        del mock_facade, mock_nodes, mock_known_hosts
+        mock_quorumtool.return_value = (0, _quorum_status(3))
+        with self.assertRaises(SystemExit):
+            cluster.stop_cluster_nodes(["node3", "node2"])
+        mock_err.assert_called_once_with(
+            "Stopping the node(s) will cause a loss of the quorum, use "
+            "--force to override"
+        )
+        mock_parallel.assert_not_called()
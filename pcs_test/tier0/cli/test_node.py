@@ -0,0 +1,141 @@
+from unittest import (
+    TestCase,
+    mock,
+)
+
+from pcs import node
+from pcs.cli.common.errors import CmdLineInputError
+from pcs.common.pacemaker.node import CibNodeDto, CibNodeListDto
+from pcs.common.pacemaker.nvset import CibNvpairDto, CibNvsetDto
+
+from pcs_test.tools.misc import dict_to_modifiers
+
+FIXTURE_NODE_CONFIG = CibNodeListDto(
+    nodes=[
+        CibNodeDto(
+            id="1",
+            uname="node1",
+            description=None,
+            score=None,
+            type=None,
+            instance_attributes=[
+                CibNvsetDto(
+                    id="nodes-1",
+                    options={},
+                    rule=None,
+                    nvpairs=[CibNvpairDto(id="nodes-1-a", name="a", value="A")],
+                )
+            ],
+            utilization=[],
+        ),
+        CibNodeDto(
+            id="2",
+            uname="node2",
+            description=None,
+            score=None,
+            type=None,
+            instance_attributes=[],
+            utilization=[],
+        ),
+    ]
+)
+
+
+class NodeAttributeSet(TestCase):
+    def setUp(self):
+        self.lib = mock.Mock(spec_set=["node"])
+        self.lib.node = mock.Mock(
+            spec_set=["get_config_dto", "set_nodes_attributes"]
+        )
+        self.lib.node.get_config_dto.return_value = FIXTURE_NODE_CONFIG
+
+    def _call_cmd(self, argv, modifiers=None):
+        node.node_attribute_cmd(
+            self.lib, argv, dict_to_modifiers(modifiers or {})
+        )
+
+    def test_one_node(self):
+        self._call_cmd(["node1", "a=1", "b=2"])
+        self.lib.node.get_config_dto.assert_not_called()
+        self.lib.node.set_nodes_attributes.assert_called_once_with(
+            {"node1": {"a": "1", "b": "2"}}
+        )
+
+    def test_more_nodes(self):
+        self._call_cmd(["node1", "node2", "node1", "a=1", "b=2"])
+        self.lib.node.set_nodes_attributes.assert_called_once_with(
+            {"node1": {"a": "1", "b": "2"}, "node2": {"a": "1", "b": "2"}}
+        )
+
+    def test_missing_value(self):
+        with self.assertRaises(CmdLineInputError) as cm:
+            self._call_cmd(["node1", "node2"])
+        self.assertEqual(
+            cm.exception.message, "missing value of 'node2' option"
+        )
+        self.lib.node.set_nodes_attributes.assert_not_called()
+
+    def test_node_after_pairs(self):
+        with self.assertRaises(CmdLineInputError) as cm:
+            self._call_cmd(["node1", "a=1", "node2"])
+        self.assertEqual(
+            cm.exception.message, "missing value of 'node2' option"
+        )
+        self.lib.node.set_nodes_attributes.assert_not_called()
+
+    def test_remove_existing(self):
+        self._call_cmd(["node1", "a=", "b=2"])
+        self.lib.node.get_config_dto.assert_called_once_with()
+        self.lib.node.set_nodes_attributes.assert_called_once_with(
+            {"node1": {"a": "", "b": "2"}}
+        )
+
+    @mock.patch("pcs.utils.err")
+    def test_remove_missing(self, mock_err):
+        with self.assertRaises(SystemExit) as cm:
+            self._call_cmd(["node1", "node2", "a="])
+        self.assertEqual(cm.exception.code, 2)
+        mock_err.assert_called_once_with(
+            "attribute: 'a' doesn't exist for node: 'node2'", False
+        )
+        self.lib.node.set_nodes_attributes.assert_not_called()
+
+    def test_remove_missing_forced(self):
+        self._call_cmd(["node1", "node2", "a="], {"force": True})
+        self.lib.node.get_config_dto.assert_not_called()
+        self.lib.node.set_nodes_attributes.assert_called_once_with(
+            {"node1": {"a": ""}, "node2": {"a": ""}}
+        )
+
+
+@mock.patch("pcs.utils.print_warning_if_utilization_attrs_has_no_effect")
+@mock.patch(
+    "pcs.node.PropertyConfigurationFacade.from_properties_dtos",
+    mock.Mock(),
+)
+class NodeUtilizationSet(TestCase):
+    def setUp(self):
+        self.lib = mock.Mock(spec_set=["node", "cluster_property"])
+        self.lib.node = mock.Mock(spec_set=["set_nodes_utilization"])
+
+    def _call_cmd(self, argv, modifiers=None):
+        node.node_utilization_cmd(
+            self.lib, argv, dict_to_modifiers(modifiers or {})
+        )
+
+    def test_more_nodes(self, mock_warning):
+        self._call_cmd(["node1", "node2", "cpu=4", "ram="])
+        mock_warning.assert_called_once()
+        self.lib.node.set_nodes_utilization.assert_called_once_with(
+            {
+                "node1": {"cpu": "4", "ram": ""},
+                "node2": {"cpu": "4", "ram": ""},
+            }
+        )
+
+    def test_missing_value(self, mock_warning):
+        del mock_warning
+        with self.assertRaises(CmdLineInputError) as cm:
+            self._call_cmd(["node1", "cpu"])
+        self.assertEqual(cm.exception.message, "missing value of 'cpu' option")
+        self.lib.node.set_nodes_utilization.assert_not_called()
@@ -1281,3 +1281,24 @@ class ResourceRestart(TestCase):
         )
         self.resource.restart.assert_called_once_with("resource", "node", "10s")
         mock_print.assert_called_once_with("resource successfully restarted")
+
+
+class ResourceAgentCacheRefresh(TestCase):
+    def setUp(self):
+        self.lib = mock.Mock(spec_set=["resource_agent"])
+        self.resource_agent = mock.Mock(spec_set=["refresh_metadata_cache"])
+        self.lib.resource_agent = self.resource_agent
+
+    def test_success(self):
+        resource.resource_agent_cache_refresh(
+            self.lib, [], dict_to_modifiers({})
+        )
+        self.resource_agent.refresh_metadata_cache.assert_called_once_with()
+
+    def test_args(self):
+        with self.assertRaises(CmdLineInputError) as cm:
+            resource.resource_agent_cache_refresh(
+                self.lib, ["arg"], dict_to_modifiers({})
+            )
+        self.assertIsNone(cm.exception.message)
+        self.resource_agent.refresh_metadata_cache.assert_not_called()
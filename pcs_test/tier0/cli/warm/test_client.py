@@ -0,0 +1,58 @@
+from unittest import TestCase, mock
+
+from pcs.cli.warm import client, common
+
+
+@mock.patch.dict("os.environ", {}, clear=True)
+class GetSocketPath(TestCase):
+    def test_no_runtime_dir(self):
+        self.assertIsNone(common.get_socket_path())
+
+    def test_runtime_dir(self):
+        with mock.patch.dict("os.environ", {"XDG_RUNTIME_DIR": "/run/user/5"}):
+            self.assertEqual(
+                common.get_socket_path(), "/run/user/5/pcs_warm.sock"
+            )
+
+    def test_env_override(self):
+        with mock.patch.dict(
+            "os.environ",
+            {"XDG_RUNTIME_DIR": "/run/user/5", "PCS_WARM_SOCKET": "/tmp/s"},
+        ):
+            self.assertEqual(common.get_socket_path(), "/tmp/s")
+
+
+@mock.patch("pcs.cli.warm.client.get_socket_path", lambda: "/run/pcs.sock")
+@mock.patch("pcs.app.main")
+@mock.patch("pcs.cli.warm.client.run_in_server")
+class Main(TestCase):
+    def test_run_in_server(self, mock_run, mock_app_main):
+        mock_run.return_value = 2
+        with self.assertRaises(SystemExit) as cm:
+            client.main(["resource", "config"])
+        self.assertEqual(cm.exception.code, 2)
+        mock_run.assert_called_once_with(
+            "/run/pcs.sock", ["resource", "config"]
+        )
+        mock_app_main.assert_not_called()
+
+    def test_fallback(self, mock_run, mock_app_main):
+        mock_run.return_value = None
+        client.main(["resource", "config"])
+        mock_run.assert_called_once_with(
+            "/run/pcs.sock", ["resource", "config"]
+        )
+        mock_app_main.assert_called_once_with(["resource", "config"])
+
+    def test_no_socket(self, mock_run, mock_app_main):
+        with mock.patch("pcs.cli.warm.client.get_socket_path", lambda: None):
+            client.main(["status"])
+        mock_run.assert_not_called()
+        mock_app_main.assert_called_once_with(["status"])
+
+    @mock.patch("pcs.cli.warm.server.main")
+    def test_serve(self, mock_server_main, mock_run, mock_app_main):
+        client.main(["--serve", "--workers", "2"])
+        mock_server_main.assert_called_once_with(["--workers", "2"])
+        mock_run.assert_not_called()
+        mock_app_main.assert_not_called()
@@ -0,0 +1,136 @@
+import errno
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from unittest import TestCase, mock
+
+from pcs import settings
+from pcs.cli.warm import server
+from pcs.cli.warm.client import run_in_server
+
+SERVER_START_TIMEOUT = 30
+
+
+class ServerTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # socket paths are limited to about 100 characters, so the socket is
+        # not placed in the pcs_test directory
+        # pylint: disable=consider-using-with
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.socket_path = os.path.join(cls.tmp_dir.name, "pcs_warm.sock")
+        cls.server_process = subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                "import sys; from pcs.cli.warm import server; "
+                "server.main(sys.argv[1:])",
+                "--socket",
+                cls.socket_path,
+                "--workers",
+                "2",
+            ],
+            env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+        )
+        deadline = time.monotonic() + SERVER_START_TIMEOUT
+        while time.monotonic() < deadline:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                try:
+                    sock.connect(cls.socket_path)
+                    break
+                except OSError:
+                    time.sleep(0.05)
+        else:
+            cls.tearDownClass()
+            raise AssertionError("pcs_warm server has not started")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server_process.send_signal(signal.SIGTERM)
+        cls.server_process.wait(timeout=SERVER_START_TIMEOUT)
+        cls.tmp_dir.cleanup()
+
+    def run_pcs(self, argv):
+        with (
+            open(os.devnull, "rb") as stdin,
+            tempfile.TemporaryFile() as stdout,
+            tempfile.TemporaryFile() as stderr,
+        ):
+            exit_code = run_in_server(
+                self.socket_path,
+                argv,
+                (stdin.fileno(), stdout.fileno(), stderr.fileno()),
+            )
+            stdout.seek(0)
+            stderr.seek(0)
+            return (
+                exit_code,
+                stdout.read().decode("utf-8"),
+                stderr.read().decode("utf-8"),
+            )
+
+    def test_success(self):
+        self.assertEqual(
+            self.run_pcs(["--version"]), (0, f"{settings.pcs_version}\n", "")
+        )
+
+    def test_error(self):
+        exit_code, stdout, stderr = self.run_pcs(["no-such-command"])
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(stdout, "")
+        self.assertIn("Usage: pcs", stderr)
+
+    def test_more_commands_than_workers(self):
+        for _ in range(5):
+            self.assertEqual(self.run_pcs(["--version"])[0], 0)
+
+    def test_client_environment(self):
+        with mock.patch.dict(
+            "os.environ",
+            {
+                "COMP_WORDS": "pcs reso",
+                "COMP_LENGTHS": "3 4",
+                "COMP_CWORD": "1",
+                "PCS_AUTO_COMPLETE": "1",
+            },
+        ):
+            self.assertEqual(self.run_pcs([]), (0, "resource\n", ""))
+
+    def test_client_working_directory(self):
+        with mock.patch("os.getcwd", return_value=self.tmp_dir.name):
+            exit_code, dummy_stdout, dummy_stderr = self.run_pcs(
+                ["--profile=profile.json", "help"]
+            )
+        self.assertEqual(exit_code, 0)
+        self.assertTrue(
+            os.path.exists(os.path.join(self.tmp_dir.name, "profile.json"))
+        )
+
+    def test_another_server_refused(self):
+        with self.assertRaises(OSError) as cm:
+            # pylint: disable=protected-access
+            server.Server(self.socket_path, 1)._bind()
+        self.assertEqual(cm.exception.errno, errno.EADDRINUSE)
+
+
+class ServerNotRunning(TestCase):
+    def test_no_socket(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self.assertIsNone(
+                run_in_server(os.path.join(tmp_dir, "pcs_warm.sock"), [])
+            )
+
+    def test_stale_socket(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            socket_path = os.path.join(tmp_dir, "pcs_warm.sock")
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.bind(socket_path)
+            self.assertIsNone(run_in_server(socket_path, []))
+            # pylint: disable=protected-access
+            with server.Server(socket_path, 1)._bind() as listen_sock:
+                self.assertEqual(listen_sock.getsockname(), socket_path)
+                self.assertEqual(os.stat(socket_path).st_mode & 0o777, 0o600)
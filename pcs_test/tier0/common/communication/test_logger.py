@@ -15,6 +15,7 @@ from pcs.common.node_communicator import (
     RequestTarget,
     Response,
 )
+from pcs.common.reports import ReportProcessor
 from pcs.common.reports import codes as report_codes
 from pcs.common.reports.processor import ReportProcessorToLog
 
@@ -141,6 +142,12 @@ class CommunicatorLoggerTest(TestCase):
         self.com_logger = logger.CommunicatorLogger(
             [self.reporter, self.log_reporter]
         )
+        self.logger.isEnabledFor.return_value = True
+
+    def logged_calls(self):
+        return [
+            call for call in self.logger.mock_calls if call[0] != "isEnabledFor"
+        ]
 
     def test_log_request_start(self):
         request = fixture_request()
@@ -150,7 +157,7 @@ class CommunicatorLoggerTest(TestCase):
         )
         self.assertEqual(
             [fixture_logger_call_send(request.url, request.data)],
-            self.logger.mock_calls,
+            self.logged_calls(),
         )
 
     def test_log_response_connected(self):
@@ -180,7 +187,7 @@ class CommunicatorLoggerTest(TestCase):
             expected_data,
             expected_debug_data,
         )
-        self.assertEqual(logger_calls, self.logger.mock_calls)
+        self.assertEqual(logger_calls, self.logged_calls())
 
     @mock.patch("pcs.common.communication.logger.is_proxy_set")
     def test_log_response_not_connected(self, mock_proxy):
@@ -212,7 +219,7 @@ class CommunicatorLoggerTest(TestCase):
                 response.request.url, expected_debug_data
             ),
         ]
-        self.assertEqual(logger_calls, self.logger.mock_calls)
+        self.assertEqual(logger_calls, self.logged_calls())
 
     @mock.patch("pcs.common.communication.logger.is_proxy_set")
     def test_log_response_not_connected_with_proxy(self, mock_proxy):
@@ -248,7 +255,7 @@ class CommunicatorLoggerTest(TestCase):
                 response.request.url, expected_debug_data
             ),
         ]
-        self.assertEqual(logger_calls, self.logger.mock_calls)
+        self.assertEqual(logger_calls, self.logged_calls())
 
     def test_log_retry(self):
         prev_addr = "addr"
@@ -287,7 +294,7 @@ class CommunicatorLoggerTest(TestCase):
                 req=response.request.url,
             )
         )
-        self.assertEqual([logger_call], self.logger.mock_calls)
+        self.assertEqual([logger_call], self.logged_calls())
 
     def test_log_no_more_addresses(self):
         response = Response.connection_failure(
@@ -310,4 +317,30 @@ class CommunicatorLoggerTest(TestCase):
                 label=response.request.host_label
             )
         )
-        self.assertEqual([logger_call], self.logger.mock_calls)
+        self.assertEqual([logger_call], self.logged_calls())
+
+    def test_debug_disabled_in_logger(self):
+        self.logger.isEnabledFor.return_value = False
+        request = fixture_request()
+        self.com_logger.log_request_start(request)
+        self.reporter.assert_reports(
+            fixture_report_item_list_send(request.url, request.data)
+        )
+        self.assertEqual([], self.logged_calls())
+
+    def test_debug_not_reported(self):
+        self.logger.isEnabledFor.return_value = False
+        reporter = mock.Mock(spec=ReportProcessor)
+        reporter.is_severity_reported.return_value = False
+        com_logger = logger.CommunicatorLogger([reporter, self.log_reporter])
+        response = mock.Mock(spec=Response)
+        type(response).data = mock.PropertyMock()
+        type(response).debug = mock.PropertyMock()
+        response.was_connected = True
+
+        com_logger.log_response(response)
+
+        reporter.report.assert_not_called()
+        type(response).data.assert_not_called()
+        type(response).debug.assert_not_called()
+        self.assertEqual([], self.logged_calls())
@@ -82,6 +82,39 @@ class DuplicateConstraintsExist(NameBuildTest):
         )
 
 
+class ConstraintImportDuplicate(NameBuildTest):
+    def test_build_singular(self):
+        self.assert_message_from_report(
+            "Constraint 'c1' is a duplicate of constraint 'c2'",
+            reports.ConstraintImportDuplicate("c1", ["c2"]),
+        )
+
+    def test_build_plural(self):
+        self.assert_message_from_report(
+            "Constraint 'c1' is a duplicate of constraints 'c0', 'c3'",
+            reports.ConstraintImportDuplicate("c1", ["c3", "c0"]),
+        )
+
+
+class ConstraintImportUnexpectedElement(NameBuildTest):
+    def test_build(self):
+        self.assert_message_from_report(
+            "Unable to import element 'primitive', expected 'rsc_location', "
+            "'rsc_order'",
+            reports.ConstraintImportUnexpectedElement(
+                "primitive", ["rsc_order", "rsc_location"]
+            ),
+        )
+
+
+class ConstraintImportXmlSyntaxError(NameBuildTest):
+    def test_build(self):
+        self.assert_message_from_report(
+            "Unable to parse constraints to import: error line 1",
+            reports.ConstraintImportXmlSyntaxError("error line 1"),
+        )
+
+
 class EmptyResourceSet(NameBuildTest):
     def test_success(self):
         self.assert_message_from_report(
@@ -1042,6 +1075,13 @@ class ParseErrorCorosyncConfMissingClosingBrace(NameBuildTest):
             reports.ParseErrorCorosyncConfMissingClosingBrace(),
         )
 
+    def test_position(self):
+        self.assert_message_from_report(
+            "Unable to parse corosync config: missing closing brace of a "
+            "section opened on line 3 column 9",
+            reports.ParseErrorCorosyncConfMissingClosingBrace(3, 9),
+        )
+
 
 class ParseErrorCorosyncConfUnexpectedClosingBrace(NameBuildTest):
     def test_all(self):
@@ -1050,6 +1090,13 @@ class ParseErrorCorosyncConfUnexpectedClosingBrace(NameBuildTest):
             reports.ParseErrorCorosyncConfUnexpectedClosingBrace(),
         )
 
+    def test_position(self):
+        self.assert_message_from_report(
+            "Unable to parse corosync config: unexpected closing brace on "
+            "line 3 column 1",
+            reports.ParseErrorCorosyncConfUnexpectedClosingBrace(3, 1),
+        )
+
 
 class ParseErrorCorosyncConfMissingSectionNameBeforeOpeningBrace(NameBuildTest):
     def test_all(self):
@@ -1058,6 +1105,15 @@ class ParseErrorCorosyncConfMissingSectionNameBeforeOpeningBrace(NameBuildTest):
             reports.ParseErrorCorosyncConfMissingSectionNameBeforeOpeningBrace(),
         )
 
+    def test_position(self):
+        self.assert_message_from_report(
+            "Unable to parse corosync config: missing a section name before { "
+            "on line 3 column 5",
+            reports.ParseErrorCorosyncConfMissingSectionNameBeforeOpeningBrace(
+                3, 5
+            ),
+        )
+
 
 class ParseErrorCorosyncConfExtraCharactersAfterOpeningBrace(NameBuildTest):
     def test_all(self):
@@ -1066,6 +1122,15 @@ class ParseErrorCorosyncConfExtraCharactersAfterOpeningBrace(NameBuildTest):
             reports.ParseErrorCorosyncConfExtraCharactersAfterOpeningBrace(),
         )
 
+    def test_position(self):
+        self.assert_message_from_report(
+            "Unable to parse corosync config: extra characters after { on "
+            "line 3 column 15",
+            reports.ParseErrorCorosyncConfExtraCharactersAfterOpeningBrace(
+                3, 15
+            ),
+        )
+
 
 class ParseErrorCorosyncConfExtraCharactersBeforeOrAfterClosingBrace(
     NameBuildTest
@@ -1079,6 +1144,17 @@ class ParseErrorCorosyncConfExtraCharactersBeforeOrAfterClosingBrace(
             reports.ParseErrorCorosyncConfExtraCharactersBeforeOrAfterClosingBrace(),
         )
 
+    def test_position(self):
+        self.assert_message_from_report(
+            (
+                "Unable to parse corosync config: extra characters before "
+                "or after } on line 3 column 6"
+            ),
+            reports.ParseErrorCorosyncConfExtraCharactersBeforeOrAfterClosingBrace(
+                3, 6
+            ),
+        )
+
 
 class ParseErrorCorosyncConfLineIsNotSectionNorKeyValue(NameBuildTest):
     def test_all(self):
@@ -1088,6 +1164,13 @@ class ParseErrorCorosyncConfLineIsNotSectionNorKeyValue(NameBuildTest):
             reports.ParseErrorCorosyncConfLineIsNotSectionNorKeyValue(),
         )
 
+    def test_position(self):
+        self.assert_message_from_report(
+            "Unable to parse corosync config: a line is not opening or closing "
+            "a section or key: value on line 3 column 5",
+            reports.ParseErrorCorosyncConfLineIsNotSectionNorKeyValue(3, 5),
+        )
+
 
 class ParseErrorCorosyncConf(NameBuildTest):
     def test_all(self):
@@ -3626,6 +3709,18 @@ class CibUpgradeFailedToMinimalRequiredVersion(NameBuildTest):
         )
 
 
+class CibUpgradeInBatchNotPossible(NameBuildTest):
+    def test_all(self):
+        self.assert_message_from_report(
+            (
+                "Unable to upgrade CIB to required schema version 3.1 or "
+                "higher while running a batch of commands, run the command "
+                "separately"
+            ),
+            reports.CibUpgradeInBatchNotPossible("3.1"),
+        )
+
+
 class FileAlreadyExists(NameBuildTest):
     def test_minimal(self):
         self.assert_message_from_report(
@@ -4413,6 +4508,19 @@ class ClusterSetupSuccess(NameBuildTest):
         )
 
 
+class NodePhaseDurations(NameBuildTest):
+    def test_success(self):
+        self.assert_message_from_report(
+            (
+                "Phase durations on node 'node1': destroy 0.50s, "
+                "known hosts 1.25s, total 1.75s"
+            ),
+            reports.NodePhaseDurations(
+                "node1", {"destroy": 0.5, "known hosts": 1.25}
+            ),
+        )
+
+
 class UsingDefaultAddressForHost(NameBuildTest):
     def test_success(self):
         self.assert_message_from_report(
@@ -5433,6 +5541,25 @@ class BoothConfigAcceptedByNode(NameBuildTest):
         )
 
 
+class BoothConfigUpToDateOnNodes(NameBuildTest):
+    def test_one_node(self):
+        self.assert_message_from_report(
+            "Booth config is already up to date on node 'node1', skipping",
+            reports.BoothConfigUpToDateOnNodes(["node1"]),
+        )
+
+    def test_more_nodes_another_name(self):
+        self.assert_message_from_report(
+            (
+                "Booth config 'another' is already up to date on nodes "
+                "'node1', 'node2', skipping"
+            ),
+            reports.BoothConfigUpToDateOnNodes(
+                ["node2", "node1"], name="another"
+            ),
+        )
+
+
 class BoothConfigDistributionNodeError(NameBuildTest):
     def test_empty_name(self):
         self.assert_message_from_report(
@@ -6054,6 +6181,14 @@ class CommandInvalidPayload(NameBuildTest):
         )
 
 
+class CommandNotAllowedInBatch(NameBuildTest):
+    def test_all(self):
+        self.assert_message_from_report(
+            "Command 'a cmd' cannot be run in a batch of commands",
+            reports.CommandNotAllowedInBatch("a cmd"),
+        )
+
+
 class CommandUnknown(NameBuildTest):
     def test_all(self):
         cmd = "a cmd"
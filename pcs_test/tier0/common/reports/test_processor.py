@@ -68,3 +68,69 @@ class ReportProcessorToLog(TestCase):
         self.mock_logger.error.assert_called_once_with(
             f"node: {self._EXPECTED_MESSAGE}"
         )
+
+    def test_debug_disabled(self):
+        self.mock_logger.isEnabledFor.return_value = False
+        message = mock.Mock(spec=reports.ReportItemMessage)
+        self.report_processor.report(reports.ReportItem.debug(message))
+        self.mock_logger.isEnabledFor.assert_called_once_with(logging.DEBUG)
+        self.mock_logger.debug.assert_not_called()
+        # the message has not been rendered
+        self.assertEqual(message.mock_calls, [])
+
+    def test_min_severity_level(self):
+        for log_level, severity in (
+            (logging.DEBUG, reports.ReportItemSeverity.DEBUG),
+            (logging.INFO, reports.ReportItemSeverity.INFO),
+            (logging.WARNING, reports.ReportItemSeverity.DEPRECATION),
+            (logging.ERROR, reports.ReportItemSeverity.ERROR),
+            (logging.CRITICAL, reports.ReportItemSeverity.ERROR),
+        ):
+            with self.subTest(log_level=log_level):
+                logger = logging.getLogger("pcs_test.report_processor")
+                logger.setLevel(log_level)
+                report_processor = reports.processor.ReportProcessorToLog(
+                    logger
+                )
+                self.assertEqual(report_processor.min_severity_level, severity)
+
+
+class ReportProcessorSeverity(TestCase):
+    def test_default(self):
+        report_processor = reports.processor.ReportProcessorInMemory()
+        self.assertEqual(
+            report_processor.min_severity_level,
+            reports.ReportItemSeverity.DEBUG,
+        )
+        self.assertTrue(
+            report_processor.is_severity_reported(
+                reports.ReportItemSeverity.DEBUG
+            )
+        )
+
+    def test_is_severity_reported(self):
+        report_processor = reports.processor.ReportProcessorInMemory()
+        with mock.patch.object(
+            reports.processor.ReportProcessorInMemory,
+            "min_severity_level",
+            reports.ReportItemSeverity.WARNING,
+        ):
+            self.assertEqual(
+                {
+                    severity: report_processor.is_severity_reported(severity)
+                    for severity in (
+                        reports.ReportItemSeverity.DEBUG,
+                        reports.ReportItemSeverity.INFO,
+                        reports.ReportItemSeverity.DEPRECATION,
+                        reports.ReportItemSeverity.WARNING,
+                        reports.ReportItemSeverity.ERROR,
+                    )
+                },
+                {
+                    reports.ReportItemSeverity.DEBUG: False,
+                    reports.ReportItemSeverity.INFO: False,
+                    reports.ReportItemSeverity.DEPRECATION: True,
+                    reports.ReportItemSeverity.WARNING: True,
+                    reports.ReportItemSeverity.ERROR: True,
+                },
+            )
@@ -6,8 +6,9 @@ from unittest import (
 
 import pcs.common.node_communicator as lib
 from pcs import settings
-from pcs.common import host
+from pcs.common import host, profiling
 from pcs.common import pcs_pycurl as pycurl
+from pcs.common.cancellation import CancellationToken, OperationCancelled
 from pcs.common.host import Destination
 
 from pcs_test.tools.custom_mock import (
@@ -275,6 +276,7 @@ class CreateRequestHandleTest(TestCase):
         pycurl.SSL_VERIFYHOST: 0,
         pycurl.SSL_VERIFYPEER: 0,
         pycurl.NOSIGNAL: 1,
+        pycurl.ACCEPT_ENCODING: "",
     }
 
     def test_all_info(self, mock_curl):
@@ -347,6 +349,51 @@ class CreateRequestHandleTest(TestCase):
         self.assertEqual("", handle.output_buffer.getvalue().decode("utf-8"))
         self.assertEqual("", handle.debug_buffer.getvalue().decode("utf-8"))
 
+    def test_compressed_response_debug(self, mock_curl):
+        mock_curl.return_value = MockCurl(
+            None,
+            b"output",
+            [
+                (pycurl.DEBUG_HEADER_IN, b"HTTP/1.1 200 OK\r\n"),
+                (pycurl.DEBUG_HEADER_IN, b"Content-Encoding: gzip\r\n"),
+                (pycurl.DEBUG_DATA_IN, b"\x1f\x8b\x08\x00\xff"),
+            ],
+        )
+        request = lib.Request(
+            lib.RequestTarget("label"), lib.RequestData("action")
+        )
+        # pylint: disable=protected-access
+        handle = lib._create_request_handle(request, {}, 10)
+        handle.perform()
+        self.assertEqual(
+            (
+                "< HTTP/1.1 200 OK\r\n"
+                "< Content-Encoding: gzip\r\n"
+                "<< [5 bytes of compressed data]\n"
+            ),
+            handle.debug_buffer.getvalue().decode("utf-8"),
+        )
+
+    def test_not_compressed_response_debug(self, mock_curl):
+        mock_curl.return_value = MockCurl(
+            None,
+            b"output",
+            [
+                (pycurl.DEBUG_HEADER_IN, b"Content-Encoding: identity\r\n"),
+                (pycurl.DEBUG_DATA_IN, b"output"),
+            ],
+        )
+        request = lib.Request(
+            lib.RequestTarget("label"), lib.RequestData("action")
+        )
+        # pylint: disable=protected-access
+        handle = lib._create_request_handle(request, {}, 10)
+        handle.perform()
+        self.assertEqual(
+            "< Content-Encoding: identity\r\n<< output\n",
+            handle.debug_buffer.getvalue().decode("utf-8"),
+        )
+
 
 def fixture_request(host_id=1, action="action"):
     return lib.Request(
@@ -417,6 +464,31 @@ class CommunicatorSimpleTest(CommunicatorBaseTest):
         self.assertEqual(errno, response.errno)
         self.assertEqual(expected_reason, response.error_msg)
 
+    def test_profiling(self, mock_create_handle, _):
+        com = self.get_communicator()
+        handle = MockCurl(info={pycurl.RESPONSE_CODE: 200})
+        handle.output_buffer = io.BytesIO(b"output")
+        profiler = profiling.Profiler("test")
+        with profiler.activate():
+            response = self.get_response(com, mock_create_handle, handle)
+        self.assert_common_checks(com, response)
+        events = profiler.to_dict()["events"]
+        self.assertEqual(len(events), 1)
+        self.assertGreaterEqual(events[0].pop("duration"), 0)
+        self.assertGreaterEqual(events[0].pop("start"), 0)
+        self.assertEqual(
+            events[0],
+            {
+                "type": profiling.EVENT_REQUEST,
+                "target": "host0",
+                "action": "action",
+                "bytes_in": 6,
+                "bytes_out": 0,
+                "was_connected": True,
+                "response_code": 200,
+            },
+        )
+
 
 class CommunicatorMultiTest(CommunicatorBaseTest):
     @mock.patch("pcs.common.node_communicator._create_request_handle")
@@ -488,6 +560,93 @@ class CommunicatorMultiTest(CommunicatorBaseTest):
         com._multi_handle.assert_no_handle_left()
 
 
+@mock.patch("pcs.common.node_communicator._create_request_handle")
+class CommunicatorCancellationTest(CommunicatorBaseTest):
+    def setUp(self):
+        super().setUp()
+        self.token = CancellationToken()
+
+    def get_communicator(self):
+        return lib.Communicator(
+            self.mock_com_log, None, None, cancellation_token=self.token
+        )
+
+    @mock.patch(
+        "pcs.common.node_communicator.pycurl.CurlMulti",
+        side_effect=lambda: MockCurlMulti([1, 1]),
+    )
+    def test_not_cancelled(self, _, mock_create_handle):
+        com = self.get_communicator()
+        mock_create_handle.side_effect = lambda request, _, __: MockCurl(
+            request=request
+        )
+        request_list = [fixture_request(i) for i in range(2)]
+        com.add_requests(request_list)
+        self.assertEqual(
+            request_list, [response.request for response in com.start_loop()]
+        )
+        # pylint: disable=protected-access
+        com._multi_handle.assert_no_handle_left()
+
+    @mock.patch(
+        "pcs.common.node_communicator.pycurl.CurlMulti",
+        side_effect=lambda: MockCurlMulti([1]),
+    )
+    def test_cancelled_while_running(self, _, mock_create_handle):
+        com = self.get_communicator()
+        mock_create_handle.side_effect = lambda request, _, __: MockCurl(
+            request=request
+        )
+        request_list = [fixture_request(i) for i in range(3)]
+        com.add_requests(request_list)
+        response_list = []
+        with self.assertRaises(OperationCancelled):
+            for response in com.start_loop():
+                response_list.append(response)
+                self.token.cancel()
+        self.assertEqual(
+            [request_list[0]], [response.request for response in response_list]
+        )
+        # pylint: disable=protected-access
+        com._multi_handle.assert_no_handle_left()
+        self.assertEqual(
+            [mock.call.log_request_start(request) for request in request_list]
+            + [mock.call.log_response(response_list[0])],
+            self.mock_com_log.mock_calls,
+        )
+        # the communicator can be used again
+        self.assertEqual([], list(com.start_loop()))
+
+    @mock.patch(
+        "pcs.common.node_communicator.pycurl.CurlMulti",
+        side_effect=lambda: MockCurlMulti([]),
+    )
+    def test_cancelled_before_start(self, _, mock_create_handle):
+        com = self.get_communicator()
+        mock_create_handle.side_effect = lambda request, _, __: MockCurl(
+            request=request
+        )
+        com.add_requests([fixture_request(i) for i in range(2)])
+        self.token.cancel()
+        with self.assertRaises(OperationCancelled):
+            next(com.start_loop())
+        # pylint: disable=protected-access
+        com._multi_handle.assert_no_handle_left()
+
+    def test_factory_passes_token(self, _):
+        factory = lib.NodeCommunicatorFactory(
+            self.mock_com_log, None, None, None, self.token
+        )
+        for communicator in (
+            factory.get_communicator(),
+            factory.get_communicator_no_privilege_transition(),
+            factory.get_multiaddress_communicator(),
+        ):
+            with self.subTest(communicator=communicator):
+                # pylint: disable=protected-access
+                self.assertIs(communicator._cancellation_token, self.token)
+
+
 def fixture_logger_request_retry_calls(response, hostname):
     return [
         mock.call.log_request_start(response.request),
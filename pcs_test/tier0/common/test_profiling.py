@@ -0,0 +1,155 @@
+import io
+import json
+from unittest import TestCase
+
+from pcs.common import profiling
+
+
+def _strip_times(events):
+    for event in events:
+        del event["start"]
+        del event["duration"]
+    return events
+
+
+def _profiled_function():
+    return sum(range(100))
+
+
+class ProfilingNotActive(TestCase):
+    def test_functions_do_nothing(self):
+        self.assertFalse(profiling.is_active())
+        self.assertIsNone(profiling.get_active_profiler())
+        profiling.add_event(profiling.EVENT_WAIT, 0.0, 1.0)
+        with profiling.measure(profiling.EVENT_CIB_LOAD) as trace:
+            self.assertIsNone(trace)
+        with profiling.profile_library_command("command"):
+            pass
+
+
+class Profiler(TestCase):
+    def setUp(self):
+        self.profiler = profiling.Profiler("test")
+
+    def test_activate(self):
+        with self.profiler.activate():
+            self.assertTrue(profiling.is_active())
+            self.assertIs(profiling.get_active_profiler(), self.profiler)
+        self.assertFalse(profiling.is_active())
+
+    def test_events(self):
+        with (
+            self.profiler.activate(),
+            profiling.profile_library_command("command"),
+        ):
+            with profiling.measure(profiling.EVENT_CIB_LOAD) as trace:
+                trace["size"] = 10
+            profiling.add_event(
+                profiling.EVENT_REQUEST, 0.0, 0.5, target="node1"
+            )
+            with profiling.measure(profiling.EVENT_CIB_LOAD):
+                pass
+
+        profile = self.profiler.to_dict()
+        self.assertEqual(profile["name"], "test")
+        self.assertEqual(
+            profile["format_version"], profiling.PROFILE_FORMAT_VERSION
+        )
+        self.assertEqual(
+            {
+                event_type: summary["count"]
+                for event_type, summary in profile["summary"].items()
+            },
+            {
+                profiling.EVENT_LIBRARY_COMMAND: 1,
+                profiling.EVENT_CIB_LOAD: 2,
+                profiling.EVENT_REQUEST: 1,
+            },
+        )
+        self.assertEqual(
+            profile["summary"][profiling.EVENT_REQUEST]["duration"], 0.5
+        )
+        # events are sorted by their start
+        self.assertEqual(
+            _strip_times(profile["events"]),
+            [
+                {"type": profiling.EVENT_REQUEST, "target": "node1"},
+                {
+                    "type": profiling.EVENT_LIBRARY_COMMAND,
+                    "name": "command",
+                },
+                {"type": profiling.EVENT_CIB_LOAD, "size": 10},
+                {"type": profiling.EVENT_CIB_LOAD},
+            ],
+        )
+
+    def test_event_recorded_on_exception(self):
+        with (
+            self.profiler.activate(),
+            self.assertRaises(ValueError),
+            profiling.measure(profiling.EVENT_CIB_PUSH),
+        ):
+            raise ValueError()
+        self.assertEqual(
+            _strip_times(self.profiler.to_dict()["events"]),
+            [{"type": profiling.EVENT_CIB_PUSH}],
+        )
+
+    def test_functions_profiled(self):
+        with (
+            self.profiler.activate(),
+            profiling.profile_library_command("command"),
+        ):
+            _profiled_function()
+        functions = self.profiler.to_dict()["functions"]
+        self.assertTrue(
+            any(
+                item["function"].endswith("(_profiled_function)")
+                and item["calls"] == 1
+                for item in functions
+            )
+        )
+        self.assertEqual(
+            [item["cumulative_time"] for item in functions],
+            sorted(
+                (item["cumulative_time"] for item in functions), reverse=True
+            ),
+        )
+
+    def test_no_library_command(self):
+        self.assertEqual(self.profiler.to_dict()["functions"], [])
+
+    def test_write_json(self):
+        with (
+            self.profiler.activate(),
+            profiling.profile_library_command("command"),
+        ):
+            _profiled_function()
+        output = io.StringIO()
+        self.profiler.write_json(output)
+        self.assertEqual(
+            json.loads(output.getvalue())["summary"][
+                profiling.EVENT_LIBRARY_COMMAND
+            ]["count"],
+            1,
+        )
+
+    def test_write_summary(self):
+        with (
+            self.profiler.activate(),
+            profiling.profile_library_command("command"),
+        ):
+            _profiled_function()
+        output = io.StringIO()
+        self.profiler.write_summary(output)
+        summary = output.getvalue()
+        self.assertTrue(summary.startswith("Profile of 'test', total time"))
+        self.assertIn("library_command: 1x", summary)
+        self.assertIn("_profiled_function", summary)
+
+
+class TextSize(TestCase):
+    def test_size(self):
+        self.assertEqual(profiling.text_size(None), 0)
+        self.assertEqual(profiling.text_size(b"ab"), 2)
+        self.assertEqual(profiling.text_size("čš"), 4)
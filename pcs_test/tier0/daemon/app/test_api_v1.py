@@ -1,8 +1,31 @@
-from unittest import TestCase
+import json
+import logging
+from typing import Any
+from unittest import TestCase, mock
 
+from tornado.httpclient import AsyncHTTPClient, HTTPResponse
+from tornado.simple_httpclient import SimpleAsyncHTTPClient
+from tornado.web import Application
+
+from pcs.common.async_tasks.dto import (
+    CommandDto,
+    CommandOptionsDto,
+    TaskResultDto,
+)
+from pcs.common.async_tasks.types import TaskFinishType, TaskState
+from pcs.daemon.app import api_v1
 from pcs.daemon.app.api_v1 import API_V1_MAP
+from pcs.daemon.async_tasks.scheduler import Scheduler
 from pcs.daemon.async_tasks.worker.command_mapping import COMMAND_MAP
 
+from pcs_test.tier0.daemon.app.fixtures_app_api import (
+    ApiTestBase,
+    MockAuthProviderFactory,
+)
+
+# Don't write errors to test output.
+logging.getLogger("tornado.access").setLevel(logging.CRITICAL)
+
 
 class ApiV1MapTest(TestCase):
     def test_all_commands_exist(self):
@@ -12,3 +35,91 @@ class ApiV1MapTest(TestCase):
             len(missing_commands),
             f"Commands missing in COMMAND_MAP: {missing_commands}",
         )
+
+
+class ETagTest(ApiTestBase):
+    read_only_url = "/api/v1/status-full-cluster-status-plaintext/v1"
+    modifying_url = "/api/v1/resource-enable/v1"
+    legacy_url = "/remote/cluster_status_plaintext?data_json={}"
+
+    def setUp(self) -> None:
+        self.scheduler = mock.AsyncMock(Scheduler)
+        self.scheduler.new_task = mock.Mock(return_value="task-123")
+        self.auth_provider_factory = MockAuthProviderFactory()
+        super().setUp()
+
+    def get_app(self) -> Application:
+        return Application(
+            api_v1.get_routes(self.auth_provider_factory, self.scheduler)
+        )
+
+    def get_http_client(self) -> AsyncHTTPClient:
+        # Curl client, which may have been configured globally by other tests
+        # running in the same process, refuses GET requests with a body.
+        return SimpleAsyncHTTPClient(force_instance=True)
+
+    def fetch(self, path: str, **kwargs: Any) -> HTTPResponse:
+        if not path.startswith("/remote/"):
+            # ApiV1Handler reads parameters from request body even for GET
+            kwargs.setdefault("body", "{}")
+            kwargs["allow_nonstandard_methods"] = True
+        response = super().fetch(path, method="GET", **kwargs)
+        self.assert_headers(response.headers)
+        return response
+
+    def set_result(self, finish_type=TaskFinishType.SUCCESS, result="status"):
+        self.scheduler.wait_for_task.return_value = TaskResultDto(
+            task_ident="task-123",
+            command=CommandDto(
+                "status.full_cluster_status_plaintext",
+                {},
+                CommandOptionsDto(),
+            ),
+            reports=[],
+            state=TaskState.FINISHED,
+            task_finish_type=finish_type,
+            kill_reason=None,
+            result=result,
+        )
+
+    def assert_not_modified(self, url):
+        response = self.fetch(url)
+        self.assertEqual(response.code, 200)
+        etag = response.headers.get("Etag")
+        self.assertIsNotNone(etag)
+
+        response = self.fetch(url, headers={"If-None-Match": etag})
+        self.assertEqual(response.code, 304)
+        self.assertEqual(response.body, b"")
+
+    def test_read_only_command(self):
+        self.set_result()
+        self.assert_not_modified(self.read_only_url)
+
+    def test_read_only_command_legacy_handler(self):
+        self.set_result()
+        self.assert_not_modified(self.legacy_url)
+
+    def test_changed_result(self):
+        self.set_result(result="status 1")
+        etag = self.fetch(self.read_only_url).headers.get("Etag")
+        self.set_result(result="status 2")
+
+        response = self.fetch(
+            self.read_only_url, headers={"If-None-Match": etag}
+        )
+        self.assertEqual(response.code, 200)
+        self.assertEqual(json.loads(response.body)["data"], "status 2")
+        self.assertNotEqual(response.headers.get("Etag"), etag)
+
+    def test_failed_command(self):
+        self.set_result(finish_type=TaskFinishType.FAIL, result=None)
+        response = self.fetch(self.read_only_url)
+        self.assertEqual(response.code, 200)
+        self.assertNotIn("Etag", response.headers)
+
+    def test_modifying_command(self):
+        self.set_result(result=None)
+        response = self.fetch(self.modifying_url)
+        self.assertEqual(response.code, 200)
+        self.assertNotIn("Etag", response.headers)
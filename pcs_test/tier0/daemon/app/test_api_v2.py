@@ -1,14 +1,20 @@
+import asyncio
 import json
 import logging
+import socket
 from typing import Any
 from unittest import mock
 
 from tornado.httpclient import HTTPResponse
+from tornado.iostream import IOStream, StreamClosedError
 from tornado.web import Application
 
+from pcs.common import reports
 from pcs.common.async_tasks.dto import (
+    CommandBatchDto,
     CommandDto,
     CommandOptionsDto,
+    TaskProgressDto,
     TaskResultDto,
 )
 from pcs.common.async_tasks.types import (
@@ -16,9 +22,13 @@ from pcs.common.async_tasks.types import (
     TaskKillReason,
     TaskState,
 )
+from pcs.common.interface.dto import to_dict
+from pcs.common.pacemaker.cib_watch import CibChangeDto, CibVersionDto
 from pcs.daemon.app import api_v2
 from pcs.daemon.async_tasks.scheduler import Scheduler, TaskNotFoundError
-from pcs.daemon.async_tasks.types import Command
+from pcs.daemon.async_tasks.types import BATCH_COMMAND_NAME, Command
+from pcs.daemon.cib_watcher import CibWatcher
+from pcs.lib.permissions.types import PermissionRequiredType
 
 from pcs_test.tier0.daemon.app.fixtures_app_api import (
     ApiTestBase,
@@ -382,6 +392,128 @@ class RunTaskHandlerTest(ApiV2Test):
         )
 
 
+class BatchTaskHandlerMixin:
+    def tearDown(self):
+        self.auth_provider_factory.provider.auth_user.assert_called_once_with()
+
+    def make_batch_command(self):
+        dto_list = [
+            self.make_command_dto("command.one"),
+            self.make_command_dto("command.two", {"param2": "value2"}),
+        ]
+        return Command(
+            CommandDto(
+                BATCH_COMMAND_NAME,
+                to_dict(CommandBatchDto(dto_list)),
+                dto_list[0].options,
+            ),
+            is_batch=True,
+        )
+
+    def make_batch_body(self, commands=None):
+        return json.dumps(
+            {
+                "commands": (
+                    commands
+                    if commands is not None
+                    else [
+                        self.make_command_dict("command.one"),
+                        self.make_command_dict(
+                            "command.two", {"param2": "value2"}
+                        ),
+                    ]
+                )
+            }
+        )
+
+    def test_no_json_in_body(self):
+        response = self.fetch(self.url, body="", headers={})
+
+        self.assert_error_response(
+            response,
+            400,
+            "Request body is missing, has wrong format or wrong/missing headers.",
+        )
+        self.scheduler.new_task.assert_not_called()
+
+    def test_no_commands(self):
+        response = self.fetch(self.url, body=self.make_batch_body([]))
+
+        self.assert_error_response(
+            response, 400, "No commands specified in the batch."
+        )
+        self.scheduler.new_task.assert_not_called()
+
+    def test_different_options(self):
+        response = self.fetch(
+            self.url,
+            body=self.make_batch_body(
+                [
+                    self.make_command_dict("command.one"),
+                    self.make_command_dict(
+                        "command.two",
+                        options={"effective_username": "another_user"},
+                    ),
+                ]
+            ),
+        )
+
+        self.assert_error_response(
+            response,
+            400,
+            "All commands in the batch must have the same options.",
+        )
+        self.scheduler.new_task.assert_not_called()
+
+
+class NewBatchTaskHandlerTest(BatchTaskHandlerMixin, ApiV2Test):
+    url = "/api/v2/task/batch/create"
+
+    def test_success(self):
+        self.scheduler.new_task.return_value = "task-123"
+
+        response = self.fetch(self.url, body=self.make_batch_body())
+
+        data = self.assert_json_response(response, 200, ["task_ident"])
+        self.assertEqual(data["task_ident"], "task-123")
+        self.scheduler.new_task.assert_called_once_with(
+            self.make_batch_command(), self.auth_provider_factory.user
+        )
+
+
+class RunBatchTaskHandlerTest(BatchTaskHandlerMixin, ApiV2Test):
+    url = "/api/v2/task/batch/run"
+
+    def test_success(self):
+        self.scheduler.new_task.return_value = "task-123"
+        self.scheduler.wait_for_task.return_value = self.make_task_result_dto(
+            task_ident="task-123", result=["results"]
+        )
+
+        response = self.fetch(self.url, body=self.make_batch_body())
+
+        data = self.assert_success_response(response)
+        self.assertEqual(data["task_ident"], "task-123")
+        self.assertEqual(data["result"], ["results"])
+        self.scheduler.new_task.assert_called_once_with(
+            self.make_batch_command(), self.auth_provider_factory.user
+        )
+        self.scheduler.wait_for_task.assert_called_once_with(
+            "task-123", self.auth_provider_factory.user
+        )
+
+    def test_task_not_found_error(self):
+        self.scheduler.new_task.return_value = "task-123"
+        self.scheduler.wait_for_task.side_effect = TaskNotFoundError("task-123")
+
+        response = self.fetch(self.url, body=self.make_batch_body())
+
+        self.assert_error_response(response, 500)
+        self.scheduler.wait_for_task.assert_called_once_with(
+            "task-123", self.auth_provider_factory.user
+        )
+
+
 class TaskInfoHandlerTest(ApiV2Test):
     url = "/api/v2/task/result"
 
@@ -426,6 +558,160 @@ class TaskInfoHandlerTest(ApiV2Test):
         )
 
 
+class TaskProgressHandlerTest(ApiV2Test):
+    url = "/api/v2/task/progress"
+
+    def tearDown(self):
+        self.auth_provider_factory.provider.auth_user.assert_called_once_with()
+
+    @staticmethod
+    def make_progress_dto(
+        state: TaskState,
+        report_offset: int = 0,
+        report_count: int = 0,
+        result: Any = None,
+    ) -> TaskProgressDto:
+        return TaskProgressDto(
+            task_ident="task-123",
+            state=state,
+            task_finish_type=(
+                TaskFinishType.SUCCESS
+                if state == TaskState.FINISHED
+                else TaskFinishType.UNFINISHED
+            ),
+            kill_reason=None,
+            report_offset=report_offset,
+            reports=[
+                reports.ReportItem.info(
+                    reports.messages.CibUpgradeSuccessful()
+                ).to_dto()
+            ]
+            * report_count,
+            result=result,
+        )
+
+    def assert_progress_lines(
+        self, response: HTTPResponse, expected_lines: list[tuple[Any, ...]]
+    ) -> None:
+        self.assertEqual(response.code, 200)
+        self.assertEqual(
+            response.headers.get("Content-Type"), "application/x-ndjson"
+        )
+        self.assertTrue(response.body.endswith(b"\n"))
+        self.assertEqual(
+            [
+                (
+                    line["state"],
+                    line["report_offset"],
+                    len(line["reports"]),
+                    line["result"],
+                )
+                for line in map(json.loads, response.body.splitlines())
+            ],
+            expected_lines,
+        )
+
+    def test_stream(self):
+        self.scheduler.get_task_progress.return_value = self.make_progress_dto(
+            TaskState.QUEUED
+        )
+        self.scheduler.wait_for_task_progress.side_effect = [
+            self.make_progress_dto(TaskState.EXECUTED),
+            self.make_progress_dto(TaskState.EXECUTED, 0, 2),
+            self.make_progress_dto(TaskState.FINISHED, 2, 1, "result"),
+        ]
+
+        response = self.fetch(f"{self.url}?task_ident=task-123", headers={})
+
+        self.assert_progress_lines(
+            response,
+            [
+                ("QUEUED", 0, 0, None),
+                ("EXECUTED", 0, 0, None),
+                ("EXECUTED", 0, 2, None),
+                ("FINISHED", 2, 1, "result"),
+            ],
+        )
+        user = self.auth_provider_factory.user
+        self.scheduler.get_task_progress.assert_called_once_with(
+            "task-123", user, 0
+        )
+        self.assertEqual(
+            self.scheduler.wait_for_task_progress.call_args_list,
+            [
+                mock.call("task-123", user, 0, TaskState.QUEUED),
+                mock.call("task-123", user, 0, TaskState.EXECUTED),
+                mock.call("task-123", user, 2, TaskState.EXECUTED),
+            ],
+        )
+
+    def test_resume_finished(self):
+        self.scheduler.get_task_progress.return_value = self.make_progress_dto(
+            TaskState.FINISHED, 3, result="result"
+        )
+
+        response = self.fetch(
+            f"{self.url}?task_ident=task-123&report_offset=3", headers={}
+        )
+
+        self.assert_progress_lines(response, [("FINISHED", 3, 0, "result")])
+        self.scheduler.get_task_progress.assert_called_once_with(
+            "task-123", self.auth_provider_factory.user, 3
+        )
+        self.scheduler.wait_for_task_progress.assert_not_called()
+
+    def test_task_deleted_while_streaming(self):
+        self.scheduler.get_task_progress.return_value = self.make_progress_dto(
+            TaskState.EXECUTED
+        )
+        self.scheduler.wait_for_task_progress.side_effect = TaskNotFoundError(
+            "task-123"
+        )
+
+        response = self.fetch(f"{self.url}?task_ident=task-123", headers={})
+
+        self.assert_progress_lines(response, [("EXECUTED", 0, 0, None)])
+
+    def test_missing_query_argument(self):
+        response = self.fetch(self.url, headers={})
+
+        self.assert_error_response(
+            response, 400, 'URL argument "task_ident" is missing.'
+        )
+        self.scheduler.get_task_progress.assert_not_called()
+
+    def _assert_invalid_report_offset(self, offset):
+        response = self.fetch(
+            f"{self.url}?task_ident=task-123&report_offset={offset}",
+            headers={},
+        )
+        self.assert_error_response(
+            response,
+            400,
+            'URL argument "report_offset" must be a non-negative integer.',
+        )
+        self.scheduler.get_task_progress.assert_not_called()
+
+    def test_negative_report_offset(self):
+        self._assert_invalid_report_offset("-1")
+
+    def test_not_integer_report_offset(self):
+        self._assert_invalid_report_offset("abc")
+
+    def test_task_not_found(self):
+        self.scheduler.get_task_progress.side_effect = TaskNotFoundError(
+            "nonexistent-task"
+        )
+
+        response = self.fetch(
+            f"{self.url}?task_ident=nonexistent-task", headers={}
+        )
+
+        self.assert_error_response(
+            response, 404, "Task with this identifier does not exist."
+        )
+
+
 class KillTaskHandlerTest(ApiV2Test):
     url = "/api/v2/task/kill"
 
@@ -468,3 +754,134 @@ class KillTaskHandlerTest(ApiV2Test):
         self.scheduler.kill_task.assert_called_once_with(
             "nonexistent-task", self.auth_provider_factory.user
         )
+
+
+class CibChangesHandlerTest(ApiV2Test):
+    url = "/api/v2/cib/changes"
+
+    def setUp(self) -> None:
+        self.cib_watcher: mock.AsyncMock | None = mock.AsyncMock(CibWatcher)
+        permissions_patcher = mock.patch(
+            "pcs.daemon.app.api_v2.PermissionsChecker"
+        )
+        self.permissions_checker = permissions_patcher.start()
+        self.addCleanup(permissions_patcher.stop)
+        self.is_authorized = self.permissions_checker.return_value.is_authorized
+        self.is_authorized.return_value = True
+        super().setUp()
+
+    def get_app(self) -> Application:
+        return Application(
+            api_v2.get_routes(
+                self.auth_provider_factory, self.scheduler, self.cib_watcher
+            )
+        )
+
+    @staticmethod
+    def make_change_dto(generation: int) -> CibChangeDto:
+        return CibChangeDto(
+            generation=generation,
+            timestamp=1000.0 + generation,
+            version=CibVersionDto(0, 5, generation),
+        )
+
+    def test_stream(self):
+        changes = [self.make_change_dto(1), self.make_change_dto(2)]
+        self.cib_watcher.wait_for_change.side_effect = [
+            *changes,
+            # the client disconnects
+            StreamClosedError(),
+        ]
+
+        response = self.fetch(self.url, headers={})
+
+        self.assertEqual(response.code, 200)
+        self.assertEqual(
+            response.headers.get("Content-Type"), "application/x-ndjson"
+        )
+        self.assertEqual(
+            [json.loads(line) for line in response.body.splitlines()],
+            [to_dict(change) for change in changes],
+        )
+        self.assertEqual(
+            self.cib_watcher.wait_for_change.call_args_list,
+            [mock.call(-1), mock.call(1), mock.call(2)],
+        )
+        self.is_authorized.assert_called_once_with(
+            self.auth_provider_factory.user, PermissionRequiredType.READ
+        )
+
+    def test_resume(self):
+        self.cib_watcher.wait_for_change.side_effect = [
+            self.make_change_dto(8),
+            StreamClosedError(),
+        ]
+
+        response = self.fetch(f"{self.url}?generation=7", headers={})
+
+        self.assertEqual(response.code, 200)
+        self.assertEqual(
+            self.cib_watcher.wait_for_change.call_args_list,
+            [mock.call(7), mock.call(8)],
+        )
+
+    def test_client_disconnected_while_waiting(self):
+        waiting_cancelled = asyncio.Event()
+
+        async def wait_for_change(generation):
+            if generation < 1:
+                return self.make_change_dto(1)
+            try:
+                # no more CIB changes come
+                await asyncio.get_running_loop().create_future()
+            except asyncio.CancelledError:
+                waiting_cancelled.set()
+                raise
+            return None
+
+        self.cib_watcher.wait_for_change.side_effect = wait_for_change
+
+        async def disconnect_after_first_change():
+            stream = IOStream(socket.socket())
+            await stream.connect(("127.0.0.1", self.get_http_port()))
+            await stream.write(
+                f"GET {self.url} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode()
+            )
+            # response headers and the first change in a chunk
+            await stream.read_until(b"\r\n\r\n")
+            await stream.read_until(b"\n\r\n")
+            stream.close()
+            await asyncio.wait_for(waiting_cancelled.wait(), timeout=5)
+
+        self.io_loop.run_sync(disconnect_after_first_change)
+        self.assertEqual(
+            self.cib_watcher.wait_for_change.call_args_list,
+            [mock.call(-1), mock.call(1)],
+        )
+
+    def test_invalid_generation(self):
+        response = self.fetch(f"{self.url}?generation=abc", headers={})
+
+        self.assert_error_response(
+            response, 400, 'URL argument "generation" must be an integer.'
+        )
+        self.cib_watcher.wait_for_change.assert_not_called()
+
+    def test_not_authorized(self):
+        self.is_authorized.return_value = False
+
+        response = self.fetch(self.url, headers={})
+
+        self.assert_error_response(response, 403)
+        self.cib_watcher.wait_for_change.assert_not_called()
+
+    def test_disabled(self):
+        self.cib_watcher = None
+        self._app = self.get_app()
+        self.http_server.request_callback = self._app
+
+        response = self.fetch(self.url, headers={})
+
+        self.assert_error_response(
+            response, 404, "Tracking of CIB changes is disabled in pcsd."
+        )
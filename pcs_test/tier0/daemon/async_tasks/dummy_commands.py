@@ -1,5 +1,9 @@
+import signal
+
+from pcs.common.cancellation import OperationCancelled
 from pcs.common.reports import ReportItem
 from pcs.common.reports.messages import CibUpgradeSuccessful
+from pcs.daemon.async_tasks.worker import executor
 from pcs.daemon.async_tasks.worker.command_mapping import _Cmd
 from pcs.lib.errors import LibraryError
 from pcs.lib.permissions.config.types import PermissionGrantedType as p
@@ -30,8 +34,30 @@ def dummy_workload_lib_exception_contains_reports(_) -> None:
     raise LibraryError(ReportItem.error(CibUpgradeSuccessful()))
 
 
-def _get_cmd(callback):
-    return _Cmd(cmd=callback, required_permission=p.READ)
+def dummy_workload_with_wait(_, wait: bool = False) -> bool:
+    return wait
+
+
+def dummy_workload_killed(_) -> None:
+    # the task gets killed while waiting for an external process
+    # pylint: disable=protected-access
+    executor._sigterm_handler(signal.SIGTERM, None)
+    raise OperationCancelled()
+
+
+def dummy_workload_killed_not_cancellable(_) -> str:
+    # the task gets killed while not waiting for anything and finishes
+    # pylint: disable=protected-access
+    executor._sigterm_handler(signal.SIGTERM, None)
+    return RESULT
+
+
+def _get_cmd(callback, allowed_in_batch=False):
+    return _Cmd(
+        cmd=callback,
+        required_permission=p.READ,
+        allowed_in_batch=allowed_in_batch,
+    )
 
 
 test_command_map = {
@@ -41,6 +67,16 @@ test_command_map = {
     "lib_exc": _get_cmd(dummy_workload_lib_exception),
     "lib_exc_reports": _get_cmd(dummy_workload_lib_exception_contains_reports),
     "success_api_v1": _get_cmd(dummy_workload_with_result),
+    "batch_success": _get_cmd(dummy_workload_with_result, True),
+    "batch_success_with_reports": _get_cmd(
+        dummy_workload_no_result_with_reports, True
+    ),
+    "batch_lib_exc_reports": _get_cmd(
+        dummy_workload_lib_exception_contains_reports, True
+    ),
+    "batch_wait": _get_cmd(dummy_workload_with_wait, True),
+    "killed": _get_cmd(dummy_workload_killed),
+    "killed_not_cancellable": _get_cmd(dummy_workload_killed_not_cancellable),
 }
 
 test_legacy_api_commands = ("success_api_v1",)
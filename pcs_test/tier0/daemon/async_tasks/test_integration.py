@@ -305,7 +305,10 @@ class GarbageCollectionUserKillTests(
         await self.perform_actions(0)
         self.assert_task_state_counts_equal(0, 1, 0, 1)
 
-        self.mock_os_kill.assert_called_once()
+        self.assertEqual(
+            self.mock_os_kill.mock_calls,
+            [mock.call(0, signal.SIGTERM), mock.call(0, signal.SIGCONT)],
+        )
         self.assert_end_state()
 
     async def test_kill_executed(self):
@@ -317,7 +320,29 @@ class GarbageCollectionUserKillTests(
         await self.perform_actions(0)
         self.assert_task_state_counts_equal(0, 0, 1, 1)
 
-        self.mock_os_kill.assert_called_once()
+        # the worker is resumed in case it has paused itself
+        self.assertEqual(
+            self.mock_os_kill.mock_calls,
+            [mock.call(0, signal.SIGTERM), mock.call(0, signal.SIGCONT)],
+        )
+        self.assert_end_state()
+
+    async def test_kill_executed_finished_meanwhile(self):
+        self._create_tasks(2)
+        await self.perform_actions(0)
+        self.execute_tasks(["id0", "id1"])
+        await self.perform_actions(2)
+        self.scheduler.kill_task("id0", AUTH_USER)
+        await self.perform_actions(0)
+        # the worker has sent the result before it got the signal
+        self.finish_tasks(["id0"])
+        await self.perform_actions(1)
+        self.assert_task_state_counts_equal(0, 0, 1, 1)
+
+        self.assertEqual(
+            self.mock_os_kill.mock_calls,
+            [mock.call(0, signal.SIGTERM), mock.call(0, signal.SIGCONT)],
+        )
         self.assert_end_state()
 
     async def test_kill_finished(self):
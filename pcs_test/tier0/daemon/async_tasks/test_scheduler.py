@@ -1,5 +1,8 @@
 # pylint: disable=protected-access
+import asyncio
 import dataclasses
+import threading
+from datetime import timedelta
 from queue import Empty
 from unittest import mock
 
@@ -20,15 +23,21 @@ from pcs.daemon.async_tasks.task import (
     Task,
     TaskConfig,
 )
+from pcs.daemon.async_tasks.types import Command
 from pcs.daemon.async_tasks.worker.executor import task_executor
 from pcs.daemon.async_tasks.worker.types import (
     Message,
     TaskExecuted,
+    TaskFinished,
 )
+from pcs.lib.auth.types import AuthUser
 
 from .helpers import (
     ANOTHER_AUTH_USER,
     AUTH_USER,
+    DATETIME_NOW,
+    MockDateTimeNowMixin,
+    MockOsKillMixin,
     SchedulerBaseAsyncTestCase,
 )
 
@@ -64,6 +73,67 @@ class GetTaskTest(SchedulerBaseAsyncTestCase):
             self.scheduler.get_task("id0", ANOTHER_AUTH_USER)
 
 
+class TaskProgressTest(SchedulerBaseAsyncTestCase):
+    def _put_report(self, task_ident):
+        self.worker_com.put(
+            Message(
+                task_ident, ReportItem.info(CibUpgradeSuccessful()).to_dto()
+            )
+        )
+
+    async def _receive(self, count):
+        received = 0
+        while received < count:
+            received += await self.scheduler._receive_messages()
+
+    def test_get_progress(self):
+        self._create_tasks(1)
+        progress = self.scheduler.get_task_progress("id0", AUTH_USER, 0)
+        self.assertEqual("id0", progress.task_ident)
+        self.assertEqual(TaskState.CREATED, progress.state)
+        self.assertEqual([], progress.reports)
+        self.assertIsNone(
+            self.scheduler._task_register["id0"]._to_delete_timestamp
+        )
+
+    def test_get_progress_finished(self):
+        self._create_tasks(1)
+        self.scheduler._task_register["id0"].state = TaskState.FINISHED
+        self.scheduler.get_task_progress("id0", AUTH_USER, 0)
+        self.assertIsNotNone(
+            self.scheduler._task_register["id0"]._to_delete_timestamp
+        )
+
+    def test_get_progress_different_user(self):
+        self._create_tasks(1)
+        with self.assertRaises(scheduler.TaskNotFoundError):
+            self.scheduler.get_task_progress("id0", ANOTHER_AUTH_USER, 0)
+
+    async def test_wait_for_progress(self):
+        self._create_tasks(1)
+        self._put_report("id0")
+        await self._receive(1)
+        waiter = asyncio.create_task(
+            self.scheduler.wait_for_task_progress(
+                "id0", AUTH_USER, 1, TaskState.CREATED
+            )
+        )
+        await asyncio.sleep(0)
+        self.assertFalse(waiter.done())
+        self._put_report("id0")
+        self._put_report("id0")
+        await self._receive(2)
+        progress = await asyncio.wait_for(waiter, 1)
+        self.assertEqual(1, progress.report_offset)
+        self.assertEqual(2, len(progress.reports))
+
+    async def test_wait_for_progress_task_not_exists(self):
+        with self.assertRaises(scheduler.TaskNotFoundError):
+            await self.scheduler.wait_for_task_progress(
+                "id0", AUTH_USER, 0, TaskState.CREATED
+            )
+
+
 class KillTaskTest(SchedulerBaseAsyncTestCase):
     def test_task_exists(self):
         self._create_tasks(2)
@@ -337,3 +407,308 @@ class DeadlockDetectionTest(SchedulerBaseAsyncTestCase):
             task.task_ident: task for task in (task1, task2, task3, task4)
         }
         self.assertFalse(self.scheduler._is_possibly_dead_locked())
+
+
+class CoalescingTest(
+    MockDateTimeNowMixin, MockOsKillMixin, SchedulerBaseAsyncTestCase
+):
+    def setUp(self):
+        super().setUp()
+        self.mock_datetime_now = self._init_mock_datetime_now()
+        self._init_mock_os_kill()
+
+    def _new_task(
+        self,
+        task_ident,
+        command_name="resource_agent.get_agents_list",
+        params=None,
+        auth_user=AUTH_USER,
+    ):
+        with mock.patch(
+            "pcs.daemon.async_tasks.scheduler.get_unique_uuid",
+            return_value=task_ident,
+        ):
+            self.scheduler.new_task(
+                Command(
+                    CommandDto(
+                        command_name,
+                        {"standard": "ocf"} if params is None else params,
+                        CommandOptionsDto(),
+                    )
+                ),
+                auth_user,
+            )
+
+    async def _finish_task(self, task_ident, finish_type, result):
+        await self.scheduler._process_tasks()
+        self.worker_com.put(Message(task_ident, TaskExecuted(WORKER1_PID)))
+        self.worker_com.put(
+            Message(
+                task_ident, ReportItem.info(CibUpgradeSuccessful()).to_dto()
+            )
+        )
+        self.worker_com.put(
+            Message(task_ident, TaskFinished(finish_type, result))
+        )
+        received = 0
+        while received < 3:
+            received += await self.scheduler._receive_messages()
+
+    def _assert_scheduled(self, task_ident_list):
+        self.assertEqual(
+            [
+                call.kwargs["args"][0].task_ident
+                for call in self.mp_pool_mock.apply_async.call_args_list
+            ],
+            task_ident_list,
+        )
+
+    async def test_share_result(self):
+        self._new_task("id0")
+        await self.scheduler._process_tasks()
+        self._new_task("id1")
+        self._new_task("id2")
+        await self.scheduler._process_tasks()
+        self._assert_scheduled(["id0"])
+        self.assertEqual(
+            TaskState.CREATED, self.scheduler.get_task("id1", AUTH_USER).state
+        )
+
+        await self._finish_task("id0", TaskFinishType.SUCCESS, ["result"])
+        await self.scheduler._process_tasks()
+        self._assert_scheduled(["id0"])
+        leader_dto = self.scheduler.get_task("id0", AUTH_USER)
+        for task_ident in ("id1", "id2"):
+            with self.subTest(task_ident=task_ident):
+                task_dto = self.scheduler.get_task(task_ident, AUTH_USER)
+                self.assertEqual(TaskState.FINISHED, task_dto.state)
+                self.assertEqual(
+                    TaskFinishType.SUCCESS, task_dto.task_finish_type
+                )
+                self.assertEqual(["result"], task_dto.result)
+                self.assertEqual(leader_dto.reports, task_dto.reports)
+        self.assertEqual(self.scheduler._coalescing_followers, {})
+
+    async def test_share_failure_with_waiting_tasks_only(self):
+        self._new_task("id0")
+        self._new_task("id1")
+        await self._finish_task("id0", TaskFinishType.FAIL, None)
+        await self.scheduler._process_tasks()
+        self.assertEqual(
+            TaskFinishType.FAIL,
+            self.scheduler.get_task("id1", AUTH_USER).task_finish_type,
+        )
+        self._new_task("id2")
+        await self.scheduler._process_tasks()
+        self._assert_scheduled(["id0", "id2"])
+
+    async def test_not_read_only_command(self):
+        self._new_task("id0", command_name="resource.create")
+        self._new_task("id1", command_name="resource.create")
+        await self.scheduler._process_tasks()
+        self._assert_scheduled(["id0", "id1"])
+
+    async def test_unknown_command(self):
+        self._new_task("id0", command_name="command 0")
+        self._new_task("id1", command_name="command 0")
+        await self.scheduler._process_tasks()
+        self._assert_scheduled(["id0", "id1"])
+
+    async def test_different_params(self):
+        self._new_task("id0")
+        self._new_task("id1", params={"standard": "stonith"})
+        await self.scheduler._process_tasks()
+        self._assert_scheduled(["id0", "id1"])
+
+    async def test_different_user(self):
+        self._new_task("id0")
+        self._new_task("id1", auth_user=ANOTHER_AUTH_USER)
+        self._new_task("id2", auth_user=AuthUser(AUTH_USER.username, ()))
+        await self.scheduler._process_tasks()
+        self._assert_scheduled(["id0", "id1", "id2"])
+
+    async def test_leader_killed(self):
+        self._new_task("id0")
+        self._new_task("id1")
+        self._new_task("id2")
+        self.scheduler.kill_task("id0", AUTH_USER)
+        await self.scheduler._process_tasks()
+        self._assert_scheduled(["id1"])
+        self.assertEqual(
+            TaskFinishType.KILL,
+            self.scheduler.get_task("id0", AUTH_USER).task_finish_type,
+        )
+        await self._finish_task("id1", TaskFinishType.SUCCESS, "result")
+        await self.scheduler._process_tasks()
+        self.assertEqual(
+            "result", self.scheduler.get_task("id2", AUTH_USER).result
+        )
+
+    async def test_follower_killed(self):
+        self._new_task("id0")
+        self._new_task("id1")
+        self.scheduler.kill_task("id1", AUTH_USER)
+        await self.scheduler._process_tasks()
+        await self._finish_task("id0", TaskFinishType.SUCCESS, "result")
+        await self.scheduler._process_tasks()
+        self._assert_scheduled(["id0"])
+        task_dto = self.scheduler.get_task("id1", AUTH_USER)
+        self.assertEqual(TaskFinishType.KILL, task_dto.task_finish_type)
+        self.assertIsNone(task_dto.result)
+
+    async def test_no_ttl(self):
+        self._new_task("id0")
+        await self._finish_task("id0", TaskFinishType.SUCCESS, "result")
+        await self.scheduler._process_tasks()
+        self.assertEqual(self.scheduler._coalescing_register, {})
+        self._new_task("id1")
+        await self.scheduler._process_tasks()
+        self._assert_scheduled(["id0", "id1"])
+
+    async def test_ttl(self):
+        self.scheduler._config = dataclasses.replace(
+            self.scheduler._config, coalescing_ttl=10
+        )
+        self._new_task("id0")
+        await self._finish_task("id0", TaskFinishType.SUCCESS, "result")
+        await self.scheduler._process_tasks()
+
+        self.mock_datetime_now.return_value = DATETIME_NOW + timedelta(
+            seconds=10
+        )
+        self._new_task("id1")
+        task_dto = self.scheduler.get_task("id1", AUTH_USER)
+        self.assertEqual(TaskState.FINISHED, task_dto.state)
+        self.assertEqual("result", task_dto.result)
+
+        self.mock_datetime_now.return_value = DATETIME_NOW + timedelta(
+            seconds=11
+        )
+        self._new_task("id2")
+        await self.scheduler._process_tasks()
+        self._assert_scheduled(["id0", "id2"])
+
+    def test_followers_not_counted_in_deadlock_detection(self):
+        self._new_task("id0")
+        self._new_task("id1")
+        self.scheduler._task_register["id0"].state = TaskState.EXECUTED
+        with mock.patch.object(Task, "is_defunct", lambda self, timeout: True):
+            self.assertFalse(self.scheduler._is_possibly_dead_locked())
+
+
+class InProcessTaskTest(SchedulerBaseAsyncTestCase):
+    def setUp(self):
+        super().setUp()
+        self.executor_mock = mock.Mock(spec_set=[])
+        patcher = mock.patch(
+            "pcs.daemon.async_tasks.scheduler.in_process_task_executor",
+            self.executor_mock,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _new_task(self, task_ident):
+        with mock.patch(
+            "pcs.daemon.async_tasks.scheduler.get_unique_uuid",
+            return_value=task_ident,
+        ):
+            self.scheduler.new_task(
+                Command(
+                    CommandDto(
+                        "cluster.get_permissions_metadata",
+                        {},
+                        CommandOptionsDto(),
+                    ),
+                    is_legacy_command=True,
+                ),
+                AUTH_USER,
+            )
+
+    async def test_run_without_scheduler_pass(self):
+        report_dto = ReportItem.info(CibUpgradeSuccessful()).to_dto()
+        self.executor_mock.side_effect = lambda task, logger: [
+            Message(task.task_ident, report_dto),
+            Message(
+                task.task_ident, TaskFinished(TaskFinishType.SUCCESS, "result")
+            ),
+        ]
+        self._new_task("id0")
+        task_dto = await self.scheduler.wait_for_task("id0", AUTH_USER)
+        self.assertEqual(TaskState.FINISHED, task_dto.state)
+        self.assertEqual(TaskFinishType.SUCCESS, task_dto.task_finish_type)
+        self.assertEqual("result", task_dto.result)
+        self.assertEqual([report_dto], task_dto.reports)
+        self.mp_pool_mock.apply_async.assert_not_called()
+        self.executor_mock.assert_called_once_with(
+            self.scheduler._task_register["id0"].to_worker_command(),
+            self.logger_mock,
+        )
+
+    async def test_run_in_scheduler_pass(self):
+        self.executor_mock.side_effect = lambda task, logger: [
+            Message(task.task_ident, TaskFinished(TaskFinishType.FAIL, None)),
+        ]
+        # tasks created outside of the event loop
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._new_task, "id0"
+        )
+        self.executor_mock.assert_not_called()
+        await self.scheduler._process_tasks()
+        task_dto = await self.scheduler.wait_for_task("id0", AUTH_USER)
+        self.assertEqual(TaskFinishType.FAIL, task_dto.task_finish_type)
+        self.mp_pool_mock.apply_async.assert_not_called()
+
+    async def test_kill_running_task(self):
+        release_task = threading.Event()
+
+        def executor(task, logger):
+            del logger
+            release_task.wait()
+            return [
+                Message(
+                    task.task_ident, TaskFinished(TaskFinishType.SUCCESS, "")
+                ),
+            ]
+
+        self.executor_mock.side_effect = executor
+        with mock.patch("os.kill") as mock_os_kill:
+            self._new_task("id0")
+            self.assertEqual(
+                TaskState.EXECUTED,
+                self.scheduler.get_task("id0", AUTH_USER).state,
+            )
+            self.scheduler.kill_task("id0", AUTH_USER)
+            await self.scheduler._process_tasks()
+            release_task.set()
+            task_dto = await self.scheduler.wait_for_task("id0", AUTH_USER)
+            mock_os_kill.assert_not_called()
+        self.assertEqual(TaskFinishType.KILL, task_dto.task_finish_type)
+        self.assertIsNone(task_dto.result)
+
+    async def test_executor_error(self):
+        self.executor_mock.side_effect = RuntimeError("error")
+        self._new_task("id0")
+        # wait for the thread to finish and let the scheduler process it
+        self.scheduler._thread_pool.shutdown(wait=True)
+        await asyncio.sleep(0)
+        self.assertEqual(
+            TaskKillReason.INTERNAL_MESSAGING_ERROR,
+            self.scheduler.get_task("id0", AUTH_USER).kill_reason,
+        )
+
+    @mock.patch.object(Task, "is_defunct", lambda self, timeout: True)
+    def test_not_counted_in_deadlock_detection(self):
+        self._create_tasks(1)
+        task = Task(
+            "id1",
+            Command(
+                CommandDto(
+                    "cluster.get_permissions_metadata", {}, CommandOptionsDto()
+                )
+            ),
+            AUTH_USER,
+            TaskConfig(),
+        )
+        task.mark_executed_in_process()
+        self.scheduler._task_register["id1"] = task
+        self.assertFalse(self.scheduler._is_possibly_dead_locked())
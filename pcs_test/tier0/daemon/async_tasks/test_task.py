@@ -1,4 +1,6 @@
 # pylint: disable=protected-access
+import asyncio
+import signal
 from datetime import timedelta
 from unittest import (
     IsolatedAsyncioTestCase,
@@ -10,6 +12,7 @@ from pcs.common.async_tasks import types
 from pcs.common.async_tasks.dto import (
     CommandDto,
     CommandOptionsDto,
+    TaskProgressDto,
 )
 from pcs.common.reports import ReportItemDto
 from pcs.daemon.async_tasks.types import Command
@@ -141,7 +144,13 @@ class TestKill(MockOsKillMixin, TaskBaseTestCase):
         self.task.receive_message(message)
         self.task.kill()
         task_dto = self.task.to_dto()
-        self.mock_os_kill.assert_called_once_with(WORKER_PID, 15)
+        self.assertEqual(
+            self.mock_os_kill.mock_calls,
+            [
+                mock.call(WORKER_PID, signal.SIGTERM),
+                mock.call(WORKER_PID, signal.SIGCONT),
+            ],
+        )
         self.assertEqual(types.TaskState.FINISHED, task_dto.state)
         self.assertEqual(types.TaskFinishType.KILL, task_dto.task_finish_type)
 
@@ -151,13 +160,35 @@ class TestKill(MockOsKillMixin, TaskBaseTestCase):
         self.mock_os_kill.raiseError.side_effect = ProcessLookupError()
         self.task.kill()
         task_dto = self.task.to_dto()
-        self.mock_os_kill.assert_called_once_with(WORKER_PID, 15)
+        self.assertEqual(
+            self.mock_os_kill.mock_calls,
+            [
+                mock.call(WORKER_PID, signal.SIGTERM),
+                mock.call(WORKER_PID, signal.SIGCONT),
+            ],
+        )
         self.assertEqual(types.TaskState.FINISHED, task_dto.state)
         self.assertEqual(types.TaskFinishType.KILL, task_dto.task_finish_type)
 
     def test_kill_finished(self):
         self._assert_not_killed(types.TaskState.FINISHED)
 
+    def test_finished_message_after_kill(self):
+        self.task.receive_message(Message(TASK_IDENT, TaskExecuted(WORKER_PID)))
+        self.task.kill()
+        self.mock_os_kill.reset_mock()
+        # the worker finished the task before it got the signal
+        self.task.receive_message(
+            Message(
+                TASK_IDENT, TaskFinished(types.TaskFinishType.SUCCESS, "result")
+            )
+        )
+        task_dto = self.task.to_dto()
+        self.mock_os_kill.assert_not_called()
+        self.assertEqual(types.TaskState.FINISHED, task_dto.state)
+        self.assertEqual(types.TaskFinishType.KILL, task_dto.task_finish_type)
+        self.assertIsNone(task_dto.result)
+
 
 class TestGetLastTimestamp(MockDateTimeNowMixin, TaskBaseTestCase):
     def test_no_messages_created(self):
@@ -285,3 +316,64 @@ class TestAbandoned(TaskBaseTestCase):
         mock_is_timed_out.assert_called_once_with(
             task_abandoned_timeout_seconds
         )
+
+
+class TestProgress(MockOsKillMixin, TaskBaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self._init_mock_os_kill()
+        self.report_list = [mock.MagicMock(ReportItemDto) for _ in range(3)]
+
+    def _receive_report(self, index):
+        self.task.receive_message(Message(TASK_IDENT, self.report_list[index]))
+
+    def test_progress_dto(self):
+        self._receive_report(0)
+        self._receive_report(1)
+        self.task.receive_message(
+            Message(
+                TASK_IDENT, TaskFinished(types.TaskFinishType.SUCCESS, "ok")
+            )
+        )
+        for offset, expected_offset in ((0, 0), (1, 1), (2, 2), (5, 2)):
+            with self.subTest(offset=offset):
+                self.assertEqual(
+                    TaskProgressDto(
+                        TASK_IDENT,
+                        types.TaskState.FINISHED,
+                        types.TaskFinishType.SUCCESS,
+                        None,
+                        expected_offset,
+                        self.report_list[expected_offset:2],
+                        "ok",
+                    ),
+                    self.task.to_progress_dto(offset),
+                )
+
+    async def test_wait_for_report(self):
+        self._receive_report(0)
+        waiter = asyncio.create_task(
+            self.task.wait_for_progress(1, types.TaskState.CREATED)
+        )
+        await asyncio.sleep(0)
+        self.assertFalse(waiter.done())
+        self._receive_report(1)
+        await asyncio.wait_for(waiter, 1)
+
+    async def test_wait_for_state_change(self):
+        waiter = asyncio.create_task(
+            self.task.wait_for_progress(0, types.TaskState.CREATED)
+        )
+        await asyncio.sleep(0)
+        self.assertFalse(waiter.done())
+        self.task.state = types.TaskState.QUEUED
+        await asyncio.wait_for(waiter, 1)
+
+    async def test_no_wait_for_known_progress(self):
+        self._receive_report(0)
+        await asyncio.wait_for(
+            self.task.wait_for_progress(0, types.TaskState.CREATED), 1
+        )
+        await asyncio.wait_for(
+            self.task.wait_for_progress(1, types.TaskState.QUEUED), 1
+        )
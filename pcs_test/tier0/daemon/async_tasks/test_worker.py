@@ -1,17 +1,27 @@
+import json
+import os
+import signal
 from multiprocessing import Queue
+from queue import Empty
 from unittest import (
     TestCase,
     mock,
 )
 
-from pcs.common import reports
+from pcs import settings
+from pcs.common import profiling, reports
 from pcs.common.async_tasks import types
 from pcs.common.async_tasks.dto import (
+    CommandBatchDto,
     CommandDto,
     CommandOptionsDto,
+    CommandResultDto,
 )
-from pcs.daemon.async_tasks.types import Command
+from pcs.common.cancellation import CancellationToken
+from pcs.common.interface.dto import to_dict
+from pcs.daemon.async_tasks.types import BATCH_COMMAND_NAME, Command
 from pcs.daemon.async_tasks.worker import executor
+from pcs.daemon.async_tasks.worker.communicator import WorkerCommunicator
 from pcs.daemon.async_tasks.worker.types import (
     Message,
     TaskExecuted,
@@ -19,6 +29,8 @@ from pcs.daemon.async_tasks.worker.types import (
     WorkerCommand,
 )
 
+from pcs_test.tools.misc import get_tmp_dir
+
 from .dummy_commands import (
     RESULT,
     test_command_map,
@@ -64,7 +76,7 @@ class TestExecutor(MockOsKillMixin, TestCase):
     def setUp(self) -> None:
         super().setUp()
         # Os.kill is used to pause the worker and we do not want to pause tests
-        self._init_mock_os_kill()
+        self.mock_os_kill = self._init_mock_os_kill()
 
     def _get_payload_from_worker_com(self, worker_com):
         message = worker_com.get()
@@ -200,3 +212,360 @@ class TestExecutor(MockOsKillMixin, TestCase):
         self.assertIsInstance(payload, TaskFinished)
         self.assertEqual(types.TaskFinishType.SUCCESS, payload.task_finish_type)
         self.assertEqual(RESULT, payload.result)
+
+    @mock.patch("pcs.daemon.async_tasks.worker.executor.signal.alarm")
+    @mock.patch(
+        "pcs.daemon.async_tasks.worker.executor.worker_com",
+        WorkerCommunicator(Queue()),
+    )
+    def test_killed(self, mock_alarm, mock_getpid):
+        mock_getpid.return_value = WORKER_PID
+        with self.assertRaises(SystemExit):
+            executor.task_executor(
+                WorkerCommand(
+                    TASK_IDENT,
+                    Command(CommandDto("killed", {}, COMMAND_OPTIONS)),
+                    AUTH_USER,
+                )
+            )
+        # pylint: disable=protected-access
+        worker_queue = executor.worker_com._queue
+        # 1. TaskExecuted
+        self._assert_task_executed(worker_queue)
+        # No TaskFinished, the scheduler has finished the task when killing it
+        with self.assertRaises(Empty):
+            worker_queue.get(timeout=0.2)
+        mock_alarm.assert_has_calls(
+            [mock.call(settings.task_cancel_timeout_seconds), mock.call(0)]
+        )
+        self.assertIsNone(executor._task_cancellation_token)
+        # the worker exits instead of pausing itself
+        self.mock_os_kill.assert_not_called()
+
+    @mock.patch("pcs.daemon.async_tasks.worker.executor.signal.alarm")
+    @mock.patch(
+        "pcs.daemon.async_tasks.worker.executor.worker_com",
+        WorkerCommunicator(Queue()),
+    )
+    def test_killed_not_cancellable(self, mock_alarm, mock_getpid):
+        mock_getpid.return_value = WORKER_PID
+        with self.assertRaises(SystemExit):
+            executor.task_executor(
+                WorkerCommand(
+                    TASK_IDENT,
+                    Command(
+                        CommandDto(
+                            "killed_not_cancellable", {}, COMMAND_OPTIONS
+                        )
+                    ),
+                    AUTH_USER,
+                )
+            )
+        # pylint: disable=protected-access
+        worker_queue = executor.worker_com._queue
+        # 1. TaskExecuted
+        self._assert_task_executed(worker_queue)
+        # 2. TaskFinished, it is ignored by the scheduler
+        payload = self._get_payload_from_worker_com(worker_queue)
+        self.assertIsInstance(payload, TaskFinished)
+        mock_alarm.assert_has_calls(
+            [mock.call(settings.task_cancel_timeout_seconds), mock.call(0)]
+        )
+        self.mock_os_kill.assert_not_called()
+
+
+@mock.patch("pcs.daemon.async_tasks.worker.executor.signal.alarm")
+class TestSigtermHandler(TestCase):
+    def setUp(self):
+        self.worker_com = WorkerCommunicator(Queue())
+        patcher = mock.patch(
+            "pcs.daemon.async_tasks.worker.executor.worker_com",
+            self.worker_com,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _set_token(self, token):
+        patcher = mock.patch(
+            "pcs.daemon.async_tasks.worker.executor._task_cancellation_token",
+            token,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_no_task(self, mock_alarm):
+        # pylint: disable=protected-access
+        with self.assertRaises(SystemExit):
+            executor._sigterm_handler(signal.SIGTERM, None)
+        mock_alarm.assert_not_called()
+
+    def test_no_task_sending_message(self, mock_alarm):
+        # pylint: disable=protected-access
+        with self.worker_com._lock:
+            executor._sigterm_handler(signal.SIGTERM, None)
+        with self.assertRaises(SystemExit):
+            self.worker_com.put(Message(TASK_IDENT, None))
+        mock_alarm.assert_not_called()
+
+    def test_task_running(self, mock_alarm):
+        # pylint: disable=protected-access
+        token = CancellationToken()
+        self._set_token(token)
+        executor._sigterm_handler(signal.SIGTERM, None)
+        self.assertTrue(token.is_cancelled)
+        mock_alarm.assert_called_once_with(settings.task_cancel_timeout_seconds)
+        # the task is already being cancelled, terminate the worker now
+        with self.assertRaises(SystemExit):
+            executor._sigterm_handler(signal.SIGTERM, None)
+
+    def test_cancel_timeout(self, mock_alarm):
+        # pylint: disable=protected-access
+        token = CancellationToken()
+        self._set_token(token)
+        executor._sigterm_handler(signal.SIGTERM, None)
+        mock_alarm.assert_called_once_with(settings.task_cancel_timeout_seconds)
+        with self.assertRaises(SystemExit):
+            executor._sigalrm_handler(signal.SIGALRM, None)
+
+
+@mock.patch(
+    "pcs.daemon.async_tasks.worker.executor.COMMAND_MAP", test_command_map
+)
+@mock.patch(
+    "pcs.daemon.async_tasks.worker.executor.LEGACY_API_COMMANDS",
+    test_legacy_api_commands,
+)
+@mock.patch(
+    "pcs.daemon.async_tasks.worker.executor.PermissionsChecker",
+    lambda _: PermissionsCheckerMock({}),
+)
+class TestInProcessExecutor(TestCase):
+    def _run(self, command_name):
+        with mock.patch("os.kill") as mock_os_kill:
+            messages = executor.in_process_task_executor(
+                WorkerCommand(
+                    TASK_IDENT,
+                    Command(CommandDto(command_name, {}, COMMAND_OPTIONS)),
+                    AUTH_USER,
+                ),
+                mock.MagicMock(),
+            )
+            # the process running the task must not be paused
+            mock_os_kill.assert_not_called()
+        self.assertTrue(
+            all(message.task_ident == TASK_IDENT for message in messages)
+        )
+        return [message.payload for message in messages]
+
+    def test_successful_run(self):
+        self.assertEqual(
+            [TaskFinished(types.TaskFinishType.SUCCESS, RESULT)],
+            self._run("success"),
+        )
+
+    def test_reports(self):
+        report, finished = self._run("success_with_reports")
+        self.assertIsInstance(report, reports.ReportItemDto)
+        self.assertEqual(
+            report.message.code, reports.codes.CIB_UPGRADE_SUCCESSFUL
+        )
+        self.assertEqual(
+            TaskFinished(types.TaskFinishType.SUCCESS, None), finished
+        )
+
+    def test_unsuccessful_run(self):
+        report, finished = self._run("lib_exc_reports")
+        self.assertIsInstance(report, reports.ReportItemDto)
+        self.assertEqual(
+            TaskFinished(types.TaskFinishType.FAIL, None), finished
+        )
+
+    def test_unhandled_exception(self):
+        self.assertEqual(
+            [TaskFinished(types.TaskFinishType.UNHANDLED_EXCEPTION, None)],
+            self._run("unhandled_exc"),
+        )
+
+
+@mock.patch(
+    "pcs.daemon.async_tasks.worker.executor.COMMAND_MAP", test_command_map
+)
+@mock.patch(
+    "pcs.daemon.async_tasks.worker.executor.PermissionsChecker",
+    lambda _: PermissionsCheckerMock({}),
+)
+class TestProfiling(TestCase):
+    def _run(self, profile_dir, logger):
+        return executor.in_process_task_executor(
+            WorkerCommand(
+                TASK_IDENT,
+                Command(CommandDto("success", {}, COMMAND_OPTIONS)),
+                AUTH_USER,
+                profile_dir=profile_dir,
+            ),
+            logger,
+        )
+
+    def test_profile_written(self):
+        with get_tmp_dir("test_worker_profile") as profile_dir:
+            messages = self._run(profile_dir, mock.MagicMock())
+            with open(
+                os.path.join(profile_dir, f"{TASK_IDENT}.json"),
+                encoding="utf-8",
+            ) as profile_file:
+                profile = json.load(profile_file)
+        self.assertEqual(
+            [TaskFinished(types.TaskFinishType.SUCCESS, RESULT)],
+            [message.payload for message in messages],
+        )
+        self.assertEqual(profile["name"], "success")
+        self.assertEqual(
+            [(event["type"], event["name"]) for event in profile["events"]],
+            [(profiling.EVENT_LIBRARY_COMMAND, "success")],
+        )
+
+    def test_profile_not_writable(self):
+        logger = mock.MagicMock()
+        messages = self._run("/nonexistent/directory", logger)
+        self.assertEqual(
+            [TaskFinished(types.TaskFinishType.SUCCESS, RESULT)],
+            [message.payload for message in messages],
+        )
+        logger.warning.assert_called_once_with(
+            "Unable to write profile of task %s to '%s': %s",
+            TASK_IDENT,
+            f"/nonexistent/directory/{TASK_IDENT}.json",
+            mock.ANY,
+        )
+
+
+@mock.patch(
+    "pcs.daemon.async_tasks.worker.executor.COMMAND_MAP", test_command_map
+)
+@mock.patch(
+    "pcs.daemon.async_tasks.worker.executor.PermissionsChecker",
+    lambda _: PermissionsCheckerMock({}),
+)
+class TestBatchExecutor(TestCase):
+    def _run(self, *commands):
+        batch_dto = CommandBatchDto(
+            [
+                CommandDto(command_name, params, COMMAND_OPTIONS)
+                for command_name, params in commands
+            ]
+        )
+        messages = executor.in_process_task_executor(
+            WorkerCommand(
+                TASK_IDENT,
+                Command(
+                    CommandDto(
+                        BATCH_COMMAND_NAME, to_dict(batch_dto), COMMAND_OPTIONS
+                    ),
+                    is_batch=True,
+                ),
+                AUTH_USER,
+            ),
+            mock.MagicMock(),
+        )
+        return [message.payload for message in messages]
+
+    def _assert_failed_command(self, result, command_name, report_code):
+        self.assertEqual(result.command_name, command_name)
+        self.assertFalse(result.success)
+        self.assertIsNone(result.result)
+        self.assertEqual(
+            [report.message.code for report in result.reports], [report_code]
+        )
+
+    def test_success(self):
+        report, finished = self._run(
+            ("batch_success", {}),
+            ("batch_success_with_reports", {}),
+            ("batch_wait", {"wait": False}),
+        )
+        self.assertEqual(
+            report.message.code, reports.codes.CIB_UPGRADE_SUCCESSFUL
+        )
+        self.assertEqual(
+            TaskFinished(
+                types.TaskFinishType.SUCCESS,
+                [
+                    CommandResultDto("batch_success", True, [], RESULT),
+                    CommandResultDto(
+                        "batch_success_with_reports", True, [report], None
+                    ),
+                    CommandResultDto("batch_wait", True, [], False),
+                ],
+            ),
+            finished,
+        )
+
+    def test_failed_command_stops_batch(self):
+        report, finished = self._run(
+            ("batch_success", {}),
+            ("batch_lib_exc_reports", {}),
+            ("batch_success_with_reports", {}),
+        )
+        self.assertEqual(
+            report.message.code, reports.codes.CIB_UPGRADE_SUCCESSFUL
+        )
+        self.assertEqual(finished.task_finish_type, types.TaskFinishType.FAIL)
+        self.assertEqual(len(finished.result), 2)
+        self.assertEqual(
+            finished.result[0],
+            CommandResultDto("batch_success", True, [], RESULT),
+        )
+        self._assert_failed_command(
+            finished.result[1],
+            "batch_lib_exc_reports",
+            reports.codes.CIB_UPGRADE_SUCCESSFUL,
+        )
+
+    def test_command_not_allowed(self):
+        _, finished = self._run(("batch_success", {}), ("success", {}))
+        self.assertEqual(finished.task_finish_type, types.TaskFinishType.FAIL)
+        self._assert_failed_command(
+            finished.result[1],
+            "success",
+            reports.codes.COMMAND_NOT_ALLOWED_IN_BATCH,
+        )
+
+    def test_unknown_command(self):
+        _, finished = self._run(("nonexistent", {}))
+        self.assertEqual(finished.task_finish_type, types.TaskFinishType.FAIL)
+        self._assert_failed_command(
+            finished.result[0], "nonexistent", reports.codes.COMMAND_UNKNOWN
+        )
+
+    def test_wait_not_allowed(self):
+        _, finished = self._run(("batch_wait", {"wait": True}))
+        self.assertEqual(finished.task_finish_type, types.TaskFinishType.FAIL)
+        self._assert_failed_command(
+            finished.result[0],
+            "batch_wait",
+            reports.codes.COMMAND_INVALID_PAYLOAD,
+        )
+
+    def test_invalid_batch(self):
+        messages = executor.in_process_task_executor(
+            WorkerCommand(
+                TASK_IDENT,
+                Command(
+                    CommandDto(
+                        BATCH_COMMAND_NAME,
+                        {"commands": "not a list"},
+                        COMMAND_OPTIONS,
+                    ),
+                    is_batch=True,
+                ),
+                AUTH_USER,
+            ),
+            mock.MagicMock(),
+        )
+        report, finished = [message.payload for message in messages]
+        self.assertEqual(
+            report.message.code, reports.codes.COMMAND_INVALID_PAYLOAD
+        )
+        self.assertEqual(
+            TaskFinished(types.TaskFinishType.FAIL, None), finished
+        )
@@ -0,0 +1,164 @@
+import asyncio
+import logging
+from unittest import IsolatedAsyncioTestCase, mock
+
+from pcs.common.pacemaker.cib_watch import CibVersionDto
+from pcs.daemon import cib_watcher
+
+VERSION_QUERY = ["--local", "--query", "--xpath", "/cib", "--no-children"]
+CIB_VERSION_XML = '<cib admin_epoch="0" epoch="{}" num_updates="{}"/>'
+CIB_XML = """
+    <cib admin_epoch="0" epoch="{}" num_updates="{}">
+        <configuration/>
+    </cib>
+"""
+
+
+class CibWatcherTest(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.logger = mock.Mock(spec_set=logging.Logger)
+        self.outputs = []
+        self.cibadmin_calls = []
+
+    def create_watcher(self, keep_cib=False):
+        watcher = cib_watcher.CibWatcher(self.logger, keep_cib=keep_cib)
+
+        async def run_tool(logger, argv):
+            self.assertIs(logger, self.logger)
+            self.cibadmin_calls.append(argv[1:])
+            return self.outputs.pop(0)
+
+        patcher = mock.patch(
+            "pcs.daemon.cib_watcher.run_tool", side_effect=run_tool
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return watcher
+
+    async def test_initial_state(self):
+        watcher = self.create_watcher()
+        self.assertEqual(watcher.state.generation, 0)
+        self.assertIsNone(watcher.state.version)
+        self.assertIsNone(watcher.cib)
+
+    async def test_version_changes(self):
+        watcher = self.create_watcher()
+        self.outputs = [
+            CIB_VERSION_XML.format(1, 1),
+            CIB_VERSION_XML.format(1, 1),
+            CIB_VERSION_XML.format(1, 2),
+        ]
+        await watcher.refresh()
+        self.assertEqual(watcher.state.generation, 1)
+        self.assertEqual(watcher.state.version, CibVersionDto(0, 1, 1))
+        await watcher.refresh()
+        self.assertEqual(watcher.state.generation, 1)
+        await watcher.refresh()
+        self.assertEqual(watcher.state.generation, 2)
+        self.assertEqual(watcher.state.version, CibVersionDto(0, 1, 2))
+        self.assertIsNone(watcher.cib)
+        self.assertEqual(self.cibadmin_calls, [VERSION_QUERY] * 3)
+
+    async def test_cib_not_available(self):
+        watcher = self.create_watcher()
+        self.outputs = [None, CIB_VERSION_XML.format(1, 1), None]
+        await watcher.refresh()
+        self.assertEqual(watcher.state.generation, 0)
+        await watcher.refresh()
+        self.assertEqual(watcher.state.generation, 1)
+        await watcher.refresh()
+        self.assertEqual(watcher.state.generation, 2)
+        self.assertIsNone(watcher.state.version)
+        self.logger.info.assert_has_calls(
+            [mock.call("CIB is available"), mock.call("CIB is not available")]
+        )
+
+    async def test_keep_cib(self):
+        watcher = self.create_watcher(keep_cib=True)
+        self.outputs = [
+            CIB_VERSION_XML.format(1, 1),
+            # the CIB has changed after its version was loaded
+            CIB_XML.format(1, 2),
+            CIB_VERSION_XML.format(1, 2),
+        ]
+        await watcher.refresh()
+        self.assertEqual(watcher.state.generation, 1)
+        self.assertEqual(watcher.state.version, CibVersionDto(0, 1, 2))
+        self.assertEqual(watcher.cib, CIB_XML.format(1, 2))
+        await watcher.refresh()
+        self.assertEqual(watcher.state.generation, 1)
+        self.assertEqual(
+            self.cibadmin_calls,
+            [
+                VERSION_QUERY,
+                ["--local", "--query"],
+                VERSION_QUERY,
+            ],
+        )
+
+    async def test_listeners(self):
+        watcher = self.create_watcher()
+        self.outputs = [CIB_VERSION_XML.format(1, 1)] * 2
+        failing_listener = mock.Mock(side_effect=RuntimeError)
+        listener = mock.Mock()
+        removed_listener = mock.Mock()
+        watcher.add_listener(failing_listener)
+        watcher.add_listener(listener)
+        watcher.add_listener(removed_listener)
+        watcher.remove_listener(removed_listener)
+        await watcher.refresh()
+        await watcher.refresh()
+        listener.assert_called_once_with(watcher.state)
+        failing_listener.assert_called_once_with(watcher.state)
+        removed_listener.assert_not_called()
+        self.logger.exception.assert_called_once_with(
+            "Error in a CIB change listener"
+        )
+
+    async def test_wait_for_change(self):
+        watcher = self.create_watcher()
+        self.outputs = [CIB_VERSION_XML.format(1, 1)]
+        waiter = asyncio.create_task(watcher.wait_for_change(0))
+        await asyncio.sleep(0)
+        self.assertFalse(waiter.done())
+        await watcher.refresh()
+        self.assertEqual(await waiter, watcher.state)
+        # the state is already newer than the specified generation
+        self.assertEqual(await watcher.wait_for_change(0), watcher.state)
+
+    async def test_wait_for_change_generation_from_previous_run(self):
+        watcher = self.create_watcher()
+        self.assertEqual(await watcher.wait_for_change(5), watcher.state)
+
+
+class RunTool(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.logger = mock.Mock(spec_set=logging.Logger)
+
+    async def test_success(self):
+        self.assertEqual(
+            await cib_watcher.run_tool(self.logger, ["/bin/echo", "a", "b"]),
+            "a b\n",
+        )
+
+    async def test_failure(self):
+        self.assertIsNone(
+            await cib_watcher.run_tool(self.logger, ["/bin/false"])
+        )
+        self.logger.debug.assert_called_once_with(
+            "Running %s has failed: %s", "/bin/false", ""
+        )
+
+    async def test_not_installed(self):
+        self.assertIsNone(
+            await cib_watcher.run_tool(self.logger, ["/nonexistent/cibadmin"])
+        )
+
+    @mock.patch("pcs.daemon.cib_watcher.QUERY_TIMEOUT_SECONDS", 0.01)
+    async def test_timeout(self):
+        self.assertIsNone(
+            await cib_watcher.run_tool(self.logger, ["/bin/sleep", "10"])
+        )
+        self.logger.debug.assert_called_once_with(
+            "Running %s has timed out", "/bin/sleep"
+        )
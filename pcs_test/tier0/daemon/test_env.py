@@ -62,6 +62,11 @@ class Prepare(TestCase, create_setup_patch_mixin(env)):
             env.PCSD_TASK_ABANDONED_TIMEOUT: settings.task_abandoned_timeout_seconds,
             env.PCSD_TASK_UNRESPONSIVE_TIMEOUT: settings.task_unresponsive_timeout_seconds,
             env.PCSD_TASK_DELETION_TIMEOUT: settings.task_deletion_timeout_seconds,
+            env.PCSD_TASK_COALESCING_TTL: settings.task_coalescing_ttl_seconds,
+            env.PCSD_PROFILE_DIR: None,
+            env.PCSD_CIB_WATCH_INTERVAL_MS: settings.pcsd_cib_watch_interval_ms,
+            env.PCSD_CIB_WATCH_KEEP_CIB: False,
+            env.PCSD_STATUS_WATCH: False,
             "has_errors": False,
         }
         if specific_env_values is None:
@@ -97,6 +102,10 @@ class Prepare(TestCase, create_setup_patch_mixin(env)):
             env.PCSD_TASK_ABANDONED_TIMEOUT: "6",
             env.PCSD_TASK_UNRESPONSIVE_TIMEOUT: "7",
             env.PCSD_TASK_DELETION_TIMEOUT: "8",
+            env.PCSD_TASK_COALESCING_TTL: "9",
+            env.PCSD_CIB_WATCH_INTERVAL_MS: "10",
+            env.PCSD_CIB_WATCH_KEEP_CIB: "true",
+            env.PCSD_STATUS_WATCH: "true",
         }
         self.assert_environ_produces_modified_pcsd_env(
             environ=environ,
@@ -119,6 +128,10 @@ class Prepare(TestCase, create_setup_patch_mixin(env)):
                 env.PCSD_TASK_ABANDONED_TIMEOUT: 6,
                 env.PCSD_TASK_UNRESPONSIVE_TIMEOUT: 7,
                 env.PCSD_TASK_DELETION_TIMEOUT: 8,
+                env.PCSD_TASK_COALESCING_TTL: 9,
+                env.PCSD_CIB_WATCH_INTERVAL_MS: 10,
+                env.PCSD_CIB_WATCH_KEEP_CIB: True,
+                env.PCSD_STATUS_WATCH: True,
             },
         )
 
@@ -289,3 +302,56 @@ class Prepare(TestCase, create_setup_patch_mixin(env)):
                 f"Value '-1' for '{env.PCSD_TASK_DELETION_TIMEOUT}' is not a non-negative integer"
             ],
         )
+
+    def test_invalid_task_coalescing_ttl(self):
+        self.assert_environ_produces_modified_pcsd_env(
+            environ={env.PCSD_TASK_COALESCING_TTL: "-1"},
+            specific_env_values={
+                env.PCSD_TASK_COALESCING_TTL: settings.task_coalescing_ttl_seconds,
+                "has_errors": True,
+            },
+            errors=[
+                f"Value '-1' for '{env.PCSD_TASK_COALESCING_TTL}' is not a non-negative integer"
+            ],
+        )
+
+    def test_invalid_cib_watch_interval(self):
+        self.assert_environ_produces_modified_pcsd_env(
+            environ={env.PCSD_CIB_WATCH_INTERVAL_MS: "often"},
+            specific_env_values={
+                env.PCSD_CIB_WATCH_INTERVAL_MS: settings.pcsd_cib_watch_interval_ms,
+                "has_errors": True,
+            },
+            errors=[
+                f"Value 'often' for '{env.PCSD_CIB_WATCH_INTERVAL_MS}' is not a non-negative integer"
+            ],
+        )
+
+    def test_status_watch_without_cib_watch(self):
+        self.assert_environ_produces_modified_pcsd_env(
+            environ={env.PCSD_STATUS_WATCH: "true"},
+            specific_env_values={"has_errors": True},
+            errors=[
+                f"'{env.PCSD_STATUS_WATCH}' requires "
+                f"'{env.PCSD_CIB_WATCH_INTERVAL_MS}' to be a positive integer"
+            ],
+        )
+
+    def test_profile_dir(self):
+        path_isdir = self.setup_patch("os.path.isdir", return_value=True)
+        self.assert_environ_produces_modified_pcsd_env(
+            environ={env.PCSD_PROFILE_DIR: "/var/tmp/profiles"},
+            specific_env_values={env.PCSD_PROFILE_DIR: "/var/tmp/profiles"},
+        )
+        path_isdir.assert_called_once_with("/var/tmp/profiles")
+
+    def test_profile_dir_not_exists(self):
+        self.setup_patch("os.path.isdir", return_value=False)
+        self.assert_environ_produces_modified_pcsd_env(
+            environ={env.PCSD_PROFILE_DIR: "/var/tmp/profiles"},
+            specific_env_values={"has_errors": True},
+            errors=[
+                f"Directory '/var/tmp/profiles' for '{env.PCSD_PROFILE_DIR}' "
+                "does not exist"
+            ],
+        )
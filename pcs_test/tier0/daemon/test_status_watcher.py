@@ -0,0 +1,163 @@
+import asyncio
+import logging
+import os.path
+import tempfile
+from unittest import IsolatedAsyncioTestCase, mock
+
+from pcs import settings
+from pcs.common.pacemaker.cib_watch import CibVersionDto
+from pcs.daemon.cib_watcher import CibWatcher
+from pcs.daemon.status_watcher import ClusterStatusWatcher
+from pcs.lib.pacemaker.status_snapshot import (
+    get_process_start_time,
+    load_snapshot,
+)
+
+CRM_MON_ARGV = [
+    settings.crm_mon_exec,
+    "--one-shot",
+    "--inactive",
+    "--output-as",
+    "xml",
+]
+
+
+class ClusterStatusWatcherTest(IsolatedAsyncioTestCase):
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = os.path.join(self.tmp_dir.name, "status.json")
+        self.logger = mock.Mock(spec_set=logging.Logger)
+        self.cib_watcher = CibWatcher(self.logger)
+        self.crm_mon_outputs = []
+        self.crm_mon_calls = 0
+        patcher = mock.patch(
+            "pcs.daemon.status_watcher.run_tool", side_effect=self._run_tool
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.watcher = ClusterStatusWatcher(
+            self.logger, self.cib_watcher, self.path
+        )
+
+    async def _run_tool(self, logger, argv):
+        self.assertIs(logger, self.logger)
+        self.assertEqual(argv, CRM_MON_ARGV)
+        self.crm_mon_calls += 1
+        # let other changes come while crm_mon is running
+        await asyncio.sleep(0)
+        return self.crm_mon_outputs.pop(0)
+
+    def change_cib(self, generation, num_updates=None):
+        # pylint: disable=protected-access
+        self.cib_watcher._set_state(
+            None if num_updates is None else CibVersionDto(0, 5, num_updates),
+            None,
+        )
+        self.assertEqual(self.cib_watcher.state.generation, generation)
+
+    def snapshot_exists(self):
+        return os.path.exists(self.path)
+
+    def write_stale_snapshot(self):
+        with open(self.path, "w", encoding="utf-8") as snapshot_file:
+            snapshot_file.write("{}")
+
+    async def wait_for_refresh(self):
+        # pylint: disable=protected-access
+        if self.watcher._refresh_task is not None:
+            await self.watcher._refresh_task
+
+    async def test_start_removes_stale_snapshot(self):
+        self.write_stale_snapshot()
+        self.watcher.start()
+        self.assertFalse(self.snapshot_exists())
+
+    async def test_status_refreshed_on_cib_change(self):
+        self.watcher.start()
+        self.crm_mon_outputs = ["<status-1/>", "<status-2/>"]
+
+        self.change_cib(1, 1)
+        await self.wait_for_refresh()
+        snapshot = self.watcher.snapshot
+        self.assertEqual(snapshot.generation, 1)
+        self.assertEqual(snapshot.cib_version, CibVersionDto(0, 5, 1))
+        self.assertEqual(snapshot.status_xml, "<status-1/>")
+        self.assertEqual(snapshot.pid, os.getpid())
+        self.assertEqual(
+            snapshot.process_start_time, get_process_start_time(os.getpid())
+        )
+        self.assertEqual(load_snapshot(self.path), snapshot)
+
+        self.change_cib(2, 2)
+        await self.wait_for_refresh()
+        snapshot = self.watcher.snapshot
+        self.assertEqual(snapshot.generation, 2)
+        self.assertEqual(snapshot.cib_version, CibVersionDto(0, 5, 2))
+        self.assertEqual(snapshot.status_xml, "<status-2/>")
+        self.assertEqual(load_snapshot(self.path), snapshot)
+
+    async def test_changes_merged_while_crm_mon_runs(self):
+        self.watcher.start()
+        self.crm_mon_outputs = ["<status-1/>", "<status-3/>"]
+
+        self.change_cib(1, 1)
+        # let crm_mon start
+        await asyncio.sleep(0)
+        self.assertEqual(self.crm_mon_calls, 1)
+        self.change_cib(2, 2)
+        self.change_cib(3, 3)
+        await self.wait_for_refresh()
+        self.assertEqual(self.crm_mon_calls, 2)
+        snapshot = self.watcher.snapshot
+        self.assertEqual(snapshot.generation, 2)
+        self.assertEqual(snapshot.cib_version, CibVersionDto(0, 5, 3))
+        self.assertEqual(snapshot.status_xml, "<status-3/>")
+
+    async def test_cib_not_available(self):
+        self.watcher.start()
+        self.crm_mon_outputs = ["<status-1/>"]
+        self.change_cib(1, 1)
+        await self.wait_for_refresh()
+        self.assertTrue(self.snapshot_exists())
+
+        self.change_cib(2)
+        await self.wait_for_refresh()
+        self.assertIsNone(self.watcher.snapshot)
+        self.assertFalse(self.snapshot_exists())
+        self.assertEqual(self.crm_mon_calls, 1)
+
+    async def test_crm_mon_failed(self):
+        self.watcher.start()
+        self.crm_mon_outputs = ["<status-1/>", None]
+        self.change_cib(1, 1)
+        await self.wait_for_refresh()
+        self.change_cib(2, 2)
+        await self.wait_for_refresh()
+        self.assertIsNone(self.watcher.snapshot)
+        self.assertFalse(self.snapshot_exists())
+
+    async def test_unable_to_store(self):
+        self.path = os.path.join(self.tmp_dir.name, "missing", "status.json")
+        self.watcher = ClusterStatusWatcher(
+            self.logger, self.cib_watcher, self.path
+        )
+        self.watcher.start()
+        self.crm_mon_outputs = ["<status-1/>"]
+        self.change_cib(1, 1)
+        await self.wait_for_refresh()
+        self.logger.error.assert_called_once()
+        # the status is still available in pcsd
+        self.assertEqual(self.watcher.snapshot.status_xml, "<status-1/>")
+
+    async def test_stop(self):
+        self.watcher.start()
+        self.crm_mon_outputs = ["<status-1/>"]
+        self.change_cib(1, 1)
+        await self.wait_for_refresh()
+        self.watcher.stop()
+        self.assertFalse(self.snapshot_exists())
+        self.change_cib(2, 2)
+        await self.wait_for_refresh()
+        self.assertEqual(self.crm_mon_calls, 1)
@@ -49,3 +49,30 @@ class GetTicketNames(GetTicketNamesBase, TestCase):
             ["T1", "T2", "T3", "T-self-managed"],
             cib_commands.get_ticket_names(self.cib),
         )
+
+
+class SetTicketsStandby(GetTicketNamesBase, TestCase):
+    def test_success(self):
+        self.assertTrue(
+            cib_commands.set_tickets_standby(self.cib, ["T1", "T3", "T4"])
+        )
+        self.assertEqual(
+            ["T1", "T3"],
+            self.cib.xpath("status/tickets/ticket_state[@standby='true']/@id"),
+        )
+
+    def test_already_in_standby(self):
+        cib_commands.set_tickets_standby(self.cib, ["T1"])
+        self.assertFalse(cib_commands.set_tickets_standby(self.cib, ["T1"]))
+
+    def test_no_tickets(self):
+        self.assertFalse(cib_commands.set_tickets_standby(self.cib, []))
+
+
+class RemoveTicketStates(GetTicketNamesBase, TestCase):
+    def test_success(self):
+        cib_commands.remove_ticket_states(self.cib, ["T1", "T3", "T4"])
+        self.assertEqual(
+            ["T2", "T-self-managed"],
+            cib_commands.get_ticket_names(self.cib),
+        )
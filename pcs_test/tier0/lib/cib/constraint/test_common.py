@@ -4,7 +4,9 @@ from lxml import etree
 
 from pcs.common import const, reports
 from pcs.lib.cib.constraint.common import (
+    ConstraintSignatureIndex,
     DuplicatesChecker,
+    DuplicatesCheckerSetConstraint,
     create_constraint_with_set,
     find_constraints_of_same_type,
     is_constraint,
@@ -187,6 +189,80 @@ class DuplicatesCheckerTest(DuplicatesCheckerTestBase):
         self.assert_success(cib, checker, duplicates)
 
 
+class ConstraintSignatureIndexTest(TestCase):
+    class MockChecker(DuplicatesChecker):
+        def get_signatures(self, constraint_el):
+            return [int(constraint_el.attrib["id"][-1]) % 2]
+
+    def assert_duplicates(self, index, checker, constraint_el, expected_ids):
+        self.assertEqual(
+            [
+                el.attrib["id"]
+                for el in index.find_duplicates(checker, constraint_el)
+            ],
+            expected_ids,
+        )
+
+    def test_find_duplicates(self):
+        cib = fixture_cib()
+        index = ConstraintSignatureIndex(cib)
+        checker = self.MockChecker()
+        for type_id in ("LP", "LS", "CP", "CS", "OP", "OS", "TP", "TS"):
+            with self.subTest(constraint_type=type_id):
+                self.assert_duplicates(
+                    index,
+                    checker,
+                    cib.xpath(".//*[@id=$id]", id=f"{type_id}3")[0],
+                    [f"{type_id}1"],
+                )
+
+    def test_add(self):
+        cib = fixture_cib()
+        index = ConstraintSignatureIndex(cib)
+        checker = DuplicatesCheckerSetConstraint()
+        new_el = etree.fromstring(
+            """
+            <rsc_order id="OS4">
+                <resource_set>
+                    <resource_ref id="R2"/> <resource_ref id="R3"/>
+                </resource_set>
+            </rsc_order>
+            """
+        )
+        self.assert_duplicates(index, checker, new_el, ["OS2"])
+        cib.append(new_el)
+        index.add(new_el)
+        # adding an already indexed constraint does nothing
+        index.add(new_el)
+        self.assert_duplicates(
+            index,
+            checker,
+            cib.xpath(".//*[@id=$id]", id="OS2")[0],
+            ["OS4"],
+        )
+        self.assert_duplicates(index, checker, new_el, ["OS2"])
+
+    def test_add_before_index_built(self):
+        cib = fixture_cib()
+        index = ConstraintSignatureIndex(cib)
+        checker = DuplicatesCheckerSetConstraint()
+        new_el = etree.SubElement(cib, "rsc_colocation", id="CS4")
+        new_el.append(
+            etree.fromstring(
+                '<resource_set><resource_ref id="R1"/></resource_set>'
+            )
+        )
+        index.add(new_el)
+        new_el_2 = etree.fromstring(
+            """
+            <rsc_colocation id="CS5">
+                <resource_set><resource_ref id="R1"/></resource_set>
+            </rsc_colocation>
+            """
+        )
+        self.assert_duplicates(index, checker, new_el_2, ["CS4"])
+
+
 class ValidateConstrainableElement(TestCase):
     _cib = str_to_etree(
         """
@@ -10,6 +10,9 @@ from pcs.common.reports import codes as report_codes
 from pcs.lib.cib.constraint import colocation
 from pcs.lib.errors import LibraryError
 
+from pcs_test.tier0.lib.cib.constraint.test_common import (
+    DuplicatesCheckerTestBase,
+)
 from pcs_test.tools.assertions import assert_raise_library_error
 
 
@@ -97,3 +100,34 @@ class PrepareOptionsWithSetTest(TestCase):
                 },
             ),
         )
+
+
+class DuplicatesCheckerColocationPlainTest(DuplicatesCheckerTestBase):
+    cib = etree.fromstring(
+        """
+        <constraints>
+          <rsc_colocation id="C1" rsc="R1" with-rsc="R2" score="100" />
+          <rsc_colocation id="C2" rsc="R1" with-rsc="R2" score="-100"
+              rsc-role="Started"
+          />
+          <rsc_colocation id="C3" rsc="R2" with-rsc="R1" score="100" />
+          <rsc_colocation id="C4" rsc="R1" with-rsc="R2" score="100"
+              with-rsc-role="Master"
+          />
+          <rsc_colocation id="C5" rsc="R1" with-rsc="R2" score="100"
+              with-rsc-role="Promoted"
+          />
+        </constraints>
+        """
+    )
+
+    def test_success(self):
+        duplicates = {
+            "C1": ["C2"],  # started is the default role, score doesn't matter
+            "C2": ["C1"],
+            "C3": [],  # resources are swapped
+            "C4": ["C5"],  # legacy role matches its current name
+            "C5": ["C4"],
+        }
+        checker = colocation.DuplicatesCheckerColocationPlain()
+        self.assert_success(self.cib, checker, duplicates)
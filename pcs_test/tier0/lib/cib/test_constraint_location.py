@@ -138,6 +138,20 @@ class DuplicatesCheckerLocationRulePlainTest(DuplicatesCheckerTestBase):
               />
             </rule>
           </rsc_location>
+          <rsc_location id="L8" rsc="R1">
+            <rule id="L8-rule" boolean-op="and" score="0" role="Promoted">
+              <date_expression id="L8-rule-expr" operation="date_spec">
+                <date_spec id="L8-rule-expr-datespec" weekdays="1-5" />
+              </date_expression>
+            </rule>
+          </rsc_location>
+          <rsc_location id="L9" rsc="R1" role="Master">
+            <rule id="L9-rule" boolean-op="and" score="0">
+              <date_expression id="L9-rule-expr" operation="date_spec">
+                <date_spec id="L9-rule-expr-datespec" weekdays="1-5" />
+              </date_expression>
+            </rule>
+          </rsc_location>
         </constraints>
         """
     )
@@ -151,11 +165,171 @@ class DuplicatesCheckerLocationRulePlainTest(DuplicatesCheckerTestBase):
             "L5": [],  # rsc doesn't match, rule matches
             "L6": ["L7"],  # rsc-pattern matches, normalized rule matches
             "L7": ["L6"],  # rsc-pattern matches, normalized rule matches
+            # role doesn't match L2 and L4, the rule's and the constraint's
+            # roles match when normalized
+            "L8": ["L9"],
+            "L9": ["L8"],
         }
         checker = location.DuplicatesCheckerLocationRulePlain()
         self.assert_success(self.cib, checker, duplicates)
 
 
+class DuplicatesCheckerLocationPlainTest(DuplicatesCheckerTestBase):
+    cib = etree.fromstring(
+        """
+        <constraints>
+          <rsc_location id="L1" rsc="R1" node="node1" score="100" />
+          <rsc_location id="L2" rsc="R1" node="node1" score="-100" />
+          <rsc_location id="L3" rsc="R1" node="node2" score="100" />
+          <rsc_location id="L4" rsc="R2" node="node1" score="100" />
+          <rsc_location id="L5" rsc-pattern="R*" node="node1" score="100" />
+          <rsc_location id="L6" rsc="R1">
+            <rule id="L6-rule" boolean-op="and" score="0">
+              <expression id="L6-rule-expr"
+                  attribute="#uname" operation="eq" value="node1"
+              />
+            </rule>
+            <rule id="L6-rule-1" boolean-op="and" score="0">
+              <date_expression id="L6-rule-1-expr" operation="date_spec">
+                <date_spec id="L6-rule-1-expr-datespec" weekdays="1-5" />
+              </date_expression>
+            </rule>
+          </rsc_location>
+          <rsc_location id="L7" rsc="R1">
+            <rule id="L7-rule" boolean-op="and" score="0">
+              <expression id="L7-rule-expr"
+                  attribute="#uname" operation="eq" type="string" value="node1"
+              />
+            </rule>
+          </rsc_location>
+          <rsc_location id="L8" rsc="R2">
+            <rule id="L8-rule" boolean-op="and" score="0">
+              <expression id="L8-rule-expr"
+                  attribute="#uname" operation="eq" value="node1"
+              />
+            </rule>
+          </rsc_location>
+          <rsc_location id="L9" rsc="R1" node="node1" score="100"
+              role="Promoted"
+          />
+          <rsc_location id="L10" rsc="R1" node="node1" score="100"
+              role="Master"
+          />
+          <rsc_location id="L11" rsc="R1" role="Promoted">
+            <rule id="L11-rule" boolean-op="and" score="0">
+              <expression id="L11-rule-expr"
+                  attribute="#uname" operation="eq" value="node1"
+              />
+            </rule>
+          </rsc_location>
+          <rsc_location id="L12" rsc="R1">
+            <rule id="L12-rule" boolean-op="and" score="0" role="Promoted">
+              <expression id="L12-rule-expr"
+                  attribute="#uname" operation="eq" value="node1"
+              />
+            </rule>
+          </rsc_location>
+        </constraints>
+        """
+    )
+
+    def test_success(self):
+        duplicates = {
+            "L1": ["L2"],  # rsc and node match, score doesn't matter
+            "L2": ["L1"],
+            "L3": [],  # node doesn't match
+            "L4": [],  # rsc doesn't match
+            "L5": [],  # rsc-pattern is not rsc
+            "L6": ["L7"],  # rsc matches, one of the rules matches
+            "L7": ["L6"],  # node constraints are not duplicates of rules
+            "L8": [],  # rsc doesn't match
+            "L9": ["L10"],  # role doesn't match L1, legacy role name matches
+            "L10": ["L9"],
+            "L11": ["L12"],  # role doesn't match L6 and L7
+            "L12": ["L11"],  # a role of a rule overrides the constraint's role
+        }
+        checker = location.DuplicatesCheckerLocationPlain()
+        self.assert_success(self.cib, checker, duplicates)
+
+
+class DuplicatesCheckerLocationWithSetTest(DuplicatesCheckerTestBase):
+    cib = etree.fromstring(
+        """
+        <constraints>
+          <rsc_location id="L1" node="node1" score="100">
+            <resource_set id="L1-set">
+              <resource_ref id="R1" /><resource_ref id="R2" />
+            </resource_set>
+          </rsc_location>
+          <rsc_location id="L2" node="node1" score="-100">
+            <resource_set id="L2-set">
+              <resource_ref id="R1" /><resource_ref id="R2" />
+            </resource_set>
+          </rsc_location>
+          <rsc_location id="L3" node="node2" score="100">
+            <resource_set id="L3-set">
+              <resource_ref id="R1" /><resource_ref id="R2" />
+            </resource_set>
+          </rsc_location>
+          <rsc_location id="L4" node="node1" score="100" role="Promoted">
+            <resource_set id="L4-set">
+              <resource_ref id="R1" /><resource_ref id="R2" />
+            </resource_set>
+          </rsc_location>
+          <rsc_location id="L5" node="node1" score="100">
+            <resource_set id="L5-set">
+              <resource_ref id="R2" /><resource_ref id="R1" />
+            </resource_set>
+          </rsc_location>
+          <rsc_location id="L6">
+            <resource_set id="L6-set">
+              <resource_ref id="R1" /><resource_ref id="R2" />
+            </resource_set>
+            <rule id="L6-rule" boolean-op="and" score="0">
+              <expression id="L6-rule-expr"
+                  attribute="#uname" operation="eq" value="node1"
+              />
+            </rule>
+          </rsc_location>
+          <rsc_location id="L7">
+            <resource_set id="L7-set">
+              <resource_ref id="R1" /><resource_ref id="R2" />
+            </resource_set>
+            <rule id="L7-rule" boolean-op="and" score="0">
+              <expression id="L7-rule-expr"
+                  attribute="#uname" operation="eq" type="string" value="node1"
+              />
+            </rule>
+          </rsc_location>
+          <rsc_location id="L8">
+            <resource_set id="L8-set">
+              <resource_ref id="R1" /><resource_ref id="R2" />
+            </resource_set>
+            <rule id="L8-rule" boolean-op="and" score="0">
+              <expression id="L8-rule-expr"
+                  attribute="#uname" operation="eq" value="node2"
+              />
+            </rule>
+          </rsc_location>
+        </constraints>
+        """
+    )
+
+    def test_success(self):
+        duplicates = {
+            "L1": ["L2"],  # sets and node match, score doesn't matter
+            "L2": ["L1"],
+            "L3": [],  # node doesn't match
+            "L4": [],  # role doesn't match
+            "L5": [],  # sets don't match
+            "L6": ["L7"],  # sets and rules match
+            "L7": ["L6"],  # node constraints are not duplicates of rules
+            "L8": [],  # rule doesn't match
+        }
+        checker = location.DuplicatesCheckerLocationWithSet()
+        self.assert_success(self.cib, checker, duplicates)
+
+
 class ValidateCreatePlainWithRuleCommonMixin:
     def setUp(self):
         self.cib = etree.fromstring(
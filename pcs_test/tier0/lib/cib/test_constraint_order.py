@@ -11,6 +11,9 @@ from pcs.lib.cib.constraint import order
 from pcs.lib.errors import LibraryError
 from pcs.lib.pacemaker.values import BOOLEAN_VALUES
 
+from pcs_test.tier0.lib.cib.constraint.test_common import (
+    DuplicatesCheckerTestBase,
+)
 from pcs_test.tools.assertions import assert_raise_library_error
 
 
@@ -129,3 +132,28 @@ class PrepareOptionsWithSetTest(TestCase):
                 },
             ),
         )
+
+
+class DuplicatesCheckerOrderPlainTest(DuplicatesCheckerTestBase):
+    cib = etree.fromstring(
+        """
+        <constraints>
+          <rsc_order id="O1" first="R1" then="R2" />
+          <rsc_order id="O2" first="R1" then="R2" first-action="start"
+              then-action="start" kind="Optional"
+          />
+          <rsc_order id="O3" first="R2" then="R1" />
+          <rsc_order id="O4" first="R1" then="R2" first-action="promote" />
+        </constraints>
+        """
+    )
+
+    def test_success(self):
+        duplicates = {
+            "O1": ["O2"],  # start is the default action, options don't matter
+            "O2": ["O1"],
+            "O3": [],  # resources are swapped
+            "O4": [],  # action doesn't match
+        }
+        checker = order.DuplicatesCheckerOrderPlain()
+        self.assert_success(self.cib, checker, duplicates)
@@ -198,6 +198,68 @@ class UpdateNodeInstanceAttrs(TestCase):
         )
 
 
+@mock.patch("pcs.lib.cib.node._ensure_node_exists")
+class UpdateNodeUtilization(TestCase):
+    def setUp(self):
+        self.node1 = etree.fromstring('<node id="1" uname="rh73-node1"/>')
+        self.node2 = etree.fromstring(
+            """
+            <node id="2" uname="rh73-node2">
+                <utilization id="nodes-2-utilization">
+                    <nvpair id="nodes-2-utilization-cpu" name="cpu" value="2"/>
+                    <nvpair id="nodes-2-utilization-ram" name="ram" value="8"/>
+                </utilization>
+            </node>
+        """
+        )
+        self.cib = etree.fromstring(
+            UpdateNodeInstanceAttrs.compile_cib(self.node1, self.node2)
+        )
+        self.id_provider = IdProvider(self.cib)
+
+    def test_empty_node(self, mock_get_node):
+        mock_get_node.return_value = self.node1
+        node.update_node_utilization(
+            self.cib, self.id_provider, "rh73-node1", {"cpu": "4"}
+        )
+        assert_xml_equal(
+            etree_to_str(self.node1),
+            """
+                <node id="1" uname="rh73-node1">
+                    <utilization id="nodes-1-utilization">
+                        <nvpair id="nodes-1-utilization-cpu"
+                            name="cpu" value="4"
+                        />
+                    </utilization>
+                </node>
+            """,
+        )
+
+    def test_existing_attrs(self, mock_get_node):
+        mock_get_node.return_value = self.node2
+        node.update_node_utilization(
+            self.cib,
+            self.id_provider,
+            "rh73-node2",
+            {"cpu": "", "ram": "16", "disk": "100"},
+        )
+        assert_xml_equal(
+            etree_to_str(self.node2),
+            """
+                <node id="2" uname="rh73-node2">
+                    <utilization id="nodes-2-utilization">
+                        <nvpair id="nodes-2-utilization-ram"
+                            name="ram" value="16"
+                        />
+                        <nvpair id="nodes-2-utilization-disk"
+                            name="disk" value="100"
+                        />
+                    </utilization>
+                </node>
+            """,
+        )
+
+
 class EnsureNodeExists(TestCase):
     # pylint: disable=protected-access
     def setUp(self):
@@ -1056,6 +1056,49 @@ class GetElementsById(TestCase):
         self.assert_result([], ["RX1"])
 
 
+class GetConfigurationIdMap(TestCase):
+    def test_success(self):
+        cib = etree.fromstring(
+            """
+            <cib>
+                <configuration>
+                    <resources>
+                        <primitive id="R1">
+                            <meta_attributes id="R1-meta">
+                                <nvpair id="R1-meta-remote" name="remote-node"
+                                    value="node-R1"
+                                />
+                            </meta_attributes>
+                        </primitive>
+                        <primitive id="R2" />
+                    </resources>
+                    <tags>
+                        <tag id="T">
+                            <obj_ref id="RX1" />
+                        </tag>
+                    </tags>
+                </configuration>
+                <status>
+                    <lrm_resource id="R3" />
+                </status>
+            </cib>
+            """
+        )
+        id_map = lib.get_configuration_id_map(cib.find(".//tags"))
+        self.assertEqual(
+            {element_id: el.tag for element_id, el in id_map.items()},
+            {
+                "R1": "primitive",
+                "R1-meta": "meta_attributes",
+                "R1-meta-remote": "nvpair",
+                "node-R1": "primitive",
+                "R2": "primitive",
+                "T": "tag",
+            },
+        )
+        self.assertIs(id_map["node-R1"], id_map["R1"])
+
+
 def _configuration_fixture(configuration_content):
     return f"""
     <cib>
@@ -1,5 +1,9 @@
 from textwrap import dedent
 
+from pcs_test.tools.command_env.mock_node_communicator import (
+    place_requests,
+    place_responses,
+)
 from pcs_test.tools.misc import outdent
 
 QDEVICE_HOST = "qdevice.host"
@@ -127,3 +131,52 @@ def fixture_totem(
         crypto_options=options_fixture(crypto_options, prefix="crypto_"),
         totem_options=options_fixture(totem_options),
     )
+
+
+def pipeline_calls_fixture(config, call_name_list, before):
+    """
+    Rearrange communication calls to the order they are done in by a node
+    pipeline
+
+    list call_name_list -- names of calls of the pipeline phases
+    string before -- name of a call to place the pipeline calls before
+    """
+    request_lists = []
+    response_lists = []
+    for name in call_name_list:
+        request_lists.append(config.calls.get(f"{name}_requests").request_list)
+        response_lists.append(
+            config.calls.get(f"{name}_responses").response_list
+        )
+        config.calls.remove(f"{name}_requests")
+        config.calls.remove(f"{name}_responses")
+
+    failed_nodes = set()
+    response_list = []
+    next_request_list = []
+    for phase_index, phase_response_list in enumerate(response_lists):
+        for response in phase_response_list:
+            label = response.request.target.label
+            if label in failed_nodes:
+                continue
+            response_list.append(response)
+            if not response.was_connected or response.response_code != 200:
+                failed_nodes.add(label)
+                continue
+            if phase_index + 1 < len(request_lists):
+                next_request_list.extend(
+                    request
+                    for request in request_lists[phase_index + 1]
+                    if request.target.label == label
+                )
+
+    place_requests(
+        config.calls, "pipeline_requests", request_lists[0], before=before
+    )
+    place_responses(
+        config.calls, "pipeline_responses", response_list, before=before
+    )
+    for index, request in enumerate(next_request_list):
+        place_requests(
+            config.calls, f"pipeline_requests_{index}", [request], before=before
+        )
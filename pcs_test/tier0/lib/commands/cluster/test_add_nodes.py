@@ -24,6 +24,7 @@ from .common import (
     corosync_node_fixture,
     get_two_node,
     node_fixture,
+    pipeline_calls_fixture,
 )
 
 
@@ -743,6 +744,41 @@ class AddNodesSuccessMinimal(TestCase):
     def test_minimal_3_existing_3_new(self):
         self._test_minimal(3, 3)
 
+    @mock.patch("pcs.lib.communication.tools.time.monotonic", lambda: 10.0)
+    def test_pipeline(self):
+        self.set_up(2, 3)
+        pipeline_calls_fixture(
+            self.config,
+            [
+                "http.host.cluster_destroy",
+                "http.host.update_known_hosts",
+                "local.disable_sbd.http.sbd.disable_sbd",
+            ],
+            before="fs.isdir",
+        )
+
+        cluster.add_nodes(
+            self.env_assist.get_env(),
+            [{"name": node} for node in self.new_nodes],
+            pipeline=True,
+        )
+
+        self.env_assist.assert_reports(
+            self.expected_reports
+            + [
+                fixture.info(
+                    reports.codes.NODE_PHASE_DURATIONS,
+                    node=node,
+                    phase_durations={
+                        "destroy": 0.0,
+                        "known hosts": 0.0,
+                        "sbd service": 0.0,
+                    },
+                )
+                for node in self.new_nodes
+            ]
+        )
+
     def _test_enable(self, existing, new):
         self.set_up(existing, new)
         self.config.http.host.enable_cluster(
@@ -485,7 +485,9 @@ class UpdateConfigLocal(TestCase):
         self.env_assist.assert_reports(
             [
                 fixture.error(
-                    report_codes.PARSE_ERROR_COROSYNC_CONF_LINE_IS_NOT_SECTION_NOR_KEY_VALUE
+                    report_codes.PARSE_ERROR_COROSYNC_CONF_LINE_IS_NOT_SECTION_NOR_KEY_VALUE,
+                    line_number=1,
+                    column_number=1,
                 )
             ],
         )
@@ -57,6 +57,8 @@ class SetCorosyncConfParseError(TestCase):
             [
                 fixture.error(
                     reports.codes.PARSE_ERROR_COROSYNC_CONF_MISSING_CLOSING_BRACE,
+                    line_number=1,
+                    column_number=7,
                 ),
             ]
         )
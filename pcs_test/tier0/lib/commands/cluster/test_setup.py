@@ -19,7 +19,7 @@ from pcs_test.tools.command_env.mock_node_communicator import (
 )
 from pcs_test.tools.custom_mock import patch_getaddrinfo
 
-from .common import CLUSTER_NAME, CLUSTER_UUID
+from .common import CLUSTER_NAME, CLUSTER_UUID, pipeline_calls_fixture
 
 PCSD_SSL_KEY = generate_key()
 PCSD_SSL_CERT = generate_cert(PCSD_SSL_KEY, "servername")
@@ -637,6 +637,173 @@ class SetupSuccessNoClusterUuid(TestCase):
         self.env_assist.assert_reports(reports_success_minimal_fixture())
 
 
+@mock.patch(
+    "pcs.lib.commands.cluster.setup_cluster.generate_uuid", lambda: CLUSTER_UUID
+)
+@mock.patch(
+    "pcs.lib.commands.cluster.setup_cluster.generate_binary_key",
+    lambda random_bytes_count: RANDOM_KEY,
+)
+@mock.patch("pcs.lib.communication.tools.time.monotonic", lambda: 10.0)
+class SetupPipeline(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(self)
+        self.config.env.set_known_nodes(NODE_LIST)
+        patch_getaddrinfo(self, NODE_LIST)
+        self.phase_call_list = [
+            "http.host.cluster_destroy",
+            "http.host.update_known_hosts",
+            "http.files.remove_files",
+            "http.files.put_files",
+        ]
+
+    @staticmethod
+    def _durations_reports(phase_dict):
+        return [
+            fixture.info(
+                reports.codes.NODE_PHASE_DURATIONS,
+                node=node,
+                phase_durations=dict.fromkeys(phase_list, 0.0),
+            )
+            for node, phase_list in phase_dict.items()
+        ]
+
+    def test_success(self):
+        config_success_minimal_fixture(
+            self.config,
+            corosync_conf=corosync_conf_fixture(COROSYNC_NODE_LIST),
+        )
+        pipeline_calls_fixture(
+            self.config,
+            self.phase_call_list,
+            before="distribute_corosync_conf_requests",
+        )
+
+        cluster.setup(
+            self.env_assist.get_env(),
+            CLUSTER_NAME,
+            COMMAND_NODE_LIST,
+            pipeline=True,
+        )
+
+        self.env_assist.assert_reports(
+            reports_success_minimal_fixture()
+            + self._durations_reports(
+                {
+                    node: [
+                        "destroy",
+                        "known hosts",
+                        "pcsd settings",
+                        "authkeys",
+                    ]
+                    for node in NODE_LIST
+                }
+            )
+        )
+
+    def test_node_failure_stops_node_only(self):
+        config_success_minimal_fixture(
+            self.config,
+            corosync_conf=corosync_conf_fixture(COROSYNC_NODE_LIST),
+        )
+        self.config.calls.get(
+            "http.host.cluster_destroy_responses"
+        ).response_list = create_communication(
+            [
+                {"label": "node1"},
+                {"label": "node2", "response_code": 400, "output": REASON},
+                {"label": "node3"},
+            ],
+            action="remote/cluster_destroy",
+        )[1]
+        self.config.calls.remove("distribute_corosync_conf_requests")
+        self.config.calls.remove("distribute_corosync_conf_responses")
+        pipeline_calls_fixture(self.config, self.phase_call_list, before=None)
+        nodes_success = ["node1", "node3"]
+
+        self.env_assist.assert_raise_library_error(
+            lambda: cluster.setup(
+                self.env_assist.get_env(),
+                CLUSTER_NAME,
+                COMMAND_NODE_LIST,
+                pipeline=True,
+            ),
+            [],
+        )
+
+        self.env_assist.assert_reports(
+            [
+                fixture.info(
+                    reports.codes.USING_DEFAULT_ADDRESS_FOR_HOST,
+                    host_name=node,
+                    address=node,
+                    address_source=reports.const.DEFAULT_ADDRESS_SOURCE_KNOWN_HOSTS,
+                )
+                for node in NODE_LIST
+            ]
+            + [
+                fixture.info(
+                    reports.codes.CLUSTER_DESTROY_STARTED,
+                    host_name_list=NODE_LIST,
+                ),
+                fixture.error(
+                    reports.codes.NODE_COMMUNICATION_COMMAND_UNSUCCESSFUL,
+                    node="node2",
+                    command="remote/cluster_destroy",
+                    reason=REASON,
+                ),
+                fixture.info(
+                    reports.codes.FILES_REMOVE_FROM_NODES_STARTED,
+                    file_list=["pcsd settings"],
+                    node_list=NODE_LIST,
+                ),
+                fixture.info(
+                    reports.codes.FILES_DISTRIBUTION_STARTED,
+                    file_list=["corosync authkey", "pacemaker authkey"],
+                    node_list=NODE_LIST,
+                ),
+            ]
+            + [
+                fixture.info(reports.codes.CLUSTER_DESTROY_SUCCESS, node=node)
+                for node in nodes_success
+            ]
+            + [
+                fixture.info(
+                    reports.codes.FILE_REMOVE_FROM_NODE_SUCCESS,
+                    node=node,
+                    file_description="pcsd settings",
+                )
+                for node in nodes_success
+            ]
+            + [
+                fixture.info(
+                    reports.codes.FILE_DISTRIBUTION_SUCCESS,
+                    node=node,
+                    file_description=file,
+                )
+                for node in nodes_success
+                for file in ["corosync authkey", "pacemaker authkey"]
+            ]
+            + self._durations_reports(
+                {
+                    "node1": [
+                        "destroy",
+                        "known hosts",
+                        "pcsd settings",
+                        "authkeys",
+                    ],
+                    "node2": ["destroy"],
+                    "node3": [
+                        "destroy",
+                        "known hosts",
+                        "pcsd settings",
+                        "authkeys",
+                    ],
+                }
+            )
+        )
+
+
 @mock.patch(
     "pcs.lib.commands.cluster.setup_cluster.generate_uuid", lambda: CLUSTER_UUID
 )
@@ -0,0 +1,354 @@
+from unittest import TestCase
+
+from lxml import etree
+
+from pcs.common import reports
+from pcs.common.tools import xml_fromstring
+from pcs.lib.commands.constraint import common as constraint_command
+
+from pcs_test.tools import fixture
+from pcs_test.tools.command_env import get_env_tools
+
+RESOURCES = """
+    <resources>
+        <primitive id="R1" class="ocf" provider="pacemaker" type="Dummy"/>
+        <primitive id="R2" class="ocf" provider="pacemaker" type="Dummy"/>
+        <primitive id="R3" class="ocf" provider="pacemaker" type="Dummy"/>
+        <clone id="C">
+            <primitive id="CR" class="ocf" provider="pacemaker" type="Dummy"/>
+        </clone>
+    </resources>
+"""
+
+CONSTRAINTS = """
+    <constraints>
+        <rsc_location id="L1" rsc="R1" node="node1" score="100"/>
+        <rsc_order id="O1" first="R1" then="R2"/>
+    </constraints>
+"""
+
+
+class ImportConstraints(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(test_case=self)
+
+    def _load_cib(self):
+        self.config.runner.cib.load(
+            filename="cib-empty-3.7.xml",
+            resources=RESOURCES,
+            constraints=CONSTRAINTS,
+        )
+
+    def _import(self, constraints_xml, force_flags=()):
+        constraint_command.import_constraints(
+            self.env_assist.get_env(), constraints_xml, force_flags=force_flags
+        )
+
+    def test_success(self):
+        self._load_cib()
+        self.config.env.push_cib(
+            constraints="""
+                <constraints>
+                    <rsc_location id="L1" rsc="R1" node="node1" score="100"/>
+                    <rsc_order id="O1" first="R1" then="R2"/>
+                    <rsc_location id="L2" rsc="R1" node="node2" score="100"/>
+                    <rsc_colocation id="C1" rsc="R1" with-rsc="R2"
+                        score="INFINITY"
+                    />
+                    <rsc_order id="O2" first="R2" then="R3"/>
+                    <rsc_ticket id="T1" ticket="T" rsc="R3"/>
+                    <rsc_colocation id="CS1" score="INFINITY">
+                        <resource_set id="CS1-set">
+                            <resource_ref id="R1"/>
+                            <resource_ref id="R2"/>
+                        </resource_set>
+                    </rsc_colocation>
+                </constraints>
+            """
+        )
+        self._import(
+            """
+            <constraints>
+                <rsc_location id="L2" rsc="R1" node="node2" score="100"/>
+                <rsc_colocation id="C1" rsc="R1" with-rsc="R2"
+                    score="INFINITY"
+                />
+                <rsc_order id="O2" first="R2" then="R3"/>
+                <rsc_ticket id="T1" ticket="T" rsc="R3"/>
+                <rsc_colocation id="CS1" score="INFINITY">
+                    <resource_set id="CS1-set">
+                        <resource_ref id="R1"/>
+                        <resource_ref id="R2"/>
+                    </resource_set>
+                </rsc_colocation>
+            </constraints>
+            """
+        )
+
+    def test_options_not_validated(self):
+        # options are left for pacemaker to validate when the CIB is pushed
+        self._load_cib()
+        self.config.env.push_cib(
+            constraints="""
+                <constraints>
+                    <rsc_location id="L1" rsc="R1" node="node1" score="100"/>
+                    <rsc_order id="O1" first="R1" then="R2"/>
+                    <rsc_location id="L2" rsc="R1" node="node2" score="high"
+                        role="Leader"
+                    />
+                </constraints>
+            """
+        )
+        self._import(
+            """
+            <constraints>
+                <rsc_location id="L2" rsc="R1" node="node2" score="high"
+                    role="Leader"
+                />
+            </constraints>
+            """
+        )
+
+    def test_xml_syntax_error(self):
+        # the message comes from libxml2 and differs between its versions
+        with self.assertRaises(etree.XMLSyntaxError) as cm:
+            xml_fromstring("<constraints>")
+        self.env_assist.assert_raise_library_error(
+            lambda: self._import("<constraints>"),
+            [
+                fixture.error(
+                    reports.codes.CONSTRAINT_IMPORT_XML_SYNTAX_ERROR,
+                    reason=str(cm.exception),
+                )
+            ],
+            expected_in_processor=False,
+        )
+
+    def test_unexpected_root(self):
+        self.env_assist.assert_raise_library_error(
+            lambda: self._import("<resources/>"),
+            [
+                fixture.error(
+                    reports.codes.CONSTRAINT_IMPORT_UNEXPECTED_ELEMENT,
+                    element_tag="resources",
+                    expected_tags=["constraints"],
+                )
+            ],
+            expected_in_processor=False,
+        )
+
+    def test_invalid_constraints(self):
+        self._load_cib()
+        self.env_assist.assert_raise_library_error(
+            lambda: self._import(
+                """
+                <constraints>
+                    <primitive id="R4"/>
+                    <rsc_order first="R2" then="R3"/>
+                    <rsc_order id="O1" first="R3" then="R1"/>
+                    <rsc_colocation id="C1" rsc="R1" with-rsc="RX"/>
+                    <rsc_ticket id="C1" ticket="T">
+                        <resource_set id="R2">
+                            <resource_ref id="R1"/>
+                        </resource_set>
+                    </rsc_ticket>
+                </constraints>
+                """
+            )
+        )
+        self.env_assist.assert_reports(
+            [
+                fixture.error(
+                    reports.codes.CONSTRAINT_IMPORT_UNEXPECTED_ELEMENT,
+                    element_tag="primitive",
+                    expected_tags=[
+                        "rsc_colocation",
+                        "rsc_location",
+                        "rsc_order",
+                        "rsc_ticket",
+                    ],
+                ),
+                fixture.error(
+                    reports.codes.REQUIRED_OPTIONS_ARE_MISSING,
+                    option_names=["id"],
+                    option_type="rsc_order",
+                ),
+                fixture.error(reports.codes.ID_ALREADY_EXISTS, id="O1"),
+                fixture.error(
+                    reports.codes.ID_NOT_FOUND,
+                    id="RX",
+                    expected_types=[],
+                    context_type="",
+                    context_id="",
+                ),
+                fixture.error(reports.codes.ID_ALREADY_EXISTS, id="C1"),
+                fixture.error(reports.codes.ID_ALREADY_EXISTS, id="R2"),
+            ]
+        )
+
+    def test_duplicates(self):
+        self._load_cib()
+        self.env_assist.assert_raise_library_error(
+            lambda: self._import(
+                """
+                <constraints>
+                    <rsc_location id="L2" rsc="R1" node="node1" score="-10"/>
+                    <rsc_order id="O2" first="R2" then="R3"/>
+                    <rsc_order id="O3" first="R2" then="R3"
+                        first-action="start"
+                    />
+                </constraints>
+                """
+            )
+        )
+        self.env_assist.assert_reports(
+            [
+                fixture.error(
+                    reports.codes.CONSTRAINT_IMPORT_DUPLICATE,
+                    force_code=reports.codes.FORCE,
+                    constraint_id="L2",
+                    duplicate_ids=["L1"],
+                ),
+                fixture.error(
+                    reports.codes.CONSTRAINT_IMPORT_DUPLICATE,
+                    force_code=reports.codes.FORCE,
+                    constraint_id="O3",
+                    duplicate_ids=["O2"],
+                ),
+            ]
+        )
+
+    def test_location_differing_in_node_or_role(self):
+        self._load_cib()
+        location_set = """
+            <rsc_location id="{id}" node="{node}" score="100"{role}>
+                <resource_set id="{id}-set">
+                    <resource_ref id="R1"/>
+                    <resource_ref id="R2"/>
+                </resource_set>
+            </rsc_location>
+        """
+        imported = "".join(
+            [
+                location_set.format(id="LS1", node="node1", role=""),
+                location_set.format(id="LS2", node="node2", role=""),
+                location_set.format(
+                    id="LS3", node="node1", role=' role="Promoted"'
+                ),
+            ]
+        )
+        self.config.env.push_cib(
+            constraints=f"""
+                <constraints>
+                    <rsc_location id="L1" rsc="R1" node="node1" score="100"/>
+                    <rsc_order id="O1" first="R1" then="R2"/>
+                    <rsc_location id="L2" rsc="R1" node="node1" score="100"
+                        role="Promoted"
+                    />
+                    {imported}
+                </constraints>
+            """
+        )
+        self._import(
+            f"""
+            <constraints>
+                <rsc_location id="L2" rsc="R1" node="node1" score="100"
+                    role="Promoted"
+                />
+                {imported}
+            </constraints>
+            """
+        )
+
+    def test_duplicates_forced(self):
+        self._load_cib()
+        self.config.env.push_cib(
+            constraints="""
+                <constraints>
+                    <rsc_location id="L1" rsc="R1" node="node1" score="100"/>
+                    <rsc_order id="O1" first="R1" then="R2"/>
+                    <rsc_location id="L2" rsc="R1" node="node1" score="-10"/>
+                    <rsc_order id="O2" first="R1" then="R2"
+                        first-action="start"
+                    />
+                </constraints>
+            """
+        )
+        self._import(
+            """
+            <constraints>
+                <rsc_location id="L2" rsc="R1" node="node1" score="-10"/>
+                <rsc_order id="O2" first="R1" then="R2"
+                    first-action="start"
+                />
+            </constraints>
+            """,
+            force_flags=[reports.codes.FORCE],
+        )
+        self.env_assist.assert_reports(
+            [
+                fixture.warn(
+                    reports.codes.CONSTRAINT_IMPORT_DUPLICATE,
+                    constraint_id="L2",
+                    duplicate_ids=["L1"],
+                ),
+                fixture.warn(
+                    reports.codes.CONSTRAINT_IMPORT_DUPLICATE,
+                    constraint_id="O2",
+                    duplicate_ids=["O1"],
+                ),
+            ]
+        )
+
+    def test_multiinstance_resource(self):
+        self._load_cib()
+        self.env_assist.assert_raise_library_error(
+            lambda: self._import(
+                """
+                <constraints>
+                    <rsc_order id="O2" first="CR" then="R3"/>
+                </constraints>
+                """
+            )
+        )
+        self.env_assist.assert_reports(
+            [
+                fixture.error(
+                    reports.codes.RESOURCE_FOR_CONSTRAINT_IS_MULTIINSTANCE,
+                    force_code=reports.codes.FORCE,
+                    resource_id="CR",
+                    parent_type="clone",
+                    parent_id="C",
+                ),
+            ]
+        )
+
+    def test_multiinstance_resource_forced(self):
+        self._load_cib()
+        self.config.env.push_cib(
+            constraints="""
+                <constraints>
+                    <rsc_location id="L1" rsc="R1" node="node1" score="100"/>
+                    <rsc_order id="O1" first="R1" then="R2"/>
+                    <rsc_order id="O2" first="CR" then="R3"/>
+                </constraints>
+            """
+        )
+        self._import(
+            """
+            <constraints>
+                <rsc_order id="O2" first="CR" then="R3"/>
+            </constraints>
+            """,
+            force_flags=[reports.codes.FORCE],
+        )
+        self.env_assist.assert_reports(
+            [
+                fixture.warn(
+                    reports.codes.RESOURCE_FOR_CONSTRAINT_IS_MULTIINSTANCE,
+                    resource_id="CR",
+                    parent_type="clone",
+                    parent_id="C",
+                ),
+            ]
+        )
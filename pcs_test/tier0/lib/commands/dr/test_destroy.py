@@ -225,7 +225,9 @@ class FatalConfigIssue(FixtureMixin, TestCase):
         self.env_assist.assert_reports(
             [
                 fixture.error(
-                    report_codes.PARSE_ERROR_COROSYNC_CONF_LINE_IS_NOT_SECTION_NOR_KEY_VALUE
+                    report_codes.PARSE_ERROR_COROSYNC_CONF_LINE_IS_NOT_SECTION_NOR_KEY_VALUE,
+                    line_number=2,
+                    column_number=3,
                 ),
             ]
         )
@@ -1,5 +1,6 @@
 # pylint: disable=too-many-lines
 import base64
+import json
 import os
 from textwrap import dedent
 from unittest import TestCase, mock
@@ -13,9 +14,11 @@ from pcs.common.booth_dto import (
 from pcs.common.file import RawFileError
 from pcs.lib.booth import constants
 from pcs.lib.commands import booth as commands
+from pcs.lib.errors import LibraryError
 
 from pcs_test.tools import fixture
 from pcs_test.tools.command_env import get_env_tools
+from pcs_test.tools.fixture_cib import modify_cib
 from pcs_test.tools.misc import get_test_resource as rc
 from pcs_test.tools.xml import XmlManipulation
 
@@ -31,6 +34,32 @@ def fixture_report_invalid_name(name):
     )
 
 
+def fixture_tickets_standby(ticket_names):
+    def _standby(cib_tree):
+        for ticket_state in cib_tree.xpath("status/tickets/ticket_state"):
+            if ticket_state.get("id") in ticket_names:
+                ticket_state.set("standby", "true")
+
+    return _standby
+
+
+def fixture_tickets_cleanup(config, ticket_names):
+    standby = fixture_tickets_standby(ticket_names)
+    config.env.push_cib(name="env.push_cib.standby", modifiers=[standby])
+    config.runner.cib.load_content(
+        modify_cib(config.calls.get("runner.cib.load").stdout, [standby]),
+        name="runner.cib.load.standby",
+    )
+    config.env.push_cib(
+        name="env.push_cib.cleanup",
+        load_key="runner.cib.load.standby",
+        remove=[
+            f"./status/tickets/ticket_state[@id='{ticket}']"
+            for ticket in ticket_names
+        ],
+    )
+
+
 class FixtureMixin:
     booth_dir = settings.booth_config_dir
     site_ip = "192.168.122.254"
@@ -2907,6 +2936,7 @@ class ConfigSyncTest(TestCase, FixtureMixin):
             self.fixture_key_path(instance_name)
         )
         self.fixture_config_read_success(instance_name=instance_name)
+        self.fixture_get_config_missing(instance_name=instance_name)
         self.config.http.booth.send_config(
             instance_name,
             config_content.decode("utf-8"),
@@ -2915,6 +2945,17 @@ class ConfigSyncTest(TestCase, FixtureMixin):
             node_labels=self.node_list,
         )
 
+    def fixture_get_config_missing(
+        self, node_labels=None, instance_name="booth"
+    ):
+        self.config.http.booth.get_config(
+            instance_name,
+            communication_list=[
+                dict(label=node, response_code=400, output=self.reason)
+                for node in (node_labels or self.node_list)
+            ],
+        )
+
     def fixture_config_read_success(self, instance_name="booth"):
         config_content = self.fixture_cfg_content(
             self.fixture_key_path(instance_name)
@@ -2972,6 +3013,125 @@ class ConfigSyncTest(TestCase, FixtureMixin):
             self.fixture_reports_success(instance_name=instance_name)
         )
 
+    def test_skip_up_to_date_nodes(self):
+        self.fixture_config_read_success()
+        self.config.http.booth.get_config(
+            "booth",
+            config_data=self.fixture_cfg_content().decode("utf-8"),
+            authfile=os.path.basename(self.fixture_key_path()),
+            authfile_data=RANDOM_KEY,
+            communication_list=[
+                dict(label=self.node_list[0]),
+                dict(
+                    label=self.node_list[1],
+                    output=json.dumps(
+                        {
+                            "config": {
+                                "data": self.fixture_cfg_content(
+                                    ticket_list=[["T1", []]]
+                                ).decode("utf-8"),
+                            },
+                            "authfile": {
+                                "name": os.path.basename(
+                                    self.fixture_key_path()
+                                ),
+                                "data": base64.b64encode(RANDOM_KEY).decode(
+                                    "utf-8"
+                                ),
+                            },
+                        }
+                    ),
+                ),
+            ],
+        )
+        self.config.http.booth.send_config(
+            "booth",
+            self.fixture_cfg_content().decode("utf-8"),
+            authfile=os.path.basename(self.fixture_key_path()),
+            authfile_data=RANDOM_KEY,
+            node_labels=self.node_list[1:],
+        )
+
+        commands.config_sync(self.env_assist.get_env())
+        self.env_assist.assert_reports(
+            [
+                fixture.info(
+                    reports.codes.BOOTH_CONFIG_UP_TO_DATE_ON_NODES,
+                    node_list=self.node_list[:1],
+                    name="booth",
+                ),
+                fixture.info(reports.codes.BOOTH_CONFIG_DISTRIBUTION_STARTED),
+                fixture.info(
+                    reports.codes.BOOTH_CONFIG_ACCEPTED_BY_NODE,
+                    node=self.node_list[1],
+                    name_list=["booth"],
+                ),
+            ]
+        )
+
+    def test_all_nodes_up_to_date(self):
+        self.fixture_config_read_success()
+        self.config.http.booth.get_config(
+            "booth",
+            config_data=self.fixture_cfg_content().decode("utf-8"),
+            authfile=os.path.basename(self.fixture_key_path()),
+            authfile_data=RANDOM_KEY,
+            node_labels=self.node_list,
+        )
+
+        commands.config_sync(self.env_assist.get_env())
+        self.env_assist.assert_reports(
+            [
+                fixture.info(
+                    reports.codes.BOOTH_CONFIG_UP_TO_DATE_ON_NODES,
+                    node_list=self.node_list,
+                    name="booth",
+                ),
+            ]
+        )
+
+    def test_node_authfile_differs(self):
+        self.fixture_config_read_success()
+        self.config.http.booth.get_config(
+            "booth",
+            config_data=self.fixture_cfg_content().decode("utf-8"),
+            authfile=os.path.basename(self.fixture_key_path()),
+            authfile_data=b"another key",
+            node_labels=self.node_list,
+        )
+        self.config.http.booth.send_config(
+            "booth",
+            self.fixture_cfg_content().decode("utf-8"),
+            authfile=os.path.basename(self.fixture_key_path()),
+            authfile_data=RANDOM_KEY,
+            node_labels=self.node_list,
+        )
+
+        commands.config_sync(self.env_assist.get_env())
+        self.env_assist.assert_reports(self.fixture_reports_success())
+
+    def test_node_config_differs_in_comments(self):
+        self.fixture_config_read_success()
+        self.config.http.booth.get_config(
+            "booth",
+            config_data=(
+                "# a comment\n" + self.fixture_cfg_content().decode("utf-8")
+            ),
+            authfile=os.path.basename(self.fixture_key_path()),
+            authfile_data=RANDOM_KEY,
+            node_labels=self.node_list,
+        )
+        self.config.http.booth.send_config(
+            "booth",
+            self.fixture_cfg_content().decode("utf-8"),
+            authfile=os.path.basename(self.fixture_key_path()),
+            authfile_data=RANDOM_KEY,
+            node_labels=self.node_list,
+        )
+
+        commands.config_sync(self.env_assist.get_env())
+        self.env_assist.assert_reports(self.fixture_reports_success())
+
     def test_not_live_cib(self):
         self.config.env.set_cib_data("<cib/>")
         self.env_assist.assert_raise_library_error(
@@ -2997,6 +3157,7 @@ class ConfigSyncTest(TestCase, FixtureMixin):
             }
         )
         self.config.corosync_conf.load(node_name_list=self.node_list)
+        self.fixture_get_config_missing(instance_name=instance_name)
         self.config.http.booth.send_config(
             instance_name,
             config_data.decode("utf-8"),
@@ -3027,6 +3188,7 @@ class ConfigSyncTest(TestCase, FixtureMixin):
             filename="corosync-some-node-names.conf",
             instead="corosync_conf.load",
         )
+        self.fixture_get_config_missing(nodes)
         self.config.http.booth.send_config(
             "booth",
             self.fixture_cfg_content().decode("utf-8"),
@@ -3074,6 +3236,7 @@ class ConfigSyncTest(TestCase, FixtureMixin):
 
     def test_node_failure(self):
         self.fixture_config_read_success()
+        self.fixture_get_config_missing()
         self.config.http.booth.send_config(
             "booth",
             self.fixture_cfg_content().decode("utf-8"),
@@ -3113,6 +3276,7 @@ class ConfigSyncTest(TestCase, FixtureMixin):
 
     def test_node_failure_skip_offline(self):
         self.fixture_config_read_success()
+        self.fixture_get_config_missing()
         self.config.http.booth.send_config(
             "booth",
             self.fixture_cfg_content().decode("utf-8"),
@@ -3150,6 +3314,7 @@ class ConfigSyncTest(TestCase, FixtureMixin):
 
     def test_node_offline(self):
         self.fixture_config_read_success()
+        self.fixture_get_config_missing()
         self.config.http.booth.send_config(
             "booth",
             self.fixture_cfg_content().decode("utf-8"),
@@ -3191,11 +3356,8 @@ class ConfigSyncTest(TestCase, FixtureMixin):
 
     def test_node_offline_skip_offline(self):
         self.fixture_config_read_success()
-        self.config.http.booth.send_config(
+        self.config.http.booth.get_config(
             "booth",
-            self.fixture_cfg_content().decode("utf-8"),
-            authfile=os.path.basename(self.fixture_key_path()),
-            authfile_data=RANDOM_KEY,
             communication_list=[
                 dict(
                     label=self.node_list[0],
@@ -3205,25 +3367,62 @@ class ConfigSyncTest(TestCase, FixtureMixin):
                 ),
                 dict(
                     label=self.node_list[1],
+                    response_code=400,
+                    output=self.reason,
                 ),
             ],
         )
+        self.config.http.booth.send_config(
+            "booth",
+            self.fixture_cfg_content().decode("utf-8"),
+            authfile=os.path.basename(self.fixture_key_path()),
+            authfile_data=RANDOM_KEY,
+            node_labels=self.node_list[1:],
+        )
 
         commands.config_sync(self.env_assist.get_env(), skip_offline_nodes=True)
         self.env_assist.assert_reports(
             [
+                fixture.warn(
+                    reports.codes.NODE_COMMUNICATION_ERROR_UNABLE_TO_CONNECT,
+                    node=self.node_list[0],
+                    reason=self.reason,
+                    command="remote/booth_get_config",
+                ),
                 fixture.info(reports.codes.BOOTH_CONFIG_DISTRIBUTION_STARTED),
                 fixture.info(
                     reports.codes.BOOTH_CONFIG_ACCEPTED_BY_NODE,
                     node=self.node_list[1],
                     name_list=["booth"],
                 ),
+            ]
+        )
+
+    def test_all_nodes_offline_skip_offline(self):
+        self.fixture_config_read_success()
+        self.config.http.booth.get_config(
+            "booth",
+            communication_list=[
+                dict(
+                    label=node,
+                    errno=1,
+                    error_msg=self.reason,
+                    was_connected=False,
+                )
+                for node in self.node_list
+            ],
+        )
+
+        commands.config_sync(self.env_assist.get_env(), skip_offline_nodes=True)
+        self.env_assist.assert_reports(
+            [
                 fixture.warn(
                     reports.codes.NODE_COMMUNICATION_ERROR_UNABLE_TO_CONNECT,
-                    node=self.node_list[0],
+                    node=node,
                     reason=self.reason,
-                    command="remote/booth_set_config",
-                ),
+                    command="remote/booth_get_config",
+                )
+                for node in self.node_list
             ]
         )
 
@@ -3373,6 +3572,7 @@ class ConfigSyncTest(TestCase, FixtureMixin):
             self.fixture_cfg_path(),
             content=bytes(),
         )
+        self.fixture_get_config_missing()
         self.config.http.booth.send_config(
             "booth",
             bytes().decode("utf-8"),
@@ -3401,6 +3601,7 @@ class ConfigSyncTest(TestCase, FixtureMixin):
             self.fixture_cfg_path(),
             content=config_content.encode("utf-8"),
         )
+        self.fixture_get_config_missing()
         self.config.http.booth.send_config(
             "booth", config_content, node_labels=self.node_list
         )
@@ -4215,8 +4416,7 @@ class TicketCleanup(CrmTicketOperationTest, TestCase):
         self.config.runner.cib.load(status=self.CIB_STATUS)
 
     def fixture_crm_call(self, ticket_name):
-        self.config.runner.pcmk.ticket_standby(ticket_name)
-        self.config.runner.pcmk.ticket_cleanup(ticket_name)
+        fixture_tickets_cleanup(self.config, [ticket_name])
 
     def fixture_reports(self, ticket_name):
         return [
@@ -4233,39 +4433,49 @@ class TicketCleanup(CrmTicketOperationTest, TestCase):
     def _call_cmd(self, ticket_name):
         commands.ticket_cleanup(self.env_assist.get_env(), ticket_name)
 
+    def test_already_in_standby(self):
+        self.config.runner.cib.load(
+            status="""
+                <status>
+                    <tickets>
+                        <ticket_state id="T1" granted="false"
+                            booth-cfg-name="booth"
+                        />
+                        <ticket_state id="T2" granted="false" standby="true"
+                            booth-cfg-name="booth"
+                        />
+                    </tickets>
+                </status>
+            """,
+            instead="runner.cib.load",
+        )
+        self.config.env.push_cib(
+            remove="./status/tickets/ticket_state[@id='T2']"
+        )
+
+        commands.ticket_cleanup(self.env_assist.get_env(), "T2")
+        self.env_assist.assert_reports(self.fixture_reports("T2"))
+
     def test_standby_fails(self):
-        self.config.runner.pcmk.ticket_standby(
-            "T2", returncode=1, stderr="some error"
+        self.config.env.push_cib(
+            modifiers=[fixture_tickets_standby(["T2"])],
+            exception=LibraryError(
+                reports.item.ReportItem.error(
+                    reports.messages.CibPushError("some error", "")
+                )
+            ),
         )
 
         self.env_assist.assert_raise_library_error(
-            lambda: commands.ticket_cleanup(self.env_assist.get_env(), "T2")
-        )
-        self.env_assist.assert_reports(
+            lambda: commands.ticket_cleanup(self.env_assist.get_env(), "T2"),
             [
-                fixture.info(
-                    reports.codes.BOOTH_TICKET_CHANGING_STATE,
-                    ticket_name="T2",
-                    state="standby",
-                ),
                 fixture.error(
-                    reports.codes.BOOTH_TICKET_OPERATION_FAILED,
-                    operation="standby",
+                    reports.codes.CIB_PUSH_ERROR,
                     reason="some error",
-                    site_ip=None,
-                    ticket_name="T2",
-                ),
-            ]
-        )
-
-    def test_cleanup_fails(self):
-        self.config.runner.pcmk.ticket_standby("T2")
-        self.config.runner.pcmk.ticket_cleanup(
-            "T2", returncode=1, stderr="some error"
-        )
-
-        self.env_assist.assert_raise_library_error(
-            lambda: commands.ticket_cleanup(self.env_assist.get_env(), "T2")
+                    pushed_cib="",
+                )
+            ],
+            expected_in_processor=False,
         )
         self.env_assist.assert_reports(
             [
@@ -4274,16 +4484,6 @@ class TicketCleanup(CrmTicketOperationTest, TestCase):
                     ticket_name="T2",
                     state="standby",
                 ),
-                fixture.info(
-                    reports.codes.BOOTH_TICKET_CLEANUP, ticket_name="T2"
-                ),
-                fixture.error(
-                    reports.codes.BOOTH_TICKET_OPERATION_FAILED,
-                    operation="cleanup",
-                    reason="some error",
-                    site_ip=None,
-                    ticket_name="T2",
-                ),
             ]
         )
 
@@ -4413,8 +4613,7 @@ class TicketCleanupAuto(TestCase, FixtureMixin):
             self.fixture_cfg_content(ticket_list=[["T1", []]]),
         )
         self.config.runner.cib.load(status=self.CIB_STATUS)
-        self.config.runner.pcmk.ticket_standby("T2")
-        self.config.runner.pcmk.ticket_cleanup("T2")
+        fixture_tickets_cleanup(self.config, ["T2"])
 
         commands.ticket_cleanup_auto(self.env_assist.get_env())
         self.env_assist.assert_reports(
@@ -4437,10 +4636,7 @@ class TicketCleanupAuto(TestCase, FixtureMixin):
             self.fixture_cfg_content(ticket_list=[]),
         )
         self.config.runner.cib.load(status=self.CIB_STATUS)
-        self.config.runner.pcmk.ticket_standby("T1", name="ticket_standby.T1")
-        self.config.runner.pcmk.ticket_cleanup("T1", name="ticket_cleanup.T1")
-        self.config.runner.pcmk.ticket_standby("T2", name="ticket_standby.T2")
-        self.config.runner.pcmk.ticket_cleanup("T2", name="ticket_cleanup.T2")
+        fixture_tickets_cleanup(self.config, ["T1", "T2"])
 
         commands.ticket_cleanup_auto(self.env_assist.get_env())
         self.env_assist.assert_reports(
@@ -4450,14 +4646,14 @@ class TicketCleanupAuto(TestCase, FixtureMixin):
                     ticket_name="T1",
                     state="standby",
                 ),
-                fixture.info(
-                    reports.codes.BOOTH_TICKET_CLEANUP, ticket_name="T1"
-                ),
                 fixture.info(
                     reports.codes.BOOTH_TICKET_CHANGING_STATE,
                     ticket_name="T2",
                     state="standby",
                 ),
+                fixture.info(
+                    reports.codes.BOOTH_TICKET_CLEANUP, ticket_name="T1"
+                ),
                 fixture.info(
                     reports.codes.BOOTH_TICKET_CLEANUP, ticket_name="T2"
                 ),
@@ -4471,8 +4667,7 @@ class TicketCleanupAuto(TestCase, FixtureMixin):
             self.fixture_cfg_content(ticket_list=[]),
         )
         self.config.runner.cib.load(status=self.CIB_STATUS)
-        self.config.runner.pcmk.ticket_standby("T-non-default-booth")
-        self.config.runner.pcmk.ticket_cleanup("T-non-default-booth")
+        fixture_tickets_cleanup(self.config, ["T-non-default-booth"])
 
         commands.ticket_cleanup_auto(
             self.env_assist.get_env(), instance_name="custom-booth"
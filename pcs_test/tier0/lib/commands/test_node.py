@@ -389,3 +389,287 @@ class GetConfigDto(TestCase):
             expected_in_processor=False,
         )
         self.env_assist.assert_reports([])
+
+
+FIXTURE_STATE_NODES = """
+    <nodes>
+        <node name="rh7-1" id="1" is_dc="true" />
+        <node name="rh7-2" id="2" />
+        <node name="rh7-3" id="rh7-3" type="remote" />
+    </nodes>
+"""
+
+
+class SetNodesAttributes(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(self)
+
+    def test_success(self):
+        (
+            self.config.runner.cib.load(
+                nodes="""
+                    <nodes>
+                        <node id="1" uname="rh7-1">
+                            <instance_attributes id="nodes-1">
+                                <nvpair id="nodes-1-a" name="a" value="A"/>
+                            </instance_attributes>
+                        </node>
+                        <node id="2" uname="rh7-2"/>
+                    </nodes>
+                """
+            )
+            .runner.pcmk.load_state(nodes=FIXTURE_STATE_NODES)
+            .env.push_cib(
+                nodes="""
+                    <nodes>
+                        <node id="1" uname="rh7-1">
+                            <instance_attributes id="nodes-1">
+                                <nvpair id="nodes-1-b" name="b" value="B"/>
+                            </instance_attributes>
+                        </node>
+                        <node id="2" uname="rh7-2">
+                            <instance_attributes id="nodes-2">
+                                <nvpair id="nodes-2-b" name="b" value="B"/>
+                            </instance_attributes>
+                        </node>
+                        <node id="rh7-3" uname="rh7-3" type="remote">
+                            <instance_attributes id="nodes-rh7-3">
+                                <nvpair id="nodes-rh7-3-c" name="c" value="C"/>
+                            </instance_attributes>
+                        </node>
+                    </nodes>
+                """
+            )
+        )
+        lib.set_nodes_attributes(
+            self.env_assist.get_env(),
+            {
+                "rh7-1": {"a": "", "b": "B"},
+                "rh7-2": {"b": "B"},
+                "rh7-3": {"c": "C"},
+            },
+        )
+
+    def test_nodes_in_cib_state_not_loaded(self):
+        (
+            self.config.runner.cib.load(
+                filename="cib-empty-withnodes.xml"
+            ).env.push_cib(
+                nodes="""
+                    <nodes>
+                        <node id="1" uname="rh7-1"/>
+                        <node id="2" uname="rh7-2">
+                            <instance_attributes id="nodes-2">
+                                <nvpair id="nodes-2-a" name="a" value="A"/>
+                            </instance_attributes>
+                        </node>
+                    </nodes>
+                """
+            )
+        )
+        lib.set_nodes_attributes(
+            self.env_assist.get_env(), {"rh7-1": {"a": ""}, "rh7-2": {"a": "A"}}
+        )
+
+    def test_nodes_not_found(self):
+        (
+            self.config.runner.cib.load(
+                filename="cib-empty-withnodes.xml"
+            ).runner.pcmk.load_state(nodes=FIXTURE_STATE_NODES)
+        )
+        self.env_assist.assert_raise_library_error(
+            lambda: lib.set_nodes_attributes(
+                self.env_assist.get_env(),
+                {"rh7-1": {"a": "A"}, "node-8": {"a": "A"}, "node-9": {}},
+            ),
+            [
+                fixture.error(
+                    reports.codes.NODE_NOT_FOUND,
+                    node="node-8",
+                    searched_types=[],
+                ),
+                fixture.error(
+                    reports.codes.NODE_NOT_FOUND,
+                    node="node-9",
+                    searched_types=[],
+                ),
+            ],
+            expected_in_processor=False,
+        )
+
+    def test_cib_file(self):
+        (
+            # This makes env.is_cib_live return False
+            self.config.env.set_cib_data("<cib/>")
+            .runner.cib.load(
+                filename="cib-empty-withnodes.xml",
+                env={"CIB_file": "/fake/tmp/file"},
+            )
+            .env.push_cib(
+                nodes="""
+                    <nodes>
+                        <node id="1" uname="rh7-1">
+                            <instance_attributes id="nodes-1">
+                                <nvpair id="nodes-1-a" name="a" value="A"/>
+                            </instance_attributes>
+                        </node>
+                        <node id="2" uname="rh7-2"/>
+                    </nodes>
+                """
+            )
+        )
+        lib.set_nodes_attributes(
+            self.env_assist.get_env(), {"rh7-1": {"a": "A"}}
+        )
+
+    def test_cib_file_node_not_in_cib(self):
+        (
+            self.config.env.set_cib_data("<cib/>").runner.cib.load(
+                filename="cib-empty-withnodes.xml",
+                env={"CIB_file": "/fake/tmp/file"},
+            )
+        )
+        self.env_assist.assert_raise_library_error(
+            lambda: lib.set_nodes_attributes(
+                self.env_assist.get_env(), {"rh7-3": {"a": "A"}}
+            ),
+            [
+                fixture.error(
+                    reports.codes.NODE_NOT_FOUND,
+                    node="rh7-3",
+                    searched_types=[],
+                ),
+            ],
+            expected_in_processor=False,
+        )
+
+
+class SetNodesUtilization(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(self)
+
+    def test_success(self):
+        (
+            self.config.runner.cib.load(
+                nodes="""
+                    <nodes>
+                        <node id="1" uname="rh7-1">
+                            <utilization id="nodes-1-utilization">
+                                <nvpair id="nodes-1-utilization-cpu"
+                                    name="cpu" value="2"
+                                />
+                            </utilization>
+                        </node>
+                        <node id="2" uname="rh7-2"/>
+                    </nodes>
+                """
+            )
+            # all the nodes are in the CIB, cluster state is not loaded
+            .env.push_cib(
+                nodes="""
+                    <nodes>
+                        <node id="1" uname="rh7-1">
+                            <utilization id="nodes-1-utilization">
+                                <nvpair id="nodes-1-utilization-ram"
+                                    name="ram" value="64"
+                                />
+                            </utilization>
+                        </node>
+                        <node id="2" uname="rh7-2">
+                            <utilization id="nodes-2-utilization">
+                                <nvpair id="nodes-2-utilization-ram"
+                                    name="ram" value="64"
+                                />
+                            </utilization>
+                        </node>
+                    </nodes>
+                """
+            )
+        )
+        lib.set_nodes_utilization(
+            self.env_assist.get_env(),
+            {
+                "rh7-1": {"cpu": "", "ram": "64"},
+                "rh7-2": {"ram": "64"},
+            },
+        )
+
+    def test_not_integer(self):
+        self.env_assist.assert_raise_library_error(
+            lambda: lib.set_nodes_utilization(
+                self.env_assist.get_env(),
+                {"rh7-1": {"cpu": "", "ram": "big"}, "rh7-2": {"ram": "1.5"}},
+            ),
+        )
+        self.env_assist.assert_reports(
+            [
+                fixture.error(
+                    reports.codes.INVALID_OPTION_VALUE,
+                    option_name="ram",
+                    option_value="big",
+                    allowed_values="an integer",
+                    cannot_be_empty=False,
+                    forbidden_characters=None,
+                ),
+                fixture.error(
+                    reports.codes.INVALID_OPTION_VALUE,
+                    option_name="ram",
+                    option_value="1.5",
+                    allowed_values="an integer",
+                    cannot_be_empty=False,
+                    forbidden_characters=None,
+                ),
+            ]
+        )
+
+    def test_not_integer_same_attrs_for_all_nodes(self):
+        attrs = {"cpu": "", "ram": "big"}
+        self.env_assist.assert_raise_library_error(
+            lambda: lib.set_nodes_utilization(
+                self.env_assist.get_env(),
+                dict.fromkeys(["rh7-1", "rh7-2", "rh7-3"], attrs),
+            ),
+        )
+        self.env_assist.assert_reports(
+            [
+                fixture.error(
+                    reports.codes.INVALID_OPTION_VALUE,
+                    option_name="ram",
+                    option_value="big",
+                    allowed_values="an integer",
+                    cannot_be_empty=False,
+                    forbidden_characters=None,
+                ),
+            ]
+        )
+
+    def test_remove_from_node_not_in_cib(self):
+        (
+            self.config.runner.cib.load(
+                nodes="""
+                    <nodes>
+                        <node id="1" uname="rh7-1">
+                            <utilization id="nodes-1-utilization">
+                                <nvpair id="nodes-1-utilization-cpu"
+                                    name="cpu" value="2"
+                                />
+                            </utilization>
+                        </node>
+                    </nodes>
+                """
+            )
+            .runner.pcmk.load_state(nodes=FIXTURE_STATE_NODES)
+            .env.push_cib(
+                nodes="""
+                    <nodes>
+                        <node id="1" uname="rh7-1">
+                            <utilization id="nodes-1-utilization"/>
+                        </node>
+                    </nodes>
+                """
+            )
+        )
+        lib.set_nodes_utilization(
+            self.env_assist.get_env(),
+            dict.fromkeys(["rh7-1", "rh7-2", "rh7-3"], {"cpu": ""}),
+        )
@@ -476,7 +476,9 @@ class SetQuorumOptionsTest(TestCase):
         self.env_assist.assert_reports(
             [
                 fixture.error(
-                    reports.codes.PARSE_ERROR_COROSYNC_CONF_MISSING_CLOSING_BRACE
+                    reports.codes.PARSE_ERROR_COROSYNC_CONF_MISSING_CLOSING_BRACE,
+                    line_number=1,
+                    column_number=9,
                 )
             ]
         )
@@ -1,7 +1,11 @@
 # coding=utf-8
-from unittest import TestCase
+import os
+import os.path
+from unittest import TestCase, mock
 
-from pcs.common import const
+from pcs import settings
+from pcs.common import const, file_type_codes
+from pcs.common.file import RawFileError
 from pcs.common.interface.dto import from_dict
 from pcs.common.pacemaker.resource.operations import (
     CibResourceOperationDto,
@@ -15,13 +19,25 @@ from pcs.common.resource_agent.dto import (
     ResourceAgentNameDto,
     ResourceAgentParameterDto,
 )
+from pcs.common.tools import Version
 from pcs.lib.commands import resource_agent as lib
-from pcs.lib.resource_agent import ResourceAgentName
+from pcs.lib.resource_agent import AgentMetadataCache, ResourceAgentName
 from pcs.lib.resource_agent import const as ra_const
 
 from pcs_test.tools import fixture
 from pcs_test.tools.command_env import get_env_tools
 from pcs_test.tools.metadata_dto import get_fixture_meta_attributes_dto
+from pcs_test.tools.misc import get_tmp_dir
+
+CACHED_METADATA = """
+    <resource-agent name="Dummy">
+        <version>1.0</version>
+        <shortdesc lang="en">Cached agent</shortdesc>
+        <longdesc lang="en">Cached agent</longdesc>
+        <parameters/>
+        <actions/>
+    </resource-agent>
+"""
 
 
 def _operation_fixture(name, interval="", role=None, timeout=None):
@@ -1246,3 +1262,115 @@ class GetMetaAttributesMetadata(TestCase):
                 )
             ]
         )
+
+
+class AgentMetadataCacheMixin:
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(test_case=self)
+        self.tmp_dir = get_tmp_dir("tier0_lib_commands_resource_agent_cache")
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.cache_dir = os.path.join(self.tmp_dir.name, "cache")
+        ocf_root = os.path.join(self.tmp_dir.name, "ocf")
+        agent_dir = os.path.join(ocf_root, "resource.d", "heartbeat")
+        os.makedirs(agent_dir)
+        with open(os.path.join(agent_dir, "Dummy"), "w") as agent_file:
+            agent_file.write("#!/bin/sh\n")
+        patcher = mock.patch.object(settings, "ocf_root", ocf_root)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.config.env.set_agent_metadata_cache_dir(self.cache_dir)
+        self.name = ResourceAgentName("ocf", "heartbeat", "Dummy")
+
+    def get_cache(self):
+        return AgentMetadataCache(self.cache_dir, lambda: Version(3, 0, 1))
+
+
+class GetAgentMetadataCached(AgentMetadataCacheMixin, TestCase):
+    def test_cache_miss(self):
+        self.config.runner.pcmk.version()
+        self.config.runner.pcmk.load_agent(
+            agent_name=self.name.full_name,
+            agent_filename="resource_agent_ocf_heartbeat_dummy_utf8.xml",
+            env={"PATH": "/usr/sbin:/bin:/usr/bin"},
+        )
+        self.assertEqual(
+            lib.get_agent_metadata(
+                self.env_assist.get_env(), self.name
+            ).shortdesc,
+            "Example stateless resource agent: ®",
+        )
+        self.assertIn(
+            "Example stateless resource agent: ®",
+            self.get_cache().get(self.name),
+        )
+
+    def test_cache_hit(self):
+        self.get_cache().put(self.name, CACHED_METADATA)
+        self.config.runner.pcmk.version()
+        self.assertEqual(
+            lib.get_agent_metadata(
+                self.env_assist.get_env(), self.name
+            ).shortdesc,
+            "Cached agent",
+        )
+
+    def test_cache_outdated(self):
+        self.get_cache().put(self.name, CACHED_METADATA)
+        self.config.runner.pcmk.version(version="3.0.2")
+        self.config.runner.pcmk.load_agent(
+            agent_name=self.name.full_name,
+            agent_filename="resource_agent_ocf_heartbeat_dummy_utf8.xml",
+            env={"PATH": "/usr/sbin:/bin:/usr/bin"},
+        )
+        self.assertEqual(
+            lib.get_agent_metadata(
+                self.env_assist.get_env(), self.name
+            ).shortdesc,
+            "Example stateless resource agent: ®",
+        )
+
+    def test_agent_file_missing(self):
+        # pacemaker version is not loaded if there is nothing to cache
+        name = ResourceAgentName("ocf", "pacemaker", "Stateful")
+        self.config.runner.pcmk.load_agent(
+            agent_name=name.full_name,
+            env={"PATH": "/usr/sbin:/bin:/usr/bin"},
+        )
+        self.assertEqual(
+            lib.get_agent_metadata(self.env_assist.get_env(), name).name,
+            ResourceAgentNameDto(
+                standard="ocf", provider="pacemaker", type="Stateful"
+            ),
+        )
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+
+class RefreshMetadataCache(AgentMetadataCacheMixin, TestCase):
+    def test_success(self):
+        self.get_cache().put(self.name, CACHED_METADATA)
+        lib.refresh_metadata_cache(self.env_assist.get_env())
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_no_cache_dir(self):
+        lib.refresh_metadata_cache(self.env_assist.get_env())
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_error(self):
+        self.get_cache().put(self.name, CACHED_METADATA)
+        with mock.patch(
+            "os.remove", side_effect=PermissionError(13, "Permission denied")
+        ):
+            self.env_assist.assert_raise_library_error(
+                lambda: lib.refresh_metadata_cache(self.env_assist.get_env())
+            )
+        self.env_assist.assert_reports(
+            [
+                fixture.error(
+                    report_codes.FILE_IO_ERROR,
+                    file_type_code=file_type_codes.RESOURCE_AGENT_METADATA_CACHE,
+                    operation=RawFileError.ACTION_REMOVE,
+                    reason="Permission denied",
+                    file_path=self.cache_dir,
+                )
+            ]
+        )
@@ -312,6 +312,8 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
             [
                 fixture.error(
                     report_codes.PARSE_ERROR_COROSYNC_CONF_LINE_IS_NOT_SECTION_NOR_KEY_VALUE,
+                    line_number=1,
+                    column_number=1,
                 ),
             ]
         )
@@ -115,9 +115,6 @@ class ListAgents(TestCase):
             env={"PATH": "/usr/sbin:/bin:/usr/bin"},
             name="runner.pcmk.load_agent.fence_apc",
         )
-        self.config.runner.pcmk.load_fake_agent_metadata(
-            stdout=_fixture_fenced_xml
-        )
         self.config.runner.pcmk.load_agent(
             agent_name="stonith:fence_dummy",
             agent_is_missing=True,
@@ -130,6 +127,9 @@ class ListAgents(TestCase):
             env={"PATH": "/usr/sbin:/bin:/usr/bin"},
             name="runner.pcmk.load_agent.fence_xvm",
         )
+        self.config.runner.pcmk.load_fake_agent_metadata(
+            stdout=_fixture_fenced_xml
+        )
         agent_stub = {
             "parameters": [
                 _fixture_parameter("own-param", "testing own parameter")
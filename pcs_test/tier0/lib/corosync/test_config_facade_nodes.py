@@ -664,3 +664,172 @@ class RemoveNodes(TestCase):
         """
         )
         ac(expected_config, facade.config.export())
+
+
+_LOOKUP_CONFIG = dedent(
+    """\
+    totem {
+        transport: knet
+
+        interface {
+            linknumber: 1
+            knet_transport: sctp
+        }
+    }
+
+    nodelist {
+        node {
+            ring0_addr: node1-addr0
+            ring1_addr: node1-addr1
+            nodeid: 1
+            name: node1
+        }
+
+        node {
+            ring0_addr: node2-addr0
+            ring1_addr: node2-addr1
+            nodeid: 2
+            name: node2
+        }
+
+        node {
+            ring0_addr: node2-addr0
+            nodeid: 3
+            name: node2
+        }
+    }
+    """
+)
+
+
+class NodeLookups(TestCase):
+    def setUp(self):
+        self.facade = _get_facade(_LOOKUP_CONFIG)
+
+    def test_by_name(self):
+        self.assertEqual(self.facade.get_node_by_name("node1").nodeid, "1")
+        # the first node of the name is returned
+        self.assertEqual(self.facade.get_node_by_name("node2").nodeid, "2")
+        self.assertIsNone(self.facade.get_node_by_name("node3"))
+
+    def test_by_nodeid(self):
+        self.assertEqual(self.facade.get_node_by_nodeid("3").name, "node2")
+        self.assertIsNone(self.facade.get_node_by_nodeid("4"))
+
+    def test_by_addr(self):
+        self.assertEqual(
+            self.facade.get_node_by_addr("node1-addr1").name, "node1"
+        )
+        self.assertEqual(
+            self.facade.get_node_by_addr("node2-addr0").nodeid, "2"
+        )
+        self.assertIsNone(self.facade.get_node_by_addr("node1"))
+
+    def test_link_addrs(self):
+        self.assertEqual(
+            self.facade.get_link_addrs("0"),
+            ["node1-addr0", "node2-addr0", "node2-addr0"],
+        )
+        self.assertEqual(
+            self.facade.get_link_addrs("1"), ["node1-addr1", "node2-addr1"]
+        )
+        self.assertEqual(self.facade.get_link_addrs("2"), [])
+
+
+class CachedViewsInvalidation(TestCase):
+    # pylint: disable=protected-access
+    def setUp(self):
+        self.facade = _get_facade(_LOOKUP_CONFIG)
+
+    def assert_node_names(self, expected_names):
+        self.assertEqual(
+            [node.name for node in self.facade.get_nodes()], expected_names
+        )
+
+    def test_views_reused_without_changes(self):
+        nodes = self.facade.get_nodes()
+        view = self.facade._get_nodes_view()
+        self.assertEqual(self.facade.get_nodes(), nodes)
+        self.assertIs(self.facade._get_nodes_view(), view)
+        self.facade.get_links_options()
+        links_options = self.facade._links_options
+        self.facade.get_links_options()
+        self.assertIs(self.facade._links_options, links_options)
+
+    def test_returned_data_do_not_change_views(self):
+        self.facade.get_nodes().clear()
+        self.facade.get_used_linknumber_list().clear()
+        self.facade.get_link_addrs("0").clear()
+        self.facade.get_links_options()["1"]["transport"] = "udp"
+        self.assert_node_names(["node1", "node2", "node2"])
+        self.assertEqual(self.facade.get_used_linknumber_list(), [0, 1])
+        self.assertEqual(len(self.facade.get_link_addrs("0")), 3)
+        self.assertEqual(
+            self.facade.get_links_options(),
+            {"1": {"linknumber": "1", "transport": "sctp"}},
+        )
+
+    def test_add_nodes(self):
+        self.assert_node_names(["node1", "node2", "node2"])
+        self.facade.add_nodes([dict(name="node4", addrs=["a4-0", "a4-1"])])
+        self.assert_node_names(["node1", "node2", "node2", "node4"])
+        self.assertEqual(self.facade.get_node_by_addr("a4-1").name, "node4")
+        self.assertEqual(self.facade.get_node_by_nodeid("4").name, "node4")
+
+    def test_remove_nodes(self):
+        self.assertIsNotNone(self.facade.get_node_by_name("node1"))
+        self.facade.remove_nodes(["node1"])
+        self.assertIsNone(self.facade.get_node_by_name("node1"))
+        self.assertIsNone(self.facade.get_node_by_addr("node1-addr0"))
+        self.assertEqual(self.facade.get_link_addrs("1"), ["node2-addr1"])
+
+    def test_rename_node(self):
+        self.assertIsNotNone(self.facade.get_node_by_name("node1"))
+        self.facade.rename_node("node1", "node5")
+        self.assertIsNone(self.facade.get_node_by_name("node1"))
+        self.assertEqual(self.facade.get_node_by_name("node5").nodeid, "1")
+
+    def test_links(self):
+        self.assertEqual(self.facade.get_used_linknumber_list(), [0, 1])
+        self.facade.add_link(
+            {"node1": "node1-addr3", "node2": "node2-addr3"},
+            {"linknumber": "3", "link_priority": "10"},
+        )
+        self.assertEqual(self.facade.get_used_linknumber_list(), [0, 1, 3])
+        self.assertEqual(
+            self.facade.get_link_addrs("3"),
+            ["node1-addr3", "node2-addr3", "node2-addr3"],
+        )
+        self.assertEqual(
+            self.facade.get_links_options()["3"],
+            {"linknumber": "3", "link_priority": "10"},
+        )
+
+        self.facade.update_link("3", {"node1": "node1-addr4"}, {})
+        self.assertEqual(
+            self.facade.get_link_addrs("3"),
+            ["node1-addr4", "node2-addr3", "node2-addr3"],
+        )
+
+        self.facade.remove_links(["1"])
+        self.assertEqual(self.facade.get_used_linknumber_list(), [0, 3])
+        self.assertEqual(self.facade.get_link_addrs("1"), [])
+        self.assertEqual(list(self.facade.get_links_options()), ["3"])
+
+    def test_transport_change(self):
+        self.assertEqual(
+            self.facade.get_links_options(),
+            {"1": {"linknumber": "1", "transport": "sctp"}},
+        )
+        self.facade.config.get_sections("totem")[0].set_attribute(
+            "transport", "udp"
+        )
+        self.assertEqual(self.facade.get_links_options(), {"1": {}})
+
+    def test_config_changed_directly(self):
+        self.assert_node_names(["node1", "node2", "node2"])
+        nodelist = self.facade.config.get_sections("nodelist")[0]
+        nodelist.get_sections("node")[0].set_attribute("name", "node6")
+        self.assert_node_names(["node6", "node2", "node2"])
+        nodelist.del_section(nodelist.get_sections("node")[0])
+        self.assert_node_names(["node2", "node2"])
@@ -1,6 +1,7 @@
 # pylint: disable=too-many-lines
 from unittest import TestCase
 
+from pcs.common import reports
 from pcs.lib.corosync import config_parser
 
 from pcs_test.tools.misc import outdent
@@ -289,6 +290,80 @@ class SectionTest(TestCase):
             ],
         )
 
+    def test_attribute_lookup_after_changes(self):
+        section = config_parser.Section("mySection")
+        section.add_attribute("name1", "value1")
+        section.add_attribute("name2", "value2")
+        section.add_attribute("name1", "value1a")
+        section.add_attribute("name1", "value1b")
+        section.del_attributes_by_name("name1", "value1a")
+        self.assertEqual(
+            section.get_attributes("name1"),
+            [("name1", "value1"), ("name1", "value1b")],
+        )
+        self.assertEqual(section.get_attribute_value("name1"), "value1b")
+
+        section.set_attribute("name1", "value1c")
+        self.assertEqual(
+            section.get_attributes("name1"), [("name1", "value1c")]
+        )
+        self.assertEqual(section.get_attribute_value("name1"), "value1c")
+
+        section.del_attributes_by_name("name1")
+        self.assertEqual(section.get_attributes("name1"), [])
+        self.assertIsNone(section.get_attribute_value("name1"))
+        self.assertEqual(section.get_attribute_value("name1", "def"), "def")
+
+        section.set_attribute("name1", "value1d")
+        self.assertEqual(
+            section.get_attributes(),
+            [("name2", "value2"), ("name1", "value1d")],
+        )
+        self.assertEqual(
+            section.get_attributes("name1"), [("name1", "value1d")]
+        )
+
+    def test_section_lookup_after_changes(self):
+        root1 = config_parser.Section("root1")
+        root2 = config_parser.Section("root2")
+        child1 = config_parser.Section("child")
+        child2 = config_parser.Section("child")
+        root1.add_section(child1)
+        root1.add_section(child2)
+
+        root2.add_section(child1)
+        self.assertEqual(root1.get_sections("child"), [child2])
+        self.assertEqual(root2.get_sections("child"), [child1])
+
+        root1.del_section(child2)
+        self.assertEqual(root1.get_sections("child"), [])
+        self.assertEqual(root1.get_sections(), [])
+        self.assertRaises(ValueError, root1.del_section, child2)
+
+    def test_revision(self):
+        root = config_parser.Section("root")
+        child = config_parser.Section("child")
+        grandchild = config_parser.Section("grandchild")
+        self.assertEqual(root.revision, 0)
+
+        child.add_section(grandchild)
+        self.assertEqual(child.revision, 1)
+        root.add_section(child)
+        self.assertEqual(root.revision, 1)
+        self.assertEqual(grandchild.revision, 1)
+
+        grandchild.add_attribute("name1", "value1")
+        self.assertEqual(root.revision, 2)
+        grandchild.set_attribute("name1", "value2")
+        self.assertEqual(root.revision, 3)
+        grandchild.del_attributes_by_name("name2")
+        self.assertEqual(root.revision, 3)
+        grandchild.del_attributes_by_name("name1")
+        self.assertEqual(root.revision, 4)
+        child.del_section(grandchild)
+        self.assertEqual(root.revision, 5)
+        self.assertEqual(child.revision, 5)
+
     def test_section_add(self):
         root = config_parser.Section("root")
         child1 = config_parser.Section("child1")
@@ -801,6 +876,16 @@ class SectionTest(TestCase):
 
 class ParserTest(TestCase):
     # pylint: disable=too-many-public-methods
+    def assert_parse_error(
+        self, string, exception_class, line_number, column_number
+    ):
+        with self.assertRaises(exception_class) as cm:
+            config_parser.Parser.parse(string.encode("utf-8"))
+        self.assertEqual(
+            (cm.exception.line_number, cm.exception.column_number),
+            (line_number, column_number),
+        )
+
     def test_empty(self):
         self.assertEqual(
             str(config_parser.Parser.parse("".encode("utf-8"))), ""
@@ -947,10 +1032,11 @@ class ParserTest(TestCase):
             }
             """
         )
-        self.assertRaises(
+        self.assert_parse_error(
+            string,
             config_parser.MissingSectionNameBeforeOpeningBraceException,
-            config_parser.Parser.parse,
-            string.encode("utf-8"),
+            2,
+            5,
         )
 
     def test_sections_junk_after_opening(self):
@@ -968,10 +1054,11 @@ class ParserTest(TestCase):
             }
             """
         )
-        self.assertRaises(
+        self.assert_parse_error(
+            string,
             config_parser.ExtraCharactersAfterOpeningBraceException,
-            config_parser.Parser.parse,
-            string.encode("utf-8"),
+            2,
+            16,
         )
 
     def test_sections_comment_junk_after_opening(self):
@@ -989,10 +1076,11 @@ class ParserTest(TestCase):
             }
             """
         )
-        self.assertRaises(
+        self.assert_parse_error(
+            string,
             config_parser.ExtraCharactersAfterOpeningBraceException,
-            config_parser.Parser.parse,
-            string.encode("utf-8"),
+            2,
+            17,
         )
 
     def test_sections_junk_before_closing(self):
@@ -1010,10 +1098,11 @@ class ParserTest(TestCase):
             }
             """
         )
-        self.assertRaises(
+        self.assert_parse_error(
+            string,
             config_parser.ExtraCharactersBeforeOrAfterClosingBraceException,
-            config_parser.Parser.parse,
-            string.encode("utf-8"),
+            3,
+            5,
         )
 
     def test_sections_junk_after_closing(self):
@@ -1031,10 +1120,11 @@ class ParserTest(TestCase):
             }
             """
         )
-        self.assertRaises(
+        self.assert_parse_error(
+            string,
             config_parser.ExtraCharactersBeforeOrAfterClosingBraceException,
-            config_parser.Parser.parse,
-            string.encode("utf-8"),
+            3,
+            6,
         )
 
     def test_sections_comment_junk_after_closing(self):
@@ -1052,10 +1142,11 @@ class ParserTest(TestCase):
             }
             """
         )
-        self.assertRaises(
+        self.assert_parse_error(
+            string,
             config_parser.ExtraCharactersBeforeOrAfterClosingBraceException,
-            config_parser.Parser.parse,
-            string.encode("utf-8"),
+            3,
+            7,
         )
 
     def test_sections_unexpected_closing_brace(self):
@@ -1064,10 +1155,8 @@ class ParserTest(TestCase):
             }
             """
         )
-        self.assertRaises(
-            config_parser.UnexpectedClosingBraceException,
-            config_parser.Parser.parse,
-            string.encode("utf-8"),
+        self.assert_parse_error(
+            string, config_parser.UnexpectedClosingBraceException, 1, 1
         )
 
     def test_sections_unexpected_closing_brace_inner_section(self):
@@ -1083,10 +1172,8 @@ class ParserTest(TestCase):
             }
             """
         )
-        self.assertRaises(
-            config_parser.UnexpectedClosingBraceException,
-            config_parser.Parser.parse,
-            string.encode("utf-8"),
+        self.assert_parse_error(
+            string, config_parser.UnexpectedClosingBraceException, 8, 1
         )
 
     def test_sections_missing_closing_brace(self):
@@ -1095,10 +1182,8 @@ class ParserTest(TestCase):
             section1 {
             """
         )
-        self.assertRaises(
-            config_parser.MissingClosingBraceException,
-            config_parser.Parser.parse,
-            string.encode("utf-8"),
+        self.assert_parse_error(
+            string, config_parser.MissingClosingBraceException, 1, 10
         )
 
     def test_sections_missing_closing_brace_inner_section(self):
@@ -1112,10 +1197,8 @@ class ParserTest(TestCase):
             }
             """
         )
-        self.assertRaises(
-            config_parser.MissingClosingBraceException,
-            config_parser.Parser.parse,
-            string.encode("utf-8"),
+        self.assert_parse_error(
+            string, config_parser.MissingClosingBraceException, 1, 10
         )
 
     def test_junk_line(self):
@@ -1132,10 +1215,8 @@ class ParserTest(TestCase):
             }
             """
         )
-        self.assertRaises(
-            config_parser.LineIsNotSectionNorKeyValueException,
-            config_parser.Parser.parse,
-            string.encode("utf-8"),
+        self.assert_parse_error(
+            string, config_parser.LineIsNotSectionNorKeyValueException, 6, 1
         )
 
     def test_comments_attributes(self):
@@ -1189,6 +1270,15 @@ class ParserTest(TestCase):
             string.encode("utf-8"),
         )
 
+    def test_deep_nesting(self):
+        # sections are not parsed recursively, the depth is not limited
+        depth = 2000
+        string = "section {\n" * depth + "name: value\n" + "}\n" * depth
+        section = config_parser.Parser.parse(string.encode("utf-8"))
+        for _ in range(depth):
+            section = section.get_sections("section")[0]
+        self.assertEqual(section.get_attributes(), [("name", "value")])
+
     def test_full_1(self):
         string = outdent(
             """\
@@ -1440,6 +1530,32 @@ class ParserTest(TestCase):
         )
 
 
+class ParserExceptionToReportMsg(TestCase):
+    def test_position(self):
+        self.assertEqual(
+            config_parser.Parser.parser_exception_to_report_msg(
+                config_parser.UnexpectedClosingBraceException(3, 5)
+            ),
+            reports.messages.ParseErrorCorosyncConfUnexpectedClosingBrace(3, 5),
+        )
+
+    def test_no_position(self):
+        self.assertEqual(
+            config_parser.Parser.parser_exception_to_report_msg(
+                config_parser.MissingClosingBraceException()
+            ),
+            reports.messages.ParseErrorCorosyncConfMissingClosingBrace(),
+        )
+
+    def test_unknown_exception(self):
+        self.assertEqual(
+            config_parser.Parser.parser_exception_to_report_msg(
+                config_parser.CircularParentshipException()
+            ),
+            reports.messages.ParseErrorCorosyncConf(),
+        )
+
+
 class VerifySection(TestCase):
     def test_empty_section(self):
         section = config_parser.Section("mySection")
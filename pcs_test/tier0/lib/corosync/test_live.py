@@ -642,6 +642,74 @@ class QuorumStatusQuorumLossNodes(TestCase):
         )
 
 
+class QuorumStatusNodesCausingQuorumLoss(TestCase):
+    @staticmethod
+    def _facade(is_quorate=True, qdevice_votes=0):
+        return lib.QuorumStatusFacade(
+            lib.QuorumStatus(
+                is_quorate=is_quorate,
+                votes_needed_for_quorum=4,
+                node_list=[
+                    lib.QuorumStatusNode(name="node1", votes=3, local=True),
+                    lib.QuorumStatusNode(name="node2", votes=2, local=False),
+                    lib.QuorumStatusNode(name="node3", votes=1, local=False),
+                ],
+                qdevice_list=(
+                    [
+                        lib.QuorumStatusNode(
+                            name="Qdevice", votes=qdevice_votes, local=False
+                        )
+                    ]
+                    if qdevice_votes
+                    else []
+                ),
+            )
+        )
+
+    def test_not_quorate(self):
+        self.assertEqual(
+            self._facade(is_quorate=False).get_nodes_causing_quorum_loss(
+                ["node1", "node2"]
+            ),
+            [],
+        )
+
+    def test_still_quorate(self):
+        self.assertEqual(
+            self._facade().get_nodes_causing_quorum_loss(["node3"]), []
+        )
+
+    def test_quorum_loss(self):
+        self.assertEqual(
+            self._facade().get_nodes_causing_quorum_loss(
+                ["node3", "node2", "node1"]
+            ),
+            ["node2", "node1"],
+        )
+
+    def test_quorum_loss_first_node(self):
+        self.assertEqual(
+            self._facade().get_nodes_causing_quorum_loss(["node1", "node3"]),
+            ["node1", "node3"],
+        )
+
+    def test_duplicate_and_unknown_nodes(self):
+        self.assertEqual(
+            self._facade().get_nodes_causing_quorum_loss(
+                ["node3", "node3", "nodeX"]
+            ),
+            [],
+        )
+
+    def test_qdevice_still_quorate(self):
+        self.assertEqual(
+            self._facade(qdevice_votes=2).get_nodes_causing_quorum_loss(
+                ["node3", "node2"]
+            ),
+            [],
+        )
+
+
 class QuorumStatusQuorumLossLocal(TestCase):
     def test_not_quorate(self):
         facade = lib.QuorumStatusFacade(
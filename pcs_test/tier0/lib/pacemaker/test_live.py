@@ -65,6 +65,16 @@ class GetClusterStatusXml(GetClusterStatusMixin, TestCase):
             self.fixture_xml(), lib._get_cluster_status_xml(env.cmd_runner())
         )
 
+    @mock.patch("pcs.lib.pacemaker.live.get_current_status_xml")
+    def test_status_kept_by_pcsd(self, mock_get_current_status):
+        mock_get_current_status.return_value = self.fixture_xml()
+        env = self.env_assist.get_env()
+        runner = env.cmd_runner()
+        assert_xml_equal(
+            self.fixture_xml(), lib._get_cluster_status_xml(runner)
+        )
+        mock_get_current_status.assert_called_once_with(runner)
+
     def test_error(self):
         self.config.runner.pcmk.load_state(
             stdout=fixture_crm_mon.error_xml(
@@ -0,0 +1,213 @@
+import dataclasses
+import json
+import os.path
+import tempfile
+from unittest import TestCase, mock
+
+from pcs import settings
+from pcs.common.pacemaker.cib_watch import CibVersionDto
+from pcs.lib.pacemaker import status_snapshot
+
+from pcs_test.tools.custom_mock import get_runner_mock
+
+CIB_VERSION_XML = '<cib admin_epoch="0" epoch="5" num_updates="12"/>'
+VERSION_QUERY = [
+    settings.cibadmin_exec,
+    "--local",
+    "--query",
+    "--xpath",
+    "/cib",
+    "--no-children",
+]
+SNAPSHOT = status_snapshot.ClusterStatusSnapshot(
+    generation=3,
+    timestamp=1000.5,
+    cib_version=CibVersionDto(0, 5, 12),
+    status_xml="<pacemaker-result/>",
+    pid=os.getpid(),
+    process_start_time=status_snapshot.get_process_start_time(os.getpid()),
+)
+
+
+class ParseCibVersion(TestCase):
+    def test_root_element(self):
+        self.assertEqual(
+            status_snapshot.parse_cib_version(CIB_VERSION_XML),
+            CibVersionDto(0, 5, 12),
+        )
+
+    def test_whole_cib(self):
+        self.assertEqual(
+            status_snapshot.parse_cib_version(
+                '<cib admin_epoch="1" epoch="5" num_updates="12">'
+                "<configuration/></cib>"
+            ),
+            CibVersionDto(1, 5, 12),
+        )
+
+    def test_wrapped_element(self):
+        self.assertEqual(
+            status_snapshot.parse_cib_version(
+                f"<xpath-query>{CIB_VERSION_XML}</xpath-query>"
+            ),
+            CibVersionDto(0, 5, 12),
+        )
+
+    def test_missing_attribute(self):
+        self.assertIsNone(status_snapshot.parse_cib_version('<cib epoch="5"/>'))
+
+    def test_not_cib(self):
+        self.assertIsNone(status_snapshot.parse_cib_version("<status/>"))
+
+    def test_not_xml(self):
+        self.assertIsNone(status_snapshot.parse_cib_version("Error: no cib"))
+
+
+class GetProcessStartTime(TestCase):
+    def test_running(self):
+        start_time = status_snapshot.get_process_start_time(os.getpid())
+        self.assertIsInstance(start_time, int)
+        self.assertEqual(
+            status_snapshot.get_process_start_time(os.getpid()), start_time
+        )
+
+    @mock.patch("pcs.lib.pacemaker.status_snapshot.open")
+    def test_name_with_spaces(self, mock_open):
+        mock_open.return_value = mock.mock_open(
+            read_data="123 (a) b (c) S " + " ".join(map(str, range(4, 30)))
+        ).return_value
+        self.assertEqual(status_snapshot.get_process_start_time(123), 22)
+        mock_open.assert_called_once_with("/proc/123/stat", encoding="utf-8")
+
+    def test_not_running(self):
+        self.assertIsNone(status_snapshot.get_process_start_time(2**30))
+
+
+class SaveLoadSnapshot(TestCase):
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = os.path.join(self.tmp_dir.name, "status.json")
+
+    def test_save_and_load(self):
+        status_snapshot.save_snapshot(self.path, SNAPSHOT)
+        self.assertEqual(status_snapshot.load_snapshot(self.path), SNAPSHOT)
+        self.assertEqual(os.listdir(self.tmp_dir.name), ["status.json"])
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o600)
+
+    def test_load_missing(self):
+        self.assertIsNone(status_snapshot.load_snapshot(self.path))
+
+    def test_load_invalid(self):
+        for content in (
+            "not json",
+            "[]",
+            json.dumps({"generation": 1}),
+            json.dumps(
+                {
+                    "generation": 1,
+                    "timestamp": 1,
+                    "cib_version": {"epoch": 1},
+                    "status_xml": "",
+                }
+            ),
+            json.dumps(
+                {
+                    "generation": 1,
+                    "timestamp": 1,
+                    "cib_version": {
+                        "admin_epoch": 0,
+                        "epoch": 1,
+                        "num_updates": 2,
+                    },
+                    "status_xml": None,
+                    "pid": 1,
+                    "process_start_time": 1,
+                }
+            ),
+            json.dumps(
+                {
+                    "generation": 1,
+                    "timestamp": 1,
+                    "cib_version": {
+                        "admin_epoch": 0,
+                        "epoch": 1,
+                        "num_updates": 2,
+                    },
+                    "status_xml": "",
+                }
+            ),
+        ):
+            with self.subTest(content=content):
+                with open(self.path, "w", encoding="utf-8") as snapshot_file:
+                    snapshot_file.write(content)
+                self.assertIsNone(status_snapshot.load_snapshot(self.path))
+
+    def test_remove(self):
+        status_snapshot.save_snapshot(self.path, SNAPSHOT)
+        status_snapshot.remove_snapshot(self.path)
+        self.assertFalse(os.path.exists(self.path))
+        # removing a missing snapshot is not an error
+        status_snapshot.remove_snapshot(self.path)
+
+
+@mock.patch("pcs.lib.pacemaker.status_snapshot.load_snapshot")
+class GetCurrentStatusXml(TestCase):
+    def test_up_to_date(self, mock_load):
+        mock_load.return_value = SNAPSHOT
+        runner = get_runner_mock(
+            stdout=CIB_VERSION_XML, env_vars={"CIB_user": "hacluster"}
+        )
+        with mock.patch.object(settings, "pacemaker_uname", "hacluster"):
+            self.assertEqual(
+                status_snapshot.get_current_status_xml(runner),
+                SNAPSHOT.status_xml,
+            )
+        mock_load.assert_called_once_with(settings.pcsd_cluster_status_snapshot)
+        runner.run.assert_called_once_with(VERSION_QUERY)
+
+    def test_cib_changed(self, mock_load):
+        mock_load.return_value = SNAPSHOT
+        runner = get_runner_mock(
+            stdout='<cib admin_epoch="0" epoch="5" num_updates="13"/>'
+        )
+        self.assertIsNone(status_snapshot.get_current_status_xml(runner))
+        runner.run.assert_called_once_with(VERSION_QUERY)
+
+    def test_pcsd_not_running(self, mock_load):
+        mock_load.return_value = dataclasses.replace(SNAPSHOT, pid=2**30)
+        runner = get_runner_mock(stdout=CIB_VERSION_XML)
+        self.assertIsNone(status_snapshot.get_current_status_xml(runner))
+        runner.run.assert_not_called()
+
+    def test_pid_reused(self, mock_load):
+        mock_load.return_value = dataclasses.replace(
+            SNAPSHOT, process_start_time=SNAPSHOT.process_start_time - 1
+        )
+        runner = get_runner_mock(stdout=CIB_VERSION_XML)
+        self.assertIsNone(status_snapshot.get_current_status_xml(runner))
+        runner.run.assert_not_called()
+
+    def test_cib_not_available(self, mock_load):
+        mock_load.return_value = SNAPSHOT
+        runner = get_runner_mock(returncode=102)
+        self.assertIsNone(status_snapshot.get_current_status_xml(runner))
+
+    def test_no_snapshot(self, mock_load):
+        mock_load.return_value = None
+        runner = get_runner_mock(stdout=CIB_VERSION_XML)
+        self.assertIsNone(status_snapshot.get_current_status_xml(runner))
+        runner.run.assert_not_called()
+
+    def test_cib_file(self, mock_load):
+        runner = get_runner_mock(env_vars={"CIB_file": "/tmp/cib.xml"})
+        self.assertIsNone(status_snapshot.get_current_status_xml(runner))
+        mock_load.assert_not_called()
+        runner.run.assert_not_called()
+
+    def test_user_restricted_by_acls(self, mock_load):
+        runner = get_runner_mock(env_vars={"CIB_user": "user1"})
+        self.assertIsNone(status_snapshot.get_current_status_xml(runner))
+        mock_load.assert_not_called()
+        runner.run.assert_not_called()
@@ -0,0 +1,143 @@
+import os
+import os.path
+from unittest import TestCase, mock
+
+from pcs.common.tools import Version
+from pcs.lib.resource_agent import AgentMetadataCache, ResourceAgentName
+
+from pcs_test.tools.misc import get_tmp_dir
+
+METADATA = '<resource-agent name="Dummy"/>'
+
+
+class AgentMetadataCacheTest(TestCase):
+    # pylint: disable=too-many-instance-attributes
+    def setUp(self):
+        self.tmp_dir = get_tmp_dir("tier0_lib_resource_agent_cache")
+        self.cache_dir = os.path.join(self.tmp_dir.name, "cache")
+        self.ocf_root = os.path.join(self.tmp_dir.name, "ocf")
+        self.fence_dir = os.path.join(self.tmp_dir.name, "sbin")
+        os.makedirs(os.path.join(self.ocf_root, "resource.d", "pacemaker"))
+        os.makedirs(self.fence_dir)
+        self.ocf_agent = ResourceAgentName("ocf", "pacemaker", "Dummy")
+        self.ocf_agent_path = os.path.join(
+            self.ocf_root, "resource.d", "pacemaker", "Dummy"
+        )
+        self._touch(self.ocf_agent_path)
+        self.stonith_agent = ResourceAgentName("stonith", None, "fence_xvm")
+        self._touch(os.path.join(self.fence_dir, "fence_xvm"))
+        self.pacemaker_version = Version(2, 1, 7)
+        self.version_getter = mock.Mock(
+            side_effect=lambda: self.pacemaker_version
+        )
+        patcher = mock.patch.multiple(
+            "pcs.settings",
+            ocf_root=self.ocf_root,
+            fence_agent_execs=self.fence_dir,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    @staticmethod
+    def _touch(path, content="#!/bin/sh\n", mtime_ns=None):
+        with open(path, "w") as agent_file:
+            agent_file.write(content)
+        if mtime_ns is not None:
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def _cache(self):
+        return AgentMetadataCache(self.cache_dir, self.version_getter)
+
+    def test_empty_cache(self):
+        self.assertIsNone(self._cache().get(self.ocf_agent))
+
+    def test_put_get(self):
+        self._cache().put(self.ocf_agent, METADATA)
+        self._cache().put(self.stonith_agent, "stonith metadata")
+        self.assertEqual(self._cache().get(self.ocf_agent), METADATA)
+        self.assertEqual(
+            self._cache().get(self.stonith_agent), "stonith metadata"
+        )
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+    def test_pacemaker_version_loaded_once(self):
+        cache = self._cache()
+        cache.put(self.ocf_agent, METADATA)
+        cache.get(self.ocf_agent)
+        cache.get(self.stonith_agent)
+        self.version_getter.assert_called_once_with()
+
+    def test_agent_changed(self):
+        self._cache().put(self.ocf_agent, METADATA)
+        self._touch(self.ocf_agent_path, "#!/bin/sh\n# new version\n")
+        self.assertIsNone(self._cache().get(self.ocf_agent))
+
+    def test_agent_mtime_changed(self):
+        self._touch(self.ocf_agent_path, mtime_ns=1_000_000_000)
+        self._cache().put(self.ocf_agent, METADATA)
+        self._touch(self.ocf_agent_path, mtime_ns=2_000_000_000)
+        self.assertIsNone(self._cache().get(self.ocf_agent))
+
+    def test_agent_removed(self):
+        self._cache().put(self.ocf_agent, METADATA)
+        os.remove(self.ocf_agent_path)
+        self.assertIsNone(self._cache().get(self.ocf_agent))
+
+    def test_pacemaker_version_changed(self):
+        self._cache().put(self.ocf_agent, METADATA)
+        self.pacemaker_version = Version(3, 0, 0)
+        self.assertIsNone(self._cache().get(self.ocf_agent))
+
+    def test_pacemaker_version_unknown(self):
+        self.pacemaker_version = None
+        self._cache().put(self.ocf_agent, METADATA)
+        self.assertFalse(os.path.exists(self.cache_dir))
+        self.assertIsNone(self._cache().get(self.ocf_agent))
+
+    def test_agent_file_missing(self):
+        agent = ResourceAgentName("ocf", "pacemaker", "Missing")
+        self._cache().put(agent, METADATA)
+        self.assertFalse(os.path.exists(self.cache_dir))
+        self.assertIsNone(self._cache().get(agent))
+
+    def test_not_cached_agents(self):
+        for agent in (
+            ResourceAgentName("systemd", None, "chronyd"),
+            ResourceAgentName("ocf", None, "Dummy"),
+            ResourceAgentName("ocf", "pacemaker", "../pacemaker/Dummy"),
+            ResourceAgentName("ocf", "..", "Dummy"),
+        ):
+            with self.subTest(agent=agent):
+                self._cache().put(agent, METADATA)
+                self.assertFalse(os.path.exists(self.cache_dir))
+                self.assertIsNone(self._cache().get(agent))
+        self.version_getter.assert_not_called()
+
+    def test_broken_entry(self):
+        cache = self._cache()
+        cache.put(self.ocf_agent, METADATA)
+        (entry_file,) = os.listdir(self.cache_dir)
+        with open(os.path.join(self.cache_dir, entry_file), "w") as entry:
+            entry.write("not a json")
+        self.assertIsNone(self._cache().get(self.ocf_agent))
+
+    def test_cache_dir_not_writable(self):
+        self._touch(self.cache_dir)
+        self._cache().put(self.ocf_agent, METADATA)
+        self.assertIsNone(self._cache().get(self.ocf_agent))
+
+    def test_clear(self):
+        self._cache().put(self.ocf_agent, METADATA)
+        self._cache().put(self.stonith_agent, METADATA)
+        self.assertEqual(self._cache().clear(), 2)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+        self.assertIsNone(self._cache().get(self.ocf_agent))
+
+    def test_clear_no_cache_dir(self):
+        self.assertEqual(self._cache().clear(), 0)
+
+    def test_clear_error(self):
+        self._touch(self.cache_dir)
+        with self.assertRaises(OSError):
+            self._cache().clear()
@@ -172,6 +172,49 @@ class ResourceAgentFacadeFactory(TestCase):
             ).facade_from_parsed_name(name)
         self.assertEqual(cm.exception.agent_name, name.full_name)
 
+    def test_facades(self):
+        name_list = [
+            ra.ResourceAgentName("stonith", None, "fence_xvm"),
+            ra.ResourceAgentName("service", None, "missing"),
+            ra.ResourceAgentName("service", None, "daemon"),
+        ]
+        self.config.runner.pcmk.load_agent(
+            agent_name="stonith:fence_xvm",
+            stdout=self._fixture_agent_xml,
+            name="runner.pcmk.load_agent.xvm",
+        )
+        self.config.runner.pcmk.load_agent(
+            agent_name="service:missing",
+            agent_is_missing=True,
+            name="runner.pcmk.load_agent.missing",
+        )
+        self.config.runner.pcmk.load_agent(
+            agent_name="service:daemon",
+            stdout=self._fixture_agent_xml,
+            name="runner.pcmk.load_agent.daemon",
+        )
+        self.config.runner.pcmk.load_fake_agent_metadata(
+            stdout=self._fixture_fenced_xml
+        )
+
+        env = self.env_assist.get_env()
+        facade1, error, facade2 = ra.ResourceAgentFacadeFactory(
+            env.cmd_runner(), env.report_processor
+        ).facades_from_parsed_names(name_list, max_processes=2, timeout=10)
+
+        self.assertEqual(facade1.metadata.name, name_list[0])
+        self.assertEqual(
+            [param.name for param in facade1.metadata.parameters],
+            ["agent-param", "fenced-param"],
+        )
+        self.assertIsInstance(error, ra.UnableToGetAgentMetadata)
+        self.assertEqual(error.agent_name, "service:missing")
+        self.assertEqual(facade2.metadata.name, name_list[2])
+        self.assertEqual(
+            [param.name for param in facade2.metadata.parameters],
+            ["agent-param"],
+        )
+
     def test_void_load_and_cache_fenced_for_stonith(self):
         name1 = ra.ResourceAgentName("stonith", None, "fence_xvm")
         name2 = ra.ResourceAgentName("stonith", None, "fence_virt")
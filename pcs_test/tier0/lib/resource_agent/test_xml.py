@@ -435,6 +435,174 @@ class LoadMetadata(TestCase):
         )
 
 
+class LoadMetadataCached(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(test_case=self)
+        self.agent_name = ra.ResourceAgentName("ocf", "pacemaker", "Dummy")
+        self.metadata = '<resource-agent name="Dummy"/>'
+        self.cache = mock.Mock(spec_set=ra.AgentMetadataCache)
+
+    def test_cache_hit(self):
+        self.cache.get.return_value = self.metadata
+
+        env = self.env_assist.get_env()
+        assert_xml_equal(
+            self.metadata,
+            etree_to_str(
+                ra.xml.load_metadata(
+                    env.cmd_runner(), self.agent_name, self.cache
+                )
+            ),
+        )
+        self.cache.get.assert_called_once_with(self.agent_name)
+        self.cache.put.assert_not_called()
+
+    def test_cache_miss(self):
+        self.cache.get.return_value = None
+        self.config.runner.pcmk.load_agent(
+            agent_name="ocf:pacemaker:Dummy", stdout=self.metadata
+        )
+
+        env = self.env_assist.get_env()
+        assert_xml_equal(
+            self.metadata,
+            etree_to_str(
+                ra.xml.load_metadata(
+                    env.cmd_runner(), self.agent_name, self.cache
+                )
+            ),
+        )
+        self.cache.put.assert_called_once_with(self.agent_name, self.metadata)
+
+    def test_cache_broken_entry(self):
+        self.cache.get.return_value = "this is not an xml"
+        self.config.runner.pcmk.load_agent(
+            agent_name="ocf:pacemaker:Dummy", stdout=self.metadata
+        )
+
+        env = self.env_assist.get_env()
+        assert_xml_equal(
+            self.metadata,
+            etree_to_str(
+                ra.xml.load_metadata(
+                    env.cmd_runner(), self.agent_name, self.cache
+                )
+            ),
+        )
+        self.cache.put.assert_called_once_with(self.agent_name, self.metadata)
+
+    def test_invalid_metadata_not_cached(self):
+        self.cache.get.return_value = None
+        self.config.runner.pcmk.load_agent(
+            agent_name="ocf:pacemaker:Dummy", stdout="this is not an xml"
+        )
+
+        env = self.env_assist.get_env()
+        with self.assertRaises(ra.UnableToGetAgentMetadata):
+            ra.xml.load_metadata(env.cmd_runner(), self.agent_name, self.cache)
+        self.cache.put.assert_not_called()
+
+
+class LoadMetadataList(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(test_case=self)
+        self.metadata = '<resource-agent name="Dummy"/>'
+        self.name_list = [
+            ra.ResourceAgentName("ocf", "pacemaker", "Dummy"),
+            ra.ResourceAgentName("ocf", "pacemaker", "Missing"),
+            ra.ResourceAgentName("ocf", "pacemaker", "NotXml"),
+        ]
+
+    def test_success_and_errors(self):
+        self.config.runner.pcmk.load_agent(
+            agent_name="ocf:pacemaker:Dummy",
+            stdout=self.metadata,
+            name="runner.pcmk.load_agent.dummy",
+        )
+        self.config.runner.pcmk.load_agent(
+            agent_name="ocf:pacemaker:Missing",
+            agent_is_missing=True,
+            stderr="error message",
+            name="runner.pcmk.load_agent.missing",
+        )
+        self.config.runner.pcmk.load_agent(
+            agent_name="ocf:pacemaker:NotXml",
+            stdout="this is not an xml",
+            name="runner.pcmk.load_agent.not_xml",
+        )
+
+        env = self.env_assist.get_env()
+        dom, error1, error2 = ra.xml.load_metadata_list(
+            env.cmd_runner(), self.name_list, max_processes=2, timeout=10
+        )
+        assert_xml_equal(self.metadata, etree_to_str(dom))
+        self.assertIsInstance(error1, ra.UnableToGetAgentMetadata)
+        self.assertEqual(error1.agent_name, "ocf:pacemaker:Missing")
+        self.assertEqual(error1.message, "error message")
+        self.assertIsInstance(error2, ra.UnableToGetAgentMetadata)
+        self.assertEqual(error2.agent_name, "ocf:pacemaker:NotXml")
+        self.assertTrue(error2.message.startswith("Start tag expected"))
+
+    def test_cache(self):
+        cache = mock.Mock(spec_set=ra.AgentMetadataCache)
+        cache.get.side_effect = lambda name: (
+            self.metadata if name.type == "Dummy" else None
+        )
+        self.config.runner.pcmk.load_agent(
+            agent_name="ocf:pacemaker:Missing",
+            stdout=self.metadata,
+            name="runner.pcmk.load_agent.missing",
+        )
+
+        env = self.env_assist.get_env()
+        dom1, dom2 = ra.xml.load_metadata_list(
+            env.cmd_runner(), self.name_list[:2], cache
+        )
+        assert_xml_equal(self.metadata, etree_to_str(dom1))
+        assert_xml_equal(self.metadata, etree_to_str(dom2))
+        cache.put.assert_called_once_with(self.name_list[1], self.metadata)
+
+
+class LoadMetadataListRunnerMock(TestCase):
+    def setUp(self):
+        self.metadata = '<resource-agent name="Dummy"/>'
+        self.name_list = [
+            ra.ResourceAgentName("ocf", "pacemaker", "Dummy"),
+            ra.ResourceAgentName("ocf", "pacemaker", "Missing"),
+        ]
+
+    def test_timeout(self):
+        runner = mock.Mock(spec_set=CommandRunner)
+        runner.run_parallel.return_value = [None, ("", "error", 1)]
+        error1, error2 = ra.xml.load_metadata_list(
+            runner, self.name_list, max_processes=4, timeout=30
+        )
+        runner.run_parallel.assert_called_once_with(
+            [
+                [settings.crm_resource_exec, "--show-metadata", name.full_name]
+                for name in self.name_list
+            ],
+            env_extend={"PATH": "/usr/sbin:/bin:/usr/bin"},
+            max_processes=4,
+            timeout=30,
+        )
+        self.assertEqual(error1.agent_name, "ocf:pacemaker:Dummy")
+        self.assertEqual(
+            error1.message, "Agent did not provide metadata in 30 seconds"
+        )
+        self.assertEqual(error2.agent_name, "ocf:pacemaker:Missing")
+        self.assertEqual(error2.message, "error")
+
+    def test_all_cached(self):
+        cache = mock.Mock(spec_set=ra.AgentMetadataCache)
+        cache.get.return_value = self.metadata
+        runner = mock.Mock(spec_set=CommandRunner)
+        self.assertEqual(
+            len(ra.xml.load_metadata_list(runner, self.name_list, cache)), 2
+        )
+        runner.run_parallel.assert_not_called()
+
+
 class LoadFakeAgentMetadata(TestCase):
     def setUp(self):
         self.env_assist, self.config = get_env_tools(test_case=self)
@@ -6,6 +6,7 @@ from unittest import (
 )
 
 from pcs.common import file_type_codes
+from pcs.common.cancellation import CancellationToken
 from pcs.common.reports import ReportItemSeverity as severity
 from pcs.common.reports import codes as report_codes
 from pcs.lib.env import LibraryEnvironment
@@ -110,6 +111,7 @@ class CmdRunner(TestCase):
             {
                 "LC_ALL": "C",
             },
+            cancellation_token=None,
         )
 
     def test_user(self, mock_runner):
@@ -128,6 +130,25 @@ class CmdRunner(TestCase):
                 "CIB_user": user,
                 "LC_ALL": "C",
             },
+            cancellation_token=None,
+        )
+
+    def test_cancellation_token(self, mock_runner):
+        expected_runner = mock.MagicMock()
+        mock_runner.return_value = expected_runner
+        token = CancellationToken()
+        env = LibraryEnvironment(
+            self.mock_logger, self.mock_reporter, cancellation_token=token
+        )
+        runner = env.cmd_runner()
+        self.assertEqual(expected_runner, runner)
+        mock_runner.assert_called_once_with(
+            self.mock_logger,
+            self.mock_reporter,
+            {
+                "LC_ALL": "C",
+            },
+            cancellation_token=token,
         )
 
     @patch_env("create_tmp_cib")
@@ -150,6 +171,7 @@ class CmdRunner(TestCase):
                 "LC_ALL": "C",
                 "CIB_file": tmp_file_name,
             },
+            cancellation_token=None,
         )
         mock_tmpfile.assert_called_once_with(self.mock_reporter, "<cib />")
 
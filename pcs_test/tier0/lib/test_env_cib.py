@@ -208,6 +208,14 @@ class GetCib(TestCase, ManageCibAssertionMixin):
         env.get_cib()
         self.assert_raises_cib_already_loaded(env.get_cib)
 
+    def test_get_after_drop(self):
+        self.config.runner.cib.load().runner.cib.load(name="load_cib_2")
+        env = self.env_assist.get_env()
+        env.get_cib()
+        env.drop_loaded_cib()
+        self.assert_raises_cib_not_loaded(lambda: env.cib)
+        env.get_cib()
+
 
 class PushLoadedCib(TestCase, ManageCibAssertionMixin):
     wait_timeout = 10
@@ -446,3 +454,145 @@ class PushCibMockedWithWait(TestCase):
             ],
             expected_in_processor=False,
         )
+
+
+class CibBatch(TestCase, ManageCibAssertionMixin):
+    def setUp(self):
+        self.tmpfile_old = "old.cib"
+        self.tmpfile_new = "new.cib"
+        self.tmp_file_mock_obj = TmpFileMock(
+            file_content_checker=assert_xml_equal,
+        )
+        self.addCleanup(self.tmp_file_mock_obj.assert_all_done)
+        tmp_file_patcher = mock.patch("pcs.lib.tools.get_tmp_file")
+        self.addCleanup(tmp_file_patcher.stop)
+        tmp_file_mock = tmp_file_patcher.start()
+        tmp_file_mock.side_effect = (
+            self.tmp_file_mock_obj.get_mock_side_effect()
+        )
+        self.env_assist, self.config = get_env_tools(test_case=self)
+
+    def config_load_cib(self):
+        self.config.runner.cib.load(name="load_cib")
+        return self.config.calls.get("load_cib").stdout
+
+    def config_push_diff(self, loaded_cib, cib_new):
+        self.tmp_file_mock_obj.set_calls(
+            [
+                TmpFileCall(self.tmpfile_old, orig_content=loaded_cib),
+                TmpFileCall(self.tmpfile_new, orig_content=cib_new),
+            ]
+        )
+        self.config.runner.cib.diff(self.tmpfile_old, self.tmpfile_new)
+        self.config.runner.cib.push_diff()
+        return [
+            fixture.debug(
+                report_codes.TMP_FILE_WRITE,
+                file_path=self.tmpfile_old,
+                content=loaded_cib,
+            ),
+            fixture.debug(
+                report_codes.TMP_FILE_WRITE,
+                file_path=self.tmpfile_new,
+                content=cib_new.strip(),
+            ),
+        ]
+
+    @staticmethod
+    def add_resources(cib):
+        resources = cib.find("configuration/resources")
+        etree.SubElement(resources, "primitive", id="R1")
+        etree.SubElement(resources, "primitive", id="R2")
+
+    def test_single_load_and_push(self):
+        loaded_cib = self.config_load_cib()
+        expected_cib = etree.fromstring(loaded_cib)
+        self.add_resources(expected_cib)
+        expected_reports = self.config_push_diff(
+            loaded_cib, etree_to_str(expected_cib)
+        )
+        env = self.env_assist.get_env()
+
+        env.begin_cib_batch()
+        cib = env.get_cib()
+        etree.SubElement(
+            cib.find("configuration/resources"), "primitive", id="R1"
+        )
+        env.push_cib()
+        self.assertIs(env.get_cib(), cib)
+        etree.SubElement(
+            cib.find("configuration/resources"), "primitive", id="R2"
+        )
+        env.push_cib()
+        env.end_cib_batch()
+
+        self.assert_raises_cib_not_loaded(lambda: env.cib)
+        self.env_assist.assert_reports(expected_reports)
+
+    def test_read_only(self):
+        self.config_load_cib()
+        env = self.env_assist.get_env()
+
+        env.begin_cib_batch()
+        env.get_cib()
+        env.get_cib()
+        env.end_cib_batch()
+
+        self.assert_raises_cib_not_loaded(lambda: env.cib)
+
+    def test_no_cib(self):
+        env = self.env_assist.get_env()
+        env.begin_cib_batch()
+        env.end_cib_batch()
+
+    def test_double_begin(self):
+        env = self.env_assist.get_env()
+        env.begin_cib_batch()
+        self.assert_raises_cib_error(
+            env.begin_cib_batch, "CIB batch has already been started"
+        )
+
+    def test_end_without_begin(self):
+        env = self.env_assist.get_env()
+        self.assert_raises_cib_error(
+            env.end_cib_batch, "CIB batch has not been started"
+        )
+
+    def test_push_not_loaded(self):
+        env = self.env_assist.get_env()
+        env.begin_cib_batch()
+        self.assert_raises_cib_not_loaded(env.push_cib)
+
+    def test_push_custom_cib(self):
+        env = self.env_assist.get_env()
+        env.begin_cib_batch()
+        self.assert_raises_cib_error(
+            partial(env.push_cib, etree.XML("<cib/>")),
+            "Cannot push custom CIB in a CIB batch",
+        )
+
+    def test_push_wait(self):
+        self.config_load_cib()
+        env = self.env_assist.get_env()
+        env.begin_cib_batch()
+        env.get_cib()
+        self.assert_raises_cib_error(
+            partial(env.push_cib, wait_timeout=10),
+            "Cannot wait for pushing a CIB batch",
+        )
+
+    def test_upgrade_not_possible(self):
+        self.config.runner.cib.load(filename="cib-empty-3.1.xml")
+        env = self.env_assist.get_env()
+        env.begin_cib_batch()
+        env.get_cib(Version(3, 1, 0))
+        self.env_assist.assert_raise_library_error(
+            lambda: env.get_cib(Version(3, 2, 0)),
+            [
+                fixture.error(
+                    report_codes.CIB_UPGRADE_IN_BATCH_NOT_POSSIBLE,
+                    required_version="3.2.0",
+                )
+            ],
+            expected_in_processor=False,
+        )
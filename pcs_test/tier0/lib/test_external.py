@@ -1,4 +1,9 @@
+import hashlib
 import logging
+import os
+import sys
+import threading
+import time
 from subprocess import DEVNULL
 from unittest import (
     TestCase,
@@ -7,7 +12,10 @@ from unittest import (
 
 import pcs.lib.external as lib
 from pcs import settings
+from pcs.common import profiling
+from pcs.common.cancellation import CancellationToken, OperationCancelled
 from pcs.common.reports import ReportItemSeverity as severity
+from pcs.common.reports import ReportProcessor
 from pcs.common.reports import codes as report_codes
 
 from pcs_test.tools.assertions import (
@@ -15,7 +23,11 @@ from pcs_test.tools.assertions import (
     assert_report_item_list_equal,
 )
 from pcs_test.tools.custom_mock import MockLibraryReportProcessor
-from pcs_test.tools.misc import outdent
+from pcs_test.tools.misc import get_tmp_dir, outdent
+
+
+def sha256(data):
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
 
 
 @mock.patch("subprocess.Popen", autospec=True)
@@ -109,6 +121,20 @@ class CommandRunnerTest(TestCase):
             ],
         )
 
+    def test_debug_not_reported(self, mock_popen):
+        mock_process = mock.MagicMock(spec_set=["communicate", "returncode"])
+        mock_process.communicate.return_value = ("stdout", "stderr")
+        mock_process.returncode = 0
+        mock_popen.return_value = mock_process
+        mock_reporter = mock.Mock(spec=ReportProcessor)
+        mock_reporter.is_severity_reported.return_value = False
+
+        runner = lib.CommandRunner(self.mock_logger, mock_reporter)
+        runner.run(["a_command"], stdin_string="stdin")
+
+        mock_reporter.is_severity_reported.assert_called_with(severity.DEBUG)
+        mock_reporter.report.assert_not_called()
+
     def test_env(self, mock_popen):
         expected_stdout = "expected output"
         expected_stderr = "expected stderr"
@@ -291,6 +317,200 @@ class CommandRunnerTest(TestCase):
             ],
         )
 
+    def test_profiling(self, mock_popen):
+        mock_process = mock.MagicMock(spec_set=["communicate", "returncode"])
+        mock_process.communicate.return_value = ("stdout", "stderr čš")
+        mock_process.returncode = 1
+        mock_popen.return_value = mock_process
+        profiler = profiling.Profiler("test")
+
+        runner = lib.CommandRunner(self.mock_logger, self.mock_reporter)
+        with profiler.activate():
+            runner.run(["/usr/sbin/a_command", "arg"], stdin_string="input")
+
+        events = profiler.to_dict()["events"]
+        self.assertEqual(len(events), 1)
+        self.assertGreaterEqual(events[0].pop("duration"), 0)
+        self.assertGreaterEqual(events[0].pop("start"), 0)
+        self.assertEqual(
+            events[0],
+            {
+                "type": profiling.EVENT_COMMAND,
+                "binary": "/usr/sbin/a_command",
+                "bytes_in": 5,
+                "bytes_out": 17,
+                "return_code": 1,
+            },
+        )
+
+    def test_debug_log_disabled(self, mock_popen):
+        mock_process = mock.MagicMock(spec_set=["communicate", "returncode"])
+        mock_process.communicate.return_value = ("stdout", "stderr")
+        mock_process.returncode = 0
+        mock_popen.return_value = mock_process
+        self.mock_logger.isEnabledFor.return_value = False
+
+        runner = lib.CommandRunner(self.mock_logger, self.mock_reporter)
+        runner.run(["a_command"], stdin_string="stdin")
+
+        self.mock_logger.debug.assert_not_called()
+        self.assertEqual(len(self.mock_reporter.report_item_list), 2)
+
+    @mock.patch.object(settings, "command_runner_debug_payload_max_chars", 10)
+    def test_long_payload_shortened(self, mock_popen):
+        stdin = "0123456789" * 3
+        stdout = "abcdefghij" * 3
+        mock_process = mock.MagicMock(spec_set=["communicate", "returncode"])
+        mock_process.communicate.return_value = (stdout, "stderr")
+        mock_process.returncode = 0
+        mock_popen.return_value = mock_process
+
+        runner = lib.CommandRunner(self.mock_logger, self.mock_reporter)
+        runner.run(["a_command"], stdin_string=stdin)
+
+        (call_started, call_finished) = self.mock_logger.debug.call_args_list
+        self.assertEqual(
+            call_started.args[3],
+            outdent(
+                f"""
+                --Debug Input Start--
+                01234
+                [... 20 of 30 characters omitted, sha256 {sha256(stdin)} ...]
+                56789
+                --Debug Input End--"""
+            ),
+        )
+        self.assertEqual(
+            call_finished.args[3],
+            outdent(
+                f"""\
+                abcde
+                [... 20 of 30 characters omitted, sha256 {sha256(stdout)} ...]
+                fghij"""
+            ),
+        )
+        # short payloads are kept untouched
+        self.assertEqual(call_finished.args[4], "stderr")
+        # reports contain full payloads
+        self.assertEqual(
+            [
+                report.message.to_dto().payload.get("stdin")
+                for report in self.mock_reporter.report_item_list[:1]
+            ]
+            + [
+                report.message.to_dto().payload.get("stdout")
+                for report in self.mock_reporter.report_item_list[1:]
+            ],
+            [stdin, stdout],
+        )
+
+    def test_long_payload_spooled(self, mock_popen):
+        tmp_dir = get_tmp_dir("tier0_lib_external_spool")
+        self.addCleanup(tmp_dir.cleanup)
+        spool_file = os.path.join(tmp_dir.name, "spool.log")
+        stdout = "abcdefghij" * 3
+        mock_process = mock.MagicMock(spec_set=["communicate", "returncode"])
+        mock_process.communicate.return_value = (stdout, "")
+        mock_process.returncode = 0
+        mock_popen.return_value = mock_process
+
+        runner = lib.CommandRunner(self.mock_logger, self.mock_reporter)
+        with mock.patch.multiple(
+            settings,
+            command_runner_debug_payload_max_chars=10,
+            command_runner_debug_spool_file=spool_file,
+        ):
+            runner.run(["a_command"])
+
+        self.assertIn(
+            f"sha256 {sha256(stdout)}, full content in {spool_file} ...]",
+            self.mock_logger.debug.call_args_list[1].args[3],
+        )
+        with open(spool_file) as spool:
+            self.assertTrue(
+                spool.read().endswith(f"sha256 {sha256(stdout)}\n{stdout}\n\n")
+            )
+        self.assertEqual(os.stat(spool_file).st_mode & 0o777, 0o600)
+        self.assertEqual(
+            sorted(os.listdir(tmp_dir.name)), ["spool.log", "spool.log.lock"]
+        )
+
+    def test_long_payload_spool_rotated(self, mock_popen):
+        tmp_dir = get_tmp_dir("tier0_lib_external_spool")
+        self.addCleanup(tmp_dir.cleanup)
+        spool_file = os.path.join(tmp_dir.name, "spool.log")
+        mock_process = mock.MagicMock(spec_set=["communicate", "returncode"])
+        mock_process.returncode = 0
+        mock_popen.return_value = mock_process
+
+        runner = lib.CommandRunner(self.mock_logger, self.mock_reporter)
+        with mock.patch.multiple(
+            settings,
+            command_runner_debug_payload_max_chars=10,
+            command_runner_debug_spool_file=spool_file,
+            command_runner_debug_spool_max_bytes=200,
+            command_runner_debug_spool_backup_count=1,
+        ):
+            for char in "abc":
+                mock_process.communicate.return_value = (char * 100, "")
+                runner.run(["a_command"])
+
+        self.assertEqual(
+            sorted(os.listdir(tmp_dir.name)),
+            ["spool.log", "spool.log.1", "spool.log.lock"],
+        )
+        with open(f"{spool_file}.1") as spool:
+            self.assertTrue(spool.read().endswith(f"{'b' * 100}\n\n"))
+        with open(spool_file) as spool:
+            self.assertTrue(spool.read().endswith(f"{'c' * 100}\n\n"))
+
+    @mock.patch.object(settings, "command_runner_debug_payload_max_chars", 10)
+    def test_long_binary_payload_shortened(self, mock_popen):
+        stdout = b"\x00" * 30
+        mock_process = mock.MagicMock(spec_set=["communicate", "returncode"])
+        mock_process.communicate.return_value = (stdout, b"stderr")
+        mock_process.returncode = 0
+        mock_popen.return_value = mock_process
+
+        runner = lib.CommandRunner(self.mock_logger, self.mock_reporter)
+        self.assertEqual(
+            runner.run(["a_command"], binary_output=True),
+            (stdout, b"stderr", 0),
+        )
+
+        call_finished = self.mock_logger.debug.call_args_list[1]
+        self.assertEqual(
+            call_finished.args[3],
+            outdent(
+                f"""\
+                b'\\x00\\x00\\x00\\x00\\x00'
+                [... 20 of 30 bytes omitted, sha256 {hashlib.sha256(stdout).hexdigest()} ...]
+                b'\\x00\\x00\\x00\\x00\\x00'"""
+            ),
+        )
+        self.assertEqual(call_finished.args[4], "b'stderr'")
+
+    @mock.patch.object(settings, "command_runner_debug_payload_max_chars", 10)
+    def test_spool_file_not_writable(self, mock_popen):
+        stdout = "abcdefghij" * 3
+        mock_process = mock.MagicMock(spec_set=["communicate", "returncode"])
+        mock_process.communicate.return_value = (stdout, "")
+        mock_process.returncode = 0
+        mock_popen.return_value = mock_process
+
+        runner = lib.CommandRunner(self.mock_logger, self.mock_reporter)
+        with mock.patch.object(
+            settings,
+            "command_runner_debug_spool_file",
+            "/nonexistent_dir/spool.log",
+        ):
+            runner.run(["a_command"])
+
+        self.assertIn(
+            f"sha256 {sha256(stdout)} ...]",
+            self.mock_logger.debug.call_args_list[1].args[3],
+        )
+
     def test_popen_error(self, mock_popen):
         expected_error = "expected error"
         command = ["a_command"]
@@ -395,6 +615,179 @@ class CommandRunnerTest(TestCase):
         )
 
 
+class CommandRunnerRunParallelTest(TestCase):
+    def setUp(self):
+        self.mock_logger = mock.MagicMock(logging.Logger)
+        self.mock_reporter = MockLibraryReportProcessor()
+        self.runner = lib.CommandRunner(
+            self.mock_logger, self.mock_reporter, {"VAR": "value"}
+        )
+
+    @staticmethod
+    def _python(code):
+        return [sys.executable, "-c", code]
+
+    def test_success(self):
+        big_output = "x" * 300000
+        result = self.runner.run_parallel(
+            [
+                self._python(
+                    "import sys, time, os; time.sleep(0.2); "
+                    "print(os.environ['VAR'] + os.environ['EXTRA'])"
+                ),
+                self._python(
+                    "import sys; sys.stderr.write('err'); sys.exit(2)"
+                ),
+                self._python("print('x' * 300000)"),
+            ],
+            env_extend={"EXTRA": "-extra"},
+            max_processes=2,
+        )
+        self.assertEqual(
+            result,
+            [
+                ("value-extra\n", "", 0),
+                ("", "err", 2),
+                (big_output + "\n", "", 0),
+            ],
+        )
+        report_codes_list = [
+            item.message.code for item in self.mock_reporter.report_item_list
+        ]
+        self.assertEqual(
+            report_codes_list.count(report_codes.RUN_EXTERNAL_PROCESS_STARTED),
+            3,
+        )
+        self.assertEqual(
+            report_codes_list.count(report_codes.RUN_EXTERNAL_PROCESS_FINISHED),
+            3,
+        )
+
+    def test_runs_in_parallel(self):
+        start = time.monotonic()
+        result = self.runner.run_parallel(
+            [self._python("import time; time.sleep(0.5)")] * 4,
+            max_processes=4,
+        )
+        self.assertEqual(result, [("", "", 0)] * 4)
+        self.assertLess(time.monotonic() - start, 1.5)
+
+    def test_timeout(self):
+        start = time.monotonic()
+        result = self.runner.run_parallel(
+            [
+                self._python("import time; time.sleep(30)"),
+                self._python("print('done')"),
+            ],
+            max_processes=2,
+            timeout=0.5,
+        )
+        self.assertEqual(result, [None, ("done\n", "", 0)])
+        self.assertLess(time.monotonic() - start, 10)
+        self.mock_logger.debug.assert_any_call(
+            "Timed out running: %s", mock.ANY
+        )
+
+    def test_no_commands(self):
+        self.assertEqual(self.runner.run_parallel([]), [])
+
+    def test_os_error(self):
+        assert_raise_library_error(
+            lambda: self.runner.run_parallel(
+                [
+                    self._python("import time; time.sleep(30)"),
+                    ["/nonexistent/command"],
+                ],
+                max_processes=2,
+            ),
+            (
+                severity.ERROR,
+                report_codes.RUN_EXTERNAL_PROCESS_ERROR,
+                {
+                    "command": "/nonexistent/command",
+                    "reason": (
+                        "No such file or directory: '/nonexistent/command'"
+                    ),
+                },
+                None,
+            ),
+        )
+        self.mock_logger.debug.assert_any_call(
+            "Killed running: %s, due to an error: %r", mock.ANY, mock.ANY
+        )
+        for call in self.mock_logger.debug.call_args_list:
+            self.assertNotEqual(call.args[0], "Timed out running: %s")
+
+
+class CommandRunnerCancellationTest(TestCase):
+    def setUp(self):
+        self.mock_logger = mock.MagicMock(logging.Logger)
+        self.mock_reporter = MockLibraryReportProcessor()
+        self.token = CancellationToken()
+        self.runner = lib.CommandRunner(
+            self.mock_logger,
+            self.mock_reporter,
+            cancellation_token=self.token,
+        )
+
+    @staticmethod
+    def _python(code):
+        return [sys.executable, "-c", code]
+
+    def _cancel_later(self):
+        timer = threading.Timer(0.3, self.token.cancel)
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+    def test_not_cancelled(self):
+        self.assertEqual(
+            self.runner.run(
+                self._python(
+                    "import sys, time; time.sleep(0.7); "
+                    "print(sys.stdin.read()); sys.exit(3)"
+                ),
+                stdin_string="input",
+            ),
+            ("input\n", "", 3),
+        )
+
+    def test_run_cancelled(self):
+        self._cancel_later()
+        start = time.monotonic()
+        with self.assertRaises(OperationCancelled):
+            self.runner.run(self._python("import time; time.sleep(30)"))
+        self.assertLess(time.monotonic() - start, 10)
+        self.mock_logger.debug.assert_called_with(
+            "Cancelled running: %s", mock.ANY
+        )
+
+    def test_run_cancelled_ignoring_sigterm(self):
+        self._cancel_later()
+        start = time.monotonic()
+        with self.assertRaises(OperationCancelled):
+            self.runner.run(
+                self._python(
+                    "import signal, time; "
+                    "signal.signal(signal.SIGTERM, signal.SIG_IGN); "
+                    "time.sleep(30)"
+                )
+            )
+        self.assertLess(time.monotonic() - start, 10)
+
+    def test_run_parallel_cancelled(self):
+        self._cancel_later()
+        start = time.monotonic()
+        with self.assertRaises(OperationCancelled):
+            self.runner.run_parallel(
+                [self._python("import time; time.sleep(30)")] * 3,
+                max_processes=2,
+            )
+        self.assertLess(time.monotonic() - start, 10)
+        self.mock_logger.debug.assert_any_call(
+            "Cancelled running: %s", mock.ANY
+        )
+
+
 class KillServicesTest(TestCase):
     def setUp(self):
         self.mock_runner = mock.MagicMock(spec_set=lib.CommandRunner)
@@ -0,0 +1,147 @@
+import json
+import os.path
+from unittest import TestCase
+
+from pcs_test.tools import duration_sharding
+from pcs_test.tools.misc import get_tmp_dir
+from pcs_test.tools.parallel_test_runner import (
+    ParallelTestResult,
+    aggregate_test_results,
+)
+
+T0 = "pcs_test.tier0.test_module.Test"
+T1 = "pcs_test.tier1.test_module.Test"
+
+
+class ShardTests(TestCase):
+    def test_no_tests(self):
+        self.assertEqual(duration_sharding.shard_tests([], {}, 4), [])
+
+    def test_less_tests_than_shards(self):
+        self.assertEqual(
+            duration_sharding.shard_tests([f"{T0}.b", f"{T0}.a"], {}, 4),
+            [[f"{T0}.a"], [f"{T0}.b"]],
+        )
+
+    def test_balanced_by_durations(self):
+        durations = {
+            f"{T0}.a": 5.0,
+            f"{T0}.b": 4.0,
+            f"{T0}.c": 3.0,
+            f"{T0}.d": 3.0,
+            f"{T0}.e": 2.0,
+            f"{T0}.f": 2.0,
+            f"{T0}.g": 1.0,
+        }
+        self.assertEqual(
+            duration_sharding.shard_tests(durations, durations, 2),
+            [
+                [f"{T0}.a", f"{T0}.d", f"{T0}.f"],
+                [f"{T0}.b", f"{T0}.c", f"{T0}.e", f"{T0}.g"],
+            ],
+        )
+
+    def test_unknown_durations(self):
+        # a tier1 test is expected to take longer than tier0 tests
+        self.assertEqual(
+            duration_sharding.shard_tests(
+                [f"{T1}.a"] + [f"{T0}.{i}" for i in range(10)],
+                {},
+                2,
+            ),
+            [[f"{T1}.a"], [f"{T0}.{i}" for i in range(10)]],
+        )
+
+    def test_select_shard(self):
+        test_list = [f"{T0}.{i}" for i in range(10)]
+        durations = {f"{T0}.{i}": float(i) for i in range(10)}
+        selected = [
+            duration_sharding.select_shard(test_list, durations, index, 3)
+            for index in range(1, 4)
+        ]
+        self.assertEqual(
+            sorted(test for shard in selected for test in shard), test_list
+        )
+        self.assertEqual(
+            [sum(durations[test] for test in shard) for shard in selected],
+            [16.0, 15.0, 14.0],
+        )
+
+    def test_select_shard_more_shards_than_tests(self):
+        self.assertEqual(
+            duration_sharding.select_shard([f"{T0}.a"], {}, 2, 2), []
+        )
+
+
+class StoredDurations(TestCase):
+    def test_load_missing(self):
+        with get_tmp_dir("tier0_durations") as tmp_dir:
+            self.assertEqual(
+                duration_sharding.load_durations(
+                    os.path.join(tmp_dir, "durations.json")
+                ),
+                {},
+            )
+
+    def test_load_invalid(self):
+        with get_tmp_dir("tier0_durations") as tmp_dir:
+            path = os.path.join(tmp_dir, "durations.json")
+            for content in (
+                "not json",
+                "[]",
+                json.dumps({"format_version": 0, "durations": {"a": 1}}),
+            ):
+                with self.subTest(content=content):
+                    with open(path, "w") as durations_file:
+                        durations_file.write(content)
+                    self.assertEqual(duration_sharding.load_durations(path), {})
+
+    def test_save_and_update(self):
+        with get_tmp_dir("tier0_durations") as tmp_dir:
+            path = os.path.join(tmp_dir, "durations.json")
+            duration_sharding.save_durations(path, {"a": 1.0, "b": 2.123456})
+            self.assertEqual(
+                duration_sharding.load_durations(path),
+                {"a": 1.0, "b": 2.1235},
+            )
+            duration_sharding.save_durations(path, {"b": 3.0, "c": 0.5})
+            self.assertEqual(
+                duration_sharding.load_durations(path),
+                {"a": 1.0, "b": 3.0, "c": 0.5},
+            )
+            duration_sharding.save_durations(path, {"c": 1.5}, ["b", "c"])
+            self.assertEqual(
+                duration_sharding.load_durations(path), {"b": 3.0, "c": 1.5}
+            )
+
+
+class FormatSlowest(TestCase):
+    def test_empty(self):
+        self.assertEqual(duration_sharding.format_slowest({}, 3), [])
+
+    def test_slowest(self):
+        self.assertEqual(
+            duration_sharding.format_slowest(
+                {"a": 0.1, "b": 2.5, "c": 1.25, "d": 0.2}, 2
+            ),
+            [
+                "Slowest 2 tests:",
+                "     2.500s  b",
+                "     1.250s  c",
+            ],
+        )
+
+
+class AggregateDurations(TestCase):
+    def test_durations_merged(self):
+        self.assertEqual(
+            aggregate_test_results(
+                [
+                    ParallelTestResult(tests_run=1, durations={"a": 1.0}),
+                    ParallelTestResult(
+                        tests_run=2, durations={"b": 2.0, "c": 3.0}
+                    ),
+                ]
+            ).durations,
+            {"a": 1.0, "b": 2.0, "c": 3.0},
+        )
@@ -0,0 +1,213 @@
+import logging
+from unittest import TestCase
+
+from lxml import etree
+
+from pcs.common import reports
+from pcs.lib.communication.nodes import CheckReachability, DistributeFiles
+from pcs.lib.communication.tools import run
+from pcs.lib.env import LibraryEnvironment
+from pcs.lib.pacemaker.status import ClusterStatusParser
+
+from pcs_test.perf import generators
+from pcs_test.perf.benchmarks import BENCHMARKS, ClusterData
+from pcs_test.perf.run import RESULTS_FORMAT_VERSION, compare_results
+from pcs_test.perf.simulator import NodeBehavior, PcsdSimulator
+from pcs_test.tools import fixture
+from pcs_test.tools.custom_mock import MockLibraryReportProcessor
+
+TINY_SIZE = generators.ClusterSize(
+    nodes=2,
+    primitives=5,
+    groups=1,
+    clones=1,
+    bundles=1,
+    constraints=6,
+    rules=2,
+    nvpairs=2,
+    tags=1,
+    acls=1,
+)
+
+
+class Generators(TestCase):
+    def test_scaled(self):
+        self.assertEqual(
+            TINY_SIZE.scaled(3),
+            generators.ClusterSize(
+                nodes=2,
+                primitives=15,
+                groups=3,
+                clones=3,
+                bundles=3,
+                constraints=18,
+                rules=6,
+                nvpairs=2,
+                tags=3,
+                acls=3,
+            ),
+        )
+
+    def test_cib(self):
+        cib = etree.fromstring(generators.generate_cib(TINY_SIZE))
+        self.assertEqual(len(cib.findall("./configuration/nodes/node")), 2)
+        self.assertEqual(len(cib.findall(".//primitive")), 5 + 3 + 1)
+        self.assertEqual(len(cib.findall(".//group")), 1)
+        self.assertEqual(len(cib.findall(".//clone")), 1)
+        self.assertEqual(len(cib.findall(".//bundle")), 1)
+        self.assertEqual(len(cib.findall("./configuration/constraints/*")), 8)
+        self.assertEqual(len(cib.findall(".//rsc_location/rule")), 2)
+        self.assertEqual(len(cib.findall(".//tag")), 1)
+        self.assertEqual(len(cib.findall(".//acl_role")), 1)
+        # obj_ref and role in acl_target elements reference other elements
+        ids = cib.xpath("//*[not(self::obj_ref or parent::acl_target)]/@id")
+        self.assertEqual(len(ids), len(set(ids)))
+
+    def test_crm_mon(self):
+        parser = ClusterStatusParser(
+            etree.fromstring(generators.generate_crm_mon(TINY_SIZE))
+        )
+        resources = parser.status_xml_to_dto().resources
+        self.assertEqual(parser.get_warnings(), [])
+        self.assertEqual(
+            [res.resource_id for res in resources],
+            ["R-0", "R-1", "R-2", "R-3", "R-4", "G-0", "C-0", "B-0"],
+        )
+
+
+class Simulator(TestCase):
+    def setUp(self):
+        self.simulator = PcsdSimulator(
+            ["ok", "slow", "offline", "unauth"],
+            {
+                "slow": NodeBehavior(
+                    latency=0.01, drip_chunk_size=8, drip_interval=0.001
+                ),
+                "offline": NodeBehavior(offline=True),
+                "unauth": NodeBehavior(response_code=401),
+            },
+        )
+        self.simulator.start()
+        self.addCleanup(self.simulator.stop)
+        self.report_processor = MockLibraryReportProcessor(debug=False)
+        self.env = LibraryEnvironment(
+            logging.getLogger("test"),
+            self.report_processor,
+            known_hosts_getter=lambda: self.simulator.known_hosts,
+        )
+
+    def _run(self, com_cmd, node_names):
+        com_cmd.set_targets(
+            self.env.get_node_target_factory().get_target_list(node_names)
+        )
+        return run(self.env.get_node_communicator(), com_cmd)
+
+    def test_reachability(self):
+        self.assertEqual(
+            self._run(
+                CheckReachability(self.report_processor),
+                ["ok", "slow", "offline", "unauth"],
+            ),
+            {
+                "ok": CheckReachability.REACHABLE,
+                "slow": CheckReachability.REACHABLE,
+                "offline": CheckReachability.UNREACHABLE,
+                "unauth": CheckReachability.UNAUTH,
+            },
+        )
+        self.assertEqual(
+            dict(self.simulator.request_counter),
+            {
+                ("ok", "remote/check_auth"): 1,
+                ("slow", "remote/check_auth"): 1,
+                ("unauth", "remote/check_auth"): 1,
+            },
+        )
+
+    def test_slowly_sent_response(self):
+        self._run(
+            DistributeFiles(
+                self.report_processor,
+                {
+                    "file1": {"type": "pcmk_remote_authkey"},
+                    "file2": {"type": "corosync_authkey"},
+                },
+            ),
+            ["ok", "slow"],
+        )
+        self.report_processor.assert_reports(
+            [
+                fixture.info(
+                    reports.codes.FILES_DISTRIBUTION_STARTED,
+                    file_list=["file1", "file2"],
+                    node_list=["ok", "slow"],
+                )
+            ]
+            + [
+                fixture.info(
+                    reports.codes.FILE_DISTRIBUTION_SUCCESS,
+                    node=node,
+                    file_description=file,
+                )
+                for node in ["ok", "slow"]
+                for file in ["file1", "file2"]
+            ]
+        )
+
+
+class Benchmarks(TestCase):
+    def test_all_benchmarks_run(self):
+        data = ClusterData(TINY_SIZE)
+        self.addCleanup(data.close)
+        for benchmark in BENCHMARKS:
+            with self.subTest(benchmark=benchmark.name):
+                self.assertGreaterEqual(benchmark.run(data), 0)
+
+
+class CompareResults(TestCase):
+    @staticmethod
+    def _results(size=None, **medians):
+        return {
+            "format_version": RESULTS_FORMAT_VERSION,
+            "size": size or {"primitives": 1},
+            "results": {
+                name: {"median": median} for name, median in medians.items()
+            },
+        }
+
+    def test_no_regression(self):
+        self.assertEqual(
+            compare_results(
+                self._results(a=0.1, b=0.2),
+                self._results(a=0.105, b=0.1, c=0.3),
+                10,
+            ),
+            (
+                [
+                    "a: 100.000 ms -> 105.000 ms (+5.0 %)",
+                    "b: 200.000 ms -> 100.000 ms (-50.0 %)",
+                    "c: no previous result",
+                ],
+                False,
+            ),
+        )
+
+    def test_regression(self):
+        self.assertEqual(
+            compare_results(self._results(a=0.1), self._results(a=0.12), 10),
+            (["a: 100.000 ms -> 120.000 ms (+20.0 %) SLOWER"], True),
+        )
+
+    def test_different_node_latency(self):
+        baseline = self._results(a=0.1)
+        baseline["node_latency"] = 0.1
+        with self.assertRaises(ValueError):
+            compare_results(baseline, self._results(a=0.1), 10)
+
+    def test_different_size(self):
+        with self.assertRaises(ValueError):
+            compare_results(
+                self._results(a=0.1),
+                self._results(size={"primitives": 2}, a=0.1),
+                10,
+            )
@@ -230,7 +230,8 @@ class NodeUtilizationSet(
             "node utilization rh7-0 test=10".split(),
             (
                 f"{FIXTURE_UTILIZATION_WARNING}"
-                "Error: Unable to find a node: rh7-0\n"
+                "Error: Node 'rh7-0' does not appear to exist in "
+                "configuration\n"
             ),
         )
 
@@ -239,8 +240,9 @@ class NodeUtilizationSet(
             "node utilization rh7-1 test1=10 test=int".split(),
             (
                 f"{FIXTURE_UTILIZATION_WARNING}"
-                "Error: Value of utilization attribute must be integer: "
-                "'test=int'\n"
+                "Error: 'int' is not a valid test value, use an integer\n"
+                "Error: Errors have occurred, therefore pcs is unable to "
+                "continue\n"
             ),
         )
 
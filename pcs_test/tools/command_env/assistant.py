@@ -7,6 +7,7 @@ import shutil
 from functools import partial
 from unittest import mock
 
+from pcs import settings
 from pcs.common.file import RawFile
 from pcs.common.node_communicator import NodeCommunicatorFactory
 from pcs.common.types import StringIterable
@@ -18,6 +19,9 @@ from pcs_test.tools.case_analysis import test_failed
 from pcs_test.tools.command_env import spy
 from pcs_test.tools.command_env.calls import Queue as CallQueue
 from pcs_test.tools.command_env.config import Config
+from pcs_test.tools.command_env.mock_agent_metadata_cache import (
+    DisabledAgentMetadataCache,
+)
 from pcs_test.tools.command_env.mock_fcntl import (
     get_fcntl_mock,
     is_fcntl_call_in,
@@ -109,6 +113,24 @@ def patch_env(call_queue, config, init_env):
             "_get_service_manager", lambda _: ServiceManagerMock(call_queue)
         ),
     ]
+    if config.env.agent_metadata_cache_dir is None:
+        # Agents metadata are loaded from agents in tests by default,
+        # persistent cache would make tests depend on each other and on the
+        # test machine
+        patcher_list.append(
+            patch_lib_env(
+                "get_agent_metadata_cache",
+                lambda _: DisabledAgentMetadataCache(),
+            )
+        )
+    else:
+        patcher_list.append(
+            mock.patch.object(
+                settings,
+                "agent_metadata_cache_dir",
+                config.env.agent_metadata_cache_dir,
+            )
+        )
     if is_fcntl_call_in(call_queue):
         fcntl_mock = get_fcntl_mock(call_queue)
         patcher_list.append(
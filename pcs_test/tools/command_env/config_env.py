@@ -19,6 +19,7 @@ class EnvConfig:
         self.__corosync_conf_data = None
         self.__booth = None
         self.__known_hosts_getter = None
+        self.__agent_metadata_cache_dir = None
 
     def set_cib_data(self, cib_data, cib_tempfile="/fake/tmp/file"):
         self.__cib_data = cib_data
@@ -80,6 +81,19 @@ class EnvConfig:
     def known_hosts_getter(self):
         return self.__known_hosts_getter
 
+    def set_agent_metadata_cache_dir(self, cache_dir):
+        """
+        Use a persistent agents metadata cache stored in the specified
+        directory instead of the default disabled cache
+
+        string cache_dir -- a directory private to the test
+        """
+        self.__agent_metadata_cache_dir = cache_dir
+
+    @property
+    def agent_metadata_cache_dir(self):
+        return self.__agent_metadata_cache_dir
+
     def push_cib(
         self,
         *,
@@ -1399,28 +1399,6 @@ class PcmkShortcuts:
             ),
         )
 
-    def ticket_cleanup(
-        self,
-        ticket_name: str,
-        stderr="",
-        returncode=0,
-        name="runner.pcmk.ticket_cleanup",
-    ) -> None:
-        self.__calls.place(
-            name,
-            RunnerCall(
-                [
-                    settings.crm_ticket_exec,
-                    "--cleanup",
-                    "--force",
-                    "--ticket",
-                    ticket_name,
-                ],
-                stderr=stderr,
-                returncode=returncode,
-            ),
-        )
-
     def version(
         self,
         name="runner.pcmk.version",
@@ -0,0 +1,23 @@
+from pcs.lib.resource_agent import AgentMetadataCache, ResourceAgentName
+
+
+class DisabledAgentMetadataCache(AgentMetadataCache):
+    """
+    Agents metadata cache which never provides nor stores any metadata
+
+    Persistent cache would make tests depend on each other and on the test
+    machine. Tests of the cache set a cache directory in the env config.
+    """
+
+    def __init__(self) -> None:
+        super().__init__("", lambda: None)
+
+    def get(self, agent_name: ResourceAgentName) -> str | None:
+        del agent_name
+        return None
+
+    def put(self, agent_name: ResourceAgentName, metadata: str) -> None:
+        del agent_name, metadata
+
+    def clear(self) -> int:
+        return 0
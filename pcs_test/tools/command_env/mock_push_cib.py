@@ -66,6 +66,11 @@ def get_push_cib(call_queue):
         if expected_call.exception:
             raise expected_call.exception
 
+        # the real push_cib forgets the loaded CIB so that it can be loaded
+        # again in the same command
+        if custom_cib is None:
+            lib_env.drop_loaded_cib()
+
     return push_cib
 
 
@@ -139,3 +139,10 @@ class Runner:
                 f"Command #{i}: ENV doesn't match. Expected: {call.env}; Real: {env}"
             )
         return call.stdout, call.stderr, call.returncode
+
+    def run_parallel(
+        self, args_list, env_extend=None, max_processes=1, timeout=None
+    ):
+        # Processes are expected to be run in the order they were specified in.
+        del max_processes, timeout
+        return [self.run(args, env_extend=env_extend) for args in args_list]
@@ -85,6 +85,14 @@ class Runner:
         print_line("returncode:{0}".format(returncode))
         return stdout, stderr, returncode
 
+    def run_parallel(
+        self, args_list, env_extend=None, max_processes=1, timeout=None
+    ):
+        print_call(self, "run_parallel")
+        print_line("max_processes: {0}".format(max_processes))
+        print_line("timeout: {0}".format(timeout))
+        return [self.run(args, env_extend=env_extend) for args in args_list]
+
 
 def get_local_corosync_conf():
     print_caption("get_local_corosync_conf", indent=0)
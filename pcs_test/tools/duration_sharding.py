@@ -0,0 +1,165 @@
+"""
+Distribution of tests to workers based on their durations in previous runs
+"""
+
+import heapq
+import json
+import os
+from collections.abc import Iterable, Mapping
+
+DURATIONS_FORMAT_VERSION = 1
+# expected durations of tests which have not been run yet, tier1 tests run
+# pcs and other binaries and take much longer than tier0 tests
+DEFAULT_TIER0_DURATION = 0.01
+DEFAULT_TIER1_DURATION = 0.5
+
+
+def load_durations(path: str) -> dict[str, float]:
+    """
+    Load durations of tests in seconds stored by previous runs
+
+    Missing or broken files are treated as empty, a test run must not fail
+    because of them.
+    """
+    try:
+        with open(path, encoding="utf-8") as durations_file:
+            data = json.load(durations_file)
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(data, dict)
+        or data.get("format_version") != DURATIONS_FORMAT_VERSION
+        or not isinstance(data.get("durations"), dict)
+    ):
+        return {}
+    return {
+        str(test_name): float(duration)
+        for test_name, duration in data["durations"].items()
+        if isinstance(duration, (int, float))
+    }
+
+
+def save_durations(
+    path: str,
+    durations: Mapping[str, float],
+    known_tests: Iterable[str] | None = None,
+) -> None:
+    """
+    Update stored durations of tests with durations measured in a test run
+
+    durations -- measured durations of tests in seconds
+    known_tests -- if specified, stored durations of tests not listed here
+        are dropped, used to forget removed tests
+    """
+    stored_durations = load_durations(path)
+    if known_tests is not None:
+        known_test_set = set(known_tests)
+        stored_durations = {
+            test_name: duration
+            for test_name, duration in stored_durations.items()
+            if test_name in known_test_set
+        }
+    stored_durations.update(durations)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as durations_file:
+        json.dump(
+            {
+                "format_version": DURATIONS_FORMAT_VERSION,
+                "durations": {
+                    test_name: round(duration, 4)
+                    for test_name, duration in sorted(stored_durations.items())
+                },
+            },
+            durations_file,
+            indent=0,
+        )
+    os.replace(tmp_path, path)
+
+
+def expected_duration(test_name: str, durations: Mapping[str, float]) -> float:
+    if test_name in durations:
+        return durations[test_name]
+    if ".tier1." in test_name:
+        return DEFAULT_TIER1_DURATION
+    return DEFAULT_TIER0_DURATION
+
+
+def shard_tests(
+    test_list: Iterable[str],
+    durations: Mapping[str, float],
+    shard_count: int,
+) -> list[list[str]]:
+    """
+    Split tests to shards with balanced expected durations
+
+    Tests are assigned from the longest one to the shard with the shortest
+    expected duration so far. Returned shards are ordered from the longest
+    one, so the long shards do not end up running last when shards are
+    dispatched to workers in the returned order. Tests in each shard are
+    sorted by their names, so tests of a module run together.
+
+    test_list -- names of tests to split
+    durations -- durations of tests in previous runs
+    shard_count -- maximal number of shards, no empty shards are returned
+    """
+    unique_test_list = sorted(set(test_list))
+    shard_count = min(max(shard_count, 1), len(unique_test_list))
+    if shard_count < 1:
+        return []
+    heap: list[tuple[float, int, list[str]]] = [
+        (0.0, index, []) for index in range(shard_count)
+    ]
+    for test_name in sorted(
+        unique_test_list,
+        key=lambda name: expected_duration(name, durations),
+        reverse=True,
+    ):
+        shard_duration, index, shard = heapq.heappop(heap)
+        shard.append(test_name)
+        heapq.heappush(
+            heap,
+            (
+                shard_duration + expected_duration(test_name, durations),
+                index,
+                shard,
+            ),
+        )
+    return [
+        sorted(shard)
+        for _, _, shard in sorted(heap, key=lambda item: (-item[0], item[1]))
+    ]
+
+
+def select_shard(
+    test_list: Iterable[str],
+    durations: Mapping[str, float],
+    index: int,
+    count: int,
+) -> list[str]:
+    """
+    Get tests of one of count balanced parts of a test suite
+
+    Used to split a test suite among several machines. All the machines must
+    use the same durations to get disjoint parts covering all the tests.
+
+    index -- 1-based index of the part
+    count -- number of parts
+    """
+    shard_list = shard_tests(test_list, durations, count)
+    if index > len(shard_list):
+        return []
+    return shard_list[index - 1]
+
+
+def format_slowest(durations: Mapping[str, float], count: int) -> list[str]:
+    """
+    Get lines of a report of the slowest tests
+    """
+    slowest = heapq.nlargest(
+        count, durations.items(), key=lambda item: (item[1], item[0])
+    )
+    if not slowest:
+        return []
+    return [f"Slowest {len(slowest)} tests:"] + [
+        f"  {duration:8.3f}s  {test_name}" for test_name, duration in slowest
+    ]
@@ -1,5 +1,6 @@
 # ruff: noqa: PLC0415 `import` should be at the top-level of a file
 import sys
+import time
 import unittest
 from dataclasses import dataclass, field
 from io import StringIO
@@ -10,12 +11,19 @@ class ParallelTestManager:
         self.result_class = result_class
         self.verbosity = verbosity
 
+    def run_tests(self, test_name_list: list[str]) -> "ParallelTestResult":
+        return aggregate_test_results(
+            [self.run_test(test_name) for test_name in test_name_list]
+        )
+
     def run_test(self, test_name: str) -> "ParallelTestResult":
+        start_time = time.perf_counter()
         test = unittest.defaultTestLoader.loadTestsFromName(test_name)
         test_runner = ParallelTestRunner(
             verbosity=self.verbosity, resultclass=self.result_class
         )
         result = test_runner.run(test)
+        duration = time.perf_counter() - start_time
         return ParallelTestResult(
             result.testsRun,
             result.wasSuccessful(),
@@ -29,6 +37,7 @@ class ParallelTestManager:
             len(result.skipped),
             len(result.expectedFailures),
             len(result.unexpectedSuccesses),
+            {test_name: duration},
         )
 
 
@@ -87,6 +96,7 @@ class ParallelTestResult:
     skip_count: int = 0
     expected_failure_count: int = 0
     unexpected_success_count: int = 0
+    durations: dict[str, float] = field(default_factory=dict)
 
     def print_summary(
         self,
@@ -215,6 +225,7 @@ def aggregate_test_results(
             result.skip_reports[reason] = (
                 result.skip_reports.get(reason, 0) + count
             )
+        result.durations.update(res.durations)
     result.error_names = sorted(set(result.error_names))
     result.failure_names = sorted(set(result.failure_names))
     return result